@@ -0,0 +1,36 @@
+r"""*Benchmark suite for* ``sphobjinv``.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+The benchmarks are run as modules from the repository root, e.g.::
+
+    $ python -m benchmarks.cli --help
+
+See the "Benchmarks" section of ``CONTRIBUTING.md`` for details.
+
+"""
@@ -0,0 +1,320 @@
+r"""*End-to-end latency benchmarks for the* ``sphobjinv`` *CLI*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+Times the ``sphobjinv`` and ``sphobjinv-textconv`` entry points as
+subprocesses, as they are run by Git hooks and other tooling, and checks
+the latency percentiles against budgets. Run from the repository root::
+
+    $ python -m benchmarks.cli --repeat 5 --output cli.json
+    $ python -m benchmarks.cli --compare cli.json
+
+"""
+
+import argparse as ap
+import json
+import shutil
+import subprocess as sp  # noqa: S404
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import (
+    check_budgets,
+    corpus,
+    format_table,
+    load_results,
+    save_results,
+    summarize,
+)
+
+#: Name of this suite in saved results
+SUITE = "cli"
+
+#: Default latency budgets in seconds, by case. Deliberately generous,
+#: so that they flag gross regressions on any reasonable machine; pass
+#: ``--budgets`` with tighter values for a specific machine.
+DEFAULT_BUDGETS = {
+    "startup": {"p50": 0.5, "p95": 1.0},
+    "startup-textconv": {"p50": 0.5, "p95": 1.0},
+    "textconv": {"p50": 1.0, "p95": 2.0},
+    "convert-plain": {"p50": 1.0, "p95": 2.0},
+    "convert-zlib": {"p50": 1.0, "p95": 2.0},
+    "convert-json": {"p50": 1.5, "p95": 3.0},
+    "suggest": {"p50": 2.0, "p95": 5.0},
+}
+
+#: Search term for the ``suggest`` case
+SUGGEST_TERM = "index"
+
+
+def entry_point(name):
+    """Build the command prefix for running a console script.
+
+    The script installed alongside the running interpreter is
+    preferred, then one on ``PATH``; failing both, the entry point
+    function is run with the interpreter directly.
+
+    """
+    local = Path(sys.executable).with_name(name)
+    for candidate in (local, local.with_suffix(".exe")):
+        if candidate.is_file():
+            return [str(candidate)]
+
+    if found := shutil.which(name):
+        return [found]
+
+    fxn = {"sphobjinv": "main", "sphobjinv-textconv": "main_textconv"}[name]
+    return [sys.executable, "-c", f"from sphobjinv.cli.core import {fxn}; {fxn}()"]
+
+
+def build_cases(files, outdir):
+    """Build the commands to time for each case.
+
+    Returns a |dict| mapping each case name to a |list| of
+    ``(label, argv)`` pairs, one per command to time.
+
+    """
+    soi = entry_point("sphobjinv")
+    textconv = entry_point("sphobjinv-textconv")
+
+    def per_file(make_args):
+        """Build one command for each corpus file."""
+        return [(f.name, make_args(f)) for f in files]
+
+    def convert(mode, ext):
+        """Build the commands converting each file to `mode`."""
+        return per_file(
+            lambda f: soi
+            + ["convert", mode, "-oq", str(f), str(outdir / (f.stem + ext))]
+        )
+
+    return {
+        "startup": [("--version", soi + ["--version"])],
+        "startup-textconv": [("--version", textconv + ["--version"])],
+        "textconv": per_file(lambda f: textconv + [str(f)]),
+        "convert-plain": convert("plain", ".txt"),
+        "convert-zlib": convert("zlib", ".inv"),
+        "convert-json": convert("json", ".json"),
+        "suggest": per_file(lambda f: soi + ["suggest", str(f), SUGGEST_TERM, "-a"]),
+    }
+
+
+def time_command(argv):
+    """Run a command once, returning its wall-clock duration in seconds."""
+    start = time.perf_counter()
+    res = sp.run(  # noqa: S603
+        argv, stdin=sp.DEVNULL, stdout=sp.DEVNULL, stderr=sp.PIPE, check=False
+    )
+    elapsed = time.perf_counter() - start
+
+    if res.returncode != 0:
+        raise RuntimeError(
+            f"Command failed with exit code {res.returncode}: {' '.join(argv)}\n"
+            + res.stderr.decode(errors="replace")
+        )
+
+    return elapsed
+
+
+def run(cases, repeat, *, progress=None):
+    """Time every command of every case.
+
+    Parameters
+    ----------
+    cases
+
+        |dict| -- Commands by case name, as from :func:`build_cases`
+
+    repeat
+
+        |int| -- Number of times to run each command
+
+    progress
+
+        callable *(optional)* -- Called with each case name
+        before it is run
+
+    Returns
+    -------
+    results
+
+        |dict| -- Results by case name, each holding the ``'samples'``
+        in seconds, the ``'stats'`` summarizing them, and the median
+        time per command in ``'by_label'``
+
+    """
+    results = {}
+
+    for name, commands in cases.items():
+        if progress is not None:
+            progress(name)
+
+        # An untimed run, so that the first sample doesn't include
+        # filling the OS caches
+        time_command(commands[0][1])
+
+        samples = []
+        by_label = {}
+
+        for label, argv in commands:
+            times = [time_command(argv) for _ in range(repeat)]
+            samples.extend(times)
+            by_label[label] = summarize(times)["p50"]
+
+        results[name] = {
+            "samples": samples,
+            "stats": summarize(samples),
+            "by_label": by_label,
+        }
+
+    return results
+
+
+def report(results, baseline=None):
+    """Format a table of results, in milliseconds.
+
+    If `baseline` results are given, the change in median relative
+    to them is included.
+
+    """
+    headers = ["case", "n", "p50 ms", "p90 ms", "p99 ms", "max ms"]
+    if baseline is not None:
+        headers.append("p50 change")
+
+    rows = []
+    for name, res in results.items():
+        stats = res["stats"]
+        row = [name, stats["n"]] + [
+            f"{1000 * stats[s]:.1f}" for s in ("p50", "p90", "p99", "max")
+        ]
+
+        if baseline is not None:
+            old = baseline["cases"].get(name)
+            row.append(
+                f"{100 * (stats['p50'] / old['stats']['p50'] - 1):+.1f}%"
+                if old
+                else "n/a"
+            )
+
+        rows.append(row)
+
+    return format_table(headers, rows)
+
+
+def getparser():
+    """Build the argument parser."""
+    prs = ap.ArgumentParser(
+        prog="python -m benchmarks.cli",
+        description="Time the sphobjinv CLI entry points as subprocesses.",
+    )
+    prs.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of timed runs of each command (default 3)",
+    )
+    prs.add_argument(
+        "--files",
+        default="objects_*.inv",
+        help="Glob selecting corpus files in tests/resource "
+        "(default 'objects_*.inv')",
+    )
+    prs.add_argument(
+        "--limit", type=int, default=None, help="Use at most this many corpus files"
+    )
+    prs.add_argument(
+        "--cases",
+        default=",".join(DEFAULT_BUDGETS),
+        help="Comma-separated cases to run (default all: %(default)s)",
+    )
+    prs.add_argument(
+        "--budgets",
+        type=Path,
+        default=None,
+        help="JSON file of budgets overriding the defaults, as "
+        '{"case": {"p95": seconds, ...}, ...}',
+    )
+    prs.add_argument("--output", type=Path, default=None, help="Save results as JSON")
+    prs.add_argument(
+        "--compare",
+        type=Path,
+        default=None,
+        help="Saved results to compare against",
+    )
+    return prs
+
+
+def main(argv=None):
+    """Run the benchmarks and report the results.
+
+    Returns the exit code: 1 if any budget is exceeded, otherwise 0.
+
+    """
+    params = getparser().parse_args(argv)
+
+    files = corpus(params.files, params.limit)
+    if not files:
+        sys.exit(f"No corpus files match {params.files!r}")
+
+    budgets = dict(DEFAULT_BUDGETS)
+    if params.budgets is not None:
+        budgets.update(json.loads(params.budgets.read_text(encoding="utf-8")))
+
+    with tempfile.TemporaryDirectory() as outdir:
+        all_cases = build_cases(files, Path(outdir))
+        names = [c.strip() for c in params.cases.split(",") if c.strip()]
+
+        if unknown := set(names) - set(all_cases):
+            sys.exit(f"Unknown cases: {', '.join(sorted(unknown))}")
+
+        results = run(
+            {name: all_cases[name] for name in names},
+            params.repeat,
+            progress=lambda name: print(f"Running {name} ...", file=sys.stderr),
+        )
+
+    baseline = None if params.compare is None else load_results(params.compare)
+    print(report(results, baseline))
+
+    if params.output is not None:
+        save_results(params.output, SUITE, results)
+
+    violations = check_budgets(results, budgets)
+    for case, stat, value, limit in violations:
+        print(
+            f"BUDGET EXCEEDED: {case} {stat} = {1000 * value:.1f} ms "
+            f"(limit {1000 * limit:.1f} ms)"
+        )
+
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+r"""*Shared helpers for the* ``sphobjinv`` *benchmarks*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import datetime
+import json
+import math
+import platform
+import statistics
+import subprocess as sp  # noqa: S404
+import sys
+from pathlib import Path
+
+import sphobjinv as soi
+
+#: |Path| to the root of the repository
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+#: |Path| to the directory of test inventories used as the benchmark corpus
+RESOURCE_DIR = REPO_ROOT / "tests" / "resource"
+
+#: Percentiles reported for every set of timing samples
+PERCENTILES = (50, 90, 95, 99)
+
+
+def corpus(pattern="objects_*.inv", limit=None):
+    """List the corpus inventories matching `pattern`, in sorted order.
+
+    Parameters
+    ----------
+    pattern
+
+        |str| -- Glob pattern, relative to :data:`RESOURCE_DIR`
+
+    limit
+
+        |int| *(optional)* -- Maximum number of files to return
+
+    Returns
+    -------
+    paths
+
+        |list| of |Path| -- Matching files
+
+    """
+    paths = sorted(RESOURCE_DIR.glob(pattern))
+    return paths if limit is None else paths[:limit]
+
+
+def percentile(samples, pct):
+    """Compute a percentile of `samples`, interpolating linearly.
+
+    Parameters
+    ----------
+    samples
+
+        sequence of |float| -- Non-empty collection of values
+
+    pct
+
+        |float| -- Percentile to compute, from 0 to 100
+
+    Returns
+    -------
+    value
+
+        |float| -- Requested percentile
+
+    """
+    ordered = sorted(samples)
+    pos = (len(ordered) - 1) * pct / 100
+    lo = math.floor(pos)
+    hi = math.ceil(pos)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def summarize(samples):
+    """Compute summary statistics of a non-empty set of samples.
+
+    Returns a |dict| with the count, minimum, maximum, mean,
+    standard deviation, and the percentiles in :data:`PERCENTILES`
+    (as ``'p50'``, etc.).
+
+    """
+    stats = {
+        "n": len(samples),
+        "min": min(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "max": max(samples),
+    }
+    stats.update({f"p{pct}": percentile(samples, pct) for pct in PERCENTILES})
+    return stats
+
+
+def git_commit():
+    """Get the commit checked out in :data:`REPO_ROOT`, or |None| if unknown."""
+    try:
+        res = sp.run(  # noqa: S603,S607
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, sp.CalledProcessError):
+        return None
+
+    return res.stdout.strip()
+
+
+def environment():
+    """Describe the environment in which benchmarks are run."""
+    return {
+        "sphobjinv": soi.__version__,
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "executable": sys.executable,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def save_results(path, suite, cases):
+    """Save benchmark results as JSON.
+
+    Parameters
+    ----------
+    path
+
+        |str| or |Path| -- File to write
+
+    suite
+
+        |str| -- Name of the benchmark suite
+
+    cases
+
+        |dict| -- Results by case name. Each result is a |dict|
+        holding at least the raw ``'samples'`` and their ``'stats'``.
+
+    """
+    data = {"suite": suite, "environment": environment(), "cases": cases}
+    Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def load_results(path):
+    """Load benchmark results saved with :func:`save_results`."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def check_budgets(cases, budgets):
+    """Check results against budgets.
+
+    Parameters
+    ----------
+    cases
+
+        |dict| -- Results by case name, as for :func:`save_results`
+
+    budgets
+
+        |dict| -- Budgets by case name, each a |dict| of limits
+        keyed by statistic name (e.g., ``{"p95": 0.5}``).
+        Cases without results are ignored.
+
+    Returns
+    -------
+    violations
+
+        |list| of |tuple| -- ``(case, stat, value, limit)`` for each
+        statistic exceeding its limit
+
+    """
+    violations = []
+
+    for case, limits in budgets.items():
+        if case not in cases:
+            continue
+
+        for stat, limit in limits.items():
+            value = cases[case]["stats"][stat]
+            if value > limit:
+                violations.append((case, stat, value, limit))
+
+    return violations
+
+
+def format_table(headers, rows):
+    """Format rows of values as a plain-text table with aligned columns."""
+    cells = [list(map(str, headers))] + [[str(v) for v in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+
+    lines = [
+        "  ".join(
+            c.ljust(w) if i == 0 else c.rjust(w)
+            for i, (c, w) in enumerate(zip(row, widths))
+        )
+        for row in cells
+    ]
+    lines.insert(1, "  ".join("-" * w for w in widths))
+
+    return "\n".join(lines)
@@ -0,0 +1,317 @@
+r"""*Comparison of saved* ``sphobjinv`` *benchmark results*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+Flags statistically significant changes between two sets of results saved
+by any of the benchmark suites, typically from two commits::
+
+    $ git checkout main
+    $ python -m benchmarks.library --output base.json
+    $ git checkout my-branch
+    $ python -m benchmarks.library --output new.json
+    $ python -m benchmarks.compare base.json new.json
+
+For cases timed over many corpus files, the per-file median times of the
+two runs are paired, and the Wilcoxon signed-rank test is applied to their
+log ratios. Cases with fewer files are compared by applying the
+Mann-Whitney U test to their raw samples. A change is flagged only if it is
+both significant at ``--alpha`` and larger than ``--threshold``.
+The exit code is 1 if any regression is flagged.
+
+"""
+
+import argparse as ap
+import math
+import statistics
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+from benchmarks.common import format_table, load_results
+
+#: Minimum number of paired files for using the signed-rank test
+MIN_PAIRS = 6
+
+#: Sample sizes up to which exact distributions are used, absent ties
+EXACT_MAX = 20
+
+
+def _normal_sf(z):
+    """Upper-tail probability of the standard normal distribution."""
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _ranks(values):
+    """Rank `values` from 1, giving tied values their average rank.
+
+    Returns the ranks and the sizes of the groups of tied values.
+
+    """
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties = []
+
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+
+        if j > i:
+            ties.append(j - i + 1)
+        i = j + 1
+
+    return ranks, ties
+
+
+@lru_cache(maxsize=None)
+def _signed_rank_counts(n):
+    """Count the subsets of ranks 1..n by their sum."""
+    counts = [1]
+    for rank in range(1, n + 1):
+        new = counts + [0] * rank
+        for total, ways in enumerate(counts):
+            new[total + rank] += ways
+        counts = new
+    return tuple(counts)
+
+
+def wilcoxon_signed_rank(diffs):
+    """Two-sided p-value of the Wilcoxon signed-rank test.
+
+    Tests whether the paired differences `diffs` are symmetric about zero.
+    Zero differences are discarded. The exact null distribution is used
+    for small samples without ties, and otherwise the normal
+    approximation with tie and continuity corrections.
+
+    """
+    diffs = [d for d in diffs if d != 0]
+    n = len(diffs)
+    if n == 0:
+        return 1.0
+
+    ranks, ties = _ranks([abs(d) for d in diffs])
+    w_plus = sum(r for r, d in zip(ranks, diffs) if d > 0)
+
+    if n <= EXACT_MAX and not ties:
+        counts = _signed_rank_counts(n)
+        w = int(w_plus)
+        lower = sum(counts[: w + 1])
+        upper = sum(counts[w:])
+        return min(1.0, 2 * min(lower, upper) / 2**n)
+
+    mean = n * (n + 1) / 4
+    var = n * (n + 1) * (2 * n + 1) / 24 - sum(t**3 - t for t in ties) / 48
+    if var <= 0:
+        return 1.0
+
+    z = (abs(w_plus - mean) - 0.5) / math.sqrt(var)
+    return min(1.0, 2 * _normal_sf(max(z, 0.0)))
+
+
+@lru_cache(maxsize=None)
+def _rank_sum_counts(n1, n2):
+    """Count the arrangements of two samples by their Mann-Whitney U."""
+    if n1 == 0 or n2 == 0:
+        return (1,)
+
+    # The largest value is in either the first sample, where it exceeds
+    # all n2 values of the second, or in the second, where it exceeds none
+    first = _rank_sum_counts(n1 - 1, n2)
+    second = _rank_sum_counts(n1, n2 - 1)
+
+    counts = [0] * (n1 * n2 + 1)
+    for u, ways in enumerate(first):
+        counts[u + n2] += ways
+    for u, ways in enumerate(second):
+        counts[u] += ways
+    return tuple(counts)
+
+
+def mann_whitney_u(a, b):
+    """Two-sided p-value of the Mann-Whitney U test.
+
+    Tests whether samples `a` and `b` come from the same distribution.
+    The exact null distribution is used for small samples without ties,
+    and otherwise the normal approximation with tie and continuity
+    corrections.
+
+    """
+    n1, n2 = len(a), len(b)
+    ranks, ties = _ranks(list(a) + list(b))
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+
+    if max(n1, n2) <= EXACT_MAX and not ties:
+        counts = _rank_sum_counts(n1, n2)
+        u = int(u)
+        lower = sum(counts[: u + 1])
+        upper = sum(counts[u:])
+        return min(1.0, 2 * min(lower, upper) / math.comb(n1 + n2, n1))
+
+    n = n1 + n2
+    mean = n1 * n2 / 2
+    var = n1 * n2 / 12 * ((n + 1) - sum(t**3 - t for t in ties) / (n * (n - 1)))
+    if var <= 0:
+        return 1.0
+
+    z = (abs(u - mean) - 0.5) / math.sqrt(var)
+    return min(1.0, 2 * _normal_sf(max(z, 0.0)))
+
+
+def compare_case(old, new):
+    """Compare the results of one case from two runs.
+
+    Returns the ratio of the new to the old time (the geometric mean
+    over paired files, or otherwise the ratio of medians), the p-value,
+    and the name of the test applied.
+
+    """
+    old_files = old.get("by_label", {})
+    new_files = new.get("by_label", {})
+    labels = sorted(set(old_files) & set(new_files))
+
+    if len(labels) >= MIN_PAIRS:
+        log_ratios = [math.log(new_files[lb] / old_files[lb]) for lb in labels]
+        ratio = math.exp(statistics.fmean(log_ratios))
+        return ratio, wilcoxon_signed_rank(log_ratios), "signed-rank"
+
+    ratio = statistics.median(new["samples"]) / statistics.median(old["samples"])
+    return ratio, mann_whitney_u(old["samples"], new["samples"]), "mann-whitney"
+
+
+def compare(old, new, *, alpha=0.01, threshold=0.05):
+    """Compare two sets of saved results, case by case.
+
+    Parameters
+    ----------
+    old
+
+        |dict| -- Baseline results, as from
+        :func:`~benchmarks.common.load_results`
+
+    new
+
+        |dict| -- Results to compare against the baseline
+
+    alpha
+
+        |float| -- Significance level
+
+    threshold
+
+        |float| -- Minimum relative change to flag, e.g. 0.05 for 5%
+
+    Returns
+    -------
+    rows
+
+        |list| of |tuple| -- ``(case, ratio, p, test, verdict)`` for each
+        case present in both, where `verdict` is ``'REGRESSION'``,
+        ``'improvement'``, or ``''``
+
+    """
+    rows = []
+
+    for case in old["cases"]:
+        if case not in new["cases"]:
+            continue
+
+        ratio, p, test = compare_case(old["cases"][case], new["cases"][case])
+
+        verdict = ""
+        if p < alpha and ratio > 1 + threshold:
+            verdict = "REGRESSION"
+        elif p < alpha and ratio < 1 / (1 + threshold):
+            verdict = "improvement"
+
+        rows.append((case, ratio, p, test, verdict))
+
+    return rows
+
+
+def getparser():
+    """Build the argument parser."""
+    prs = ap.ArgumentParser(
+        prog="python -m benchmarks.compare",
+        description="Flag significant changes between two saved benchmark runs.",
+    )
+    prs.add_argument("old", type=Path, help="Baseline results")
+    prs.add_argument("new", type=Path, help="Results to compare")
+    prs.add_argument(
+        "--alpha",
+        type=float,
+        default=0.01,
+        help="Significance level (default %(default)s)",
+    )
+    prs.add_argument(
+        "--threshold",
+        type=float,
+        default=5.0,
+        help="Minimum change to flag, in percent (default %(default)s)",
+    )
+    return prs
+
+
+def main(argv=None):
+    """Compare two saved runs and report the results.
+
+    Returns the exit code: 1 if any regression is flagged, otherwise 0.
+
+    """
+    params = getparser().parse_args(argv)
+    old = load_results(params.old)
+    new = load_results(params.new)
+
+    if old["suite"] != new["suite"]:
+        sys.exit(f"Cannot compare suites {old['suite']!r} and {new['suite']!r}")
+
+    for label, res in (("old", old), ("new", new)):
+        env = res["environment"]
+        print(f"{label}: {env['commit'] or 'unknown commit'} ({env['timestamp']})")
+    print()
+
+    rows = compare(old, new, alpha=params.alpha, threshold=params.threshold / 100)
+
+    print(
+        format_table(
+            ["case", "change", "p", "test", ""],
+            [
+                (case, f"{100 * (ratio - 1):+.1f}%", f"{p:.3g}", test, verdict)
+                for case, ratio, p, test, verdict in rows
+            ],
+        )
+    )
+
+    return 1 if any(row[-1] == "REGRESSION" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
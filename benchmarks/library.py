@@ -0,0 +1,390 @@
+r"""*Library-level benchmarks of* ``sphobjinv`` *over the test corpus*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+Times the core :class:`~sphobjinv.inventory.Inventory` operations
+in-process over every inventory in the test corpus, and reports throughput
+in objects and megabytes per second. Run from the repository root::
+
+    $ python -m benchmarks.library --rounds 5 --output lib.json
+
+Each round times one call per corpus file, after any per-call setup.
+The time for a round is the sum over the files, and the per-file medians
+are saved for comparison with :mod:`benchmarks.compare`.
+
+The ``suggest-*`` cases are orders of magnitude slower than the others,
+so by default they are run on a sample of the corpus spanning the range of
+inventory sizes. Pass ``--suggest-files 0`` to run them on every file.
+
+"""
+
+import argparse as ap
+import gc
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import attr
+
+import sphobjinv as soi
+from benchmarks.common import corpus, format_table, save_results, summarize
+
+#: Name of this suite in saved results
+SUITE = "library"
+
+#: Default number of corpus files for the ``suggest-*`` cases
+SUGGEST_FILES = 8
+
+#: Thresholds for the ``suggest-*`` cases
+SUGGEST_THRESHOLDS = (50, 75, 90)
+
+
+@attr.s(slots=True, frozen=True)
+class CorpusEntry:
+    """Inputs for one corpus inventory, prepared ahead of timing."""
+
+    #: |str| -- File name, used to label per-file results
+    label = attr.ib()
+
+    #: |int| -- Number of objects
+    count = attr.ib()
+
+    #: |Path| -- zlib-compressed inventory
+    zlib_path = attr.ib()
+
+    #: |Path| -- Plaintext inventory
+    plain_path = attr.ib()
+
+    #: |bytes| -- zlib-compressed contents
+    zlib = attr.ib(repr=False)
+
+    #: |bytes| -- Plaintext contents
+    plain = attr.ib(repr=False)
+
+    #: |dict| -- JSON-dict form
+    json_dict = attr.ib(repr=False)
+
+    #: |int| -- Size of the JSON-dict form serialized as JSON
+    json_size = attr.ib()
+
+    #: |Inventory| -- Parsed inventory, for cases not timing parsing
+    inv = attr.ib(repr=False)
+
+    #: |str| -- Search term for the ``suggest-*`` cases
+    term = attr.ib()
+
+    @classmethod
+    def load(cls, path, workdir):
+        """Prepare the inputs for the corpus file at `path`."""
+        zlib_bytes = path.read_bytes()
+        plain_bytes = soi.decompress(zlib_bytes)
+
+        plain_path = workdir / (path.stem + ".txt")
+        plain_path.write_bytes(plain_bytes)
+
+        inv = soi.Inventory(zlib=zlib_bytes)
+        json_dict = inv.json_dict()
+
+        # The final segment of a name from the middle of the inventory
+        term = inv.objects[inv.count // 2].name.rpartition(".")[2] if inv.count else ""
+
+        return cls(
+            label=path.name,
+            count=inv.count,
+            zlib_path=path,
+            plain_path=plain_path,
+            zlib=zlib_bytes,
+            plain=plain_bytes,
+            json_dict=json_dict,
+            json_size=len(json.dumps(json_dict).encode("utf-8")),
+            inv=inv,
+            term=term,
+        )
+
+
+@attr.s(slots=True, frozen=True)
+class Case:
+    """One library operation to time over the corpus."""
+
+    #: callable -- Operation to time, called with the result of :attr:`setup`
+    fxn = attr.ib()
+
+    #: |str| -- Attribute of :class:`CorpusEntry` whose size in bytes
+    #: is the basis for throughput in MB/s
+    basis = attr.ib(default="zlib")
+
+    #: callable -- Untimed setup, called with each :class:`CorpusEntry`
+    setup = attr.ib(default=lambda entry: entry)
+
+    #: |bool| -- Whether the case runs on the sample for the
+    #: ``suggest-*`` cases, rather than on every corpus file
+    sampled = attr.ib(default=False)
+
+    def size(self, entry):
+        """Compute the throughput basis for `entry`, in bytes."""
+        if self.basis == "json":
+            return entry.json_size
+        return len(getattr(entry, self.basis))
+
+
+def _json_roundtrip(entry):
+    """Serialize an inventory to JSON text and parse it back."""
+    return soi.Inventory(dict_json=json.loads(json.dumps(entry.inv.json_dict())))
+
+
+def _stream(path, entry, **kwargs):
+    """Stream-convert the inventory at `path` into the scratch directory."""
+    soi.stream.convert_file(path, entry.plain_path.with_suffix(".out"), **kwargs)
+
+
+def _suggest_case(thresh):
+    """Build a case searching a freshly loaded inventory at `thresh`."""
+    return Case(
+        fxn=lambda args: args[0].suggest(args[1], thresh=thresh),
+        setup=lambda entry: (soi.Inventory(zlib=entry.zlib), entry.term),
+        sampled=True,
+    )
+
+
+#: Cases by name
+CASES = {
+    "load-bytes-zlib": Case(lambda e: soi.Inventory(zlib=e.zlib)),
+    "load-bytes-plain": Case(lambda e: soi.Inventory(plaintext=e.plain), "plain"),
+    "load-fname-zlib": Case(lambda e: soi.Inventory(fname_zlib=e.zlib_path)),
+    "load-fname-plain": Case(
+        lambda e: soi.Inventory(fname_plain=e.plain_path), "plain"
+    ),
+    "load-dict-json": Case(lambda e: soi.Inventory(dict_json=e.json_dict), "json"),
+    "load-url": Case(lambda e: soi.Inventory(url=e.zlib_path.as_uri())),
+    "decompress": Case(lambda e: soi.decompress(e.zlib)),
+    "compress": Case(lambda e: soi.compress(e.plain), "plain"),
+    "data-file": Case(lambda e: e.inv.data_file(), "plain"),
+    "data-file-contract": Case(lambda e: e.inv.data_file(contract=True), "plain"),
+    "stream-zlib-plain": Case(lambda e: _stream(e.zlib_path, e)),
+    "stream-plain-zlib": Case(
+        lambda e: _stream(e.plain_path, e, compress=True), "plain"
+    ),
+    "json-dict": Case(lambda e: e.inv.json_dict(), "json"),
+    "json-roundtrip": Case(_json_roundtrip, "json"),
+    **{f"suggest-{t}": _suggest_case(t) for t in SUGGEST_THRESHOLDS},
+}
+
+
+def suggest_sample(entries, n):
+    """Select `n` entries at evenly spaced quantiles of inventory size.
+
+    If `n` is zero or at least the number of entries, all are returned.
+
+    """
+    if not n or n >= len(entries):
+        return list(entries)
+
+    by_size = sorted(entries, key=lambda e: (e.count, e.label))
+    return [by_size[int((i + 0.5) * len(by_size) / n)] for i in range(n)]
+
+
+def time_case(case, entries):
+    """Time one round of `case`, returning the duration per entry."""
+    times = []
+
+    for entry in entries:
+        args = case.setup(entry)
+        start = time.perf_counter()
+        case.fxn(args)
+        times.append(time.perf_counter() - start)
+
+    return times
+
+
+def run(names, entries, rounds, *, suggest_files=SUGGEST_FILES, progress=None):
+    """Time the named cases over the corpus.
+
+    Parameters
+    ----------
+    names
+
+        |list| of |str| -- Names of the cases in :data:`CASES` to run
+
+    entries
+
+        |list| of :class:`CorpusEntry` -- Prepared corpus
+
+    rounds
+
+        |int| -- Number of timed rounds of each case
+
+    suggest_files
+
+        |int| *(optional)* -- Number of corpus files for the sampled
+        cases, or zero for all of them
+
+    progress
+
+        callable *(optional)* -- Called with each case name
+        before it is run
+
+    Returns
+    -------
+    results
+
+        |dict| -- Results by case name, each holding the round times
+        as ``'samples'`` in seconds, the ``'stats'`` summarizing them,
+        the median time per file in ``'by_label'``, and the
+        ``'objects_per_s'`` and ``'mb_per_s'`` at the median round time
+
+    """
+    sample = suggest_sample(entries, suggest_files)
+    results = {}
+
+    for name in names:
+        if progress is not None:
+            progress(name)
+
+        case = CASES[name]
+        used = sample if case.sampled else entries
+
+        # An untimed call, so that the first round doesn't include
+        # any lazy imports or other one-time setup
+        time_case(case, used[:1])
+
+        per_file = {entry.label: [] for entry in used}
+        samples = []
+
+        for _ in range(rounds):
+            gc.collect()
+            times = time_case(case, used)
+            samples.append(sum(times))
+            for entry, elapsed in zip(used, times):
+                per_file[entry.label].append(elapsed)
+
+        stats = summarize(samples)
+        results[name] = {
+            "samples": samples,
+            "stats": stats,
+            "by_label": {k: statistics.median(v) for k, v in per_file.items()},
+            "objects_per_s": sum(e.count for e in used) / stats["p50"],
+            "mb_per_s": sum(case.size(e) for e in used) / stats["p50"] / 1e6,
+        }
+
+    return results
+
+
+def report(results):
+    """Format a table of results."""
+    headers = ["case", "files", "p50 ms", "stdev", "kobj/s", "MB/s"]
+    rows = [
+        (
+            name,
+            len(res["by_label"]),
+            f"{1000 * res['stats']['p50']:.1f}",
+            f"{100 * res['stats']['stdev'] / res['stats']['mean']:.1f}%",
+            f"{res['objects_per_s'] / 1000:.1f}",
+            f"{res['mb_per_s']:.2f}",
+        )
+        for name, res in results.items()
+    ]
+    return format_table(headers, rows)
+
+
+def getparser():
+    """Build the argument parser."""
+    prs = ap.ArgumentParser(
+        prog="python -m benchmarks.library",
+        description="Time sphobjinv library operations over the test corpus.",
+    )
+    prs.add_argument(
+        "--rounds",
+        type=int,
+        default=5,
+        help="Number of timed rounds of each case (default %(default)s)",
+    )
+    prs.add_argument(
+        "--files",
+        default="objects_*.inv",
+        help="Glob selecting corpus files in tests/resource "
+        "(default 'objects_*.inv')",
+    )
+    prs.add_argument(
+        "--limit", type=int, default=None, help="Use at most this many corpus files"
+    )
+    prs.add_argument(
+        "--suggest-files",
+        type=int,
+        default=SUGGEST_FILES,
+        help="Number of corpus files for the suggest cases, "
+        "or 0 for all (default %(default)s)",
+    )
+    prs.add_argument(
+        "--cases",
+        default=",".join(CASES),
+        help="Comma-separated cases to run (default all: %(default)s)",
+    )
+    prs.add_argument("--output", type=Path, default=None, help="Save results as JSON")
+    return prs
+
+
+def main(argv=None):
+    """Run the benchmarks and report the results.
+
+    Returns the exit code.
+
+    """
+    params = getparser().parse_args(argv)
+
+    files = corpus(params.files, params.limit)
+    if not files:
+        sys.exit(f"No corpus files match {params.files!r}")
+
+    names = [c.strip() for c in params.cases.split(",") if c.strip()]
+    if unknown := set(names) - set(CASES):
+        sys.exit(f"Unknown cases: {', '.join(sorted(unknown))}")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        entries = [CorpusEntry.load(f, Path(workdir)) for f in files]
+
+        results = run(
+            names,
+            entries,
+            params.rounds,
+            suggest_files=params.suggest_files,
+            progress=lambda name: print(f"Running {name} ...", file=sys.stderr),
+        )
+
+    print(report(results))
+
+    if params.output is not None:
+        save_results(params.output, SUITE, results)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
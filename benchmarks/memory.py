@@ -0,0 +1,286 @@
+r"""*Memory footprint benchmarks of* ``sphobjinv`` *over the test corpus*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+Records the memory allocated while loading, converting, and searching
+every inventory in the test corpus, with :mod:`tracemalloc`, and checks the
+totals per object against budgets. Run from the repository root::
+
+    $ python -m benchmarks.memory --output memory.json
+
+For each case and file, the *peak* is the most memory allocated at any
+point during the operation, and the *retained* memory is that still
+allocated afterward while its result is held. Both are relative to the
+memory allocated beforehand. For the ``load-*`` cases, the retained
+memory is the footprint of the loaded inventory; for ``suggest``, it
+includes the search structures cached on the inventory.
+
+"""
+
+import argparse as ap
+import gc
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import sphobjinv as soi
+from benchmarks.common import check_budgets, corpus, format_table, save_results
+from benchmarks.library import SUGGEST_FILES, CorpusEntry, suggest_sample
+
+#: Name of this suite in saved results
+SUITE = "memory"
+
+#: Default budgets in bytes per object, by case. About a third above the
+#: values measured when the suite was added, so that they catch real
+#: regressions but not differences among Python versions. They are set for
+#: the full corpus: on a few small files, fixed costs such as the state of
+#: the zlib compressor can dominate the totals per object.
+DEFAULT_BUDGETS = {
+    "load-zlib": {"retained_per_object": 1100, "peak_per_object": 1250},
+    "load-plain": {"retained_per_object": 1100, "peak_per_object": 1100},
+    "load-json": {"retained_per_object": 700, "peak_per_object": 750},
+    "convert-plain": {"peak_per_object": 500},
+    "convert-zlib": {"peak_per_object": 700},
+    "convert-json": {"peak_per_object": 500},
+    "suggest": {"retained_per_object": 500, "peak_per_object": 550},
+}
+
+#: Setup, operation, and whether the case runs on the
+#: sample for ``suggest``, by case name
+CASES = {
+    "load-zlib": (None, lambda e: soi.Inventory(zlib=e.zlib), False),
+    "load-plain": (None, lambda e: soi.Inventory(plaintext=e.plain), False),
+    "load-json": (None, lambda e: soi.Inventory(dict_json=e.json_dict), False),
+    "convert-plain": (None, lambda e: e.inv.data_file(), False),
+    "convert-zlib": (None, lambda e: soi.compress(e.inv.data_file()), False),
+    "convert-json": (None, lambda e: e.inv.json_dict(), False),
+    "suggest": (
+        lambda e: (soi.Inventory(zlib=e.zlib), e.term),
+        lambda args: (args[0], args[0].suggest(args[1], thresh=75)),
+        True,
+    ),
+}
+
+
+def measure(fxn, arg):
+    """Run ``fxn(arg)`` under :mod:`tracemalloc`.
+
+    Returns the peak and retained allocations in bytes, relative
+    to those before the call.
+
+    """
+    gc.collect()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+
+    result = fxn(arg)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+
+    del result
+    return peak - before, current - before
+
+
+def run(names, entries, *, suggest_files=SUGGEST_FILES, progress=None):
+    """Measure the named cases over the corpus.
+
+    Parameters
+    ----------
+    names
+
+        |list| of |str| -- Names of the cases in :data:`CASES` to run
+
+    entries
+
+        |list| of :class:`~benchmarks.library.CorpusEntry` -- Prepared corpus
+
+    suggest_files
+
+        |int| *(optional)* -- Number of corpus files for ``suggest``,
+        or zero for all of them
+
+    progress
+
+        callable *(optional)* -- Called with each case name
+        before it is run
+
+    Returns
+    -------
+    results
+
+        |dict| -- Results by case name, each holding the total
+        ``'samples'`` of retained bytes, the ``'stats'``, and the
+        retained bytes per file in ``'by_label'``. The stats are the
+        total retained bytes, the largest peak for any one file,
+        and the totals over all files of each, per object.
+
+    """
+    sample = suggest_sample(entries, suggest_files)
+    results = {}
+
+    tracemalloc.start()
+    try:
+        for name in names:
+            if progress is not None:
+                progress(name)
+
+            setup, fxn, sampled = CASES[name]
+            used = sample if sampled else entries
+
+            # Run once untracked, so that lazy imports and other
+            # one-time allocations aren't counted
+            fxn(setup(used[0]) if setup else used[0])
+
+            peaks = {}
+            retained = {}
+            for entry in used:
+                arg = setup(entry) if setup else entry
+                peaks[entry.label], retained[entry.label] = measure(fxn, arg)
+                del arg
+
+            count = sum(e.count for e in used)
+            total_retained = sum(retained.values())
+
+            results[name] = {
+                "samples": [total_retained],
+                "stats": {
+                    "objects": count,
+                    "retained": total_retained,
+                    "retained_per_object": total_retained / count,
+                    "peak": max(peaks.values()),
+                    "peak_per_object": sum(peaks.values()) / count,
+                },
+                "by_label": retained,
+            }
+    finally:
+        tracemalloc.stop()
+
+    return results
+
+
+def report(results):
+    """Format a table of results."""
+    headers = ["case", "files", "retained MB", "B/obj", "peak MB", "peak B/obj"]
+    rows = [
+        (
+            name,
+            len(res["by_label"]),
+            f"{res['stats']['retained'] / 1e6:.2f}",
+            f"{res['stats']['retained_per_object']:.0f}",
+            f"{res['stats']['peak'] / 1e6:.2f}",
+            f"{res['stats']['peak_per_object']:.0f}",
+        )
+        for name, res in results.items()
+    ]
+    return format_table(headers, rows)
+
+
+def getparser():
+    """Build the argument parser."""
+    prs = ap.ArgumentParser(
+        prog="python -m benchmarks.memory",
+        description="Measure sphobjinv memory allocation over the test corpus.",
+    )
+    prs.add_argument(
+        "--files",
+        default="objects_*.inv",
+        help="Glob selecting corpus files in tests/resource "
+        "(default 'objects_*.inv')",
+    )
+    prs.add_argument(
+        "--limit", type=int, default=None, help="Use at most this many corpus files"
+    )
+    prs.add_argument(
+        "--suggest-files",
+        type=int,
+        default=SUGGEST_FILES,
+        help="Number of corpus files for the suggest case, "
+        "or 0 for all (default %(default)s)",
+    )
+    prs.add_argument(
+        "--cases",
+        default=",".join(CASES),
+        help="Comma-separated cases to run (default all: %(default)s)",
+    )
+    prs.add_argument(
+        "--budgets",
+        type=Path,
+        default=None,
+        help="JSON file of budgets overriding the defaults, as "
+        '{"case": {"peak_per_object": bytes, ...}, ...}',
+    )
+    prs.add_argument("--output", type=Path, default=None, help="Save results as JSON")
+    return prs
+
+
+def main(argv=None):
+    """Run the benchmarks and report the results.
+
+    Returns the exit code: 1 if any budget is exceeded, otherwise 0.
+
+    """
+    params = getparser().parse_args(argv)
+
+    files = corpus(params.files, params.limit)
+    if not files:
+        sys.exit(f"No corpus files match {params.files!r}")
+
+    names = [c.strip() for c in params.cases.split(",") if c.strip()]
+    if unknown := set(names) - set(CASES):
+        sys.exit(f"Unknown cases: {', '.join(sorted(unknown))}")
+
+    budgets = dict(DEFAULT_BUDGETS)
+    if params.budgets is not None:
+        budgets.update(json.loads(params.budgets.read_text(encoding="utf-8")))
+
+    with tempfile.TemporaryDirectory() as workdir:
+        entries = [CorpusEntry.load(f, Path(workdir)) for f in files]
+
+        results = run(
+            names,
+            entries,
+            suggest_files=params.suggest_files,
+            progress=lambda name: print(f"Running {name} ...", file=sys.stderr),
+        )
+
+    print(report(results))
+
+    if params.output is not None:
+        save_results(params.output, SUITE, results)
+
+    violations = check_budgets(results, budgets)
+    for case, stat, value, limit in violations:
+        print(f"BUDGET EXCEEDED: {case} {stat} = {value:.0f} (limit {limit:.0f})")
+
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+r"""*Scaling benchmarks of* ``sphobjinv`` *over synthetic inventories*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+Times parsing, writing, and searching synthetic inventories from
+:mod:`sphobjinv.synth` of increasing size, reporting the throughput and
+the scaling exponent between successive sizes. An exponent near 1 means
+linear scaling. Run from the repository root::
+
+    $ python -m benchmarks.scaling --sizes 10k,100k,1M,10M --output scaling.json
+
+The inventories are generated before timing starts. At 10M objects the
+parsed inventory takes several GB of memory. ``suggest`` is run only at
+sizes up to ``--suggest-max``, since it scans every object on each search;
+it is timed on an inventory that has already been searched once.
+
+"""
+
+import argparse as ap
+import gc
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import attr
+
+import sphobjinv as soi
+from benchmarks.common import format_table, save_results, summarize
+
+#: Name of this suite in saved results
+SUITE = "scaling"
+
+#: Default inventory sizes
+DEFAULT_SIZES = "10k,100k,1M"
+
+#: Default largest size at which ``suggest`` is timed
+SUGGEST_MAX = "100k"
+
+#: Multipliers for size suffixes
+_SUFFIXES = {"k": 10**3, "M": 10**6}
+
+
+def parse_size(text):
+    """Convert a size such as ``'100k'`` or ``'1M'`` to an |int|."""
+    text = text.strip()
+    if text[-1:] in _SUFFIXES:
+        return int(float(text[:-1]) * _SUFFIXES[text[-1]])
+    return int(text)
+
+
+def size_label(size):
+    """Format a size compactly, as for :func:`parse_size`."""
+    for suffix, mult in sorted(_SUFFIXES.items(), key=lambda kv: -kv[1]):
+        if size >= mult and size % mult == 0:
+            return f"{size // mult}{suffix}"
+    return str(size)
+
+
+@attr.s(slots=True, frozen=True)
+class SizedInput:
+    """Synthetic inventory of one size, prepared ahead of timing."""
+
+    #: |int| -- Number of objects
+    size = attr.ib()
+
+    #: |Path| -- zlib-compressed inventory
+    zlib_path = attr.ib()
+
+    #: |Path| -- Plaintext inventory
+    plain_path = attr.ib()
+
+    #: |Inventory| -- Parsed inventory
+    inv = attr.ib(repr=False)
+
+    #: |str| -- Search term for ``suggest``
+    term = attr.ib()
+
+    @classmethod
+    def create(cls, size, workdir, seed=0):
+        """Generate an inventory of `size` objects in `workdir`."""
+        zlib_path = workdir / f"synth_{size}.inv"
+        plain_path = workdir / f"synth_{size}.txt"
+
+        soi.synth.write(zlib_path, size, seed=seed)
+        soi.synth.write(plain_path, size, seed=seed, compress=False)
+
+        inv = soi.Inventory(fname_zlib=zlib_path)
+        term = inv.objects[size // 2].name.rpartition(".")[2] if size else ""
+
+        return cls(size, zlib_path, plain_path, inv, term)
+
+
+#: Operations to time, by case name
+CASES = {
+    "parse-zlib": lambda si: soi.Inventory(fname_zlib=si.zlib_path),
+    "parse-plain": lambda si: soi.Inventory(fname_plain=si.plain_path),
+    "write-plain": lambda si: si.inv.data_file(),
+    "write-zlib": lambda si: soi.compress(si.inv.data_file()),
+    "suggest": lambda si: si.inv.suggest(si.term, thresh=75),
+}
+
+
+def run(names, sizes, rounds, *, suggest_max=None, seed=0, progress=None):
+    """Time the named cases at each size.
+
+    Parameters
+    ----------
+    names
+
+        |list| of |str| -- Names of the cases in :data:`CASES` to run
+
+    sizes
+
+        |list| of |int| -- Inventory sizes, in objects
+
+    rounds
+
+        |int| -- Number of timed calls of each case at each size
+
+    suggest_max
+
+        |int| *(optional)* -- Largest size at which to run ``suggest``
+
+    seed
+
+        |int| *(optional)* -- Seed for the synthetic inventories
+
+    progress
+
+        callable *(optional)* -- Called with a description of
+        each step before it is run
+
+    Returns
+    -------
+    results
+
+        |dict| -- Results by ``'{case}-{size}'``, each holding the
+        ``'samples'`` in seconds, the ``'stats'`` summarizing them,
+        the ``'size'``, the ``'objects_per_s'`` at the median time,
+        and the ``'exponent'`` of the scaling from the previous size
+        (|None| for the first)
+
+    """
+    results = {}
+    previous = {}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sorted(sizes):
+            if progress is not None:
+                progress(f"Generating {size_label(size)} objects ...")
+
+            si = SizedInput.create(size, Path(workdir), seed)
+
+            for name in names:
+                if name == "suggest" and suggest_max is not None and size > suggest_max:
+                    continue
+
+                if progress is not None:
+                    progress(f"Running {name} at {size_label(size)} ...")
+
+                # An untimed call, also building any cached search structures
+                if name == "suggest":
+                    CASES[name](si)
+
+                samples = []
+                for _ in range(rounds):
+                    gc.collect()
+                    start = time.perf_counter()
+                    CASES[name](si)
+                    samples.append(time.perf_counter() - start)
+
+                stats = summarize(samples)
+                exponent = None
+                if name in previous:
+                    prev_size, prev_p50 = previous[name]
+                    exponent = math.log(stats["p50"] / prev_p50) / math.log(
+                        size / prev_size
+                    )
+                previous[name] = (size, stats["p50"])
+
+                results[f"{name}-{size_label(size)}"] = {
+                    "samples": samples,
+                    "stats": stats,
+                    "size": size,
+                    "objects_per_s": size / stats["p50"],
+                    "exponent": exponent,
+                }
+
+            # Release the inventory before generating the next size
+            del si
+
+    return results
+
+
+def report(results):
+    """Format a table of results."""
+    headers = ["case", "objects", "p50 s", "kobj/s", "exponent"]
+    rows = [
+        (
+            name,
+            res["size"],
+            f"{res['stats']['p50']:.3f}",
+            f"{res['objects_per_s'] / 1000:.1f}",
+            "" if res["exponent"] is None else f"{res['exponent']:.2f}",
+        )
+        for name, res in results.items()
+    ]
+    return format_table(headers, rows)
+
+
+def getparser():
+    """Build the argument parser."""
+    prs = ap.ArgumentParser(
+        prog="python -m benchmarks.scaling",
+        description="Time sphobjinv operations on synthetic inventories of "
+        "increasing size.",
+    )
+    prs.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help="Comma-separated inventory sizes, with optional k/M suffixes "
+        "(default %(default)s)",
+    )
+    prs.add_argument(
+        "--rounds",
+        type=int,
+        default=3,
+        help="Number of timed calls of each case at each size (default %(default)s)",
+    )
+    prs.add_argument(
+        "--suggest-max",
+        default=SUGGEST_MAX,
+        help="Largest size at which to run suggest (default %(default)s)",
+    )
+    prs.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for the synthetic inventories (default %(default)s)",
+    )
+    prs.add_argument(
+        "--cases",
+        default=",".join(CASES),
+        help="Comma-separated cases to run (default all: %(default)s)",
+    )
+    prs.add_argument("--output", type=Path, default=None, help="Save results as JSON")
+    return prs
+
+
+def main(argv=None):
+    """Run the benchmarks and report the results.
+
+    Returns the exit code.
+
+    """
+    params = getparser().parse_args(argv)
+
+    names = [c.strip() for c in params.cases.split(",") if c.strip()]
+    if unknown := set(names) - set(CASES):
+        sys.exit(f"Unknown cases: {', '.join(sorted(unknown))}")
+
+    try:
+        sizes = [parse_size(s) for s in params.sizes.split(",") if s.strip()]
+        suggest_max = parse_size(params.suggest_max)
+    except ValueError as e:
+        sys.exit(f"Invalid size: {e}")
+
+    results = run(
+        names,
+        sizes,
+        params.rounds,
+        suggest_max=suggest_max,
+        seed=params.seed,
+        progress=lambda msg: print(msg, file=sys.stderr),
+    )
+
+    print(report(results))
+
+    if params.output is not None:
+        save_results(params.output, SUITE, results)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,12 +29,111 @@ Sphinx |objects.inv| files.
 
 """
 
-from sphobjinv.data import DataFields, DataObjBytes, DataObjStr
-from sphobjinv.enum import HeaderFields, SourceTypes
-from sphobjinv.error import SphobjinvError, VersionError
-from sphobjinv.fileops import readbytes, readjson, urlwalk, writebytes, writejson
-from sphobjinv.inventory import Inventory
-from sphobjinv.re import p_data, pb_comments, pb_data, pb_project, pb_version
-from sphobjinv.schema import json_schema
+import importlib
+
 from sphobjinv.version import __version__
-from sphobjinv.zlib import compress, decompress
+
+# The names re-exported here are imported only when first accessed,
+# since several of their modules are slow to import (e.g., jsonschema, ssl),
+# and most uses of the package need only a few of them.
+#: Module providing each name re-exported at the package level
+_LAZY_ATTRS = {
+    "DataFields": "sphobjinv.data",
+    "DataObjBytes": "sphobjinv.data",
+    "DataObjStr": "sphobjinv.data",
+    "HeaderFields": "sphobjinv.enum",
+    "Phase": "sphobjinv.enum",
+    "SourceTypes": "sphobjinv.enum",
+    "SyncStatus": "sphobjinv.enum",
+    "DaemonError": "sphobjinv.error",
+    "SphobjinvError": "sphobjinv.error",
+    "VersionError": "sphobjinv.error",
+    "readbytes": "sphobjinv.fileops",
+    "readjson": "sphobjinv.fileops",
+    "urlwalk": "sphobjinv.fileops",
+    "writebytes": "sphobjinv.fileops",
+    "writejson": "sphobjinv.fileops",
+    "InventoryHeader": "sphobjinv.header",
+    "peek_header": "sphobjinv.header",
+    "ConnectionPool": "sphobjinv.http",
+    "HTTPCache": "sphobjinv.http",
+    "RequestPolicy": "sphobjinv.http",
+    "NameIndex": "sphobjinv.index",
+    "Inventory": "sphobjinv.inventory",
+    "sync": "sphobjinv.mirror",
+    "p_data": "sphobjinv.re",
+    "pb_comments": "sphobjinv.re",
+    "pb_data": "sphobjinv.re",
+    "pb_project": "sphobjinv.re",
+    "pb_version": "sphobjinv.re",
+    "Registry": "sphobjinv.registry",
+    "json_schema": "sphobjinv.schema",
+    "SuggestCache": "sphobjinv.suggest",
+    "SuggestSession": "sphobjinv.suggest",
+    "compress": "sphobjinv.zlib",
+    "decompress": "sphobjinv.zlib",
+    "iter_decompress": "sphobjinv.zlib",
+}
+
+#: Submodules imported when first accessed as attributes of the package
+_SUBMODULES = frozenset(
+    (
+        "aio",
+        "cli",
+        "daemon",
+        "data",
+        "enum",
+        "error",
+        "fileops",
+        "header",
+        "http",
+        "index",
+        "instrument",
+        "inventory",
+        "mirror",
+        "re",
+        "registry",
+        "remote",
+        "schema",
+        "stream",
+        "suggest",
+        "synth",
+        "zlib",
+    )
+)
+
+#: Names exported by ``from sphobjinv import *``. Includes the submodules
+#: that were bound on the package when its names were imported eagerly.
+__all__ = sorted(
+    {
+        *_LAZY_ATTRS,
+        "__version__",
+        "data",
+        "enum",
+        "error",
+        "fileops",
+        "inventory",
+        "re",
+        "schema",
+        "version",
+        "zlib",
+    }
+)
+
+
+def __getattr__(name):
+    """Import a re-exported name or a submodule on first access."""
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the package attributes, including those not yet imported."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | _SUBMODULES)
@@ -0,0 +1,479 @@
+r"""*asyncio helpers for retrieving* ``sphobjinv`` *inventories*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import http.client
+import io
+import urllib.error as urlerr
+import urllib.parse as urlparse
+from collections import defaultdict
+
+from sphobjinv.http import (
+    MAX_REDIRECTS,
+    REDIRECT_CODES,
+    USER_AGENT,
+    RequestPolicy,
+    _use_pool,
+    is_transient,
+    urlopen,
+)
+from sphobjinv.inventory import Inventory
+
+
+async def read_chunked(reader):
+    """Read a body sent with ``Transfer-Encoding: chunked``.
+
+    Parameters
+    ----------
+    reader
+
+        :class:`asyncio.StreamReader` -- Stream positioned at
+        the start of the body
+
+    Returns
+    -------
+    body
+
+        |bytes| -- Decoded body
+
+    """
+    parts = []
+
+    while True:
+        size_line = await reader.readline()
+        size = int(size_line.split(b";")[0].strip(), 16)
+
+        if size == 0:
+            break
+
+        parts.append(await reader.readexactly(size))
+        await reader.readline()
+
+    # Discard any trailer fields
+    while (await reader.readline()).strip():
+        pass
+
+    return b"".join(parts)
+
+
+class _TimedReader:
+    """Wrapper applying a timeout to each read from a stream."""
+
+    def __init__(self, reader, timeout):
+        """Wrap `reader`, allowing `timeout` seconds per read."""
+        self._reader = reader
+        self._timeout = timeout
+
+    async def readline(self):
+        """Read one line."""
+        return await asyncio.wait_for(self._reader.readline(), self._timeout)
+
+    async def readexactly(self, n):
+        """Read exactly `n` bytes."""
+        return await asyncio.wait_for(self._reader.readexactly(n), self._timeout)
+
+    async def read(self, n=-1):
+        """Read up to `n` bytes, or until EOF."""
+        if n >= 0:
+            return await asyncio.wait_for(self._reader.read(n), self._timeout)
+
+        # Apply the timeout to each chunk, not to the whole body
+        parts = []
+        while chunk := await asyncio.wait_for(self._reader.read(65536), self._timeout):
+            parts.append(chunk)
+        return b"".join(parts)
+
+
+async def _read_response(reader, method):
+    """Read a complete HTTP/1.x response.
+
+    Returns the status, reason, headers, and body.
+
+    """
+    status_line = await reader.readline()
+    try:
+        _, status, *reason = status_line.decode("latin-1").split(None, 2)
+        status = int(status)
+    except ValueError as e:
+        raise http.client.BadStatusLine(status_line) from e
+
+    header_lines = []
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        header_lines.append(line)
+
+    headers = http.client.parse_headers(io.BytesIO(b"".join(header_lines)))
+
+    if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+        body = b""
+    elif "chunked" in headers.get("Transfer-Encoding", "").lower():
+        body = await read_chunked(reader)
+    elif (length := headers.get("Content-Length")) is not None:
+        body = await reader.readexactly(int(length))
+    else:
+        body = await reader.read()
+
+    return status, (reason[0].strip() if reason else ""), headers, body
+
+
+async def _request_once(url, context, policy):
+    """Make a single GET request, without following redirects."""
+    parts = urlparse.urlsplit(url)
+
+    if not parts.hostname:
+        raise urlerr.URLError("no host given")
+
+    https = parts.scheme == "https"
+    port = parts.port or (443 if https else 80)
+    host_header = parts.netloc.rpartition("@")[2]
+    path = urlparse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+
+    request = (
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {host_header}\r\n"
+        f"User-Agent: {USER_AGENT}\r\n"
+        "Accept-Encoding: identity\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    ).encode("latin-1")
+
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                parts.hostname,
+                port,
+                ssl=(context if context is not None else True) if https else None,
+                server_hostname=parts.hostname if https else None,
+            ),
+            policy.connect_timeout,
+        )
+    except asyncio.TimeoutError as e:
+        raise urlerr.URLError(TimeoutError("connect timed out")) from e
+    except OSError as e:
+        raise urlerr.URLError(e) from e
+
+    if policy.read_timeout is not None:
+        reader = _TimedReader(reader, policy.read_timeout)
+
+    try:
+        writer.write(request)
+        await writer.drain()
+        return await _read_response(reader, "GET")
+    except asyncio.TimeoutError as e:
+        raise urlerr.URLError(TimeoutError("read timed out")) from e
+    except (OSError, asyncio.IncompleteReadError, http.client.HTTPException) as e:
+        raise urlerr.URLError(e) from e
+    finally:
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+
+
+async def fetch(url, *, context=None, policy=None):
+    """Download the contents of a URL without blocking the event loop.
+
+    ``http`` and ``https`` URLs are retrieved over :mod:`asyncio` streams,
+    following redirects. These streams connect directly to the server
+    and can't go through a proxy, so other URL types, and URLs for
+    which a proxy is configured (see :func:`urllib.request.getproxies`),
+    are retrieved with :func:`sphobjinv.http.urlopen` in the default
+    executor, as for a blocking download.
+
+    Parameters
+    ----------
+    url
+
+        |str| -- URL to retrieve
+
+    context
+
+        :class:`ssl.SSLContext` *(optional)* -- Context for HTTPS requests
+
+    policy
+
+        :class:`~sphobjinv.http.RequestPolicy` *(optional)* -- Timeouts,
+        retries, and hedging to apply to the retrieval. Hedged
+        requests are sent as concurrent tasks, and the slower one
+        is cancelled.
+
+    Returns
+    -------
+    body
+
+        |bytes| -- Response body
+
+    Raises
+    ------
+    urllib.error.HTTPError
+
+        If the final response has a non-2xx status
+
+    urllib.error.URLError
+
+        If the retrieval fails for another reason
+
+    """
+    policy = policy or RequestPolicy()
+
+    return await _call(
+        policy, functools.partial(_fetch_once, url, context, policy), url
+    )
+
+
+async def _fetch_once(url, context, policy):
+    """Make one attempt at downloading a URL, following redirects."""
+    loop = asyncio.get_running_loop()
+
+    for _ in range(MAX_REDIRECTS + 1):
+        if not _use_pool(url):
+            return await loop.run_in_executor(
+                None, functools.partial(_blocking_fetch, url, context, policy)
+            )
+
+        status, reason, headers, body = await _request_once(url, context, policy)
+
+        location = headers.get("Location")
+        if status not in REDIRECT_CODES or location is None:
+            break
+
+        url = urlparse.urljoin(url, location)
+    else:
+        raise urlerr.HTTPError(url, status, "Too many redirects", headers, None)
+
+    if not 200 <= status < 300:
+        raise urlerr.HTTPError(url, status, reason, headers, io.BytesIO(body))
+
+    return body
+
+
+def _blocking_fetch(url, context, policy):
+    """Retrieve a URL with the blocking machinery."""
+    with urlopen(
+        url,
+        context=context,
+        connect_timeout=policy.connect_timeout,
+        read_timeout=policy.read_timeout,
+    ) as resp:
+        return resp.read()
+
+
+async def _call(policy, coro_fxn, url):
+    """Carry out a retrieval under `policy`, as for :meth:`RequestPolicy.call`."""
+    attempt = 0
+
+    while True:
+        try:
+            if policy.hedge:
+                return await _hedged(policy, coro_fxn, url)
+            return await _timed(policy, coro_fxn, url)
+        except Exception as e:  # noqa: PIE786
+            if attempt >= policy.retries or not is_transient(e):
+                raise
+            delay = policy.backoff_delay(attempt, e)
+
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def _timed(policy, coro_fxn, url):
+    """Await `coro_fxn`, recording its duration if it succeeds."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    result = await coro_fxn()
+    policy.record(url, loop.time() - start)
+    return result
+
+
+async def _hedged(policy, coro_fxn, url):
+    """Await `coro_fxn`, starting it again if the first attempt is slow."""
+    tasks = [asyncio.ensure_future(_timed(policy, coro_fxn, url))]
+
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=policy.hedge_after(url))
+
+        if not done:
+            tasks.append(asyncio.ensure_future(_timed(policy, coro_fxn, url)))
+
+        error = None
+        pending = tasks
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = error or task.exception()
+
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def load(url, *, executor=None, policy=None):
+    """Retrieve and parse an inventory without blocking the event loop.
+
+    The download is made with :func:`fetch`, and the decompression
+    and parsing are run in `executor`.
+
+    Parameters
+    ----------
+    url
+
+        |str| -- URL of a zlib-compressed |objects.inv|
+
+    executor
+
+        :class:`concurrent.futures.Executor` *(optional)* -- Executor
+        for decompression and parsing. If |None|, the event loop's
+        default executor is used.
+
+    policy
+
+        :class:`~sphobjinv.http.RequestPolicy` *(optional)* -- Timeouts,
+        retries, and hedging to apply to the download, as for :func:`fetch`
+
+    Returns
+    -------
+    inv
+
+        |Inventory| -- Inventory retrieved from `url`
+
+    """
+    body = await fetch(url, context=Inventory._sslcontext, policy=policy)
+
+    # Run in a copy of the current context, so that instrumentation
+    # collectors registered by the caller also receive the parsing events
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(
+            contextvars.copy_context().run, Inventory._from_url_bytes, body
+        ),
+    )
+
+
+async def load_many(
+    urls,
+    *,
+    concurrency=10,
+    per_host=4,
+    executor=None,
+    return_exceptions=False,
+    policy=None,
+):
+    """Retrieve and parse many inventories concurrently.
+
+    .. code-block:: python
+
+        async for url, inv in soi.aio.load_many(urls, concurrency=20):
+            ...
+
+    Results are yielded as each inventory becomes available,
+    which is generally not the order of `urls`.
+
+    Parameters
+    ----------
+    urls
+
+        iterable of |str| -- URLs of zlib-compressed |objects.inv| files
+
+    concurrency
+
+        |int| *(optional)* -- Maximum number of inventories
+        being retrieved at any one time
+
+    per_host
+
+        |int| *(optional)* -- Maximum number of inventories
+        being retrieved from any one host at a time
+
+    executor
+
+        :class:`concurrent.futures.Executor` *(optional)* -- Executor
+        for decompression and parsing, as for :func:`load`
+
+    return_exceptions
+
+        |bool| *(optional)* -- If |True|, a failure to load an inventory
+        is yielded as the exception instance in place of the |Inventory|.
+        If |False|, the first failure is raised, and all remaining
+        retrievals are cancelled.
+
+    policy
+
+        :class:`~sphobjinv.http.RequestPolicy` *(optional)* -- Timeouts,
+        retries, and hedging to apply to each download, as for :func:`fetch`.
+        A hedged request counts toward the concurrency limits
+        only through the retrieval that it duplicates.
+
+    Yields
+    ------
+    url
+
+        |str| -- URL from `urls`
+
+    inv
+
+        |Inventory| -- Inventory retrieved from `url`,
+        or an exception if `return_exceptions` is |True|
+
+    """
+    overall = asyncio.Semaphore(concurrency)
+    hosts = defaultdict(functools.partial(asyncio.Semaphore, per_host))
+
+    async def load_one(url):
+        """Load one inventory within the concurrency limits."""
+        async with hosts[urlparse.urlsplit(url).netloc], overall:
+            try:
+                return url, await load(url, executor=executor, policy=policy)
+            except Exception as e:  # noqa: PIE786
+                if return_exceptions:
+                    return url, e
+                raise
+
+    tasks = [asyncio.ensure_future(load_one(url)) for url in urls]
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
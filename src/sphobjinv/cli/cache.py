@@ -0,0 +1,246 @@
+r"""``sphobjinv`` *module for the CLI textconv output cache*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import attr
+
+from sphobjinv.cli.parser import PrsConst
+from sphobjinv.version import __version__ as soi_version
+
+#: Extension of the files holding cached output
+CACHE_EXT = ".txt"
+
+#: Name of the file holding the running total size of the cache entries
+TOTAL_NAME = "total-size"
+
+#: Fraction of :attr:`TextconvCache.max_size` to which the cache is trimmed,
+#: so that the next trim is some stores away
+TRIM_TARGET = 0.9
+
+
+def cache_key(path):
+    """Compute the cache key for the contents of the file at `path`.
+
+    The key also covers the |soi| version, so that output cached by
+    an earlier version is not reused.
+
+    Parameters
+    ----------
+    path
+
+        |str| -- Path to the input file
+
+    Returns
+    -------
+    key
+
+        |str| or |None| -- Hex digest identifying the file contents,
+        or |None| if the file cannot be read
+
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+
+    return hashlib.sha256(soi_version.encode() + b"\0" + data).hexdigest()
+
+
+@attr.s(slots=True, frozen=True)
+class TextconvCache:
+    """On-disk cache of rendered ``sphobjinv-textconv`` output.
+
+    Each entry holds the plaintext rendering of one input file, stored
+    under the :func:`cache_key` of the input file contents. As Git passes
+    the same contents to the textconv every time it diffs a revision,
+    repeated diffs are served from the cache without any parsing.
+
+    A running total of the entry sizes is kept in the cache directory,
+    so that a store only lists the directory once the total exceeds
+    :attr:`max_size`. The least recently used entries are then removed,
+    down to a fraction :data:`TRIM_TARGET` of :attr:`max_size`.
+    Entries are marked as used by updating their modification time.
+
+    Failures to read or write the cache are ignored, so that a broken
+    cache only costs the time to render the output afresh.
+
+    """
+
+    #: |Path| -- Directory holding the cache entries
+    directory = attr.ib(converter=Path)
+
+    #: |int| -- Maximum total size in bytes of the cache entries
+    max_size = attr.ib()
+
+    def _path(self, key):
+        """Return the path of the entry for `key`."""
+        return self.directory / (key + CACHE_EXT)
+
+    def get(self, key):
+        """Retrieve the output cached for `key`.
+
+        Parameters
+        ----------
+        key
+
+            |str| -- Key from :func:`cache_key`
+
+        Returns
+        -------
+        b_str
+
+            |bytes| or |None| -- Cached plaintext, or |None| on a miss
+
+        """
+        path = self._path(key)
+
+        try:
+            b_str = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+
+        return b_str
+
+    def put(self, key, b_str):
+        """Store the output for `key`, trimming the cache if it is too large.
+
+        Parameters
+        ----------
+        key
+
+            |str| -- Key from :func:`cache_key`
+
+        b_str
+
+            |bytes| -- Plaintext to cache
+
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temporary file first, so that a concurrent
+            # textconv never reads a partial entry
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b_str)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            return
+
+        # Concurrent stores may race on the total, or a store may replace
+        # an existing entry, but each trim corrects the total again
+        total = self._read_total()
+        if total is None or total + len(b_str) > self.max_size:
+            self.trim()
+        else:
+            self._write_total(total + len(b_str))
+
+    def _read_total(self):
+        """Read the running total size of the entries, or |None| if unknown."""
+        try:
+            return int((self.directory / TOTAL_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _write_total(self, total):
+        """Record the running total size of the entries."""
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(str(total))
+            os.replace(tmp, self.directory / TOTAL_NAME)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+
+    def trim(self):
+        """Remove the least recently used entries if over :attr:`max_size`.
+
+        The entries are measured afresh, and if their total size exceeds
+        :attr:`max_size`, entries are removed until it is within
+        :data:`TRIM_TARGET` of :attr:`max_size`. The running total is
+        then updated.
+
+        """
+        entries = []
+
+        for path in self.directory.glob("*" + CACHE_EXT):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+
+        if total > self.max_size:
+            for _, size, path in sorted(entries):
+                if total <= self.max_size * TRIM_TARGET:
+                    break
+
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+
+        self._write_total(total)
+
+
+def textconv_cache(params):
+    """Return the cache requested in `params`, from argument or environment.
+
+    |None| if caching is not requested.
+
+    """
+    directory = params.get(PrsConst.CACHE) or os.environ.get(
+        PrsConst.ENV_TEXTCONV_CACHE
+    )
+
+    if not directory:
+        return None
+
+    return TextconvCache(
+        os.path.expanduser(directory), params[PrsConst.CACHE_SIZE] * 2**20
+    )
@@ -30,7 +30,8 @@ Sphinx |objects.inv| files.
 """
 
 from sphobjinv.cli.parser import PrsConst
-from sphobjinv.cli.write import write_file, write_stdout
+from sphobjinv.cli.paths import resolve_inpath
+from sphobjinv.cli.write import write_file, write_passthrough, write_stdout
 
 
 def do_convert(inv, in_path, params):
@@ -71,3 +72,66 @@ def do_convert(inv, in_path, params):
         write_stdout(inv, params)
     else:
         write_file(inv, in_path, params)
+
+
+def passthrough_inpath(params):
+    """Check whether the conversion can be carried out by streaming.
+
+    Conversions from a local plaintext or zlib-compressed file to a
+    plaintext or zlib-compressed file on disk don't need the objects
+    of the inventory, and so can be streamed by
+    :func:`do_convert_passthrough` without loading the inventory first.
+
+    Parameters
+    ----------
+    params
+
+        |dict| -- Parameters/values mapping from the active subparser
+
+    Returns
+    -------
+    in_path
+
+        |str| or |None| -- Absolute path of the input file if the
+        conversion can be streamed; otherwise, |None|
+
+    """
+    from sphobjinv.header import peek_header
+
+    if (
+        params[PrsConst.MODE] == PrsConst.JSON
+        or params[PrsConst.URL]
+        or "-" in (params[PrsConst.INFILE], params[PrsConst.OUTFILE])
+    ):
+        return None
+
+    # Anything other than a plaintext or zlib inventory, including
+    # a missing file, is left for the usual loading to handle
+    try:
+        in_path = resolve_inpath(params[PrsConst.INFILE])
+        peek_header(in_path)
+    except (OSError, ValueError):
+        return None
+
+    return in_path
+
+
+def do_convert_passthrough(in_path, params):
+    """Carry out the conversion by streaming, including writing output.
+
+    As for :func:`do_convert`, but the inventory is converted with
+    :func:`~sphobjinv.cli.write.write_passthrough` and is never loaded.
+
+    Parameters
+    ----------
+    in_path
+
+        |str| -- Absolute path of the input file,
+        from :func:`passthrough_inpath`
+
+    params
+
+        |dict| -- Parameters/values mapping from the active subparser
+
+    """
+    write_passthrough(in_path, params)
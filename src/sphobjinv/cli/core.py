@@ -31,12 +31,12 @@ Sphinx |objects.inv| files.
 
 import sys
 
-from sphobjinv.cli.convert import do_convert
-from sphobjinv.cli.load import inv_local, inv_stdin, inv_url
 from sphobjinv.cli.parser import PrsConst, getparser, getparser_textconv
-from sphobjinv.cli.suggest import do_suggest
 from sphobjinv.cli.ui import print_stderr
 
+# The modules implementing each mode are imported only once the mode is
+# known, so that startup doesn't pay for the dependencies of the others
+
 
 def main():
     r"""Handle command line invocation.
@@ -48,8 +48,12 @@ def main():
     Creates the |Inventory| from the indicated source
     and method.
 
-    Invokes :func:`~sphobjinv.cli.convert.do_convert` or
-    :func:`~sphobjinv.cli.suggest.do_suggest`
+    Invokes :func:`~sphobjinv.cli.convert.do_convert`,
+    :func:`~sphobjinv.cli.suggest.do_suggest`,
+    :func:`~sphobjinv.cli.sync.do_sync`,
+    :func:`~sphobjinv.cli.serve.do_serve_mirror`,
+    :func:`~sphobjinv.cli.generate.do_generate`, or
+    :func:`~sphobjinv.cli.daemon.do_daemon`
     per the subparser name stored in SUBPARSER_NAME.
 
     """
@@ -77,24 +81,112 @@ def main():
     # for cosmetics
     print_stderr(" ", params)
 
-    # Generate the input Inventory based on --url or stdio or file.
+    from sphobjinv.cli.timings import instrumented
+
+    with instrumented(params) as timings:
+        run(prs, params, timings)
+
+
+def run(prs, params, timings):
+    """Carry out the subcommand selected in `params`.
+
+    Calls :func:`sys.exit` when complete.
+
+    Parameters
+    ----------
+    prs
+
+        :class:`~argparse.ArgumentParser` -- Parser that produced `params`
+
+    params
+
+        |dict| -- Parameters/values mapping from the active subparser
+
+    timings
+
+        :class:`~sphobjinv.cli.timings.Timings` -- Record of the stages of
+        the run
+
+    """
+    mode = params[PrsConst.SUBPARSER_NAME][:2]
+
+    # Syncing works on many inventories, none of which is loaded here
+    if mode == PrsConst.SYNC[:2]:
+        from sphobjinv.cli.sync import do_sync
+
+        with timings.stage(PrsConst.SYNC):
+            do_sync(params)
+        print_stderr(" ", params)
+        sys.exit(0)
+
+    # Likewise, serving works on a whole directory of inventories
+    if mode == PrsConst.SERVE_MIRROR[:2]:
+        from sphobjinv.cli.serve import do_serve_mirror
+
+        with timings.stage(PrsConst.SERVE_MIRROR):
+            do_serve_mirror(params)
+        print_stderr(" ", params)
+        sys.exit(0)
+
+    # Generating creates an inventory rather than loading one
+    if mode == PrsConst.GENERATE[:2]:
+        from sphobjinv.cli.generate import do_generate
+
+        with timings.stage(PrsConst.GENERATE):
+            do_generate(params)
+        print_stderr(" ", params)
+        sys.exit(0)
+
+    # The daemon serves inventories for other invocations
+    if mode == PrsConst.DAEMON[:2]:
+        from sphobjinv.cli.daemon import do_daemon
+
+        with timings.stage(PrsConst.DAEMON):
+            do_daemon(params)
+        print_stderr(" ", params)
+        sys.exit(0)
+
+    # Conversions between plaintext and zlib files don't need the
+    # inventory to be loaded
+    if mode == PrsConst.CONVERT[:2]:
+        from sphobjinv.cli.convert import do_convert_passthrough, passthrough_inpath
+
+        if (in_path := passthrough_inpath(params)) is not None:
+            with timings.stage(PrsConst.CONVERT):
+                do_convert_passthrough(in_path, params)
+            print_stderr(" ", params)
+            sys.exit(0)
+
+    # Generate the input Inventory based on --url or stdio or file,
+    # preferring the copy held by a running daemon.
     # These inventory-load functions should call
     # sys.exit(n) internally in error-exit situations
-    if params[PrsConst.URL]:
-        if params[PrsConst.INFILE] == "-":
+    from sphobjinv.cli.load import inv_daemon, inv_local, inv_stdin, inv_url
+
+    with timings.stage("load"):
+        if params[PrsConst.URL] and params[PrsConst.INFILE] == "-":
             prs.error("argument -u/--url not allowed with '-' as infile")
-        inv, in_path = inv_url(params)
-    elif params[PrsConst.INFILE] == "-":
-        inv = inv_stdin(params)
-        in_path = None
-    else:
-        inv, in_path = inv_local(params)
+
+        inv, in_path = inv_daemon(params)
+
+        if inv is None and params[PrsConst.URL]:
+            inv, in_path = inv_url(params)
+        elif inv is None and params[PrsConst.INFILE] == "-":
+            inv = inv_stdin(params)
+        elif inv is None:
+            inv, in_path = inv_local(params)
 
     # Perform action based upon mode
-    if params[PrsConst.SUBPARSER_NAME][:2] == PrsConst.CONVERT[:2]:
-        do_convert(inv, in_path, params)
-    elif params[PrsConst.SUBPARSER_NAME][:2] == PrsConst.SUGGEST[:2]:
-        do_suggest(inv, params)
+    if mode == PrsConst.CONVERT[:2]:
+        from sphobjinv.cli.convert import do_convert
+
+        with timings.stage(PrsConst.CONVERT):
+            do_convert(inv, in_path, params)
+    elif mode == PrsConst.SUGGEST[:2]:
+        from sphobjinv.cli.suggest import do_suggest
+
+        with timings.stage(PrsConst.SUGGEST):
+            do_suggest(inv, params)
 
     # Cosmetic final blank line
     print_stderr(" ", params)
@@ -114,13 +206,35 @@ def main_textconv():
 
     # No version arg handling, using 'version' action in this parser
 
-    inv, in_path = inv_local(params)
+    # Timing and profiling can only be requested via the environment here
+    from sphobjinv.cli.cache import cache_key, textconv_cache
+    from sphobjinv.cli.load import inv_local
+    from sphobjinv.cli.timings import instrumented
+    from sphobjinv.cli.write import print_plaintext
+
+    cache = textconv_cache(params)
+
+    with instrumented(params) as timings:
+        key = b_str = None
+
+        if cache is not None:
+            with timings.stage(PrsConst.CACHE):
+                key = cache_key(params[PrsConst.INFILE])
+                if key is not None:
+                    b_str = cache.get(key)
+
+        if b_str is not None:
+            print_plaintext(b_str)
+        else:
+            with timings.stage("load"):
+                inv, _ = inv_local(params)
 
-    params[PrsConst.CONTRACT] = False
-    params[PrsConst.EXPAND] = False
-    params[PrsConst.MODE] = PrsConst.PLAIN
-    params[PrsConst.OUTFILE] = "-"
+            with timings.stage(PrsConst.CONVERT):
+                b_str = inv.data_file()
+                print_plaintext(b_str)
 
-    do_convert(inv, in_path, params)
+            if key is not None:
+                with timings.stage(PrsConst.CACHE):
+                    cache.put(key, b_str)
 
     sys.exit(0)
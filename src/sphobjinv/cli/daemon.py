@@ -0,0 +1,152 @@
+r"""``sphobjinv`` *module for the CLI inventory daemon*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import signal
+import sys
+import threading
+
+from sphobjinv.cli.parser import PrsConst
+from sphobjinv.cli.ui import err_format, print_stderr
+from sphobjinv.error import DaemonError
+from sphobjinv.remote import DaemonClient, state_path
+
+
+def do_daemon(params):
+    """Run, stop, or describe the inventory daemon.
+
+    With STOP, asks the running daemon to exit. With STATUS, prints
+    a description of the running daemon. Otherwise, starts a
+    :class:`~sphobjinv.daemon.DaemonServer` and serves until interrupted
+    or terminated, writing the state file through which other
+    invocations find it while it runs.
+
+    Calls :func:`sys.exit` internally in error-exit situations.
+
+    Parameters
+    ----------
+    params
+
+        |dict| -- Parameters/values mapping from the active subparser
+
+    """
+    client = DaemonClient.discover()
+
+    if params[PrsConst.STOP]:
+        stop_daemon(client, params)
+    elif params[PrsConst.STATUS]:
+        print_status(client, params)
+    else:
+        run_daemon(client, params)
+
+
+def stop_daemon(client, params):
+    """Ask the running daemon to exit."""
+    if client is None:
+        print_stderr("No daemon is running.", params)
+        sys.exit(1)
+
+    try:
+        client.shutdown()
+    except DaemonError:
+        # The daemon exited without removing its state file
+        state_path().unlink(missing_ok=True)
+        print_stderr("No daemon is running.", params)
+        sys.exit(1)
+
+    print_stderr("Daemon stopped.", params)
+
+
+def print_status(client, params):
+    """Print a description of the running daemon to stdout."""
+    try:
+        status = client.status() if client is not None else None
+    except DaemonError:
+        status = None
+
+    if status is None:
+        print_stderr("No daemon is running.", params)
+        sys.exit(1)
+
+    print(f"Daemon (pid {status['pid']}) at http://{client.host}:{client.port}/")
+    print(f"  Requests served: {status['requests']}")
+    print(
+        f"  Inventories held: {status['inventories']} "
+        f"({status['size'] / 2**20:.1f} MiB)"
+    )
+    print(f"  Registry hits/misses: {status['hits']}/{status['misses']}")
+
+
+def run_daemon(client, params):
+    """Serve inventories until interrupted or terminated."""
+    from sphobjinv.daemon import DaemonServer
+    from sphobjinv.registry import Registry
+
+    if client is not None:
+        try:
+            client.status()
+        except DaemonError:
+            pass
+        else:
+            print_stderr(
+                f"\nError: A daemon is already running on port {client.port}", params
+            )
+            sys.exit(1)
+
+    try:
+        server = DaemonServer(
+            ("127.0.0.1", params[PrsConst.PORT]),
+            registry=Registry(max_size=params[PrsConst.MAX_SIZE] * 2**20),
+        )
+    except OSError as e:
+        print_stderr("\nError while starting daemon:", params)
+        print_stderr(err_format(e), params)
+        sys.exit(1)
+
+    # Exit cleanly on 'kill', so that the state file is removed
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, _raise_interrupt)
+
+    with server:
+        server.write_state()
+        print_stderr(f"Daemon listening at {server.url}", params)
+        sys.stderr.flush()
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print_stderr("\nStopped.", params)
+        finally:
+            server.remove_state()
+
+
+def _raise_interrupt(signum, frame):
+    """Handle a signal by raising :exc:`KeyboardInterrupt`."""
+    raise KeyboardInterrupt
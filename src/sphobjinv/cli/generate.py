@@ -0,0 +1,78 @@
+r"""``sphobjinv`` *module for CLI synthetic inventory generation*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import os
+import sys
+
+from sphobjinv.cli.parser import PrsConst
+from sphobjinv.cli.ui import err_format, print_stderr
+
+
+def do_generate(params):
+    """Generate a synthetic inventory and write it to OUTFILE.
+
+    Objects are drawn with :mod:`sphobjinv.synth`. Plaintext and
+    zlib-compressed output is written as it is generated, so
+    inventories of any size can be created; JSON output is
+    built in memory.
+
+    Calls :func:`sys.exit` internally in error-exit situations.
+
+    Parameters
+    ----------
+    params
+
+        |dict| -- Parameters/values mapping from the active subparser
+
+    """
+    from sphobjinv.fileops import writejson
+    from sphobjinv.synth import generate, write
+
+    mode = params[PrsConst.MODE]
+    count = params[PrsConst.COUNT]
+    out_path = params[PrsConst.OUTFILE]
+    kwargs = {"seed": params[PrsConst.SEED], "project": params[PrsConst.PROJECT]}
+
+    if os.path.isfile(out_path) and not params[PrsConst.OVERWRITE]:
+        print_stderr("\nFile exists. To overwrite, supply '-o'. Exiting...", params)
+        sys.exit(1)
+
+    try:
+        if mode == PrsConst.JSON:
+            writejson(out_path, generate(count, **kwargs).json_dict())
+        else:
+            write(out_path, count, compress=(mode == PrsConst.ZLIB), **kwargs)
+    except Exception as e:
+        print_stderr("\nError during write of output file:", params)
+        print_stderr(err_format(e), params)
+        sys.exit(1)
+
+    print_stderr(f"Generated {count} objects to '{out_path}' ({mode}).", params)
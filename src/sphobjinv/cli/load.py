@@ -31,16 +31,17 @@ Sphinx |objects.inv| files.
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError
-from urllib.error import HTTPError, URLError
 
-from jsonschema.exceptions import ValidationError
-
-from sphobjinv import Inventory, VersionError, readjson, urlwalk
+from sphobjinv import DaemonError, Inventory, VersionError, readjson, urlwalk
 from sphobjinv.cli.parser import PrsConst
 from sphobjinv.cli.paths import resolve_inpath
 from sphobjinv.cli.ui import err_format, print_stderr
 
+# The URL-retrieval machinery and jsonschema are imported only by the
+# loaders needing them, to keep startup fast for local inventories
+
 
 def import_infile(in_path):
     """Attempt import of indicated file.
@@ -124,6 +125,33 @@ def inv_local(params):
     return inv, in_path
 
 
+def url_policy(params):
+    """Build the download policy given by the URL retrieval arguments.
+
+    Parameters
+    ----------
+    params
+
+        |dict| -- Parameters/values mapping from the active subparser
+
+    Returns
+    -------
+    policy
+
+        :class:`~sphobjinv.http.RequestPolicy` -- Timeouts, retries,
+        and hedging for downloads
+
+    """
+    from sphobjinv.http import RequestPolicy
+
+    return RequestPolicy(
+        connect_timeout=params[PrsConst.CONNECT_TIMEOUT],
+        read_timeout=params[PrsConst.READ_TIMEOUT],
+        retries=params[PrsConst.RETRIES],
+        hedge=params[PrsConst.HEDGE],
+    )
+
+
 def inv_url(params):
     """Create |Inventory| from file downloaded from URL.
 
@@ -133,6 +161,13 @@ def inv_url(params):
 
     If an inventory is not found at that exact URL, progressively
     searches the directory tree of the URL for |objects.inv|.
+    The candidate locations are first checked concurrently with
+    lightweight partial downloads, and are then considered in order
+    from the deepest to the shallowest, with the first one
+    yielding a valid inventory being used.
+
+    Timeouts, retries, and hedging of the downloads are applied
+    as given by the URL retrieval arguments in `params`.
 
     Injects the URL at which an inventory was found into `params`
     under the FOUND_URL key.
@@ -158,21 +193,22 @@ def inv_url(params):
         If URL is longer than 45 characters, the central portion is elided.
 
     """
-    in_file = params[PrsConst.INFILE]
+    from urllib.error import HTTPError, URLError
 
-    def attempt_inv_load(url, params):
-        """Attempt the Inventory load and report outcome."""
-        inv = None
+    from sphobjinv.http import probe
 
-        try:
-            inv = Inventory(url=url)
-        except HTTPError as e:
+    in_file = params[PrsConst.INFILE]
+    policy = url_policy(params)
+
+    def report_failure(e):
+        """Report why a URL did not yield an inventory."""
+        if isinstance(e, HTTPError):
             print_stderr(f"  ... HTTP error: {e.code} {e.reason}.", params)
-        except URLError:  # pragma: no cover
+        elif isinstance(e, URLError):  # pragma: no cover
             print_stderr("  ... error attempting to retrieve URL.", params)
-        except VersionError:  # pragma: no cover
+        elif isinstance(e, VersionError):  # pragma: no cover
             print_stderr("  ... no recognized inventory.", params)
-        except ValueError:
+        else:
             print_stderr(
                 (
                     "  ... file found but inventory could not be loaded. "
@@ -180,9 +216,25 @@ def inv_url(params):
                 ),
                 params,
             )
-        else:
-            print_stderr("  ... inventory found.", params)
 
+    def attempt_inv_load(url, probe_future=None):
+        """Attempt the Inventory load and report outcome.
+
+        If `probe_future` is provided, its result is awaited first, and the
+        load is only attempted if the probe found a likely inventory.
+
+        """
+        try:
+            if probe_future is not None and not probe_future.result():
+                print_stderr("  ... no recognized inventory.", params)
+                return None
+
+            inv = Inventory(url=url, request_policy=policy)
+        except (URLError, VersionError, ValueError) as e:
+            report_failure(e)
+            return None
+
+        print_stderr("  ... inventory found.", params)
         return inv
 
     # Disallow --url mode on local files
@@ -191,16 +243,28 @@ def inv_url(params):
         sys.exit(1)
 
     print_stderr(f"Attempting {in_file} ...", params)
-    inv = attempt_inv_load(in_file, params)
+    inv = attempt_inv_load(in_file)
+    url = in_file
 
-    if inv:
-        url = in_file
-    else:
-        for url in urlwalk(in_file):
-            print_stderr(f'Attempting "{url}" ...', params)
-            inv = attempt_inv_load(url, params)
-            if inv:
-                break
+    if not inv:
+        # Probe all candidates at once, but consider them strictly in
+        # urlwalk order, so the inventory found doesn't depend on timing
+        candidates = [u for u in urlwalk(in_file) if u != in_file]
+        executor = ThreadPoolExecutor(max_workers=PrsConst.URL_PROBE_WORKERS)
+
+        try:
+            futures = [
+                executor.submit(probe, u, context=Inventory._sslcontext, policy=policy)
+                for u in candidates
+            ]
+
+            for url, future in zip(candidates, futures):
+                print_stderr(f'Attempting "{url}" ...', params)
+                inv = attempt_inv_load(url, future)
+                if inv:
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     # Cosmetic line break
     print_stderr(" ", params)
@@ -219,6 +283,80 @@ def inv_url(params):
     return inv, ret_path
 
 
+def inv_daemon(params):
+    """Obtain the inventory at INFILE from the running daemon, if any.
+
+    Used ahead of :func:`inv_local` and :func:`inv_url`, so that
+    repeated invocations on the same inventory are answered from memory
+    by ``sphobjinv daemon``. Only the exact URL given in INFILE is tried;
+    searching the directory tree of the URL is left to :func:`inv_url`.
+
+    Nothing is done if the input is from stdin, or if the daemon
+    is disabled by the ``SPHOBJINV_NO_DAEMON`` environment variable.
+
+    Parameters
+    ----------
+    params
+
+        |dict| -- Parameters/values mapping from the active subparser
+
+    Returns
+    -------
+    inv
+
+        :class:`~sphobjinv.remote.RemoteInventory` or |None| -- Proxy for
+        the inventory held by the daemon, or |None| if the daemon is not
+        running or could not load the inventory
+
+    in_path
+
+        |str| or |None| -- As returned by :func:`inv_local`
+        or :func:`inv_url`
+
+    """
+    from sphobjinv.remote import DaemonClient, daemon_disabled
+
+    in_file = params[PrsConst.INFILE]
+
+    if in_file == "-" or daemon_disabled():
+        return None, None
+
+    client = DaemonClient.discover()
+    if client is None:
+        return None, None
+
+    if params[PrsConst.URL]:
+        if in_file.startswith("file:/"):
+            return None, None
+        source = in_file
+    else:
+        try:
+            source = resolve_inpath(in_file)
+        except Exception:
+            # Left for inv_local to report
+            return None, None
+
+    try:
+        inv = client.load(source)
+    except DaemonError:
+        return None, None
+
+    if not params[PrsConst.URL]:
+        return inv, source
+
+    print_stderr(f"Attempting {in_file} ...", params)
+    print_stderr("  ... inventory found.", params)
+    print_stderr(" ", params)
+
+    params.update({PrsConst.FOUND_URL: in_file})
+    if len(in_file) > 45:
+        ret_path = in_file[:20] + "[...]" + in_file[-20:]
+    else:  # pragma: no cover
+        ret_path = in_file
+
+    return inv, ret_path
+
+
 def inv_stdin(params):
     """Create |Inventory| from contents of stdin.
 
@@ -242,6 +380,8 @@ def inv_stdin(params):
         provided at stdin
 
     """
+    from jsonschema.exceptions import ValidationError
+
     data = sys.stdin.read()
 
     try:
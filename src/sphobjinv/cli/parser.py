@@ -55,6 +55,29 @@ class PrsConst:
     #: Short version text for textconv entrypoint
     VER_TXT_SHORT = f"sphobjinv v{__version__}"
 
+    # ### Diagnostic args for the base parser
+    #: Optional argument name for use with the base argument parser,
+    #: to print a breakdown of the time taken by each phase to stderr
+    TIMINGS = "timings"
+
+    #: Optional argument name for use with the base argument parser,
+    #: taking the path of a :mod:`cProfile` statistics file to write
+    PROFILE = "profile"
+
+    #: Environment variable that enables :data:`TIMINGS` when set
+    #: to anything other than an empty string or ``'0'``
+    ENV_TIMINGS = "SPHOBJINV_TIMINGS"
+
+    #: Environment variable giving a path for :data:`PROFILE`
+    ENV_PROFILE = "SPHOBJINV_PROFILE"
+
+    #: Optional argument name for use with the textconv argument parser,
+    #: taking the directory in which to cache rendered output
+    CACHE = "cache"
+
+    #: Environment variable giving a directory for :data:`CACHE`
+    ENV_TEXTCONV_CACHE = "SPHOBJINV_TEXTCONV_CACHE"
+
     # ### Subparser selectors and argparse param for storing subparser name
     #: Subparser name for inventory file conversions; stored in
     #: :data:`SUBPARSER_NAME` when selected
@@ -64,8 +87,25 @@ class PrsConst:
     #: :data:`SUBPARSER_NAME` when selected
     SUGGEST = "suggest"
 
+    #: Subparser name for refreshing a local mirror of inventories; stored in
+    #: :data:`SUBPARSER_NAME` when selected
+    SYNC = "sync"
+
+    #: Subparser name for serving a local mirror of inventories over HTTP;
+    #: stored in :data:`SUBPARSER_NAME` when selected
+    SERVE_MIRROR = "serve-mirror"
+
+    #: Subparser name for generating synthetic inventories; stored in
+    #: :data:`SUBPARSER_NAME` when selected
+    GENERATE = "generate"
+
+    #: Subparser name for running a daemon that holds inventories in memory;
+    #: stored in :data:`SUBPARSER_NAME` when selected
+    DAEMON = "daemon"
+
     #: Param for storing subparser name
-    #: (:data:`CONVERT` or :data:`SUGGEST`)
+    #: (:data:`CONVERT`, :data:`SUGGEST`, :data:`SYNC`, :data:`SERVE_MIRROR`,
+    #: :data:`GENERATE`, or :data:`DAEMON`)
     SUBPARSER_NAME = "sprs_name"
 
     # ### Common URL argument for both subparsers
@@ -75,6 +115,23 @@ class PrsConst:
     #: rather than a local file path
     URL = "url"
 
+    # ### Common URL retrieval arguments for both subparsers
+    #: Param for the ``--connect-timeout`` optional argument, giving the
+    #: seconds to wait for a connection when in :data:`URL` mode
+    CONNECT_TIMEOUT = "connect_timeout"
+
+    #: Param for the ``--read-timeout`` optional argument, giving the
+    #: seconds to wait for each read from a connection when in :data:`URL` mode
+    READ_TIMEOUT = "read_timeout"
+
+    #: Optional argument name for the number of retries of transient
+    #: download failures when in :data:`URL` mode
+    RETRIES = "retries"
+
+    #: Optional argument name for enabling hedged requests
+    #: when in :data:`URL` mode
+    HEDGE = "hedge"
+
     # ### Conversion subparser: 'mode' param and choices
     #: Positional argument name for use with :data:`CONVERT` subparser,
     #: indicating output file format
@@ -158,6 +215,80 @@ class PrsConst:
     #: indicating to paginate the suggest subcommand results
     PAGINATE = "paginate"
 
+    #: Optional argument name for use with the :data:`SUGGEST` subparser,
+    #: taking a time limit in seconds for the search as one required argument
+    TIMEOUT = "timeout"
+
+    #: Optional argument name for use with the :data:`SUGGEST` subparser,
+    #: taking a Sphinx domain to which to restrict the search
+    #: as one required argument
+    DOMAIN = "domain"
+
+    #: Optional argument name for use with the :data:`SUGGEST` subparser,
+    #: taking a Sphinx role to which to restrict the search
+    #: as one required argument
+    ROLE = "role"
+
+    # ### Sync subparser params
+    #: Required positional argument name for use with the :data:`SYNC`
+    #: subparser, holding the path to the JSON inventory mapping file
+    MAPPING = "mapping"
+
+    #: Required positional argument name for use with the :data:`SYNC`
+    #: subparser, holding the path to the mirror directory
+    DEST = "dest"
+
+    #: Optional argument name for use with the :data:`SYNC` subparser,
+    #: taking the maximum number of concurrent downloads
+    WORKERS = "workers"
+
+    #: Optional argument name for use with the :data:`SYNC` subparser,
+    #: indicating to download every inventory in full
+    FORCE = "force"
+
+    # ### Serve-mirror subparser params
+    #: Required positional argument name for use with the :data:`SERVE_MIRROR`
+    #: subparser, holding the path to the mirror directory
+    DIRECTORY = "directory"
+
+    #: Optional argument name for use with the :data:`SERVE_MIRROR` subparser,
+    #: taking the host address to listen on
+    HOST = "host"
+
+    #: Optional argument name for use with the :data:`SERVE_MIRROR` subparser,
+    #: taking the port to listen on
+    PORT = "port"
+
+    #: Optional argument name for use with the :data:`SERVE_MIRROR` subparser,
+    #: taking the size in MiB of the in-memory cache of inventory contents
+    CACHE_SIZE = "cache_size"
+
+    # ### Daemon subparser params
+    #: Optional argument name for use with the :data:`DAEMON` subparser,
+    #: taking the maximum total size in MiB of the inventories held
+    MAX_SIZE = "max_size"
+
+    #: Optional argument name for use with the :data:`DAEMON` subparser,
+    #: indicating to stop the running daemon
+    STOP = "stop"
+
+    #: Optional argument name for use with the :data:`DAEMON` subparser,
+    #: indicating to describe the running daemon
+    STATUS = "status"
+
+    # ### Generate subparser params
+    #: Required positional argument name for use with the :data:`GENERATE`
+    #: subparser, holding the number of objects to generate
+    COUNT = "count"
+
+    #: Optional argument name for use with the :data:`GENERATE` subparser,
+    #: taking the seed for the random numbers
+    SEED = "seed"
+
+    #: Optional argument name for use with the :data:`GENERATE` subparser,
+    #: taking the project name for the inventory header
+    PROJECT = "project"
+
     # ### Helper strings
     #: Help text for the :data:`CONVERT` subparser
     HELP_CO_PARSER = (
@@ -167,6 +298,20 @@ class PrsConst:
     #: Help text for the :data:`SUGGEST` subparser
     HELP_SU_PARSER = "Fuzzy-search intersphinx inventory for desired object(s)."
 
+    #: Help text for the :data:`SYNC` subparser
+    HELP_SY_PARSER = "Refresh a local mirror of intersphinx inventories."
+
+    #: Help text for the :data:`SERVE_MIRROR` subparser
+    HELP_SE_PARSER = "Serve a local mirror of intersphinx inventories over HTTP."
+
+    #: Help text for the :data:`GENERATE` subparser
+    HELP_GE_PARSER = "Generate a synthetic intersphinx inventory for testing."
+
+    #: Help text for the :data:`DAEMON` subparser
+    HELP_DA_PARSER = (
+        "Hold inventories in memory to answer other sphobjinv commands quickly."
+    )
+
     #: Help text for default extensions for the various conversion types
     HELP_CONV_EXTS = "'.inv/.txt/.json'"
 
@@ -183,13 +328,130 @@ class PrsConst:
     #: (unless :data:`ALL` is specified)
     SUGGEST_CONFIRM_LENGTH = 30
 
+    #: Maximum number of candidate URLs probed concurrently
+    #: when searching for an inventory in :data:`URL` mode
+    URL_PROBE_WORKERS = 8
+
     #: Default match threshold for :option:`sphobjinv suggest --thresh`
     DEF_THRESH = 75
 
+    #: Default maximum number of concurrent downloads for :data:`SYNC`
+    DEF_WORKERS = 8
+
+    #: Default host address for :data:`SERVE_MIRROR` to listen on
+    DEF_HOST = "127.0.0.1"
+
+    #: Default port for :data:`SERVE_MIRROR` to listen on
+    DEF_PORT = 8000
+
+    #: Default size in MiB of the :data:`SERVE_MIRROR` in-memory cache
+    DEF_CACHE_SIZE = 64
+
+    #: Default maximum total size in MiB of the textconv output cache
+    DEF_TEXTCONV_CACHE_SIZE = 256
+
+    #: Default port for :data:`DAEMON` to listen on (0 picks a free port)
+    DEF_DAEMON_PORT = 0
+
+    #: Default maximum total size in MiB of the inventories held by :data:`DAEMON`
+    DEF_MAX_SIZE = 256
+
+    #: Default random seed for :data:`GENERATE`
+    DEF_SEED = 0
+
+    #: Default project name for :data:`GENERATE`
+    DEF_PROJECT = "Synthetic"
+
+    #: Default connection timeout in seconds, in :data:`URL` mode
+    DEF_CONNECT_TIMEOUT = 10.0
+
+    #: Default read timeout in seconds, in :data:`URL` mode
+    DEF_READ_TIMEOUT = 30.0
+
     #: Dict key for URL at which an inventory was actually found
     FOUND_URL = "found_url"
 
 
+def _non_negative_int(value):
+    """Convert a commandline value to a non-negative |int|."""
+    number = int(value)
+    if number < 0:
+        raise ap.ArgumentTypeError(f"must be non-negative: {value}")
+    return number
+
+
+def _positive_int(value):
+    """Convert a commandline value to a positive |int|."""
+    number = int(value)
+    if number < 1:
+        raise ap.ArgumentTypeError(f"must be positive: {value}")
+    return number
+
+
+def _add_url_retrieval_args(spr, title=f"URL retrieval (with --{PrsConst.URL})"):
+    """Add the arguments controlling URL-mode downloads to a subparser."""
+    gp_url = spr.add_argument_group(title=title)
+    gp_url.add_argument(
+        "--connect-timeout",
+        dest=PrsConst.CONNECT_TIMEOUT,
+        help="Seconds to wait for a connection to the server "
+        f"(default {PrsConst.DEF_CONNECT_TIMEOUT:g})",
+        default=PrsConst.DEF_CONNECT_TIMEOUT,
+        type=float,
+        metavar="SECONDS",
+    )
+    gp_url.add_argument(
+        "--read-timeout",
+        dest=PrsConst.READ_TIMEOUT,
+        help="Seconds to wait for each read of data from the server "
+        f"(default {PrsConst.DEF_READ_TIMEOUT:g})",
+        default=PrsConst.DEF_READ_TIMEOUT,
+        type=float,
+        metavar="SECONDS",
+    )
+    gp_url.add_argument(
+        "--" + PrsConst.RETRIES,
+        help="Number of times to retry a download after a transient failure, "
+        "with exponential backoff (default 0)",
+        default=0,
+        type=_non_negative_int,
+        metavar="N",
+    )
+    gp_url.add_argument(
+        "--" + PrsConst.HEDGE,
+        help="Send a duplicate request if a download is slow, "
+        "and use whichever response arrives first",
+        action="store_true",
+    )
+
+
+def _add_diagnostic_args(prs, timings_default, profile_default):
+    """Add the timing and profiling arguments to a parser.
+
+    They are added to the base parser and to each subparser, so that they
+    can be given either before or after the subcommand. The subparsers use
+    :data:`argparse.SUPPRESS` defaults, so as not to overwrite values
+    given before the subcommand.
+
+    """
+    gp_diag = prs.add_argument_group(title="Diagnostics")
+    gp_diag.add_argument(
+        "--" + PrsConst.TIMINGS,
+        help="Print the time taken by each phase of the run to stderr "
+        f"(also enabled by setting {PrsConst.ENV_TIMINGS}=1)",
+        action="store_true",
+        default=timings_default,
+    )
+    gp_diag.add_argument(
+        "--" + PrsConst.PROFILE,
+        help="Profile the run with cProfile, writing the statistics "
+        "to PATH for use with pstats "
+        f"(also enabled by setting {PrsConst.ENV_PROFILE}=PATH)",
+        default=profile_default,
+        metavar="PATH",
+    )
+
+
 def getparser():
     """Generate argument parser.
 
@@ -213,11 +475,16 @@ def getparser():
         help="Print package version & other info",
         action="store_true",
     )
+    _add_diagnostic_args(prs, timings_default=False, profile_default=None)
 
     sprs = prs.add_subparsers(
         title="Subcommands",
         dest=PrsConst.SUBPARSER_NAME,
-        metavar=f"{{{PrsConst.CONVERT},{PrsConst.SUGGEST}}}",
+        metavar=(
+            f"{{{PrsConst.CONVERT},{PrsConst.SUGGEST},"
+            f"{PrsConst.SYNC},{PrsConst.SERVE_MIRROR},{PrsConst.GENERATE},"
+            f"{PrsConst.DAEMON}}}"
+        ),
         help="Execution mode. Type "
         "'sphobjinv [mode] -h' "
         "for more information "
@@ -246,6 +513,32 @@ def getparser():
         help=PrsConst.HELP_SU_PARSER,
         description=PrsConst.HELP_SU_PARSER,
     )
+    spr_sync = sprs.add_parser(
+        PrsConst.SYNC,
+        aliases=[PrsConst.SYNC[:2]],
+        help=PrsConst.HELP_SY_PARSER,
+        description=PrsConst.HELP_SY_PARSER,
+    )
+    spr_serve = sprs.add_parser(
+        PrsConst.SERVE_MIRROR,
+        aliases=[PrsConst.SERVE_MIRROR[:2]],
+        help=PrsConst.HELP_SE_PARSER,
+        description=PrsConst.HELP_SE_PARSER,
+    )
+    spr_generate = sprs.add_parser(
+        PrsConst.GENERATE,
+        aliases=[PrsConst.GENERATE[:2]],
+        help=PrsConst.HELP_GE_PARSER,
+        description=PrsConst.HELP_GE_PARSER,
+    )
+    spr_daemon = sprs.add_parser(
+        PrsConst.DAEMON,
+        aliases=[PrsConst.DAEMON[:2]],
+        help=PrsConst.HELP_DA_PARSER,
+        description=PrsConst.HELP_DA_PARSER
+        + " While it runs, the convert and suggest subcommands use it "
+        "for local files and URLs, unless SPHOBJINV_NO_DAEMON=1 is set.",
+    )
 
     # ### Args for conversion subparser
     spr_convert.add_argument(
@@ -326,6 +619,7 @@ def getparser():
         ),
         action="store_true",
     )
+    _add_url_retrieval_args(spr_convert)
 
     # ### Args for suggest subparser
     spr_suggest.add_argument(
@@ -375,6 +669,28 @@ def getparser():
         choices=range(101),
         metavar="{0-100}",
     )
+    spr_suggest.add_argument(
+        "--" + PrsConst.TIMEOUT,
+        help=(
+            "Stop searching after this many seconds "
+            "and report the best matches found so far."
+        ),
+        default=None,
+        type=float,
+        metavar="SECONDS",
+    )
+    spr_suggest.add_argument(
+        "-" + PrsConst.DOMAIN[0],
+        "--" + PrsConst.DOMAIN,
+        help="Only search objects in this Sphinx domain (e.g., 'py', 'std').",
+        default=None,
+    )
+    spr_suggest.add_argument(
+        "-" + PrsConst.ROLE[0],
+        "--" + PrsConst.ROLE,
+        help="Only search objects with this Sphinx role (e.g., 'function', 'label').",
+        default=None,
+    )
     spr_suggest.add_argument(
         "-" + PrsConst.URL[0],
         "--" + PrsConst.URL,
@@ -384,6 +700,155 @@ def getparser():
         ),
         action="store_true",
     )
+    _add_url_retrieval_args(spr_suggest)
+
+    # ### Args for sync subparser
+    spr_sync.add_argument(
+        PrsConst.MAPPING,
+        help="Path to JSON file mapping inventory names to the URLs of "
+        "inventories or documentation roots, or to intersphinx-style "
+        "[base_url, inventory] pairs",
+    )
+    spr_sync.add_argument(
+        PrsConst.DEST,
+        help="Mirror directory, created if necessary",
+    )
+    spr_sync.add_argument(
+        "-" + PrsConst.WORKERS[0],
+        "--" + PrsConst.WORKERS,
+        help=f"Maximum number of concurrent downloads (default {PrsConst.DEF_WORKERS})",
+        default=PrsConst.DEF_WORKERS,
+        type=_positive_int,
+        metavar="N",
+    )
+    spr_sync.add_argument(
+        "-" + PrsConst.FORCE[0],
+        "--" + PrsConst.FORCE,
+        help="Download every inventory in full, skipping conditional requests",
+        action="store_true",
+    )
+    spr_sync.add_argument(
+        "-" + PrsConst.QUIET[0],
+        "--" + PrsConst.QUIET,
+        help="Suppress printing of status messages",
+        action="store_true",
+    )
+    _add_url_retrieval_args(spr_sync, title="URL retrieval")
+
+    # ### Args for serve-mirror subparser
+    spr_serve.add_argument(
+        PrsConst.DIRECTORY,
+        help="Mirror directory; every '.inv' file within it is served",
+    )
+    spr_serve.add_argument(
+        "--" + PrsConst.HOST,
+        help=f"Host address to listen on (default {PrsConst.DEF_HOST})",
+        default=PrsConst.DEF_HOST,
+    )
+    spr_serve.add_argument(
+        "-" + PrsConst.PORT[0],
+        "--" + PrsConst.PORT,
+        help=f"Port to listen on; 0 picks a free port (default {PrsConst.DEF_PORT})",
+        default=PrsConst.DEF_PORT,
+        type=_non_negative_int,
+    )
+    spr_serve.add_argument(
+        "--" + PrsConst.CACHE_SIZE.replace("_", "-"),
+        help="Maximum size in MiB of inventory contents kept in memory "
+        f"(default {PrsConst.DEF_CACHE_SIZE})",
+        default=PrsConst.DEF_CACHE_SIZE,
+        type=_non_negative_int,
+        metavar="MB",
+    )
+    spr_serve.add_argument(
+        "-" + PrsConst.QUIET[0],
+        "--" + PrsConst.QUIET,
+        help="Suppress printing of status messages",
+        action="store_true",
+    )
+
+    # ### Args for generate subparser
+    spr_generate.add_argument(
+        PrsConst.MODE,
+        help="Output format",
+        choices=(PrsConst.ZLIB, PrsConst.PLAIN, PrsConst.JSON),
+    )
+    spr_generate.add_argument(
+        PrsConst.COUNT,
+        help="Number of objects to generate",
+        type=_non_negative_int,
+    )
+    spr_generate.add_argument(PrsConst.OUTFILE, help="Path to desired output file")
+    spr_generate.add_argument(
+        "-" + PrsConst.SEED[0],
+        "--" + PrsConst.SEED,
+        help=f"Seed for the random numbers (default {PrsConst.DEF_SEED})",
+        default=PrsConst.DEF_SEED,
+        type=int,
+    )
+    spr_generate.add_argument(
+        "--" + PrsConst.PROJECT,
+        help=f"Project name for the inventory (default '{PrsConst.DEF_PROJECT}')",
+        default=PrsConst.DEF_PROJECT,
+    )
+    spr_generate.add_argument(
+        "-" + PrsConst.OVERWRITE[0],
+        "--" + PrsConst.OVERWRITE,
+        help="Overwrite an existing output file",
+        action="store_true",
+    )
+    spr_generate.add_argument(
+        "-" + PrsConst.QUIET[0],
+        "--" + PrsConst.QUIET,
+        help="Suppress printing of status messages",
+        action="store_true",
+    )
+
+    # ### Args for daemon subparser
+    spr_daemon.add_argument(
+        "--" + PrsConst.PORT,
+        help="Port on 127.0.0.1 to listen on (default: any free port)",
+        default=PrsConst.DEF_DAEMON_PORT,
+        type=_non_negative_int,
+    )
+    spr_daemon.add_argument(
+        "--max-size",
+        dest=PrsConst.MAX_SIZE,
+        help="Maximum total size in MiB of the inventories held "
+        f"(default {PrsConst.DEF_MAX_SIZE})",
+        default=PrsConst.DEF_MAX_SIZE,
+        type=_positive_int,
+        metavar="MIB",
+    )
+    meg_control = spr_daemon.add_mutually_exclusive_group()
+    meg_control.add_argument(
+        "--" + PrsConst.STOP,
+        help="Stop the running daemon",
+        action="store_true",
+    )
+    meg_control.add_argument(
+        "--" + PrsConst.STATUS,
+        help="Describe the running daemon",
+        action="store_true",
+    )
+    spr_daemon.add_argument(
+        "-" + PrsConst.QUIET[0],
+        "--" + PrsConst.QUIET,
+        help="Suppress printing of status messages",
+        action="store_true",
+    )
+
+    for spr in (
+        spr_convert,
+        spr_suggest,
+        spr_sync,
+        spr_serve,
+        spr_generate,
+        spr_daemon,
+    ):
+        _add_diagnostic_args(
+            spr, timings_default=ap.SUPPRESS, profile_default=ap.SUPPRESS
+        )
 
     return prs
 
@@ -417,4 +882,20 @@ def getparser_textconv():
         help=("Path to file to be converted"),
     )
 
+    prs.add_argument(
+        "--" + PrsConst.CACHE,
+        help="Directory in which to cache the output for reuse, keyed by "
+        "the contents of 'infile' "
+        f"(also enabled by setting {PrsConst.ENV_TEXTCONV_CACHE}=DIR)",
+        metavar="DIR",
+    )
+    prs.add_argument(
+        "--" + PrsConst.CACHE_SIZE.replace("_", "-"),
+        help="Maximum total size in MiB of the cached output "
+        f"(default {PrsConst.DEF_TEXTCONV_CACHE_SIZE})",
+        default=PrsConst.DEF_TEXTCONV_CACHE_SIZE,
+        type=_positive_int,
+        metavar="MIB",
+    )
+
     return prs
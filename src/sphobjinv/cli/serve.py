@@ -0,0 +1,80 @@
+r"""``sphobjinv`` *module for CLI mirror-serving functionality*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import os
+import sys
+
+from sphobjinv.cli.parser import PrsConst
+from sphobjinv.cli.ui import err_format, print_stderr
+from sphobjinv.mirror import MirrorServer
+
+
+def do_serve_mirror(params):
+    """Serve a local inventory mirror over HTTP until interrupted.
+
+    Serves the inventories in DIRECTORY with a
+    :class:`~sphobjinv.mirror.MirrorServer`, printing the base URL
+    of the server once it is listening. Returns on keyboard interrupt.
+
+    Calls :func:`sys.exit` internally in error-exit situations.
+
+    Parameters
+    ----------
+    params
+
+        |dict| -- Parameters/values mapping from the active subparser
+
+    """
+    directory = params[PrsConst.DIRECTORY]
+
+    if not os.path.isdir(directory):
+        print_stderr(f"\nError: '{directory}' is not a directory", params)
+        sys.exit(1)
+
+    try:
+        server = MirrorServer(
+            directory,
+            (params[PrsConst.HOST], params[PrsConst.PORT]),
+            cache_size=params[PrsConst.CACHE_SIZE] * 2**20,
+        )
+    except OSError as e:
+        print_stderr("\nError while starting server:", params)
+        print_stderr(err_format(e), params)
+        sys.exit(1)
+
+    with server:
+        print_stderr(f"Serving {directory} at {server.url}", params)
+        sys.stderr.flush()
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print_stderr("\nStopped.", params)
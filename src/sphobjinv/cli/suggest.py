@@ -54,6 +54,13 @@ def do_suggest(inv, params):
     all of the returned results
     unless ALL is specified.
 
+    If DOMAIN and/or ROLE are specified, only objects
+    matching them are searched.
+
+    If TIMEOUT is specified, the search is cut off after
+    that many seconds, and a notice is printed if not all
+    objects could be scored in the time allowed.
+
     No QUIET option is available here, since
     a silent mode for suggestion output is nonsensical.
 
@@ -71,12 +78,22 @@ def do_suggest(inv, params):
     """
     with_index = params[PrsConst.INDEX]
     with_score = params[PrsConst.SCORE]
-    results = inv.suggest(
-        params[PrsConst.SEARCH],
-        thresh=params[PrsConst.THRESH],
-        with_index=with_index,
-        with_score=with_score,
-    )
+    timeout = params[PrsConst.TIMEOUT]
+    suggest_kwargs = {
+        "thresh": params[PrsConst.THRESH],
+        "with_index": with_index,
+        "with_score": with_score,
+        "domain": params[PrsConst.DOMAIN],
+        "role": params[PrsConst.ROLE],
+    }
+
+    if timeout is None:
+        results = inv.suggest(params[PrsConst.SEARCH], **suggest_kwargs)
+        exhaustive = True
+    else:
+        results, exhaustive = inv.suggest(
+            params[PrsConst.SEARCH], deadline=timeout, **suggest_kwargs
+        )
 
     print_divider(params)
     print_stderr_inferred_mapping(params)
@@ -90,6 +107,12 @@ def do_suggest(inv, params):
 
     print_stderr_result_count(params, results)
 
+    if not exhaustive:
+        print_stderr(
+            f"Search time limit of {timeout} s reached; results may be incomplete.\n",
+            params,
+        )
+
     if not results:
         print_stderr("\nExiting...\n", params)
         sys.exit(0)
@@ -0,0 +1,101 @@
+r"""``sphobjinv`` *module for CLI sync functionality*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import sys
+from collections import Counter
+
+from sphobjinv.cli.load import url_policy
+from sphobjinv.cli.parser import PrsConst
+from sphobjinv.cli.ui import err_format, print_stderr
+from sphobjinv.enum import SyncStatus
+from sphobjinv.mirror import read_mapping, sync
+
+
+def do_sync(params):
+    """Refresh a local inventory mirror and report the outcome.
+
+    Reads the inventory mapping at MAPPING and brings the mirror
+    directory at DEST up to date with
+    :func:`sphobjinv.mirror.sync`, printing one status line
+    per inventory followed by a summary.
+
+    Calls :func:`sys.exit` internally in error-exit situations,
+    including when any inventory fails to sync.
+
+    Parameters
+    ----------
+    params
+
+        |dict| -- Parameters/values mapping from the active subparser
+
+    """
+    try:
+        mapping = read_mapping(params[PrsConst.MAPPING])
+    except Exception as e:  # noqa: PIE786
+        print_stderr("\nError while reading mapping file:", params)
+        print_stderr(err_format(e), params)
+        sys.exit(1)
+
+    try:
+        results = sync(
+            mapping,
+            params[PrsConst.DEST],
+            workers=params[PrsConst.WORKERS],
+            policy=url_policy(params),
+            force=params[PrsConst.FORCE],
+        )
+    except (OSError, ValueError) as e:
+        print_stderr("\nError while syncing mirror:", params)
+        print_stderr(err_format(e), params)
+        sys.exit(1)
+
+    for res in results:
+        if res.status is SyncStatus.Failed:
+            print_stderr(f"{res.name}: FAILED -- {err_format(res.error)}", params)
+        else:
+            entry = res.entry
+            print_stderr(
+                f"{res.name}: {res.status.value} "
+                f"({entry['project']} {entry['version']}, {entry['count']} objects)",
+                params,
+            )
+
+    counts = Counter(res.status for res in results)
+
+    print_stderr(
+        "\n"
+        + ", ".join(f"{counts[status]} {status.value}" for status in SyncStatus)
+        + f"; mirror at {params[PrsConst.DEST]}",
+        params,
+    )
+
+    if counts[SyncStatus.Failed]:
+        sys.exit(1)
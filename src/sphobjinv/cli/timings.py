@@ -0,0 +1,180 @@
+r"""``sphobjinv`` *module for CLI timing and profiling of runs*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import contextlib
+import os
+import sys
+import time
+
+import attr
+
+from sphobjinv.cli.parser import PrsConst
+from sphobjinv.cli.ui import err_format, print_stderr
+from sphobjinv.instrument import Recorder, collect
+
+
+@attr.s(slots=True)
+class Timings:
+    """Record of the stages of a CLI run and the phases within them.
+
+    Each stage is a step of the run as a whole, such as loading the
+    inventory, and the phases are those reported by
+    :mod:`sphobjinv.instrument` while the stage was running.
+
+    """
+
+    #: :class:`~sphobjinv.instrument.Recorder` -- Collector of phase events
+    recorder = attr.ib(factory=Recorder)
+
+    #: |list| of |tuple| -- Name, duration, and phase events of each stage
+    stages = attr.ib(factory=list)
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time the stage `name` over the body of a ``with`` block."""
+        first = len(self.recorder.events)
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.stages.append(
+                (name, time.perf_counter() - start, self.recorder.events[first:])
+            )
+
+    def report(self, total):
+        """Format the breakdown of a run lasting `total` seconds.
+
+        Time within a stage not spent in any reported phase
+        is listed as ``(other)``.
+
+        """
+        lines = ["Timings (ms):"]
+
+        def add(indent, label, seconds, size=0, count=0):
+            """Add one line of the breakdown."""
+            line = f"{'  ' * indent}{label:<{24 - 2 * indent}}{seconds * 1000:>10.1f}"
+            if size:
+                line += f"{size / 1000:>12.1f} kB"
+            elif count:
+                line += " " * 15
+            if count:
+                line += f"{count:>10} objects"
+            lines.append(line)
+
+        for name, seconds, events in self.stages:
+            add(1, name, seconds)
+
+            totals = Recorder(events).totals()
+            for phase, (phase_seconds, size, count) in totals.items():
+                add(2, phase.value, phase_seconds, size, count)
+
+            if totals:
+                other = seconds - sum(t[0] for t in totals.values())
+                add(2, "(other)", max(other, 0.0))
+
+        add(1, "total", total)
+        return "\n".join(lines)
+
+
+def timings_enabled(params):
+    """Report whether :data:`~PrsConst.TIMINGS` is set by argument or environment."""
+    return bool(params.get(PrsConst.TIMINGS)) or os.environ.get(
+        PrsConst.ENV_TIMINGS, ""
+    ) not in ("", "0")
+
+
+def profile_path(params):
+    """Return the :data:`~PrsConst.PROFILE` path from argument or environment.
+
+    |None| if profiling is not requested.
+
+    """
+    return params.get(PrsConst.PROFILE) or os.environ.get(PrsConst.ENV_PROFILE) or None
+
+
+@contextlib.contextmanager
+def instrumented(params):
+    """Time and/or profile the body of a ``with`` block, as requested in `params`.
+
+    With :data:`~PrsConst.TIMINGS`, a breakdown of the stages of the run
+    and the phases within them is printed to stderr at the end of the block.
+    With :data:`~PrsConst.PROFILE`, the run is profiled with
+    :mod:`cProfile`, and the statistics are written to the given path.
+    Both are also done if the block exits via :func:`sys.exit`.
+
+    Parameters
+    ----------
+    params
+
+        |dict| -- Parameters/values mapping from the active subparser
+
+    Yields
+    ------
+    timings
+
+        :class:`Timings` -- Record to which the block adds its stages
+
+    """
+    timings = Timings()
+    show = timings_enabled(params)
+    path = profile_path(params)
+    profiler = None
+
+    with contextlib.ExitStack() as stack:
+        if show:
+            stack.enter_context(collect(timings.recorder))
+
+        if path is not None:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        start = time.perf_counter()
+
+        try:
+            yield timings
+        finally:
+            total = time.perf_counter() - start
+
+            if profiler is not None:
+                profiler.disable()
+                try:
+                    profiler.dump_stats(path)
+                except OSError as e:
+                    print_stderr(f"\nError writing profile to '{path}':", params)
+                    print_stderr(err_format(e), params)
+                else:
+                    print_stderr(f"Profile written to '{path}'.", params)
+
+            if show:
+                print(timings.report(total), file=sys.stderr)
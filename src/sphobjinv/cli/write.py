@@ -36,7 +36,9 @@ import sys
 from sphobjinv.cli.parser import PrsConst
 from sphobjinv.cli.paths import resolve_outpath
 from sphobjinv.cli.ui import err_format, print_stderr, yesno_prompt
+from sphobjinv.enum import Phase
 from sphobjinv.fileops import writebytes, writejson
+from sphobjinv.instrument import PhaseTimer
 from sphobjinv.zlib import compress
 
 
@@ -161,6 +163,22 @@ def write_json(inv, path, params):
     writejson(path, json_dict)
 
 
+def print_plaintext(b_str):
+    """Print plaintext inventory contents to stdout.
+
+    Parameters
+    ----------
+    b_str
+
+        |bytes| -- Plaintext contents, as from
+        :meth:`Inventory.data_file() <sphobjinv.inventory.Inventory.data_file>`
+
+    """
+    with PhaseTimer(Phase.Write) as timer:
+        print(b_str.decode())
+        timer.size = len(b_str) + 1
+
+
 def write_stdout(inv, params):
     r"""Write the inventory contents to stdout.
 
@@ -182,10 +200,10 @@ def write_stdout(inv, params):
 
     """
     if params[PrsConst.MODE] == PrsConst.PLAIN:
-        print(
+        print_plaintext(
             inv.data_file(
                 expand=params[PrsConst.EXPAND], contract=params[PrsConst.CONTRACT]
-            ).decode()
+            )
         )
     elif params[PrsConst.MODE] == PrsConst.JSON:
         json_dict = inv.json_dict(
@@ -195,7 +213,10 @@ def write_stdout(inv, params):
         if params.get(PrsConst.FOUND_URL, False):
             json_dict.update({"metadata": {PrsConst.URL: params[PrsConst.FOUND_URL]}})
 
-        print(json.dumps(json_dict))
+        with PhaseTimer(Phase.Write) as timer:
+            text = json.dumps(json_dict)
+            print(text)
+            timer.size = len(text) + 1
     else:
         print_stderr("Error: Only plaintext and JSON can be emitted to stdout.", params)
         sys.exit(1)
@@ -227,7 +248,117 @@ def write_file(inv, in_path, params):
 
     """
     mode = params[PrsConst.MODE]
+    out_path = confirm_outpath(in_path, params)
+
+    # Write the output file
+    try:
+        if mode == PrsConst.ZLIB:
+            write_zlib(
+                inv,
+                out_path,
+                expand=params[PrsConst.EXPAND],
+                contract=params[PrsConst.CONTRACT],
+            )
+        if mode == PrsConst.PLAIN:
+            write_plaintext(
+                inv,
+                out_path,
+                expand=params[PrsConst.EXPAND],
+                contract=params[PrsConst.CONTRACT],
+            )
+        if mode == PrsConst.JSON:
+            write_json(inv, out_path, params)
+    except Exception as e:
+        print_stderr("\nError during write of output file:", params)
+        print_stderr(err_format(e), params)
+        sys.exit(1)
+
+    # Report success, if not QUIET
+    print_completed(in_path, out_path, params)
+
+
+def write_passthrough(in_path, params):
+    r"""Convert a local inventory file to a file on disk by streaming.
+
+    The conversion is carried out by
+    :func:`sphobjinv.stream.convert_file`, without loading
+    the inventory into an |Inventory|.
+
+    The start of the input is checked before any prompt to overwrite
+    the output file, so that the prompt isn't shown for an invalid input.
+
+    Parameters
+    ----------
+    in_path
+
+        |str| -- Absolute path to a plaintext or zlib-compressed input file
+
+    params
+
+        dict -- `argparse` parameters
+
+    """
+    from zlib import error as zlib_error
+
+    from sphobjinv.stream import check_file, convert_file
+
+    def exit_parse_error(e):
+        """Report a problem with the input file, and exit."""
+        print_stderr("\nError while parsing input file:", params)
+        print_stderr(err_format(e), params)
+        sys.exit(1)
 
+    # Check the input before asking whether to overwrite the output
+    try:
+        check_file(in_path)
+    except (ValueError, zlib_error) as e:
+        exit_parse_error(e)
+
+    out_path = confirm_outpath(in_path, params)
+
+    try:
+        convert_file(
+            in_path,
+            out_path,
+            compress=params[PrsConst.MODE] == PrsConst.ZLIB,
+            expand=params[PrsConst.EXPAND],
+            contract=params[PrsConst.CONTRACT],
+        )
+    except (ValueError, zlib_error) as e:
+        # Corrupt data beyond the part checked above
+        exit_parse_error(e)
+    except Exception as e:
+        print_stderr("\nError during write of output file:", params)
+        print_stderr(err_format(e), params)
+        sys.exit(1)
+
+    print_completed(in_path, out_path, params)
+
+
+def confirm_outpath(in_path, params):
+    r"""Resolve the output file path, confirming any overwrite.
+
+    Calls :func:`sys.exit` if the output path cannot be constructed,
+    or if an existing file is not to be overwritten.
+
+    Parameters
+    ----------
+    in_path
+
+        |str| -- For a local input file, its absolute path.
+        For a URL, the (possibly truncated) URL text.
+
+    params
+
+        dict -- `argparse` parameters
+
+    Returns
+    -------
+    out_path
+
+        |str| -- Path to the output file
+
+    """
     # Work up the output location
     try:
         out_path = resolve_outpath(params[PrsConst.OUTFILE], in_path, params)
@@ -252,32 +383,14 @@ def write_file(inv, in_path, params):
                     print_stderr("\nExiting...", params)
                     sys.exit(0)
 
-    # Write the output file
-    try:
-        if mode == PrsConst.ZLIB:
-            write_zlib(
-                inv,
-                out_path,
-                expand=params[PrsConst.EXPAND],
-                contract=params[PrsConst.CONTRACT],
-            )
-        if mode == PrsConst.PLAIN:
-            write_plaintext(
-                inv,
-                out_path,
-                expand=params[PrsConst.EXPAND],
-                contract=params[PrsConst.CONTRACT],
-            )
-        if mode == PrsConst.JSON:
-            write_json(inv, out_path, params)
-    except Exception as e:
-        print_stderr("\nError during write of output file:", params)
-        print_stderr(err_format(e), params)
-        sys.exit(1)
+    return out_path
 
-    # Report success, if not QUIET
+
+def print_completed(in_path, out_path, params):
+    """Report a successful conversion, if not QUIET."""
     print_stderr(
         "Conversion completed.\n"
-        f"'{in_path if in_path else 'stdin'}' converted to '{out_path}' ({mode}).",
+        f"'{in_path if in_path else 'stdin'}' converted to '{out_path}' "
+        f"({params[PrsConst.MODE]}).",
         params,
     )
@@ -0,0 +1,410 @@
+r"""*Daemon holding* ``sphobjinv`` *inventories warm in memory*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import hmac
+import http.server
+import json
+import os
+import secrets
+import socketserver
+import tempfile
+import threading
+from pathlib import Path
+
+from sphobjinv.registry import Registry
+from sphobjinv.remote import TOKEN_HEADER, state_path
+from sphobjinv.version import __version__ as soi_version
+from sphobjinv.zlib import compress
+
+#: Conversion modes accepted by the ``/convert`` endpoint
+CONVERT_MODES = ("plain", "zlib", "json")
+
+
+class _BadRequest(Exception):
+    """Raised for a request with missing or invalid arguments."""
+
+
+class DaemonRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Request handler for :class:`DaemonServer`.
+
+    ``GET /status`` describes the daemon. The other endpoints take
+    a JSON ``POST`` body whose ``source`` is the URL or absolute path
+    of an inventory:
+
+    ``/load``
+        Loads `source`, returning its ``project``, ``version``, and ``count``
+
+    ``/suggest``
+        Runs :meth:`Inventory.suggest() <sphobjinv.inventory.Inventory.suggest>`
+        with ``name`` and the optional ``thresh``, ``with_index``,
+        ``with_score``, ``deadline``, ``domain``, and ``role``, returning
+        the ``results`` and whether the search was ``exhaustive``
+
+    ``/lookup``
+        Returns the ``objects`` named exactly ``name``, optionally
+        restricted to a ``domain`` and ``role``, each with its ``index``
+
+    ``/convert``
+        Returns the inventory in the format ``mode`` (``'plain'``,
+        ``'zlib'``, or ``'json'``), with the optional ``expand``
+        or ``contract``
+
+    ``/shutdown``
+        Stops the daemon
+
+    Every request must carry the token of the daemon in the
+    ``X-Sphobjinv-Token`` header. Failures are reported with a
+    JSON body holding an ``error`` message.
+
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "sphobjinv-daemon/" + soi_version
+
+    def do_GET(self):  # noqa: N802
+        """Serve a GET request."""
+        if not self._authorized():
+            return
+
+        if self.path != "/status":
+            self._send_error(404, f"Unknown endpoint: {self.path}")
+            return
+
+        self._send_json(self.server.status())
+
+    def do_POST(self):  # noqa: N802
+        """Serve a POST request."""
+        if not self._authorized():
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_error(400, "Request body is not valid JSON")
+            return
+
+        if self.path == "/shutdown":
+            self._send_json({})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+
+        handler = self.server.endpoints.get(self.path)
+        if handler is None:
+            self._send_error(404, f"Unknown endpoint: {self.path}")
+            return
+
+        try:
+            if not isinstance(payload, dict) or not isinstance(
+                payload.get("source"), str
+            ):
+                raise _BadRequest("A 'source' string is required")
+
+            inv = self.server.registry.get(payload["source"])
+            result = handler(inv, payload)
+        except _BadRequest as e:
+            self._send_error(400, str(e))
+        except Exception as e:  # noqa: PIE786
+            self._send_error(422, f"{type(e).__name__}: {e}")
+        else:
+            if isinstance(result, bytes):
+                self._send(result, "application/octet-stream")
+            else:
+                self._send_json(result)
+
+    def log_message(self, format, *args):  # noqa: A002
+        """Suppress per-request logging."""
+
+    def _authorized(self):
+        """Check the request token, sending a 403 response if it is wrong."""
+        token = self.headers.get(TOKEN_HEADER, "")
+
+        if hmac.compare_digest(token.encode(), self.server.token.encode()):
+            with self.server.lock:
+                self.server.requests += 1
+            return True
+
+        self._send_error(403, "Missing or incorrect token")
+        return False
+
+    def _send(self, body, content_type, status=200):
+        """Send a complete response."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, obj, status=200):
+        """Send `obj` as a JSON response."""
+        self._send(json.dumps(obj).encode(), "application/json", status)
+
+    def _send_error(self, status, message):
+        """Send an error response with a JSON `message`."""
+        self._send_json({"error": message}, status)
+
+
+def _arg(payload, key, types, default=None):
+    """Get an optional argument from a request, checking its type."""
+    value = payload.get(key, default)
+
+    if value is not None and not isinstance(value, types):
+        raise _BadRequest(f"Invalid value for {key!r}: {value!r}")
+
+    return value
+
+
+def _load(inv, payload):
+    """Describe a loaded inventory."""
+    return {"project": inv.project, "version": inv.version, "count": inv.count}
+
+
+def _suggest(inv, payload):
+    """Search an inventory."""
+    name = _arg(payload, "name", str)
+    if name is None:
+        raise _BadRequest("A 'name' string is required")
+
+    deadline = _arg(payload, "deadline", (int, float))
+    results = inv.suggest(
+        name,
+        thresh=_arg(payload, "thresh", (int, float), 50),
+        with_index=bool(payload.get("with_index")),
+        with_score=bool(payload.get("with_score")),
+        deadline=deadline,
+        domain=_arg(payload, "domain", str),
+        role=_arg(payload, "role", str),
+    )
+
+    if deadline is None:
+        return {"results": results, "exhaustive": True}
+
+    results, exhaustive = results
+    return {"results": results, "exhaustive": exhaustive}
+
+
+def _lookup(inv, payload):
+    """Find the objects with a given name."""
+    name = _arg(payload, "name", str)
+    if name is None:
+        raise _BadRequest("A 'name' string is required")
+
+    matches = inv.name_index().prefix(
+        name, domain=_arg(payload, "domain", str), role=_arg(payload, "role", str)
+    )
+
+    return {
+        "objects": [
+            {"index": idx, "object": inv.objects[idx].json_dict()}
+            for found, idx in matches
+            if found == name
+        ]
+    }
+
+
+def _convert(inv, payload):
+    """Generate an inventory in the requested format."""
+    mode = _arg(payload, "mode", str, "plain")
+    if mode not in CONVERT_MODES:
+        raise _BadRequest(f"Invalid value for 'mode': {mode!r}")
+
+    kwargs = {
+        "expand": bool(payload.get("expand")),
+        "contract": bool(payload.get("contract")),
+    }
+
+    if mode == "json":
+        return inv.json_dict(**kwargs)
+
+    b_str = inv.data_file(**kwargs)
+    return compress(b_str) if mode == "zlib" else b_str
+
+
+class DaemonServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server keeping inventories warm in memory.
+
+    Inventories are loaded on first request through a
+    :class:`~sphobjinv.registry.Registry`, which reloads local files
+    when they change and revalidates URLs. The search data built by
+    :meth:`Inventory.suggest() <sphobjinv.inventory.Inventory.suggest>`
+    is kept with each inventory, and recent search results are cached,
+    so that repeated queries take milliseconds.
+    See :class:`DaemonRequestHandler` for the endpoints, and
+    :class:`~sphobjinv.remote.DaemonClient` for a client.
+
+    The server is intended to listen only on a loopback address.
+    Requests must carry a random token, which is shared through
+    the state file written by :meth:`write_state`; it is readable
+    only by the current user.
+
+    .. code-block:: python
+
+        with soi.daemon.DaemonServer() as server:
+            server.write_state()
+            try:
+                server.serve_forever()
+            finally:
+                server.remove_state()
+
+    Parameters
+    ----------
+    address
+
+        |tuple| *(optional)* -- Host and port to listen on.
+        Port 0 picks a free port.
+
+    registry
+
+        :class:`~sphobjinv.registry.Registry` *(optional)* -- Registry
+        holding the inventories. A new one is created if not provided.
+
+    token
+
+        |str| *(optional)* -- Token required on requests.
+        A random one is generated if not provided.
+
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), *, registry=None, token=None):
+        """Bind the server and set up the registry."""
+        super().__init__(address, DaemonRequestHandler)
+
+        #: :class:`~sphobjinv.registry.Registry` -- Registry of held inventories
+        self.registry = registry if registry is not None else Registry()
+
+        #: |str| -- Token required on requests
+        self.token = token or secrets.token_urlsafe(24)
+
+        #: |int| -- Number of authorized requests received
+        self.requests = 0
+
+        #: |dict| -- Handler for each ``POST`` endpoint taking an inventory
+        self.endpoints = {
+            "/load": _load,
+            "/suggest": self._suggest_cached,
+            "/lookup": _lookup,
+            "/convert": _convert,
+        }
+
+        self.lock = threading.Lock()
+
+    def server_bind(self):
+        """Bind without a reverse DNS lookup of the host."""
+        socketserver.TCPServer.server_bind(self)
+        self.server_name, self.server_port = self.server_address[:2]
+
+    @property
+    def url(self):
+        """|str| -- Base URL of the server, with a trailing slash."""
+        return f"http://{self.server_name}:{self.server_port}/"
+
+    def status(self):
+        """Describe the daemon and the inventories it holds.
+
+        Returns
+        -------
+        status
+
+            |dict| -- See :meth:`DaemonClient.status()
+            <sphobjinv.remote.DaemonClient.status>`
+
+        """
+        return {
+            "version": soi_version,
+            "pid": os.getpid(),
+            "port": self.server_port,
+            "requests": self.requests,
+            "inventories": len(self.registry),
+            "size": self.registry.size,
+            "hits": self.registry.hits,
+            "misses": self.registry.misses,
+        }
+
+    def _suggest_cached(self, inv, payload):
+        """Search an inventory, caching the results on it."""
+        if inv.suggest_cache is None:
+            from sphobjinv.suggest import SuggestCache
+
+            with self.lock:
+                if inv.suggest_cache is None:
+                    inv.suggest_cache = SuggestCache()
+
+        return _suggest(inv, payload)
+
+    def write_state(self, path=None):
+        """Write the state file through which clients find the daemon.
+
+        The file is created readable only by the current user,
+        and replaces any existing file atomically.
+
+        Parameters
+        ----------
+        path
+
+            |str| or |Path| *(optional)* -- State file to write, in place of
+            :func:`~sphobjinv.remote.state_path`
+
+        """
+        path = Path(path or state_path())
+        state = {
+            "version": soi_version,
+            "pid": os.getpid(),
+            "host": self.server_name,
+            "port": self.server_port,
+            "token": self.token,
+        }
+
+        # mkstemp creates the file with owner-only permissions
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+
+    def remove_state(self, path=None):
+        """Remove the state file, if it was written by this server.
+
+        Parameters
+        ----------
+        path
+
+            |str| or |Path| *(optional)* -- State file to remove, in place of
+            :func:`~sphobjinv.remote.state_path`
+
+        """
+        path = Path(path or state_path())
+
+        try:
+            if json.loads(path.read_text(encoding="utf-8"))["token"] == self.token:
+                path.unlink()
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
@@ -29,6 +29,7 @@ Sphinx |objects.inv| files.
 
 """
 
+import itertools
 from abc import ABCMeta, abstractmethod
 from enum import Enum
 
@@ -89,6 +90,27 @@ def _utf8_encode(s):
         raise TypeError("Argument must be 'bytes' or 'str'")
 
 
+# Distinct stamp of the latest field change made to a data object after
+# its creation, checked by Inventory to detect stale derived lookup
+# structures cheaply. Taking stamps from an itertools.count() means
+# concurrent edits can't end up with the same stamp, as they could
+# by racing on a read-modify-write increment.
+_edit_stamps = itertools.count(1)
+_edit_stamp = 0
+
+
+def _count_edit(instance, attribute, value):
+    """Record a change to a field of an existing data object.
+
+    Used as the attrs ``on_setattr`` hook of the data object classes,
+    so it is not called during instance creation.
+
+    """
+    global _edit_stamp
+    _edit_stamp = next(_edit_stamps)
+    return value
+
+
 class SuperDataObj(metaclass=ABCMeta):
     """Abstract base superclass defining common methods &c. for data objects.
 
@@ -381,7 +403,7 @@ class SuperDataObj(metaclass=ABCMeta):
         return self.__class__(**d)
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, on_setattr=_count_edit)
 class DataObjStr(SuperDataObj):
     """:class:`SuperDataObj` subclass generating |str| object data.
 
@@ -452,7 +474,7 @@ class DataObjStr(SuperDataObj):
         return s
 
 
-@attr.s(slots=True)
+@attr.s(slots=True, on_setattr=_count_edit)
 class DataObjBytes(SuperDataObj):
     """:class:`SuperDataObj` subclass generating |bytes| object data.
 
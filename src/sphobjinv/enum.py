@@ -106,3 +106,61 @@ class HeaderFields(Enum):
     #: during import into an
     #: :class:`~sphobjinv.inventory.Inventory`.
     Metadata = "metadata"
+
+
+class SyncStatus(Enum):
+    """|Enum| for the outcome of mirroring an inventory.
+
+    See :func:`sphobjinv.mirror.sync`.
+
+    """
+
+    #: A new or changed inventory was written to the mirror.
+    Updated = "updated"
+
+    #: The mirrored copy was confirmed current.
+    Unchanged = "unchanged"
+
+    #: The inventory could not be retrieved or validated;
+    #: any existing mirrored copy was left in place.
+    Failed = "failed"
+
+
+class Phase(Enum):
+    """|Enum| for the phases of work reported to instrumentation collectors.
+
+    See :mod:`sphobjinv.instrument`.
+
+    """
+
+    #: Reading an inventory from a file or over the network.
+    Read = "read"
+
+    #: Decompressing the zlib-compressed body of an inventory.
+    Decompress = "decompress"
+
+    #: Locating the project and version in the header of an inventory.
+    HeaderParse = "header_parse"
+
+    #: Matching the data lines of a plaintext inventory.
+    LineParse = "line_parse"
+
+    #: Creating the |DataObjStr| instances for an inventory.
+    Construct = "construct"
+
+    #: Validating a |dict| against
+    #: :data:`schema.json_schema <sphobjinv.schema.json_schema>`.
+    Validate = "validate"
+
+    #: Generating a plaintext |objects.inv| or a JSON |dict|.
+    Serialize = "serialize"
+
+    #: Compressing a plaintext |objects.inv|.
+    Compress = "compress"
+
+    #: Writing an inventory to a file or to stdout.
+    Write = "write"
+
+    #: Scoring objects against a search term in
+    #: :meth:`Inventory.suggest() <sphobjinv.inventory.Inventory.suggest>`.
+    SuggestScore = "suggest_score"
@@ -43,3 +43,23 @@ class VersionError(SphobjinvError):
     """
 
     # TODO: Add SOI prefix to this class name as part of the exceptions refactor
+
+
+class DaemonError(SphobjinvError):
+    """Raised when a request to a ``sphobjinv`` daemon fails.
+
+    See :mod:`sphobjinv.remote`.
+
+    """
+
+    def __init__(self, message, status=None):
+        """Store the message and any HTTP status of the failure."""
+        super().__init__(message, status)
+
+        #: |int| or |None| -- HTTP status returned by the daemon,
+        #: or |None| if no response was received
+        self.status = status
+
+    def __str__(self):
+        """Return the message."""
+        return self.args[0]
@@ -32,6 +32,9 @@ Sphinx |objects.inv| files.
 import json
 from pathlib import Path
 
+from sphobjinv.enum import Phase
+from sphobjinv.instrument import PhaseTimer
+
 
 def readbytes(path):
     """Read file contents and return as |bytes|.
@@ -76,7 +79,8 @@ def writebytes(path, contents):
         |bytes| -- Content to be written to file.
 
     """
-    Path(path).write_bytes(contents)
+    with PhaseTimer(Phase.Write) as timer:
+        timer.size = Path(path).write_bytes(contents)
 
 
 def readjson(path):
@@ -125,7 +129,8 @@ def writejson(path, d):
         |dict| -- Data structure to serialize.
 
     """
-    Path(path).write_text(json.dumps(d))
+    with PhaseTimer(Phase.Write) as timer:
+        timer.size = Path(path).write_text(json.dumps(d))
 
 
 def urlwalk(url):
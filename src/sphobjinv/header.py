@@ -0,0 +1,269 @@
+r"""*Header-only inspection of* ``sphobjinv`` *inventories*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import os
+import re
+import urllib.error as urlerr
+from pathlib import Path
+
+import attr
+
+from sphobjinv.enum import HeaderFields
+from sphobjinv.re import pb_project, pb_version
+
+#: |bytes| leading content of every |objects.inv| file
+INVENTORY_PREAMBLE = b"# Sphinx inventory version"
+
+#: Maximum number of bytes examined for the header lines
+MAX_HEADER_BYTES = 64 * 1024
+
+_HEADER_LINES = 4
+
+_p_url = re.compile(r"^[a-z][a-z0-9+.-]*://", re.I)
+
+
+@attr.s(slots=True, frozen=True)
+class InventoryHeader:
+    """Header information of an |objects.inv| inventory.
+
+    Returned by :func:`peek_header`.
+
+    """
+
+    #: |str| project display name
+    project = attr.ib()
+
+    #: |str| project display version
+    version = attr.ib()
+
+    #: |int| inventory format version, from the first header line
+    format_version = attr.ib()
+
+    #: |bool| -- Whether the body of the inventory is zlib-compressed
+    compressed = attr.ib()
+
+    #: |int| or |None| -- Size in bytes of the inventory as stored or served,
+    #: and thus the compressed size for a zlib-compressed inventory.
+    #: |None| if a server does not report it.
+    size = attr.ib()
+
+
+def _header_end(buf):
+    """Find the end of the header lines in `buf`, or |None| if incomplete."""
+    pos = 0
+
+    for _ in range(_HEADER_LINES):
+        pos = buf.find(b"\n", pos) + 1
+        if pos == 0:
+            return None
+
+    return pos
+
+
+def _is_zlib(data):
+    """Report whether `data` starts with a zlib stream header."""
+    return len(data) >= 2 and data[0] & 0x0F == 8 and (data[0] << 8 | data[1]) % 31 == 0
+
+
+def _parse_header(buf, size):
+    """Build an :class:`InventoryHeader` from the leading bytes of an inventory."""
+    end = _header_end(buf)
+    head = buf if end is None else buf[:end]
+    first, _, rest = head.partition(b"\n")
+    fmt = first.rstrip(b"\r").removeprefix(INVENTORY_PREAMBLE)
+
+    if not first.startswith(INVENTORY_PREAMBLE) or not fmt.strip().isdigit():
+        raise ValueError("No inventory header found")
+
+    project = pb_project.search(rest)
+    version = pb_version.search(rest)
+
+    if project is None or version is None:
+        raise ValueError("Inventory header lacks project or version")
+
+    return InventoryHeader(
+        project=project.group(HeaderFields.Project.value).decode("utf-8"),
+        version=version.group(HeaderFields.Version.value).decode("utf-8"),
+        format_version=int(fmt),
+        compressed=end is not None and _is_zlib(buf[end:]),
+        size=size,
+    )
+
+
+def _read_header(read, nbytes):
+    """Accumulate the header lines from successive calls of `read`.
+
+    The first two bytes after the header are included if present,
+    to identify the start of a zlib stream.
+
+    """
+    buf = b""
+
+    while (end := _header_end(buf)) is None or len(buf) < end + 2:
+        if len(buf) >= MAX_HEADER_BYTES:
+            raise ValueError("No inventory header found")
+
+        chunk = read(nbytes)
+        if not chunk:
+            break
+
+        buf += chunk
+
+    return buf
+
+
+def _content_size(resp):
+    """Get the full size of a resource from a possibly partial response."""
+    if resp.status == 206:
+        total = resp.headers.get("Content-Range", "").rpartition("/")[2]
+        return int(total) if total.isdigit() else None
+
+    length = resp.headers.get("Content-Length")
+    return int(length) if length is not None and length.isdigit() else None
+
+
+def _peek_url(url, nbytes, context, policy):
+    """Read the header of an inventory at a URL."""
+    # Imported here so that local files never load the HTTP machinery
+    from sphobjinv.http import RequestPolicy, urlopen
+
+    policy = policy or RequestPolicy()
+
+    def attempt():
+        """Make one attempt at retrieving the header."""
+        limit = nbytes
+
+        while True:
+            with urlopen(
+                url,
+                headers={"Range": f"bytes=0-{limit - 1}"},
+                context=context,
+                connect_timeout=policy.connect_timeout,
+                read_timeout=policy.read_timeout,
+            ) as resp:
+                size = _content_size(resp)
+                partial = resp.status == 206
+                head = _read_header(resp.read, nbytes)
+
+            # A long header may need a larger range
+            end = _header_end(head)
+            complete = (end is not None and len(head) >= end + 2) or not partial
+            if complete or len(head) < limit or limit >= MAX_HEADER_BYTES:
+                return head, size
+
+            limit *= 4
+
+    try:
+        head, size = policy.call(attempt, url)
+    except urlerr.HTTPError as e:
+        # 416 Range Not Satisfiable means an empty resource
+        if e.code != 416:
+            raise
+        e.close()
+        raise ValueError("No inventory header found") from e
+
+    return _parse_header(head, size)
+
+
+def peek_header(source, *, nbytes=512, context=None, policy=None):
+    r"""Read the header of an inventory without loading it.
+
+    Only the leading lines of `source` are read, and nothing is
+    decompressed or parsed beyond them, which makes this far cheaper
+    than instantiating an |Inventory|.
+
+    .. doctest:: peek_header
+
+        >>> header = soi.peek_header("objects_attrs.inv")
+        >>> header.project, header.version, header.size
+        ('attrs', '22.1', 1434)
+        >>> header.compressed
+        True
+
+    Parameters
+    ----------
+    source
+
+        |bytes|, |str|, or |Path| -- Contents of an inventory (as |bytes|),
+        a URL (as a |str| with a scheme, such as
+        |cour|\ https://\ |/cour|), or the path to an inventory file
+
+    nbytes
+
+        |int| *(optional)* -- Number of bytes to read at a time.
+        For URLs, this is the size of the HTTP ``Range`` requested;
+        the default easily covers a typical header.
+
+    context
+
+        :class:`ssl.SSLContext` *(optional)* -- Context for HTTPS requests.
+        The |Inventory| default is used if |None|.
+
+    policy
+
+        :class:`~sphobjinv.http.RequestPolicy` *(optional)* -- Timeouts,
+        retries, and hedging to apply to URL requests
+
+    Returns
+    -------
+    header
+
+        :class:`InventoryHeader` -- Header information of `source`
+
+    Raises
+    ------
+    ValueError
+
+        If `source` does not start with an inventory header
+
+    urllib.error.URLError
+
+        If a URL cannot be retrieved
+
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return _parse_header(bytes(source[:MAX_HEADER_BYTES]), len(source))
+
+    if isinstance(source, str) and _p_url.match(source):
+        if context is None:
+            from sphobjinv.inventory import Inventory
+
+            context = Inventory._sslcontext
+
+        return _peek_url(source, nbytes, context, policy)
+
+    path = Path(source)
+
+    with path.open("rb") as f:
+        head = _read_header(f.read, nbytes)
+        size = os.fstat(f.fileno()).st_size
+
+    return _parse_header(head, size)
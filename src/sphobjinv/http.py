@@ -0,0 +1,1039 @@
+r"""*HTTP retrieval helpers for* ``sphobjinv``.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import contextvars
+import http.client
+import io
+import random
+import socket
+import threading
+import time
+import urllib.error as urlerr
+import urllib.parse as urlparse
+import urllib.request as urlrq
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import attr
+
+from sphobjinv.header import INVENTORY_PREAMBLE
+from sphobjinv.version import __version__ as soi_version
+
+#: |str| User-Agent sent with all |soi| HTTP requests
+USER_AGENT = "sphobjinv URL/" + soi_version
+
+#: HTTP status codes for which redirects are followed
+REDIRECT_CODES = frozenset((301, 302, 303, 307, 308))
+
+#: Maximum number of redirects followed for a single request
+MAX_REDIRECTS = 10
+
+#: HTTP status codes treated as transient failures, and thus retried,
+#: by :class:`RequestPolicy`
+RETRY_STATUS_CODES = frozenset((408, 429, 500, 502, 503, 504))
+
+
+class PooledResponse:
+    """File-like response from a :class:`ConnectionPool` request.
+
+    Closing the response returns its connection to the pool for reuse
+    if the body was read completely, and discards the connection otherwise.
+
+    """
+
+    def __init__(self, pool, key, conn, resp, url):
+        """Wrap an :class:`http.client.HTTPResponse` received on `conn`."""
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._resp = resp
+
+        #: |str| -- Final URL of the response, after any redirects
+        self.url = url
+
+        #: |int| -- HTTP status code
+        self.status = resp.status
+
+        #: |str| -- HTTP reason phrase
+        self.reason = resp.reason
+
+        #: :class:`email.message.Message` -- Response headers
+        self.headers = resp.headers
+
+    @property
+    def code(self):
+        """|int| -- HTTP status code, as for :func:`urllib.request.urlopen`."""
+        return self.status
+
+    def read(self, amt=None):
+        """Read up to `amt` bytes of the body, or all of it if |None|.
+
+        Failures partway through the body, such as a read timeout or
+        a dropped connection, are raised as
+        :exc:`urllib.error.URLError`, as for failures before the body.
+
+        """
+        try:
+            data = self._resp.read(amt)
+
+            # Sized reads return short at a closed connection, rather
+            # than raising as reads of the whole body do
+            if amt and not data and self._resp.length:
+                raise http.client.IncompleteRead(data, self._resp.length)
+        except (OSError, http.client.HTTPException) as e:
+            raise urlerr.URLError(e) from e
+
+        return data
+
+    def close(self):
+        """Release the connection, to the pool if it can be reused."""
+        if self._conn is None:
+            return
+
+        conn, self._conn = self._conn, None
+        reusable = self._resp.isclosed() and not self._resp.will_close
+        self._resp.close()
+
+        if reusable:
+            self._pool._release(self._key, conn)
+        else:
+            conn.close()
+
+    def __enter__(self):
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the response on exiting the runtime context."""
+        self.close()
+
+
+@attr.s(slots=True, eq=False)
+class ConnectionPool:
+    """Pool of persistent HTTP(S) connections, reused across requests.
+
+    Connections are kept per scheme, host, port, and SSL context,
+    so that repeated downloads from the same host avoid new TCP and
+    TLS handshakes. Only ``http`` and ``https`` URLs are handled.
+
+    Instances are safe to use from multiple threads; each connection
+    is used by only one request at a time.
+
+    Most users need not create a pool, since :func:`urlopen` uses
+    :data:`default_pool` unless told otherwise.
+
+    """
+
+    #: |int| -- Maximum number of idle connections kept per host
+    max_idle = attr.ib(default=4, validator=attr.validators.instance_of(int))
+
+    _idle = attr.ib(init=False, default=attr.Factory(dict), repr=False)
+    _lock = attr.ib(init=False, default=attr.Factory(threading.Lock), repr=False)
+
+    def idle_count(self):
+        """Return the total number of idle connections in the pool."""
+        with self._lock:
+            return sum(len(conns) for conns in self._idle.values())
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def urlopen(
+        self,
+        url,
+        *,
+        headers=None,
+        context=None,
+        connect_timeout=None,
+        read_timeout=None,
+    ):
+        """Make a GET request, following redirects.
+
+        Parameters
+        ----------
+        url
+
+            |str| -- ``http`` or ``https`` URL to open
+
+        headers
+
+            |dict| *(optional)* -- Request headers
+
+        context
+
+            :class:`ssl.SSLContext` *(optional)* -- Context for HTTPS requests
+
+        connect_timeout
+
+            |float| *(optional)* -- Seconds to wait for a new
+            connection to be established
+
+        read_timeout
+
+            |float| *(optional)* -- Seconds to wait for each read
+            from the connection, including that of the response
+            headers and those made through the returned response
+
+        Returns
+        -------
+        resp
+
+            :class:`PooledResponse` -- Response, with a 2xx status
+
+        Raises
+        ------
+        urllib.error.HTTPError
+
+            If the final response has a non-2xx status
+
+        urllib.error.URLError
+
+            If the request fails for another reason, including
+            when a timeout expires before the response headers arrive
+
+        """
+        timeouts = (connect_timeout, read_timeout)
+
+        for _ in range(MAX_REDIRECTS + 1):
+            resp = self._request(url, headers or {}, context, timeouts)
+
+            location = resp.headers.get("Location")
+            if resp.status not in REDIRECT_CODES or location is None:
+                break
+
+            resp.read()
+            resp.close()
+            url = urlparse.urljoin(url, location)
+
+            if urlparse.urlsplit(url).scheme not in ("http", "https"):
+                raise urlerr.URLError(f"Redirect to unsupported URL: {url}")
+        else:
+            raise urlerr.HTTPError(
+                url, resp.status, "Too many redirects", resp.headers, None
+            )
+
+        if not 200 <= resp.status < 300:
+            # Read the error body so the connection can be reused
+            with resp:
+                body = resp.read()
+
+            raise urlerr.HTTPError(
+                url, resp.status, resp.reason, resp.headers, io.BytesIO(body)
+            )
+
+        return resp
+
+    def _request(self, url, headers, context, timeouts):
+        """Send one GET request, retrying once if a reused connection is stale."""
+        parts = urlparse.urlsplit(url)
+
+        if not parts.hostname:
+            raise urlerr.URLError("no host given")
+
+        key = (parts.scheme, parts.hostname, parts.port, context)
+        path = urlparse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        connect_timeout, read_timeout = timeouts
+
+        if read_timeout is None:
+            read_timeout = socket.getdefaulttimeout()
+
+        while True:
+            conn, reused = self._acquire(key, connect_timeout)
+
+            try:
+                if conn.sock is None:
+                    conn.connect()
+
+                # Pooled connections may carry the timeout of an earlier request
+                conn.sock.settimeout(read_timeout)
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError) as e:
+                conn.close()
+                if reused:
+                    continue
+                raise urlerr.URLError(e) from e
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise urlerr.URLError(e) from e
+
+            return PooledResponse(self, key, conn, resp, url)
+
+    def _acquire(self, key, connect_timeout):
+        """Get an idle connection for `key`, or create one.
+
+        Returns the connection and whether it was reused.
+
+        """
+        with self._lock:
+            conns = self._idle.get(key)
+            if conns:
+                return conns.pop(), True
+
+        scheme, host, port, context = key
+        kwargs = {} if connect_timeout is None else {"timeout": connect_timeout}
+
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, context=context, **kwargs)
+        else:
+            conn = http.client.HTTPConnection(host, port, **kwargs)
+
+        return conn, False
+
+    def _release(self, key, conn):
+        """Return a connection with no outstanding response to the pool."""
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+
+            if len(conns) < self.max_idle:
+                conns.append(conn)
+                return
+
+        conn.close()
+
+
+#: :class:`ConnectionPool` shared by default by all |soi| downloads
+default_pool = ConnectionPool()
+
+
+def _use_pool(url):
+    """Report whether a URL can be fetched through a connection pool."""
+    parts = urlparse.urlsplit(url)
+
+    if parts.scheme not in ("http", "https"):
+        return False
+
+    # Leave proxied requests to urllib, which knows how to make them
+    proxies = urlrq.getproxies()
+    return parts.scheme not in proxies or urlrq.proxy_bypass(parts.hostname or "")
+
+
+def urlopen(
+    url,
+    *,
+    headers=None,
+    context=None,
+    pool=None,
+    connect_timeout=None,
+    read_timeout=None,
+):
+    """Open a URL for reading, with the |soi| User-Agent.
+
+    ``http`` and ``https`` URLs are fetched over persistent connections
+    from `pool`, or from :data:`default_pool` if `pool` is |None|.
+    Other URLs, and URLs for which a proxy is configured,
+    are opened with :func:`urllib.request.urlopen`.
+
+    In either case, a non-2xx response raises
+    :exc:`urllib.error.HTTPError`, and other failures raise
+    :exc:`urllib.error.URLError`.
+
+    Parameters
+    ----------
+    url
+
+        |str| -- URL to open
+
+    headers
+
+        |dict| *(optional)* -- Additional request headers
+
+    context
+
+        :class:`ssl.SSLContext` *(optional)* -- Context for HTTPS requests
+
+    pool
+
+        :class:`ConnectionPool` *(optional)* -- Pool to use for the request
+
+    connect_timeout
+
+        |float| *(optional)* -- Seconds to wait for the connection
+        to be established
+
+    read_timeout
+
+        |float| *(optional)* -- Seconds to wait for each read
+        from the connection.
+        :func:`urllib.request.urlopen` accepts only a single timeout,
+        so where it is used, the larger of the two timeouts given
+        is applied to both.
+
+    Returns
+    -------
+    resp
+
+        File-like response object, supporting use as a context manager.
+        Always close it once finished, so that its connection can be reused.
+
+        A read from the response that exceeds `read_timeout` raises
+        :exc:`TimeoutError`, wrapped in :exc:`urllib.error.URLError`
+        for ``http`` and ``https`` URLs.
+
+    """
+    headers = {"User-Agent": USER_AGENT, **(headers or {})}
+
+    if _use_pool(url):
+        return (pool or default_pool).urlopen(
+            url,
+            headers=headers,
+            context=context,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+        )
+
+    timeouts = [t for t in (connect_timeout, read_timeout) if t is not None]
+    kwargs = {"timeout": max(timeouts)} if timeouts else {}
+
+    # Caller's responsibility to ensure URL points
+    # someplace safe/sane!
+    req = urlrq.Request(url, headers=headers)
+    return urlrq.urlopen(req, context=context, **kwargs)  # noqa: S310
+
+
+def is_transient(exc):
+    """Report whether a retrieval failure is worth retrying.
+
+    Connection failures, timeouts, incomplete responses, and
+    HTTP errors with a status in :data:`RETRY_STATUS_CODES`
+    are considered transient.
+
+    Parameters
+    ----------
+    exc
+
+        :class:`BaseException` -- Exception raised by a failed retrieval
+
+    Returns
+    -------
+    transient
+
+        |bool| -- Whether a later attempt might succeed
+
+    """
+    if isinstance(exc, urlerr.HTTPError):
+        return exc.code in RETRY_STATUS_CODES
+
+    if isinstance(exc, urlerr.URLError):
+        # Failures such as malformed URLs carry a str reason
+        return isinstance(exc.reason, (OSError, http.client.HTTPException))
+
+    return isinstance(exc, (OSError, http.client.HTTPException))
+
+
+@attr.s(slots=True, eq=False)
+class LatencyTracker:
+    """Record of recent retrieval times, kept per host.
+
+    Used by :class:`RequestPolicy` to decide when to send
+    a hedged request.
+
+    Instances are safe to use from multiple threads.
+
+    """
+
+    #: |int| -- Number of most recent retrieval times kept per host
+    window = attr.ib(default=100, validator=attr.validators.instance_of(int))
+
+    _samples = attr.ib(init=False, default=attr.Factory(dict), repr=False)
+    _lock = attr.ib(init=False, default=attr.Factory(threading.Lock), repr=False)
+
+    def record(self, host, seconds):
+        """Record a retrieval from `host` that took `seconds`."""
+        with self._lock:
+            samples = self._samples.get(host)
+            if samples is None:
+                samples = self._samples[host] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def count(self, host):
+        """Return the number of retrieval times recorded for `host`."""
+        with self._lock:
+            return len(self._samples.get(host, ()))
+
+    def percentile(self, host, pct):
+        """Return the `pct`-th percentile of the retrieval times for `host`.
+
+        Returns |None| if no times are recorded for `host`.
+
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(host, ()))
+
+        if not samples:
+            return None
+
+        return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+#: :class:`LatencyTracker` shared by default by all :class:`RequestPolicy` instances
+default_latency_tracker = LatencyTracker()
+
+
+@attr.s(slots=True, frozen=True)
+class RequestPolicy:
+    """Timeout, retry, and hedging settings for inventory retrieval.
+
+    Pass an instance as the `request_policy` argument when instantiating
+    an |Inventory| from a URL:
+
+    .. code-block:: python
+
+        policy = soi.RequestPolicy(
+            connect_timeout=5, read_timeout=20, retries=3, hedge=True
+        )
+        inv = soi.Inventory(url=url, request_policy=policy)
+
+    Failed attempts are retried only if the failure is transient
+    (see :func:`is_transient`), after an exponentially increasing,
+    randomly jittered delay. A ``Retry-After`` header on the failed
+    response lengthens the delay, up to :attr:`backoff_max`.
+
+    If :attr:`hedge` is |True| and an attempt has not completed after
+    the :attr:`hedge_percentile`-th percentile of the recent retrieval
+    times from the same host, a second, identical attempt is started,
+    and the result of whichever succeeds first is used.
+    Until :attr:`hedge_min_samples` retrieval times have been recorded
+    for a host, :attr:`hedge_delay` is used instead of the percentile.
+
+    The default instance applies no timeouts and makes a single attempt.
+
+    """
+
+    #: |float| or |None| -- Seconds to wait for a connection to be established
+    connect_timeout = attr.ib(default=None)
+
+    #: |float| or |None| -- Seconds to wait for each read from the connection
+    read_timeout = attr.ib(default=None)
+
+    #: |int| -- Number of further attempts after a transient failure
+    retries = attr.ib(default=0, validator=attr.validators.instance_of(int))
+
+    #: |float| -- Delay in seconds before the first retry;
+    #: doubled for each retry thereafter
+    backoff = attr.ib(default=0.5)
+
+    #: |float| -- Maximum delay in seconds before any retry
+    backoff_max = attr.ib(default=30.0)
+
+    #: |bool| -- Whether to send hedged requests
+    hedge = attr.ib(default=False, validator=attr.validators.instance_of(bool))
+
+    #: |float| -- Percentile of recent retrieval times after which
+    #: a hedged request is sent
+    hedge_percentile = attr.ib(default=95.0)
+
+    #: |float| -- Seconds after which a hedged request is sent,
+    #: while too few retrieval times are known
+    hedge_delay = attr.ib(default=1.0)
+
+    #: |int| -- Number of retrieval times needed for a host before
+    #: :attr:`hedge_percentile` is used
+    hedge_min_samples = attr.ib(default=10)
+
+    #: :class:`LatencyTracker` -- Record of retrieval times;
+    #: :data:`default_latency_tracker` if |None|
+    tracker = attr.ib(default=None, repr=False)
+
+    @retries.validator
+    def _retries_validator(self, attribute, value):
+        """Reject negative retry counts."""
+        if value < 0:
+            raise ValueError("'retries' must be non-negative")
+
+    def call(self, fxn, url):
+        """Carry out a retrieval under this policy.
+
+        Parameters
+        ----------
+        fxn
+
+            callable -- Function performing one complete attempt
+            at the retrieval, with no arguments. It may be called
+            more than once, and concurrently from different threads.
+
+        url
+
+            |str| -- URL being retrieved. Retrieval times are
+            recorded per host.
+
+        Returns
+        -------
+        result
+
+            Return value of the first successful call of `fxn`
+
+        Raises
+        ------
+        Exception
+
+            The exception from the final attempt, if no attempt succeeds
+
+        """
+        attempt = 0
+
+        while True:
+            try:
+                if self.hedge:
+                    return self._hedged(fxn, url)
+                return self._timed(fxn, url)
+            except Exception as e:  # noqa: PIE786
+                if attempt >= self.retries or not is_transient(e):
+                    raise
+                delay = self.backoff_delay(attempt, e)
+
+            time.sleep(delay)
+            attempt += 1
+
+    def record(self, url, seconds):
+        """Record that a successful retrieval from `url` took `seconds`."""
+        tracker = self.tracker if self.tracker is not None else default_latency_tracker
+        tracker.record(urlparse.urlsplit(url).netloc, seconds)
+
+    def hedge_after(self, url):
+        """Calculate the delay in seconds before a hedged request for `url`."""
+        tracker = self.tracker if self.tracker is not None else default_latency_tracker
+        host = urlparse.urlsplit(url).netloc
+
+        if tracker.count(host) < self.hedge_min_samples:
+            return self.hedge_delay
+
+        return tracker.percentile(host, self.hedge_percentile)
+
+    def backoff_delay(self, attempt, exc):
+        """Calculate the delay in seconds before retrying a failed retrieval.
+
+        Parameters
+        ----------
+        attempt
+
+            |int| -- Zero-based number of the attempt that failed
+
+        exc
+
+            :class:`Exception` -- Exception raised by the failed attempt
+
+        Returns
+        -------
+        delay
+
+            |float| -- Seconds to wait before the next attempt
+
+        """
+        delay = self.backoff * 2**attempt * random.uniform(0.5, 1)  # noqa: S311
+
+        headers = getattr(exc, "headers", None)
+        retry_after = headers.get("Retry-After") if headers is not None else None
+
+        if retry_after is not None and retry_after.strip().isdigit():
+            delay = max(delay, float(retry_after))
+
+        return min(delay, self.backoff_max)
+
+    def _timed(self, fxn, url):
+        """Call `fxn`, recording its duration if it succeeds."""
+        start = time.monotonic()
+        result = fxn()
+        self.record(url, time.monotonic() - start)
+        return result
+
+    def _hedged(self, fxn, url):
+        """Call `fxn`, calling it again if the first call is slow.
+
+        Returns the result of the first call to succeed, or raises
+        the exception of the first call to fail if both do.
+
+        Each call runs in a copy of the caller's context, so that
+        instrumentation collectors see the work done in the workers.
+
+        """
+        executor = ThreadPoolExecutor(max_workers=2)
+
+        def submit():
+            """Start an attempt in a worker, in a copy of the caller's context."""
+            return executor.submit(
+                contextvars.copy_context().run, self._timed, fxn, url
+            )
+
+        try:
+            futures = [submit()]
+            done, _ = wait(futures, timeout=self.hedge_after(url))
+
+            if not done:
+                futures.append(submit())
+
+            error = None
+            pending = futures
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    if future.exception() is None:
+                        return future.result()
+                    error = error or future.exception()
+
+            raise error
+        finally:
+            # Any slower attempt is abandoned to finish in the background
+            executor.shutdown(wait=False)
+
+
+def probe(url, *, context=None, nbytes=256, policy=None):
+    """Cheaply check whether a URL appears to serve an |objects.inv| file.
+
+    Only the first `nbytes` of the response are requested, via an HTTP
+    ``Range`` header, and only those are read even if the server ignores
+    the header and sends the whole file.
+
+    Parameters
+    ----------
+    url
+
+        |str| -- URL to check
+
+    context
+
+        :class:`ssl.SSLContext` *(optional)* -- Context for HTTPS requests
+
+    nbytes
+
+        |int| *(optional)* -- Number of bytes to request
+
+    policy
+
+        :class:`RequestPolicy` *(optional)* -- Timeouts, retries,
+        and hedging to apply to the request
+
+    Returns
+    -------
+    found
+
+        |bool| -- Whether the response starts like an |objects.inv| file
+
+    Raises
+    ------
+    urllib.error.URLError
+
+        If the request fails other than with an empty resource
+
+    ValueError
+
+        If `url` is not a valid URL
+
+    """
+    headers = {"Range": f"bytes=0-{nbytes - 1}"}
+    policy = policy or RequestPolicy()
+
+    def read_head():
+        """Make one attempt at retrieving the leading bytes."""
+        with urlopen(
+            url,
+            headers=headers,
+            context=context,
+            connect_timeout=policy.connect_timeout,
+            read_timeout=policy.read_timeout,
+        ) as resp:
+            return resp.read(nbytes)
+
+    try:
+        head = policy.call(read_head, url)
+    except urlerr.HTTPError as e:
+        # Only the status is of interest, so release the connection now
+        e.close()
+
+        # 416 Range Not Satisfiable means an empty resource
+        if e.code == 416:
+            return False
+        raise
+
+    return head.startswith(INVENTORY_PREAMBLE)
+
+
+@attr.s(slots=True, eq=False)
+class CacheEntry:
+    """Cached response body and validators for one URL."""
+
+    #: |bytes| response body
+    body = attr.ib(repr=False)
+
+    #: |str| or |None| -- ``ETag`` response header
+    etag = attr.ib(default=None)
+
+    #: |str| or |None| -- ``Last-Modified`` response header
+    last_modified = attr.ib(default=None)
+
+    #: |float| -- :func:`time.monotonic` time at which the body
+    #: was last confirmed current
+    checked = attr.ib(default=attr.Factory(time.monotonic))
+
+    #: Parsed form of :attr:`body`, if stored by the consumer with
+    #: :meth:`HTTPCache.set_parsed`, or |None|.
+    #: Discarded whenever the body changes.
+    parsed = attr.ib(default=None, repr=False)
+
+    #: |int| -- Estimated size in bytes of :attr:`parsed`
+    parsed_size = attr.ib(default=0, repr=False)
+
+    @property
+    def size(self):
+        """|int| -- Size in bytes of the body, plus that of its parsed form."""
+        return len(self.body) + self.parsed_size
+
+    def conditional_headers(self):
+        """Build the request headers for revalidating this entry."""
+        headers = {}
+
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+@attr.s(slots=True, eq=False)
+class HTTPCache:
+    """In-memory HTTP cache for inventory downloads.
+
+    Pass an instance as the `http_cache` argument when instantiating
+    an |Inventory| from a URL, and share it among all such
+    instantiations that should benefit from it.
+
+    Responses are stored along with their ``ETag`` and
+    ``Last-Modified`` validators. Within :attr:`ttl` seconds
+    of being stored or revalidated, an entry is reused without
+    contacting the server at all. After that, a conditional request
+    is made, and the cached body (and its parsed form, if any) is
+    reused if the server reports it unchanged with a
+    ``304 Not Modified`` response.
+    Responses without either validator are cached only for the
+    duration of :attr:`ttl`.
+
+    When the total size of the cached bodies and their parsed forms
+    exceeds :attr:`max_size`, the least recently used entries are evicted.
+
+    Instances are safe to use from multiple threads.
+
+    """
+
+    #: |float| or |None| -- Number of seconds for which a cached response
+    #: is used without revalidation. |None| or zero always revalidates.
+    ttl = attr.ib(default=None)
+
+    #: |int| -- Maximum total size in bytes of the cached response bodies
+    #: and their parsed forms
+    max_size = attr.ib(default=64 * 2**20, validator=attr.validators.instance_of(int))
+
+    #: |int| -- Number of requests served without contacting the server
+    hits = attr.ib(init=False, default=0)
+
+    #: |int| -- Number of requests answered by a ``304 Not Modified``
+    revalidations = attr.ib(init=False, default=0)
+
+    #: |int| -- Number of requests requiring a full download
+    misses = attr.ib(init=False, default=0)
+
+    _entries = attr.ib(init=False, default=attr.Factory(OrderedDict), repr=False)
+    _size = attr.ib(init=False, default=0, repr=False)
+    _lock = attr.ib(init=False, default=attr.Factory(threading.Lock), repr=False)
+
+    def __len__(self):
+        """Return the number of cached URLs."""
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """|int| -- Total size in bytes of the cached bodies and parsed forms."""
+        return self._size
+
+    def clear(self):
+        """Discard all cached responses and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.revalidations = 0
+            self.misses = 0
+
+    def get(self, url, *, context=None, policy=None):
+        """Retrieve the contents of a URL, from the cache if possible.
+
+        Parameters
+        ----------
+        url
+
+            |str| -- URL to retrieve
+
+        context
+
+            :class:`ssl.SSLContext` *(optional)* -- Context for HTTPS requests
+
+        policy
+
+            :class:`RequestPolicy` *(optional)* -- Timeouts, retries,
+            and hedging to apply to any request made
+
+        Returns
+        -------
+        entry
+
+            :class:`CacheEntry` -- Entry holding the current contents of `url`.
+            The entry may be shared with other callers.
+
+        Raises
+        ------
+        urllib.error.URLError
+
+            If the retrieval fails
+
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+
+            if entry is not None:
+                self._entries.move_to_end(url)
+
+                if self._is_fresh(entry):
+                    self.hits += 1
+                    return entry
+
+        # Network access is performed without holding the lock
+        headers = {} if entry is None else entry.conditional_headers()
+        policy = policy or RequestPolicy()
+
+        def download():
+            """Make one attempt at retrieving the contents and validators."""
+            with urlopen(
+                url,
+                headers=headers,
+                context=context,
+                connect_timeout=policy.connect_timeout,
+                read_timeout=policy.read_timeout,
+            ) as resp:
+                return CacheEntry(
+                    resp.read(),
+                    etag=resp.headers.get("ETag"),
+                    last_modified=resp.headers.get("Last-Modified"),
+                )
+
+        try:
+            new_entry = policy.call(download, url)
+        except urlerr.HTTPError as e:
+            if e.code != 304 or entry is None:
+                raise
+
+            e.close()
+
+            entry.checked = time.monotonic()
+
+            with self._lock:
+                self.revalidations += 1
+
+            return entry
+
+        with self._lock:
+            self.misses += 1
+            self._store(url, new_entry)
+
+        return new_entry
+
+    def set_parsed(self, url, entry, parsed, size):
+        """Store the parsed form of a cached body.
+
+        `size` counts toward :attr:`max_size`, so storing `parsed`
+        may evict other entries, or `entry` itself if it no longer
+        fits on its own.
+
+        Parameters
+        ----------
+        url
+
+            |str| -- URL of `entry`
+
+        entry
+
+            :class:`CacheEntry` -- Entry returned by :meth:`get` for `url`
+
+        parsed
+
+            Parsed form of the body of `entry`
+
+        size
+
+            |int| -- Estimated size in bytes of `parsed`
+
+        """
+        with self._lock:
+            stored = self._entries.get(url) is entry
+            if stored:
+                self._size -= entry.size
+
+            entry.parsed = parsed
+            entry.parsed_size = size
+
+            if stored:
+                self._entries.pop(url)
+                self._store(url, entry)
+
+    def _is_fresh(self, entry):
+        """Report whether an entry is within its time-to-live."""
+        return bool(self.ttl) and time.monotonic() - entry.checked < self.ttl
+
+    def _store(self, url, entry):
+        """Add an entry, evicting as needed to respect max_size.
+
+        Must be called with the lock held.
+
+        """
+        old = self._entries.pop(url, None)
+        if old is not None:
+            self._size -= old.size
+
+        if entry.size > self.max_size:
+            return
+
+        if entry.etag is None and entry.last_modified is None and not self.ttl:
+            # Nothing to revalidate against, and never fresh
+            return
+
+        self._entries[url] = entry
+        self._size += entry.size
+
+        while self._size > self.max_size:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
@@ -0,0 +1,260 @@
+r"""*Name-prefix index for* ``sphobjinv`` *inventories*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+from bisect import bisect_left
+
+import attr
+
+
+def _prefix_upper_bound(prefix):
+    """Return the smallest |str| sorting after every |str| starting with `prefix`."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+@attr.s(slots=True, frozen=True, eq=False)
+class NameIndex:
+    r"""Sorted-array index over the names of a set of inventory objects.
+
+    Lookups are carried out by bisection into a sorted |list| of
+    object names, so the cost of a prefix query scales with the
+    number of matching entries rather than with the size of
+    the inventory, as is the case for the full scan performed by
+    :meth:`Inventory.suggest() <sphobjinv.inventory.Inventory.suggest>`.
+
+    Instances are most conveniently obtained from
+    :meth:`Inventory.name_index() <sphobjinv.inventory.Inventory.name_index>`,
+    which builds the index once and reuses it until the
+    contents of the inventory change.
+
+    An index is a snapshot: it does **not** track subsequent
+    changes to the objects it was built from.
+
+    .. doctest:: name_index
+
+        >>> inv = soi.Inventory("objects_attrs.inv")
+        >>> idx = inv.name_index()
+        >>> idx.prefix("attr.attr.f", limit=2)
+        [('attr.attr.fields', 11), ('attr.attr.fields_dict', 12)]
+        >>> idx.children("attr.attr.filters")
+        ['exclude', 'include']
+
+    """
+
+    #: |tuple| of |str| object names, in sorted order
+    names = attr.ib(repr=False)
+
+    #: |tuple| of |int| indices into the source |list| of objects,
+    #: parallel to :attr:`names`
+    indices = attr.ib(repr=False)
+
+    #: |tuple| of |str| object domains, parallel to :attr:`names`
+    domains = attr.ib(repr=False)
+
+    #: |tuple| of |str| object roles, parallel to :attr:`names`
+    roles = attr.ib(repr=False)
+
+    @classmethod
+    def from_objects(cls, objects):
+        """Build an index from a sequence of |DataObjStr|.
+
+        Parameters
+        ----------
+        objects
+
+            |list| of |DataObjStr| -- Objects to index, typically
+            :attr:`Inventory.objects <sphobjinv.inventory.Inventory.objects>`
+
+        Returns
+        -------
+        idx
+
+            :class:`NameIndex` -- New index over `objects`
+
+        """
+        entries = sorted((o.name, i, o.domain, o.role) for i, o in enumerate(objects))
+
+        if not entries:
+            return cls(names=(), indices=(), domains=(), roles=())
+
+        names, indices, domains, roles = zip(*entries)
+        return cls(names=names, indices=indices, domains=domains, roles=roles)
+
+    def __len__(self):
+        """Return the number of indexed objects."""
+        return len(self.names)
+
+    def _matches(self, pos, domain, role):
+        """Report whether the entry at `pos` satisfies the domain/role filters."""
+        return (domain is None or self.domains[pos] == domain) and (
+            role is None or self.roles[pos] == role
+        )
+
+    def prefix(self, prefix, *, limit=None, domain=None, role=None):
+        r"""Enumerate indexed objects whose names start with `prefix`.
+
+        Results are ordered by name, and then by position within
+        the source |list| of objects.
+
+        Parameters
+        ----------
+        prefix
+
+            |str| -- Leading portion of the object names to match.
+            An empty |str| matches every object.
+
+        limit
+
+            |int| *(optional)* -- Maximum number of results to return
+
+        domain
+
+            |str| *(optional)* -- Only return objects in this Sphinx domain
+
+        role
+
+            |str| *(optional)* -- Only return objects with this Sphinx role
+
+        Returns
+        -------
+        res_l
+
+            |list| of |tuple| -- Matching objects, as
+            |cour|\ (name, index)\ |/cour| pairs
+
+        """
+        names = self.names
+        pos = bisect_left(names, prefix)
+        res_l = []
+
+        while pos < len(names) and names[pos].startswith(prefix):
+            if limit is not None and len(res_l) >= limit:
+                break
+
+            if self._matches(pos, domain, role):
+                res_l.append((names[pos], self.indices[pos]))
+
+            pos += 1
+
+        return res_l
+
+    def children(self, parent, *, sep=".", limit=None, domain=None, role=None):
+        """List the distinct name segments immediately below `parent`.
+
+        For example, with `sep` as ``'.'``, the children of
+        ``'numpy.linalg'`` include ``'norm'`` if an object
+        named ``'numpy.linalg.norm'`` is present, and also
+        if only ``'numpy.linalg.norm.foo'`` is present.
+
+        A trailing `sep` on `parent` is ignored, so that
+        partially typed names such as ``'numpy.linalg.'``
+        can be passed directly.
+        An empty `parent` lists the top-level segments.
+
+        Parameters
+        ----------
+        parent
+
+            |str| -- Dotted name whose children are to be listed
+
+        sep
+
+            |str| *(optional)* -- Segment separator (default ``'.'``)
+
+        limit
+
+            |int| *(optional)* -- Maximum number of children to return
+
+        domain
+
+            |str| *(optional)* -- Only consider objects in this Sphinx domain
+
+        role
+
+            |str| *(optional)* -- Only consider objects with this Sphinx role
+
+        Returns
+        -------
+        child_l
+
+            |list| of |str| -- Child segments, in sorted order
+
+        """
+        if not sep:
+            raise ValueError("'sep' must be a non-empty string")
+
+        if parent.endswith(sep):
+            parent = parent[: -len(sep)]
+
+        base = parent + sep if parent else ""
+        base_len = len(base)
+        names = self.names
+        filtered = domain is not None or role is not None
+
+        if limit is not None and limit < 1:
+            return []
+
+        pos = bisect_left(names, base)
+        seen = set()
+
+        # Largest segment that can still be returned, once `limit` are found
+        last = None
+
+        while pos < len(names) and names[pos].startswith(base):
+            # Names are sorted by their full text, so a later name gives a
+            # segment smaller than one already found only if it's a proper
+            # prefix of it (e.g., 'b' from 'b.z', after 'b-c' from 'b-c').
+            # Once the first character is past that of `last`, no such
+            # segment can follow.
+            rest = names[pos][base_len:]
+            if last is not None and rest[:1] > last[:1]:
+                break
+
+            segment, found_sep, _ = rest.partition(sep)
+
+            if not segment or (filtered and not self._matches(pos, domain, role)):
+                pos += 1
+                continue
+
+            if last is None or segment < last:
+                seen.add(segment)
+
+                if limit is not None and len(seen) >= limit:
+                    last = sorted(seen)[limit - 1]
+
+            if found_sep and not filtered:
+                # Everything else below this child can be skipped in one step
+                pos = bisect_left(
+                    names, _prefix_upper_bound(base + segment + sep), lo=pos
+                )
+            else:
+                pos += 1
+
+        return sorted(seen)[:limit]
@@ -0,0 +1,264 @@
+r"""*Phase-timing instrumentation for* ``sphobjinv``.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import contextlib
+import contextvars
+import time
+from collections import defaultdict
+
+import attr
+
+#: Callables receiving the events of the current context
+_collectors = contextvars.ContextVar("sphobjinv_collectors", default=())
+
+
+@attr.s(slots=True, frozen=True)
+class PhaseEvent:
+    """Report of the completion of one phase of work.
+
+    Passed to each collector registered with :func:`collect`.
+
+    """
+
+    #: :class:`~sphobjinv.enum.Phase` -- Phase of work completed
+    phase = attr.ib()
+
+    #: |float| -- Wall-clock duration of the phase, in seconds
+    seconds = attr.ib()
+
+    #: |int| or |None| -- Size in bytes of the data produced by the phase,
+    #: or consumed if it produces objects; |None| if not applicable
+    size = attr.ib(default=None)
+
+    #: |int| or |None| -- Number of inventory objects handled
+    #: by the phase; |None| if not applicable
+    count = attr.ib(default=None)
+
+
+def enabled():
+    """Report whether any collector is registered in the current context.
+
+    Returns
+    -------
+    flag
+
+        |bool| -- |True| if events are being collected
+
+    """
+    return bool(_collectors.get())
+
+
+def emit(phase, seconds, *, size=None, count=None):
+    """Send a :class:`PhaseEvent` to the collectors of the current context.
+
+    Does nothing if no collectors are registered.
+
+    Parameters
+    ----------
+    phase
+
+        :class:`~sphobjinv.enum.Phase` -- Phase of work completed
+
+    seconds
+
+        |float| -- Duration of the phase
+
+    size
+
+        |int| *(optional)* -- Size of the data handled, in bytes
+
+    count
+
+        |int| *(optional)* -- Number of objects handled
+
+    """
+    collectors = _collectors.get()
+
+    if collectors:
+        event = PhaseEvent(phase=phase, seconds=seconds, size=size, count=count)
+        for collector in collectors:
+            collector(event)
+
+
+class PhaseTimer:
+    """Context manager timing a phase of work.
+
+    The :attr:`size` and :attr:`count` of the event can be set on the
+    instance within the ``with`` block. The event is emitted only if
+    the block completes without an exception.
+
+    If no collectors are registered on entry, no time is measured
+    and nothing is emitted.
+
+    .. code-block:: python
+
+        with PhaseTimer(Phase.Decompress) as t:
+            b_plain = decompress(b_str)
+            t.size = len(b_plain)
+
+    """
+
+    __slots__ = ("phase", "size", "count", "_start")
+
+    def __init__(self, phase):
+        """Prepare to time `phase`."""
+        self.phase = phase
+        self.size = None
+        self.count = None
+        self._start = None
+
+    def __enter__(self):
+        """Start timing, if events are being collected."""
+        if _collectors.get():
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        """Emit the event, if timing and no exception was raised."""
+        if self._start is not None and exc_type is None:
+            emit(
+                self.phase,
+                time.perf_counter() - self._start,
+                size=self.size,
+                count=self.count,
+            )
+
+
+class _ChunkTimer:
+    """Iterator wrapper totalling the time spent and bytes obtained."""
+
+    __slots__ = ("_it", "seconds", "size")
+
+    def __init__(self, chunks):
+        """Wrap the iterable of |bytes| `chunks`."""
+        self._it = iter(chunks)
+        self.seconds = 0.0
+        self.size = 0
+
+    def __iter__(self):
+        """Return the wrapper itself."""
+        return self
+
+    def __next__(self):
+        """Obtain the next chunk, adding to the totals."""
+        start = time.perf_counter()
+        try:
+            chunk = next(self._it)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+        self.size += len(chunk)
+        return chunk
+
+
+@contextlib.contextmanager
+def collect(collector):
+    r"""Register a collector of :class:`PhaseEvent`\ s within a ``with`` block.
+
+    Within the block, `collector` is called with each :class:`PhaseEvent`
+    emitted in the current context, in the thread doing the work.
+    Collectors nest: an event goes to every collector registered
+    in the enclosing blocks.
+
+    Registration is scoped with :mod:`contextvars`, so it covers the
+    current thread and any :mod:`asyncio` tasks created within the block,
+    but not other threads. Events from concurrent loads can thus be
+    told apart by collecting each load in its own task or thread.
+
+    .. code-block:: python
+
+        rec = soi.instrument.Recorder()
+        with soi.instrument.collect(rec):
+            inv = soi.Inventory(url=url)
+
+        for phase, (seconds, size, count) in rec.totals().items():
+            metrics.observe(phase.value, seconds)
+
+    Each phase of an import is reported when it completes, including
+    those of unsuccessful attempts made while determining the type of
+    a source passed to |Inventory| without a keyword.
+
+    Parameters
+    ----------
+    collector
+
+        callable -- Called with each :class:`PhaseEvent`
+
+    Yields
+    ------
+    collector
+
+        callable -- `collector`, as passed
+
+    """
+    token = _collectors.set(_collectors.get() + (collector,))
+    try:
+        yield collector
+    finally:
+        _collectors.reset(token)
+
+
+@attr.s(slots=True)
+class Recorder:
+    """Collector storing the events it receives.
+
+    Pass an instance to :func:`collect`.
+
+    """
+
+    #: |list| of :class:`PhaseEvent` -- Events received, in order
+    events = attr.ib(factory=list)
+
+    def __call__(self, event):
+        """Store `event`."""
+        self.events.append(event)
+
+    def totals(self):
+        """Sum the recorded events by phase.
+
+        Returns
+        -------
+        totals
+
+            |dict| -- |tuple| of the total seconds, size, and count
+            for each :class:`~sphobjinv.enum.Phase` recorded, in the order
+            first recorded. Sizes and counts not reported are taken as zero.
+
+        """
+        totals = defaultdict(lambda: [0.0, 0, 0])
+
+        for event in self.events:
+            total = totals[event.phase]
+            total[0] += event.seconds
+            total[1] += event.size or 0
+            total[2] += event.count or 0
+
+        return {phase: tuple(total) for phase, total in totals.items()}
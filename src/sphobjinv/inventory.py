@@ -29,23 +29,148 @@ Sphinx |objects.inv| files.
 
 """
 
-import re
-import ssl
-import urllib.request as urlrq
+import itertools
+import sys
+import time
 from zlib import error as zlib_error
 
 import attr
-import certifi
-import jsonschema
-from jsonschema.exceptions import ValidationError
 
+from sphobjinv import data as _data
 from sphobjinv.data import DataObjStr, _utf8_encode
-from sphobjinv.enum import HeaderFields, SourceTypes
+from sphobjinv.enum import HeaderFields, Phase, SourceTypes
 from sphobjinv.fileops import readbytes
-from sphobjinv.re import pb_data, pb_project, pb_version
+from sphobjinv.index import NameIndex
+from sphobjinv.instrument import PhaseTimer, _ChunkTimer, emit, enabled
 from sphobjinv.schema import json_schema
-from sphobjinv.version import __version__ as soi_version
-from sphobjinv.zlib import decompress
+from sphobjinv.zlib import BUFSIZE, decompress, iter_decompress
+
+# jsonschema, the suggest machinery, and the URL-retrieval machinery
+# (which pulls in ssl and certifi) are slow to import, and are imported
+# where needed so that working with local inventories doesn't pay for them.
+
+# A data-line regex match can only span this many lines having
+# non-whitespace content, so a partial buffer can be parsed exactly
+# except for this many trailing non-blank lines
+_MATCH_MAX_LINES = 8
+
+
+class _LazySSLContext:
+    """Class attribute creating the default SSL context on first access.
+
+    On first access, the descriptor replaces itself on the owning class
+    with the context it creates.
+
+    """
+
+    def __set_name__(self, owner, name):
+        """Record the attribute name."""
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        """Create the context and store it in place of the descriptor."""
+        import ssl
+
+        import certifi
+
+        context = ssl.create_default_context(cafile=certifi.where())
+        setattr(owner, self.name, context)
+        return context
+
+
+def _settled_offset(buf, nlines):
+    """Find where the final `nlines` non-blank lines of `buf` begin.
+
+    Returns zero if `buf` has fewer such lines.
+
+    """
+    pos = len(buf)
+
+    while nlines > 0:
+        line_start = buf.rfind(b"\n", 0, pos) + 1
+
+        if buf[line_start:pos].strip():
+            nlines -= 1
+
+        if line_start == 0:
+            return 0
+
+        pos = line_start - 1
+
+    return pos + 1
+
+
+# Source of version numbers for _ObjectList, unique across all instances
+_list_versions = itertools.count()
+
+
+def _versioned(method):
+    """Wrap a mutating :class:`list` method to update the list version."""
+
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.version = next(_list_versions)
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class _ObjectList(list):
+    """List of inventory objects, with a version number updated on any change.
+
+    The version lets the derived lookup structures of an |Inventory|
+    be checked for staleness without examining every object.
+
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args):
+        """Create the list, with a new version number."""
+        super().__init__(*args)
+        self.version = next(_list_versions)
+
+    def __reduce__(self):
+        """Pickle and copy the contents only, so copies get new versions."""
+        return (self.__class__, (list(self),))
+
+    append = _versioned(list.append)
+    extend = _versioned(list.extend)
+    insert = _versioned(list.insert)
+    pop = _versioned(list.pop)
+    remove = _versioned(list.remove)
+    clear = _versioned(list.clear)
+    sort = _versioned(list.sort)
+    reverse = _versioned(list.reverse)
+    __setitem__ = _versioned(list.__setitem__)
+    __delitem__ = _versioned(list.__delitem__)
+    __iadd__ = _versioned(list.__iadd__)
+    __imul__ = _versioned(list.__imul__)
+
+
+def _object_list(value):
+    """Convert a sequence of objects to an :class:`_ObjectList`, if needed."""
+    return value if isinstance(value, _ObjectList) else _ObjectList(value)
+
+
+def _estimate_fields_size(fields, samples=100):
+    """Estimate the memory occupied by a tuple of object field tuples.
+
+    Measuring every field of a large inventory takes about as long as
+    parsing it, so the average size of an object's fields is taken from
+    `samples` objects spread across the inventory.
+
+    """
+    if not fields:
+        return sys.getsizeof(fields)
+
+    sample = fields[:: max(1, len(fields) // samples)]
+    sample_size = sum(sys.getsizeof(f) + sum(map(sys.getsizeof, f)) for f in sample)
+
+    return sys.getsizeof(fields) + sample_size * len(fields) // len(sample)
 
 
 @attr.s(slots=True, eq=True, order=False)
@@ -61,6 +186,9 @@ class Inventory:
 
     The `count_error` argument is only relevant to the `dict_json` source type.
 
+    The `http_cache` and `request_policy` arguments are only relevant
+    to the `url` source type.
+
     Equality comparisons between |Inventory| instances
     will return |True| if
     :attr:`~sphobjinv.inventory.Inventory.project`,
@@ -158,6 +286,23 @@ class Inventory:
 
         No authentication is supported at this time.
 
+        ``http`` and ``https`` downloads are made over persistent
+        connections shared across all |Inventory| instances;
+        see :class:`~sphobjinv.http.ConnectionPool`.
+
+        If an :class:`~sphobjinv.http.HTTPCache` is passed as
+        `http_cache`, the download is made through it,
+        and an inventory already parsed from an unchanged
+        cached response is reused rather than parsed again.
+
+        Timeouts, retries of transient failures, and hedged requests
+        are applied as specified by the
+        :class:`~sphobjinv.http.RequestPolicy` passed as `request_policy`.
+        By default, a single attempt is made, with no timeout.
+
+        .. versionchanged:: ##VER##
+            Added the `http_cache` and `request_policy` arguments.
+
     **Members**
 
     """
@@ -185,6 +330,12 @@ class Inventory:
         repr=False, default=True, validator=attr.validators.instance_of(bool), eq=False
     )
 
+    # HTTP cache to use for URL retrieval
+    _http_cache = attr.ib(repr=False, default=None, eq=False)
+
+    # Timeout/retry/hedging settings for URL retrieval
+    _request_policy = attr.ib(repr=False, default=None, eq=False)
+
     # Actual regular attributes
     #: |str| project display name for the inventory
     #: (see :ref:`here <syntax-mouseover-example>`).
@@ -199,12 +350,26 @@ class Inventory:
     #: Can be edited directly to change the inventory contents.
     #: Undefined/random behavior/errors will result if the type
     #: of the elements is anything other than |DataObjStr|.
-    objects = attr.ib(init=False, default=attr.Factory(list), repr=False)
+    objects = attr.ib(
+        init=False,
+        default=attr.Factory(_ObjectList),
+        repr=False,
+        converter=_object_list,
+        on_setattr=attr.setters.convert,
+    )
 
     #: :class:`~sphobjinv.enum.SourceTypes` |Enum| value indicating the type of
     #: source from which the instance was generated.
     source_type = attr.ib(init=False, default=None, eq=False)
 
+    # Cache of derived lookup structures, keyed by structure name.
+    # Each value is a (contents key, structure) tuple; see _cached_derived
+    _derived = attr.ib(init=False, default=attr.Factory(dict), repr=False, eq=False)
+
+    #: :class:`~sphobjinv.suggest.SuggestCache` for memoizing the results of
+    #: :meth:`suggest`, or |None| (the default) to disable caching.
+    suggest_cache = attr.ib(init=False, default=None, repr=False, eq=False)
+
     # Helper strings for inventory datafile output
     #: Preamble line for v2 |objects.inv| header
     header_preamble = "# Sphinx inventory version 2"
@@ -218,8 +383,9 @@ class Inventory:
     #: zlib compression line for v2 |objects.inv| header
     header_zlib = "# The remainder of this file is compressed using zlib."
 
-    # Private class member for SSL context, since context creation is slow(?)
-    _sslcontext = ssl.create_default_context(cafile=certifi.where())
+    # Private class member for SSL context, since context creation is slow.
+    # Created on first use, since most inventories aren't loaded from URLs.
+    _sslcontext = _LazySSLContext()
 
     @property
     def count(self):
@@ -262,14 +428,17 @@ class Inventory:
             If both `expand` and `contract` are |True|
 
         """
-        d = {
-            HeaderFields.Project.value: self.project,
-            HeaderFields.Version.value: self.version,
-            HeaderFields.Count.value: self.count,
-        }
+        with PhaseTimer(Phase.Serialize) as timer:
+            d = {
+                HeaderFields.Project.value: self.project,
+                HeaderFields.Version.value: self.version,
+                HeaderFields.Count.value: self.count,
+            }
 
-        for i, o in enumerate(self.objects):
-            d.update({str(i): o.json_dict(expand=expand, contract=contract)})
+            for i, o in enumerate(self.objects):
+                d.update({str(i): o.json_dict(expand=expand, contract=contract)})
+
+            timer.count = self.count
 
         return d
 
@@ -290,6 +459,61 @@ class Inventory:
         """
         return [_.as_rst for _ in self.objects]
 
+    def name_index(self):
+        """Provide a prefix index over the names of the inventory objects.
+
+        The :class:`~sphobjinv.index.NameIndex` is built on first call
+        and then reused, until the name, domain, or role of any object
+        in :attr:`objects` changes, or objects are added or removed.
+
+        The returned index is a snapshot; hold on to it
+        for repeated queries
+        (e.g., one per keystroke during autocompletion),
+        and call this method again after editing the inventory.
+
+        Returns
+        -------
+        idx
+
+            :class:`~sphobjinv.index.NameIndex` -- Index over
+            the current contents of :attr:`objects`
+
+        """
+        return self._cached_derived("name_index", NameIndex.from_objects)
+
+    def memory_usage(self):
+        """Measure the memory occupied by the inventory.
+
+        Reports the deep size of the inventory, broken down into
+        the |list| of objects, the objects themselves, their field
+        values (by field), their |DataObjBytes| twins, and any cached
+        lookup structures. Objects shared with other inventories,
+        such as interned |str| values, are included.
+        A :class:`~sphobjinv.suggest.SuggestCache` set as
+        :attr:`suggest_cache` is not included, since it may be
+        shared among inventories.
+
+        .. doctest:: memory_usage
+
+            >>> inv = soi.Inventory("objects_attrs.inv")
+            >>> usage = inv.memory_usage()
+            >>> sorted(usage.fields)
+            ['dispname', 'domain', 'name', 'priority', 'role', 'uri']
+            >>> usage.total > usage.twins > usage.strings > 0
+            True
+
+        Returns
+        -------
+        usage
+
+            :class:`~sphobjinv.memory.MemoryUsage` -- Breakdown
+            of the memory occupied, in bytes
+
+        """
+        from sphobjinv.memory import measure
+
+        return measure(self)
+
     def __str__(self):  # pragma: no cover
         """Return concise, readable description of contents."""
         ret_str = "<{0} ({1}): {2} {3}, {4} objects>"
@@ -370,6 +594,59 @@ class Inventory:
                 self.source_type = st
                 return
 
+    @classmethod
+    async def afrom_url(cls, url, *, executor=None, request_policy=None):
+        r"""Asynchronously create an instance from a URL.
+
+        Equivalent to |cour|\ Inventory(url=url)\ |/cour|, but without
+        blocking the running event loop; see :func:`sphobjinv.aio.load`.
+
+        .. code-block:: python
+
+            inv = await soi.Inventory.afrom_url(
+                "https://sphobjinv.readthedocs.io/en/latest/objects.inv"
+            )
+
+        To retrieve many inventories at once, see
+        :func:`sphobjinv.aio.load_many`.
+
+        .. versionadded:: ##VER##
+
+        Parameters
+        ----------
+        url
+
+            |str| -- URL of a zlib-compressed |objects.inv|
+
+        executor
+
+            :class:`concurrent.futures.Executor` *(optional)* -- Executor
+            for decompression and parsing. If |None|, the event loop's
+            default executor is used.
+
+        request_policy
+
+            :class:`~sphobjinv.http.RequestPolicy` *(optional)* -- Timeouts,
+            retries, and hedging to apply to the download
+
+        Returns
+        -------
+        inv
+
+            |Inventory| -- Inventory retrieved from `url`
+
+        """
+        from sphobjinv.aio import load
+
+        return await load(url, executor=executor, policy=request_policy)
+
+    @classmethod
+    def _from_url_bytes(cls, b_str):
+        """Create an instance from zlib-compressed bytes downloaded from a URL."""
+        inv = cls(zlib=b_str)
+        inv.source_type = SourceTypes.URL
+        return inv
+
     def data_file(self, *, expand=False, contract=False):
         """Generate a plaintext |objects.inv| as UTF-8 |bytes|.
 
@@ -413,21 +690,37 @@ class Inventory:
         # Extra empty string at the end puts a newline at the end
         # of the generated string, consistent with files
         # generated by Sphinx.
-        return "\n".join(
-            (
-                self.header_preamble,
-                self.header_project.format(project=self.project),
-                self.header_version.format(version=self.version),
-                self.header_zlib,
-                *(
-                    obj.data_line(expand=expand, contract=contract)
-                    for obj in self.objects
-                ),
-                "",
-            )
-        ).encode("utf-8")
-
-    def suggest(self, name, *, thresh=50, with_index=False, with_score=False):
+        with PhaseTimer(Phase.Serialize) as timer:
+            b = "\n".join(
+                (
+                    self.header_preamble,
+                    self.header_project.format(project=self.project),
+                    self.header_version.format(version=self.version),
+                    self.header_zlib,
+                    *(
+                        obj.data_line(expand=expand, contract=contract)
+                        for obj in self.objects
+                    ),
+                    "",
+                )
+            ).encode("utf-8")
+
+            timer.size = len(b)
+            timer.count = self.count
+
+        return b
+
+    def suggest(
+        self,
+        name,
+        *,
+        thresh=50,
+        with_index=False,
+        with_score=False,
+        deadline=None,
+        domain=None,
+        role=None,
+    ):
         r"""Suggest objects in the inventory to match a name.
 
         :meth:`~Inventory.suggest` makes use of
@@ -449,10 +742,36 @@ class Inventory:
         between `name` and the object(s) of interest,
         and the desired fidelity of the search results to `name`.
 
+        The search can be restricted to objects in a particular Sphinx
+        `domain` and/or with a particular `role`. Objects not matching
+        these filters are excluded before any scoring is done.
+
+        If a `deadline` is given, the search returns once that many
+        seconds have elapsed, with the best results found up to that point.
+        Objects whose reST-like representation contains `name` are scored
+        first, followed by the remaining objects in order of decreasing
+        overlap with the characters of `name`.
+
+        The `deadline` covers the whole search, including building the
+        search data for the inventory. That is done on the first search,
+        and again after any change to the inventory contents.
+        Building the data and ordering the objects can't be interrupted,
+        so a search that has to build the data can overrun `deadline`
+        by the time that takes, which may be seconds for an inventory
+        of some hundreds of thousands of objects.
+        If the deadline has passed once the data is built,
+        no objects are scored.
+
         This functionality is provided by the
         :doc:`'suggest' subparser </cli/suggest>`
         of the command-line interface.
 
+        If :attr:`suggest_cache` is set, results are served from and
+        stored to that cache. Only exhaustive results are stored.
+
+        For as-you-type searching, see
+        :class:`~sphobjinv.suggest.SuggestSession`.
+
         Parameters
         ----------
         name
@@ -473,6 +792,18 @@ class Inventory:
             |bool| -- Include with each matched name
             its |fuzzywuzzy|_ match quality score
 
+        deadline
+
+            |float| *(optional)* -- Time budget for the search, in seconds
+
+        domain
+
+            |str| *(optional)* -- Only search objects in this Sphinx domain
+
+        role
+
+            |str| *(optional)* -- Only search objects with this Sphinx role
+
         Returns
         -------
         res_l
@@ -495,42 +826,101 @@ class Inventory:
             `with_index == with_score == True`:
             |cour|\ (as_rst, score, index)\ |/cour|
 
+            If `deadline` is provided, `res_l` is instead returned
+            as the first element of a
+            |cour|\ (res_l, exhaustive)\ |/cour| |tuple|,
+            where `exhaustive` is a |bool| indicating whether
+            all objects were scored before the deadline.
+
+        .. versionchanged:: ##VER##
+            Added `deadline`, `domain`, and `role`.
+
         """
-        from sphobjinv._vendored.fuzzywuzzy import process as fwp
-
-        # Must propagate list index to include in output
-        # Search vals are rst prepended with list index
-        srch_list = [f"{i} {o}" for i, o in enumerate(self.objects_rst)]
-
-        # Composite each string result extracted by fuzzywuzzy
-        # and its match score into a single string. The match
-        # and score are returned together in a tuple.
-        results = [
-            f"{match} {score}"
-            for match, score in fwp.extract(name, srch_list, limit=None)
-            if score >= thresh
-        ]
-
-        # Define regex for splitting the three components, and
-        # use it to convert composite result string to tuple:
-        # result --> (rst, score, index)
-        p_idx = re.compile(r"^(\d+)\s+(.+?)\s+(\d+)$")
-        results = [
-            (m.group(2), int(m.group(3)), int(m.group(1)))
-            for m in map(p_idx.match, results)
-        ]
+        # Convert the time budget to an absolute time up front,
+        # so that all of the search setup counts against it
+        end_time = None if deadline is None else time.monotonic() + deadline
+
+        cache = self.suggest_cache
+        results = None
+
+        if cache is not None:
+            contents_key = self._contents_key()
+            query_key = (name, thresh, domain, role)
+            results = cache.lookup(contents_key, query_key)
+
+        if results is None:
+            results, exhaustive = self._score_suggestions(
+                name, thresh, end_time, domain, role
+            )
+
+            if cache is not None and exhaustive:
+                cache.store(contents_key, query_key, results)
+        else:
+            exhaustive = True
 
         # Return based on flags
-        if with_score:
-            if with_index:
-                return results
-            else:
-                return [tup[:2] for tup in results]
+        from sphobjinv.suggest import select_fields
+
+        res_l = select_fields(results, with_index, with_score)
+
+        if deadline is None:
+            return res_l
+        else:
+            return res_l, exhaustive
+
+    def _score_suggestions(self, name, thresh, end_time, domain, role):
+        """Score objects against `name`, until `end_time` if provided.
+
+        Only objects matching the `domain` and `role` filters are scored.
+
+        Returns the (rst, score, index) results list and a flag
+        indicating whether all candidate objects were scored.
+
+        """
+        from sphobjinv.suggest import SearchData, rank_candidates, score_candidates
+
+        data = self._cached_derived("search_data", SearchData.from_objects)
+        candidates = data.select(domain, role)
+
+        if end_time is not None:
+            # Building the search data may have used up the time budget
+            if time.monotonic() >= end_time:
+                return [], False
+
+            candidates = rank_candidates(name, data, candidates)
+
+        return score_candidates(name, data, candidates, thresh, deadline=end_time)
+
+    def _contents_key(self):
+        """Compute a hashable key identifying the searchable object contents.
+
+        Changes whenever :attr:`objects` is replaced or modified, or a field
+        of any data object is changed, so it can be computed in constant time
+        for every lookup. Changes to objects in other inventories also
+        change it, which costs only a rebuild.
+
+        """
+        return (self.objects.version, _data._edit_stamp)
+
+    def _cached_derived(self, name, build_fxn):
+        """Retrieve a derived structure, (re)building it if contents changed.
+
+        `build_fxn` is called with :attr:`objects` as its only argument.
+
+        """
+        key = self._contents_key()
+
+        try:
+            cached_key, value = self._derived[name]
+        except KeyError:
+            pass
         else:
-            if with_index:
-                return [tup[::2] for tup in results]
-            else:
-                return [tup[0] for tup in results]
+            if cached_key == key:
+                return value
+
+        value = build_fxn(self.objects)
+        self._derived[name] = (key, value)
+        return value
 
     def _general_import(self):
         """Attempt sequence of all imports."""
@@ -547,7 +937,7 @@ class Inventory:
             SourceTypes.BytesZlib: (zlib_error, TypeError),
             SourceTypes.FnamePlaintext: (OSError, TypeError, UnicodeDecodeError),
             SourceTypes.FnameZlib: (OSError, TypeError, zlib_error),
-            SourceTypes.DictJSON: (ValidationError),
+            SourceTypes.DictJSON: None,  # Filled in below, if reached
         }
 
         # Attempt series of import approaches
@@ -557,6 +947,11 @@ class Inventory:
                 # No action for source types w/o a handler function defined.
                 continue
 
+            if st is SourceTypes.DictJSON:
+                from jsonschema.exceptions import ValidationError
+
+                import_errors[st] = ValidationError
+
             if self._try_import(importers[st], self._source, import_errors[st]):
                 self.source_type = st
                 return
@@ -583,25 +978,144 @@ class Inventory:
 
     def _import_plaintext_bytes(self, b_str):
         """Import an inventory from plaintext UTF-8 bytes."""
-        b_res = pb_project.search(b_str).group(HeaderFields.Project.value)
-        project = b_res.decode("utf-8")
+        from sphobjinv.re import pb_data, pb_project, pb_version
+
+        with PhaseTimer(Phase.HeaderParse):
+            b_res = pb_project.search(b_str).group(HeaderFields.Project.value)
+            project = b_res.decode("utf-8")
 
-        b_res = pb_version.search(b_str).group(HeaderFields.Version.value)
-        version = b_res.decode("utf-8")
+            b_res = pb_version.search(b_str).group(HeaderFields.Version.value)
+            version = b_res.decode("utf-8")
 
         def gen_dataobjs():
             """Generate a data object for each line in the inventory."""
             for mch in pb_data.finditer(b_str):
                 yield DataObjStr(**mch.groupdict())
 
-        objects = []
-        objects.extend(gen_dataobjs())
+        if enabled():
+            # Match all lines before creating any objects,
+            # so that the two phases can be timed separately
+            with PhaseTimer(Phase.LineParse) as timer:
+                fields = [mch.groupdict() for mch in pb_data.finditer(b_str)]
+                timer.size = len(b_str)
+                timer.count = len(fields)
+
+            with PhaseTimer(Phase.Construct) as timer:
+                objects = [DataObjStr(**f) for f in fields]
+                timer.count = len(objects)
+        else:
+            objects = []
+            objects.extend(gen_dataobjs())
 
         if len(objects) == 0:
             raise TypeError("No objects found in plaintext")
 
         return project, version, objects
 
+    def _import_zlib_stream(self, chunks):
+        """Import a zlib-compressed inventory arriving in pieces.
+
+        Produces the same result as :meth:`_import_zlib_bytes` on the
+        concatenated pieces, but decompresses and parses each piece
+        as it arrives.
+
+        """
+        from sphobjinv.re import pb_data, pb_project, pb_version
+
+        buf = b""
+        pos = 0
+        header = {pb_project: None, pb_version: None}
+        objects = []
+
+        # With instrumentation, the time spent in each phase is totalled
+        # over all of the pieces, and reported once parsing is complete
+        timing = enabled()
+        spent = dict.fromkeys(
+            (Phase.HeaderParse, Phase.LineParse, Phase.Construct), 0.0
+        )
+
+        def parse(limit):
+            """Consume the data lines ending before `limit`."""
+            nonlocal pos
+            start = timing and time.perf_counter()
+
+            for ptn, mch in header.items():
+                if mch is None:
+                    header[ptn] = ptn.search(buf, pos, limit)
+
+            if not timing:
+                for mch in pb_data.finditer(buf, pos):
+                    if mch.end() >= limit:
+                        break
+
+                    objects.append(DataObjStr(**mch.groupdict()))
+                    pos = mch.end()
+
+                return
+
+            mark = time.perf_counter()
+            spent[Phase.HeaderParse] += mark - start
+
+            fields = []
+            for mch in pb_data.finditer(buf, pos):
+                if mch.end() >= limit:
+                    break
+
+                fields.append(mch.groupdict())
+                pos = mch.end()
+
+            start = time.perf_counter()
+            spent[Phase.LineParse] += start - mark
+
+            objects.extend(DataObjStr(**f) for f in fields)
+            spent[Phase.Construct] += time.perf_counter() - start
+
+        if timing:
+            chunks = read_timer = _ChunkTimer(chunks)
+            pieces = decompress_timer = _ChunkTimer(iter_decompress(chunks))
+        else:
+            pieces = iter_decompress(chunks)
+
+        for piece in pieces:
+            buf += piece
+            limit = _settled_offset(buf, _MATCH_MAX_LINES)
+
+            if limit > pos:
+                parse(limit)
+
+                # Drop consumed text, keeping the line containing `pos`
+                # so that line-start anchors behave as on the full text
+                cut = buf.rfind(b"\n", 0, pos) + 1
+                buf = buf[cut:]
+                pos -= cut
+
+        parse(len(buf) + 1)
+
+        project = header[pb_project].group(HeaderFields.Project.value)
+        version = header[pb_version].group(HeaderFields.Version.value)
+
+        if timing:
+            # Decompression pulls the chunks, so its time includes the reading
+            emit(Phase.Read, read_timer.seconds, size=read_timer.size)
+            emit(
+                Phase.Decompress,
+                decompress_timer.seconds - read_timer.seconds,
+                size=decompress_timer.size,
+            )
+            emit(Phase.HeaderParse, spent[Phase.HeaderParse])
+            emit(
+                Phase.LineParse,
+                spent[Phase.LineParse],
+                size=decompress_timer.size,
+                count=len(objects),
+            )
+            emit(Phase.Construct, spent[Phase.Construct], count=len(objects))
+
+        if len(objects) == 0:
+            raise TypeError("No objects found in plaintext")
+
+        return project.decode("utf-8"), version.decode("utf-8"), objects
+
     def _import_zlib_bytes(self, b_str):
         """Import a zlib-compressed inventory."""
         b_plain = decompress(b_str)
@@ -611,33 +1125,79 @@ class Inventory:
 
     def _import_plaintext_fname(self, fn):
         """Import a plaintext inventory file."""
-        b_plain = readbytes(fn)
+        with PhaseTimer(Phase.Read) as timer:
+            b_plain = readbytes(fn)
+            timer.size = len(b_plain)
 
         return self._import_plaintext_bytes(b_plain)
 
     def _import_zlib_fname(self, fn):
         """Import a zlib-compressed inventory file."""
-        b_zlib = readbytes(fn)
+        with PhaseTimer(Phase.Read) as timer:
+            b_zlib = readbytes(fn)
+            timer.size = len(b_zlib)
 
         return self._import_zlib_bytes(b_zlib)
 
     def _import_url(self, url):
         """Import a file from a remote URL."""
-        # Caller's responsibility to ensure URL points
-        # someplace safe/sane!
-        req = urlrq.Request(url, headers={"User-Agent": "sphobjinv URL/" + soi_version})
-        resp = urlrq.urlopen(req, context=self._sslcontext)  # noqa: S310
-        b_str = resp.read()
+        from sphobjinv.http import RequestPolicy, urlopen
+
+        policy = self._request_policy or RequestPolicy()
+
+        if self._http_cache is None:
+
+            def download():
+                """Make one attempt at retrieving and parsing the inventory."""
+                # Plaintext URL D/L is unreliable; zlib only.
+                # Parse as the data arrives, to overlap network and CPU time.
+                with urlopen(
+                    url,
+                    context=self._sslcontext,
+                    connect_timeout=policy.connect_timeout,
+                    read_timeout=policy.read_timeout,
+                ) as resp:
+                    return self._import_zlib_stream(
+                        iter(lambda: resp.read(BUFSIZE), b"")
+                    )
 
-        # Plaintext URL D/L is unreliable; zlib only
-        return self._import_zlib_bytes(b_str)
+            return policy.call(download, url)
+
+        with PhaseTimer(Phase.Read) as timer:
+            entry = self._http_cache.get(url, context=self._sslcontext, policy=policy)
+            timer.size = len(entry.body)
+
+        # Racing threads may both parse a new entry; either result is fine
+        if entry.parsed is None:
+            p, v, o = self._import_zlib_bytes(entry.body)
+            fields = tuple(
+                (obj.name, obj.domain, obj.role, obj.priority, obj.uri, obj.dispname)
+                for obj in o
+            )
+            self._http_cache.set_parsed(
+                url, entry, (p, v, fields), _estimate_fields_size(fields)
+            )
+            return p, v, o
+
+        # Objects are mutable, so each Inventory needs its own;
+        # building them from the stored fields skips the regex parse
+        p, v, fields = entry.parsed
+        with PhaseTimer(Phase.Construct) as timer:
+            objects = [DataObjStr(*f) for f in fields]
+            timer.count = len(objects)
+
+        return p, v, objects
 
     def _import_json_dict(self, d):
         """Import flat-dict composited data."""
+        import jsonschema
+
         # Validate the dict against the schema. Schema
         # WILL allow an inventory with no objects here
-        val = jsonschema.Draft4Validator(json_schema)
-        val.validate(d)
+        with PhaseTimer(Phase.Validate) as timer:
+            val = jsonschema.Draft4Validator(json_schema)
+            val.validate(d)
+            timer.count = d[HeaderFields.Count.value]
 
         # Pull header items first
         project = d[HeaderFields.Project.value]
@@ -653,15 +1213,19 @@ class Inventory:
 
         # Expecting the dict to be indexed by string integers
         objects = []
-        for i in range(count):
-            try:
-                objects.append(DataObjStr(**d.pop(str(i))))
-            except KeyError as e:
-                if self._count_error:
-                    err_str = (
-                        f"Too few objects found in dict (halt at {i}, expect {count})"
-                    )
-                    raise ValueError(err_str) from e
+        with PhaseTimer(Phase.Construct) as timer:
+            for i in range(count):
+                try:
+                    objects.append(DataObjStr(**d.pop(str(i))))
+                except KeyError as e:
+                    if self._count_error:
+                        err_str = (
+                            "Too few objects found in dict "
+                            f"(halt at {i}, expect {count})"
+                        )
+                        raise ValueError(err_str) from e
+
+            timer.count = len(objects)
 
         # Complain if remaining objects are anything other than the
         # valid inventory-level header keys
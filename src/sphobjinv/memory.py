@@ -0,0 +1,175 @@
+r"""*Memory footprint measurement for* ``sphobjinv`` *inventories*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import gc
+import sys
+from types import FunctionType, ModuleType
+
+import attr
+
+from sphobjinv.data import DataFields
+
+
+@attr.s(slots=True, frozen=True)
+class MemoryUsage:
+    """Breakdown of the memory occupied by an |Inventory|, in bytes.
+
+    Obtained from
+    :meth:`Inventory.memory_usage() <sphobjinv.inventory.Inventory.memory_usage>`.
+    Each object in memory is counted once, in the first of the
+    categories below that reaches it, so the categories sum to
+    the :attr:`total`.
+
+    """
+
+    #: |int| -- Number of objects in the inventory
+    count = attr.ib()
+
+    #: |int| -- The |list| holding the objects, without its contents
+    object_list = attr.ib()
+
+    #: |int| -- The |DataObjStr| instances, without their field values
+    objects = attr.ib()
+
+    #: |dict| -- The |str| field values of the objects, by field name
+    fields = attr.ib()
+
+    #: |int| -- The |DataObjBytes| twins of the objects (see
+    #: :attr:`~sphobjinv.data.DataObjStr.as_bytes`), with their
+    #: |bytes| field values
+    twins = attr.ib()
+
+    #: |int| -- Cached lookup structures derived from the objects,
+    #: such as the :class:`~sphobjinv.index.NameIndex`
+    derived = attr.ib()
+
+    #: |int| -- The |Inventory| instance and its header values
+    other = attr.ib()
+
+    @property
+    def strings(self):
+        """|int| -- Total of the |str| field values in :attr:`fields`."""
+        return sum(self.fields.values())
+
+    @property
+    def total(self):
+        """|int| -- Deep size of the inventory."""
+        return (
+            self.object_list
+            + self.objects
+            + self.strings
+            + self.twins
+            + self.derived
+            + self.other
+        )
+
+    @property
+    def per_object(self):
+        """|float| -- :attr:`total` divided by :attr:`count`, or 0.0 if empty."""
+        return self.total / self.count if self.count else 0.0
+
+
+def _sizeof(values, seen):
+    """Total the sizes of those `values` not already in `seen`, adding them."""
+    size = 0
+    for value in values:
+        if id(value) not in seen:
+            seen.add(id(value))
+            size += sys.getsizeof(value)
+    return size
+
+
+def _deep_sizeof(root, seen):
+    """Total the sizes of everything reachable from `root` not in `seen`.
+
+    Classes, modules, and functions are not followed.
+
+    """
+    size = 0
+    stack = [root]
+
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (type, ModuleType, FunctionType)):
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+
+    return size
+
+
+def measure(inv):
+    """Measure the memory occupied by an inventory.
+
+    See
+    :meth:`Inventory.memory_usage() <sphobjinv.inventory.Inventory.memory_usage>`.
+
+    Parameters
+    ----------
+    inv
+
+        |Inventory| -- Inventory to measure
+
+    Returns
+    -------
+    usage
+
+        :class:`MemoryUsage` -- Breakdown of the memory occupied by `inv`
+
+    """
+    objects = inv.objects
+    names = [field.value for field in DataFields]
+    seen = set()
+
+    object_list = _sizeof([objects], seen)
+    object_size = _sizeof(objects, seen)
+    fields = {
+        name: _sizeof((getattr(obj, name) for obj in objects), seen) for name in names
+    }
+
+    twins = _sizeof((obj.as_bytes for obj in objects), seen)
+    for name in names:
+        twins += _sizeof((getattr(obj.as_bytes, name) for obj in objects), seen)
+
+    derived = _deep_sizeof(inv._derived, seen)
+    other = _sizeof((inv, inv.project, inv.version), seen)
+
+    return MemoryUsage(
+        count=len(objects),
+        object_list=object_list,
+        objects=object_size,
+        fields=fields,
+        twins=twins,
+        derived=derived,
+        other=other,
+    )
@@ -0,0 +1,935 @@
+r"""*Local mirrors of remote* ``sphobjinv`` *inventories*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import email.utils
+import hashlib
+import http.server
+import json
+import os
+import re
+import socketserver
+import stat
+import tempfile
+import threading
+import time
+import urllib.error as urlerr
+import urllib.parse as urlparse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+import attr
+
+from sphobjinv.enum import SyncStatus
+from sphobjinv.header import peek_header
+from sphobjinv.http import RequestPolicy, urlopen
+from sphobjinv.inventory import Inventory
+from sphobjinv.version import __version__ as soi_version
+
+#: |str| file name of the manifest in a mirror directory
+MANIFEST_NAME = "manifest.json"
+
+#: |int| nanoseconds within which a directory modification time
+#: is too close to a scan to show that the directory didn't change
+#: afterwards, allowing for coarse file system timestamps
+_MTIME_SLACK_NS = 2 * 10**9
+
+#: |int| version of the manifest format
+MANIFEST_VERSION = 1
+
+#: |str| path at which a :class:`MirrorServer` serves its JSON index
+INDEX_NAME = "index.json"
+
+_p_name = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9_.+-]*$")
+
+
+def mirror_filename(name):
+    """Return the file name under which inventory `name` is mirrored.
+
+    Parameters
+    ----------
+    name
+
+        |str| -- Name of the inventory in the mapping
+
+    Returns
+    -------
+    fname
+
+        |str| -- File name within the mirror directory
+
+    Raises
+    ------
+    ValueError
+
+        If `name` is unsuitable for use in a file name
+
+    """
+    if not _p_name.match(name):
+        raise ValueError(f"Invalid inventory name for mirroring: {name!r}")
+
+    return f"objects_{name}.inv"
+
+
+def inventory_url(target):
+    r"""Get the URL of an inventory from an intersphinx mapping value.
+
+    Parameters
+    ----------
+    target
+
+        |str|, or |list| or |tuple| -- Either the URL of an inventory
+        or of the root of a documentation set, or an intersphinx-style
+        |cour|\ (base_url, inventory)\ |/cour| pair. A missing or |None|
+        `inventory` means ``objects.inv`` at `base_url`,
+        and a relative `inventory` is resolved against `base_url`.
+
+    Returns
+    -------
+    url
+
+        |str| -- URL of the inventory
+
+    """
+    if isinstance(target, str):
+        base, location = target, None
+    else:
+        base, location = (list(target) + [None])[:2]
+
+    if location is None:
+        if base.endswith(".inv"):
+            return base
+        location = "objects.inv"
+
+    return urlparse.urljoin(base.rstrip("/") + "/", location)
+
+
+def read_mapping(path):
+    """Load an inventory mapping from a JSON file.
+
+    The file must contain a JSON object mapping inventory names
+    to values accepted by :func:`inventory_url`, for example:
+
+    .. code-block:: json
+
+        {
+            "python": "https://docs.python.org/3/",
+            "attrs": ["https://www.attrs.org/en/stable/", null]
+        }
+
+    Parameters
+    ----------
+    path
+
+        |str| or |Path| -- Path to the mapping file
+
+    Returns
+    -------
+    mapping
+
+        |dict| -- Inventory URLs, keyed by name
+
+    Raises
+    ------
+    ValueError
+
+        If the file does not contain a suitable JSON object
+
+    """
+    d = json.loads(Path(path).read_text(encoding="utf-8"))
+
+    if not isinstance(d, dict):
+        raise ValueError("Mapping file must contain a JSON object")
+
+    return {name: inventory_url(target) for name, target in d.items()}
+
+
+def read_manifest(dest):
+    """Load the manifest of a mirror directory.
+
+    Parameters
+    ----------
+    dest
+
+        |str| or |Path| -- Mirror directory
+
+    Returns
+    -------
+    manifest
+
+        |dict| -- Manifest contents, with an empty ``"inventories"``
+        |dict| if the directory has no manifest yet
+
+    """
+    try:
+        manifest = json.loads((Path(dest) / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        manifest = {}
+
+    manifest.setdefault("version", MANIFEST_VERSION)
+    manifest.setdefault("inventories", {})
+    return manifest
+
+
+def _write_atomic(path, data):
+    """Write `data` to `path` so that readers never see a partial file."""
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # mkstemp creates the file readable only by its owner
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _sha256_file(path):
+    """Get the SHA-256 hex digest of a file, or |None| if it is absent."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _now():
+    """Get the current UTC time as an ISO 8601 |str|."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@attr.s(slots=True, frozen=True)
+class SyncResult:
+    """Outcome of mirroring one inventory with :func:`sync`."""
+
+    #: |str| name of the inventory in the mapping
+    name = attr.ib()
+
+    #: |str| URL of the inventory
+    url = attr.ib()
+
+    #: :class:`~sphobjinv.enum.SyncStatus` -- What happened to the mirrored copy
+    status = attr.ib()
+
+    #: |Path| to the mirrored copy
+    path = attr.ib()
+
+    #: |dict| or |None| -- Manifest entry for the mirrored copy,
+    #: or |None| if there is none
+    entry = attr.ib(default=None, repr=False)
+
+    #: :class:`Exception` or |None| -- Reason for a failure
+    error = attr.ib(default=None)
+
+
+def _sync_one(name, url, dest, previous, context, policy, force):
+    """Bring the mirrored copy of one inventory up to date."""
+    path = dest / mirror_filename(name)
+    digest = _sha256_file(path)
+    intact = (
+        previous is not None
+        and previous.get("url") == url
+        and digest is not None
+        and digest == previous.get("sha256")
+    )
+
+    headers = {}
+    if intact and not force:
+        if previous.get("etag") is not None:
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified") is not None:
+            headers["If-Modified-Since"] = previous["last_modified"]
+
+    def download():
+        """Make one attempt at retrieving the inventory."""
+        with urlopen(
+            url,
+            headers=headers,
+            context=context,
+            connect_timeout=policy.connect_timeout,
+            read_timeout=policy.read_timeout,
+        ) as resp:
+            return resp.read(), resp.headers
+
+    try:
+        body, resp_headers = policy.call(download, url)
+    except urlerr.HTTPError as e:
+        e.close()
+
+        if e.code == 304 and headers:
+            entry = {**previous, "checked": _now()}
+            return SyncResult(name, url, SyncStatus.Unchanged, path, entry)
+
+        return SyncResult(name, url, SyncStatus.Failed, path, previous, e)
+    except Exception as e:  # noqa: PIE786
+        return SyncResult(name, url, SyncStatus.Failed, path, previous, e)
+
+    # Never replace a good copy with something that doesn't parse
+    try:
+        inv = Inventory(zlib=body)
+    except Exception as e:  # noqa: PIE786
+        return SyncResult(name, url, SyncStatus.Failed, path, previous, e)
+
+    new_digest = hashlib.sha256(body).hexdigest()
+    now = _now()
+    entry = {
+        "url": url,
+        "file": path.name,
+        "sha256": new_digest,
+        "size": len(body),
+        "etag": resp_headers.get("ETag"),
+        "last_modified": resp_headers.get("Last-Modified"),
+        "project": inv.project,
+        "version": inv.version,
+        "count": inv.count,
+        "fetched": now,
+        "checked": now,
+    }
+
+    if new_digest == digest:
+        entry["fetched"] = previous.get("fetched", now) if previous else now
+        return SyncResult(name, url, SyncStatus.Unchanged, path, entry)
+
+    try:
+        _write_atomic(path, body)
+    except OSError as e:
+        return SyncResult(name, url, SyncStatus.Failed, path, previous, e)
+
+    return SyncResult(name, url, SyncStatus.Updated, path, entry)
+
+
+def sync(mapping, dest, *, workers=8, policy=None, force=False):
+    """Refresh a local mirror of remote inventories.
+
+    All inventories in `mapping` are retrieved concurrently. Where the
+    mirror already holds an intact copy, a conditional request is made
+    using the ``ETag`` and ``Last-Modified`` validators recorded in
+    the manifest, so that an unchanged inventory is not downloaded again.
+
+    Each downloaded inventory is validated by parsing it before it
+    replaces the mirrored copy, and every file, including the manifest,
+    is written atomically. A failure to retrieve or validate an
+    inventory leaves any existing copy and its manifest entry in place.
+
+    The manifest, ``manifest.json`` in `dest`, records for each
+    inventory its URL, file name, SHA-256 hash, size, validators,
+    project, version, and object count, and the UTC times at which
+    its contents were last changed (``fetched``) and last confirmed
+    current (``checked``). Manifest entries for names not in `mapping`
+    are retained.
+
+    Parameters
+    ----------
+    mapping
+
+        |dict| or |str| or |Path| -- Inventories to mirror, keyed by name,
+        with values as accepted by :func:`inventory_url`;
+        or the path to a mapping file, as read by :func:`read_mapping`
+
+    dest
+
+        |str| or |Path| -- Mirror directory, created if necessary.
+        Inventory ``name`` is stored as ``objects_{name}.inv``.
+
+    workers
+
+        |int| *(optional)* -- Maximum number of concurrent downloads
+
+    policy
+
+        :class:`~sphobjinv.http.RequestPolicy` *(optional)* -- Timeouts,
+        retries, and hedging to apply to each download
+
+    force
+
+        |bool| *(optional)* -- If |True|, download every inventory in
+        full, without conditional requests
+
+    Returns
+    -------
+    results
+
+        |list| of :class:`SyncResult` -- Outcome for each inventory,
+        in the order of `mapping`
+
+    """
+    if not isinstance(mapping, dict):
+        mapping = read_mapping(mapping)
+
+    urls = {name: inventory_url(target) for name, target in mapping.items()}
+    for name in urls:
+        mirror_filename(name)
+
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+
+    manifest = read_manifest(dest)
+    entries = manifest["inventories"]
+    policy = policy or RequestPolicy()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _sync_one,
+                name,
+                url,
+                dest,
+                entries.get(name),
+                Inventory._sslcontext,
+                policy,
+                force,
+            )
+            for name, url in urls.items()
+        ]
+        results = [f.result() for f in futures]
+
+    for res in results:
+        if res.entry is not None:
+            entries[res.name] = res.entry
+
+    manifest["version"] = MANIFEST_VERSION
+    manifest["updated"] = _now()
+
+    _write_atomic(
+        dest / MANIFEST_NAME,
+        json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"),
+    )
+
+    return results
+
+
+@attr.s(slots=True, frozen=True)
+class MirrorFile:
+    """Metadata of one inventory file served by a :class:`MirrorServer`."""
+
+    #: |str| path of the file relative to the mirror directory,
+    #: with ``/`` separators
+    name = attr.ib()
+
+    #: |int| file size in bytes
+    size = attr.ib()
+
+    #: |int| file modification time in nanoseconds, as from :func:`os.stat`
+    mtime_ns = attr.ib(repr=False)
+
+    #: |str| strong ``ETag`` of the file contents, including the quotes
+    etag = attr.ib()
+
+    #: |str| ``Last-Modified`` date of the file
+    last_modified = attr.ib()
+
+    #: :class:`~sphobjinv.header.InventoryHeader` or |None| -- Header
+    #: information, or |None| if the file is not a recognizable inventory
+    header = attr.ib(repr=False)
+
+    @classmethod
+    def from_bytes(cls, name, data, st):
+        """Build the metadata for the contents `data` and stat result `st`."""
+        try:
+            header = peek_header(data)
+        except ValueError:
+            header = None
+
+        return cls(
+            name=name,
+            size=len(data),
+            mtime_ns=st.st_mtime_ns,
+            etag=f'"{hashlib.sha256(data).hexdigest()[:32]}"',
+            last_modified=email.utils.formatdate(st.st_mtime, usegmt=True),
+            header=header,
+        )
+
+    def index_entry(self):
+        """Build the JSON index entry describing this file."""
+        header = self.header
+        return {
+            "path": self.name,
+            "project": header.project if header else None,
+            "version": header.version if header else None,
+            "format_version": header.format_version if header else None,
+            "size": self.size,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+        }
+
+
+class _Unsatisfiable(Exception):
+    """Raised for a ``Range`` lying entirely beyond the end of the content."""
+
+
+def _parse_range(value, size):
+    """Interpret a ``Range`` header for content of length `size`.
+
+    Returns a ``(start, stop)`` pair, or |None| if the whole content
+    should be sent: for headers that are malformed, request several
+    ranges, or cover all of the content.
+
+    """
+    mch = re.fullmatch(r"\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*", value)
+    if mch is None or not (mch.group(1) or mch.group(2)):
+        return None
+
+    if mch.group(1):
+        start = int(mch.group(1))
+        if start >= size:
+            raise _Unsatisfiable
+        stop = int(mch.group(2)) + 1 if mch.group(2) else size
+        if stop <= start:
+            return None
+    else:
+        suffix = int(mch.group(2))
+        if suffix == 0:
+            raise _Unsatisfiable
+        start, stop = max(0, size - suffix), size
+
+    stop = min(stop, size)
+    return None if (start, stop) == (0, size) else (start, stop)
+
+
+class MirrorRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Request handler for :class:`MirrorServer`.
+
+    Serves the ``.inv`` files of the mirror directory, and the JSON index
+    at ``/`` and ``/index.json``. ``GET`` and ``HEAD`` are supported,
+    as are conditional requests and single-range ``Range`` requests.
+
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "sphobjinv-mirror/" + soi_version
+
+    def do_GET(self):  # noqa: N802
+        """Serve a GET request."""
+        self._serve(send_body=True)
+
+    def do_HEAD(self):  # noqa: N802
+        """Serve a HEAD request."""
+        self._serve(send_body=False)
+
+    def log_message(self, format, *args):  # noqa: A002
+        """Suppress per-request logging."""
+
+    def _serve(self, send_body):
+        """Send the requested content, or its status and headers."""
+        name = urlparse.unquote(urlparse.urlsplit(self.path).path).lstrip("/")
+
+        if name in ("", INDEX_NAME):
+            body, etag = self.server.index_json()
+            last_modified = None
+            content_type = "application/json"
+        else:
+            found = self.server.lookup(name)
+            if found is None:
+                self.send_error(404)
+                return
+
+            meta, body = found
+            etag, last_modified = meta.etag, meta.last_modified
+            content_type = "application/octet-stream"
+
+        if self._not_modified(etag, last_modified):
+            self.send_response(304)
+            self._send_validators(etag, last_modified)
+            self.end_headers()
+            return
+
+        content_range = None
+        range_value = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+
+        if range_value is not None and if_range in (None, etag):
+            try:
+                span = _parse_range(range_value, len(body))
+            except _Unsatisfiable:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            if span is not None:
+                start, stop = span
+                content_range = f"bytes {start}-{stop - 1}/{len(body)}"
+                body = memoryview(body)[start:stop]
+
+        self.send_response(200 if content_range is None else 206)
+        self._send_validators(etag, last_modified)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Accept-Ranges", "bytes")
+        if content_range is not None:
+            self.send_header("Content-Range", content_range)
+        self.end_headers()
+
+        if send_body:
+            self.wfile.write(body)
+
+    def _send_validators(self, etag, last_modified):
+        """Send the ETag and Last-Modified headers."""
+        self.send_header("ETag", etag)
+        if last_modified is not None:
+            self.send_header("Last-Modified", last_modified)
+
+    def _not_modified(self, etag, last_modified):
+        """Evaluate the request's conditional headers."""
+        if_none_match = self.headers.get("If-None-Match")
+
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or etag in tags
+
+        if_modified_since = self.headers.get("If-Modified-Since")
+
+        if if_modified_since is None or last_modified is None:
+            return False
+
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+        return email.utils.parsedate_to_datetime(last_modified) <= since
+
+
+class MirrorServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server for a directory of inventories.
+
+    Every file with the extension ``.inv`` within `directory`
+    (including its subdirectories, but excluding hidden files)
+    is served at its relative path. A JSON index of these files, with
+    the project and version of each from its header, is served at
+    ``/`` and ``/index.json``. See :class:`MirrorRequestHandler`.
+
+    Strong ``ETag`` values are computed once for each file and reused
+    until its size or modification time changes, so the directory
+    can be updated, e.g. with :func:`sync`, while being served.
+    The contents of recently served files are kept in memory,
+    up to `cache_size` bytes in total.
+
+    The index is built once and reused until a file is added to or
+    removed from the directory, as seen from the modification times
+    of its subdirectories, or until a request finds that a file listed
+    in it has changed or gone. A file changed in place, rather than
+    replaced as :func:`sync` does, is thus only reflected in the index
+    once it has been requested.
+
+    .. code-block:: python
+
+        server = soi.mirror.MirrorServer("mirror", ("127.0.0.1", 8000))
+        server.serve_forever()
+
+    Parameters
+    ----------
+    directory
+
+        |str| or |Path| -- Mirror directory to serve
+
+    address
+
+        |tuple| *(optional)* -- Host and port to listen on.
+        Port 0 picks a free port; see :attr:`url`.
+
+    cache_size
+
+        |int| *(optional)* -- Maximum total size in bytes of
+        the file contents kept in memory
+
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, directory, address=("127.0.0.1", 8000), *, cache_size=64 * 2**20
+    ):
+        """Bind the server and record the mirror directory."""
+        super().__init__(address, MirrorRequestHandler)
+
+        #: |Path| -- Mirror directory
+        self.directory = Path(directory).resolve()
+
+        #: |int| -- Maximum total size in bytes of cached file contents
+        self.cache_size = cache_size
+
+        self._files = {}
+        self._bodies = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+
+        # Cached index as (directory mtimes, scan time, body, etag), and
+        # a count of invalidations, so that an index built while one
+        # happens is not stored
+        self._index = None
+        self._index_generation = 0
+
+    def server_bind(self):
+        """Bind without a reverse DNS lookup of the host."""
+        socketserver.TCPServer.server_bind(self)
+        self.server_name, self.server_port = self.server_address[:2]
+
+    @property
+    def url(self):
+        """|str| -- Base URL of the server, with a trailing slash."""
+        return f"http://{self.server_name}:{self.server_port}/"
+
+    def lookup(self, name):
+        """Get the metadata and contents of a served file.
+
+        Parameters
+        ----------
+        name
+
+            |str| -- Path of the file relative to the mirror directory,
+            with ``/`` separators
+
+        Returns
+        -------
+        found
+
+            |tuple| of :class:`MirrorFile` and |bytes|, or |None| if
+            `name` does not identify a served file
+
+        """
+        path = self._resolve(name)
+        if path is None:
+            return None
+
+        try:
+            st = path.stat()
+        except OSError:
+            st = None
+
+        if st is None or not stat.S_ISREG(st.st_mode):
+            with self._lock:
+                if name in self._files:
+                    self._invalidate_index()
+            return None
+
+        with self._lock:
+            meta = self._files.get(name)
+            current = meta is not None and (meta.size, meta.mtime_ns) == (
+                st.st_size,
+                st.st_mtime_ns,
+            )
+
+            if current and name in self._bodies:
+                self._bodies.move_to_end(name)
+                return meta, self._bodies[name]
+
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        changed = not current or len(data) != meta.size
+        if changed:
+            meta = MirrorFile.from_bytes(name, data, st)
+
+        with self._lock:
+            if changed and name in self._files:
+                self._invalidate_index()
+
+            self._files[name] = meta
+            self._cache_body(name, data)
+
+        return meta, data
+
+    def files(self):
+        """Scan the mirror directory for the files it serves.
+
+        Returns
+        -------
+        files
+
+            |list| of :class:`MirrorFile` -- Metadata of the served files,
+            sorted by name
+
+        """
+        names, _ = self._scan()
+        return self._collect(names)
+
+    def _collect(self, names):
+        """Look up the metadata of the files `names`, and forget any others."""
+        files = []
+        for name in names:
+            found = self.lookup(name)
+            if found is not None:
+                files.append(found[0])
+
+        with self._lock:
+            for stale in set(self._files) - set(names):
+                del self._files[stale]
+                self._drop_body(stale)
+
+        return files
+
+    def index_json(self):
+        """Get the JSON index of the served files.
+
+        The index is rebuilt only if the served files may have changed
+        since it was last built; see :class:`MirrorServer`.
+
+        Returns
+        -------
+        body
+
+            |bytes| -- UTF-8 JSON index
+
+        etag
+
+            |str| -- Strong ``ETag`` of `body`
+
+        """
+        with self._lock:
+            cached = self._index
+            generation = self._index_generation
+
+        if cached is not None and self._dirs_unchanged(*cached[:2]):
+            return cached[2:]
+
+        scanned_ns = time.time_ns()
+        names, dirs = self._scan()
+
+        index = {"inventories": [f.index_entry() for f in self._collect(names)]}
+        body = json.dumps(index, indent=2).encode("utf-8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+        with self._lock:
+            if generation == self._index_generation:
+                self._index = (dirs, scanned_ns, body, etag)
+
+        return body, etag
+
+    def _scan(self):
+        """List the served names, and the directories that could hold them.
+
+        Returns the sorted names, and a |dict| of the modification time
+        of each directory searched, keyed by path.
+
+        """
+        names = []
+        dirs = {}
+
+        for dirpath, dirnames, filenames in os.walk(self.directory):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+
+            try:
+                dirs[dirpath] = os.stat(dirpath).st_mtime_ns
+            except OSError:
+                continue
+
+            rel = Path(dirpath).relative_to(self.directory)
+            names.extend(
+                (rel / f).as_posix()
+                for f in filenames
+                if f.endswith(".inv") and not f.startswith(".")
+            )
+
+        return sorted(names), dirs
+
+    def _dirs_unchanged(self, dirs, scanned_ns):
+        """Check whether no directory has changed since a scan.
+
+        Directories modified just before the scan may have been modified
+        again since, within the resolution of their timestamps,
+        and so are treated as changed.
+
+        """
+        for path, mtime_ns in dirs.items():
+            if mtime_ns > scanned_ns - _MTIME_SLACK_NS:
+                return False
+
+            try:
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+
+        return True
+
+    def _invalidate_index(self):
+        """Discard the cached index.
+
+        Must be called with the lock held.
+
+        """
+        self._index = None
+        self._index_generation += 1
+
+    def _resolve(self, name):
+        """Map a relative name to a served path, or |None| if not allowed."""
+        parts = name.split("/")
+
+        if (
+            not name.endswith(".inv")
+            or any(part in ("", ".", "..") or part.startswith(".") for part in parts)
+            or "\\" in name
+        ):
+            return None
+
+        return self.directory.joinpath(*parts)
+
+    def _cache_body(self, name, data):
+        """Keep file contents in memory, evicting as needed.
+
+        Must be called with the lock held.
+
+        """
+        self._drop_body(name)
+
+        if len(data) > self.cache_size:
+            return
+
+        self._bodies[name] = data
+        self._cached_bytes += len(data)
+
+        while self._cached_bytes > self.cache_size:
+            _, evicted = self._bodies.popitem(last=False)
+            self._cached_bytes -= len(evicted)
+
+    def _drop_body(self, name):
+        """Discard cached file contents.
+
+        Must be called with the lock held.
+
+        """
+        data = self._bodies.pop(name, None)
+        if data is not None:
+            self._cached_bytes -= len(data)
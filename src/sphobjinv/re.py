@@ -34,35 +34,22 @@ import re
 from sphobjinv.data import DataFields as DF  # noqa: N817
 from sphobjinv.enum import HeaderFields as HF  # noqa: N817
 
-#: Compiled |re| |bytes|  pattern for comment lines in decompressed
-#: inventory files
-pb_comments = re.compile(b"^#.*$", re.M)
+# Compiling the patterns takes a noticeable fraction of the import time
+# of the package, so each is compiled only when first accessed.
 
-#: Compiled |re| |bytes| pattern for project line
-pb_project = re.compile(
-    rf"""
+_ptn_project = rf"""
     ^                            # Start of line
     [#][ ]Project:[ ]            # Preamble
     (?P<{HF.Project.value}>.*?)  # Lazy rest of line is project name
     \r?$                         # Ignore possible CR at EOL
-    """.encode(
-        encoding="utf-8"
-    ),
-    re.M | re.X,
-)
-
-#: Compiled |re| |bytes| pattern for version line
-pb_version = re.compile(
-    rf"""
+    """
+
+_ptn_version = rf"""
     ^                            # Start of line
     [#][ ]Version:[ ]            # Preamble
     (?P<{HF.Version.value}>.*?)  # Lazy rest of line is version
     \r?$                         # Ignore possible CR at EOL
-    """.encode(
-        encoding="utf-8"
-    ),
-    re.M | re.X,
-)
+    """
 
 #: Regex pattern string used to compile
 #: :data:`~sphobjinv.re.p_data` and
@@ -83,10 +70,27 @@ ptn_data = rf"""
     \r?$                            # Ignore possible CR at EOL
     """
 
-#: Compiled |re| |bytes| regex pattern for data lines in |bytes| decompressed
-#: inventory files
-pb_data = re.compile(ptn_data.encode(encoding="utf-8"), re.M | re.X)
+# Source and flags of each compiled pattern, by name
+_patterns = {
+    "pb_comments": (b"^#.*$", re.M),
+    "pb_project": (_ptn_project.encode("utf-8"), re.M | re.X),
+    "pb_version": (_ptn_version.encode("utf-8"), re.M | re.X),
+    "pb_data": (ptn_data.encode("utf-8"), re.M | re.X),
+    "p_data": (ptn_data, re.M | re.X),
+}
+
+
+def __getattr__(name):
+    """Compile a pattern on first access, and store it in the module."""
+    try:
+        pattern, flags = _patterns[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    compiled = globals()[name] = re.compile(pattern, flags)
+    return compiled
+
 
-#: Compiled |re| |str| regex pattern for data lines in |str| decompressed
-#: inventory files
-p_data = re.compile(ptn_data, re.M | re.X)
+def __dir__():
+    """List the module attributes, including patterns not yet compiled."""
+    return sorted(set(globals()) | set(_patterns))
@@ -0,0 +1,416 @@
+r"""*Process-wide registry of loaded* ``sphobjinv`` *inventories*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import os
+import threading
+import time
+import urllib.error as urlerr
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+
+import attr
+
+from sphobjinv.header import _p_url
+from sphobjinv.http import RequestPolicy, urlopen
+from sphobjinv.inventory import Inventory
+
+
+def estimate_size(inv):
+    """Estimate the memory occupied by an inventory, in bytes.
+
+    This is the :attr:`~sphobjinv.memory.MemoryUsage.total` from
+    :meth:`Inventory.memory_usage() <sphobjinv.inventory.Inventory.memory_usage>`.
+
+    Parameters
+    ----------
+    inv
+
+        |Inventory| -- Inventory to measure
+
+    Returns
+    -------
+    size
+
+        |int| -- Estimated size in bytes
+
+    """
+    return inv.memory_usage().total
+
+
+@attr.s(slots=True, eq=False)
+class _Entry:
+    """Loaded inventory and the information needed to revalidate it."""
+
+    #: |Inventory| loaded from the source
+    inventory = attr.ib()
+
+    #: |int| estimated size of :attr:`inventory` in bytes
+    size = attr.ib()
+
+    #: |tuple| of file size and modification time, for a local file
+    stat = attr.ib(default=None)
+
+    #: |str| or |None| -- ``ETag`` response header, for a URL
+    etag = attr.ib(default=None)
+
+    #: |str| or |None| -- ``Last-Modified`` response header, for a URL
+    last_modified = attr.ib(default=None)
+
+    #: |float| -- :func:`time.monotonic` time at which the inventory
+    #: was last confirmed current
+    checked = attr.ib(default=attr.Factory(time.monotonic))
+
+
+def _file_stat(path):
+    """Get the size and modification time identifying a file's contents."""
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+@attr.s(slots=True, eq=False)
+class Registry:
+    """Thread-safe cache of inventories, keyed by their source.
+
+    :meth:`get` returns the |Inventory| loaded from a local file
+    or a URL, loading it only if it is not already held, or if
+    its source has changed since it was loaded:
+
+    - For a local file, the file's size and modification time are
+      checked on every call, and the file is loaded again if either
+      has changed.
+    - For a URL, a conditional request using the ``ETag`` and
+      ``Last-Modified`` validators of the previous response is made,
+      and the inventory is downloaded and parsed again only if the
+      server does not answer ``304 Not Modified``. Within
+      :attr:`ttl` seconds of a load or revalidation, the held
+      inventory is returned without contacting the server.
+
+    When several threads request the same source at once, only one
+    of them loads it, and the others wait for and share its result,
+    or its exception.
+
+    When the total estimated size (see :func:`estimate_size`) of the
+    held inventories exceeds :attr:`max_size`, the least recently used
+    ones are discarded.
+
+    The same |Inventory| instance is returned to every caller
+    requesting a source, so the instances must be treated as read-only.
+    An inventory that needs to be modified should first be copied,
+    e.g. with :meth:`Inventory.json_dict() <sphobjinv.inventory.Inventory.json_dict>`.
+
+    Most applications can use the process-wide registry through the
+    module-level :func:`get`, rather than creating an instance.
+
+    """
+
+    #: |int| -- Maximum total estimated size in bytes of the held inventories
+    max_size = attr.ib(default=256 * 2**20, validator=attr.validators.instance_of(int))
+
+    #: |float| or |None| -- Number of seconds for which an inventory loaded
+    #: from a URL is used without revalidation. |None| or zero always
+    #: revalidates.
+    ttl = attr.ib(default=None)
+
+    #: :class:`~sphobjinv.http.RequestPolicy` or |None| -- Timeouts,
+    #: retries, and hedging to apply to URL requests, if not given to :meth:`get`
+    policy = attr.ib(default=None)
+
+    #: |int| -- Number of requests served without loading
+    hits = attr.ib(init=False, default=0)
+
+    #: |int| -- Number of requests answered by a ``304 Not Modified``
+    revalidations = attr.ib(init=False, default=0)
+
+    #: |int| -- Number of requests requiring a load
+    misses = attr.ib(init=False, default=0)
+
+    _entries = attr.ib(init=False, default=attr.Factory(OrderedDict), repr=False)
+    _loading = attr.ib(init=False, default=attr.Factory(dict), repr=False)
+    _size = attr.ib(init=False, default=0, repr=False)
+    _lock = attr.ib(init=False, default=attr.Factory(threading.Lock), repr=False)
+
+    def __len__(self):
+        """Return the number of held inventories."""
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """|int| -- Total estimated size in bytes of the held inventories."""
+        return self._size
+
+    def clear(self):
+        """Discard all held inventories and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.revalidations = 0
+            self.misses = 0
+
+    def discard(self, source):
+        """Discard the inventory held for `source`, if any.
+
+        Parameters
+        ----------
+        source
+
+            |str| or |Path| -- URL or local path, as for :meth:`get`
+
+        """
+        key, _ = _source_key(source)
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry.size
+
+    def get(self, source, *, policy=None):
+        """Get the current inventory from a source.
+
+        Parameters
+        ----------
+        source
+
+            |str| or |Path| -- URL of a zlib-compressed |objects.inv|
+            (as a |str| with a scheme, such as ``https://``),
+            or path to a local inventory file in any format
+            that |Inventory| can import
+
+        policy
+
+            :class:`~sphobjinv.http.RequestPolicy` *(optional)* -- Timeouts,
+            retries, and hedging to apply to any URL request,
+            in place of :attr:`policy`
+
+        Returns
+        -------
+        inv
+
+            |Inventory| -- Inventory from `source`, shared with all
+            other callers
+
+        Raises
+        ------
+        OSError
+
+            If a local file cannot be read
+
+        urllib.error.URLError
+
+            If a URL cannot be retrieved
+
+        ValueError
+
+            If the contents of `source` are not a valid inventory
+
+        """
+        key, is_url = _source_key(source)
+
+        # A local file is checked before any waiting on other threads
+        stat = None if is_url else _file_stat(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+                if (stat is not None and entry.stat == stat) or (
+                    is_url and self._is_fresh(entry)
+                ):
+                    self.hits += 1
+                    return entry.inventory
+
+            future = self._loading.get(key)
+            owner = future is None
+
+            if owner:
+                future = self._loading[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        # Loading is performed without holding the lock
+        try:
+            if is_url:
+                inv = self._load_url(key, entry, policy or self.policy)
+            else:
+                inv = self._load_file(key, stat)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(inv)
+        finally:
+            with self._lock:
+                del self._loading[key]
+
+        return inv
+
+    def _load_file(self, path, stat):
+        """Load a local file, recording `stat` as taken before reading it."""
+        inv = Inventory(path)
+
+        with self._lock:
+            self.misses += 1
+            self._store(path, _Entry(inv, estimate_size(inv), stat=stat))
+
+        return inv
+
+    def _load_url(self, url, entry, policy):
+        """Load or revalidate an inventory from a URL."""
+        headers = {}
+
+        if entry is not None:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        policy = policy or RequestPolicy()
+
+        def download():
+            """Make one attempt at retrieving the contents and validators."""
+            with urlopen(
+                url,
+                headers=headers,
+                context=Inventory._sslcontext,
+                connect_timeout=policy.connect_timeout,
+                read_timeout=policy.read_timeout,
+            ) as resp:
+                return (
+                    resp.read(),
+                    resp.headers.get("ETag"),
+                    resp.headers.get("Last-Modified"),
+                )
+
+        try:
+            body, etag, last_modified = policy.call(download, url)
+        except urlerr.HTTPError as e:
+            if e.code != 304 or entry is None:
+                raise
+
+            e.close()
+            entry.checked = time.monotonic()
+
+            with self._lock:
+                self.revalidations += 1
+
+                if url in self._entries:
+                    self._entries.move_to_end(url)
+                else:
+                    # Evicted while revalidating
+                    self._store(url, entry)
+
+            return entry.inventory
+
+        inv = Inventory._from_url_bytes(body)
+
+        with self._lock:
+            self.misses += 1
+            self._store(
+                url,
+                _Entry(inv, estimate_size(inv), etag=etag, last_modified=last_modified),
+            )
+
+        return inv
+
+    def _is_fresh(self, entry):
+        """Report whether an entry from a URL is within its time-to-live."""
+        return bool(self.ttl) and time.monotonic() - entry.checked < self.ttl
+
+    def _store(self, key, entry):
+        """Add an entry, evicting as needed to respect max_size.
+
+        Must be called with the lock held.
+
+        """
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= old.size
+
+        if entry.size > self.max_size:
+            return
+
+        self._entries[key] = entry
+        self._size += entry.size
+
+        while self._size > self.max_size:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+
+
+def _source_key(source):
+    """Normalize a source, returning the key and whether it is a URL."""
+    if isinstance(source, str) and _p_url.match(source):
+        return source, True
+
+    return str(Path(source).resolve()), False
+
+
+#: :class:`Registry` used by the module-level :func:`get`
+default_registry = Registry()
+
+
+def get(source, *, policy=None):
+    """Get the current inventory from a source, via the process-wide registry.
+
+    Equivalent to :meth:`default_registry.get(source, policy=policy)
+    <Registry.get>`. See :class:`Registry` for how inventories are
+    cached and revalidated.
+
+    .. doctest:: registry
+
+        >>> inv = soi.registry.get("objects_attrs.inv")
+        >>> inv is soi.registry.get("objects_attrs.inv")
+        True
+
+    Parameters
+    ----------
+    source
+
+        |str| or |Path| -- URL or local path of an inventory
+
+    policy
+
+        :class:`~sphobjinv.http.RequestPolicy` *(optional)* -- Timeouts,
+        retries, and hedging to apply to any URL request
+
+    Returns
+    -------
+    inv
+
+        |Inventory| -- Inventory from `source`, shared with all
+        other callers; treat it as read-only
+
+    """
+    return default_registry.get(source, policy=policy)
@@ -0,0 +1,452 @@
+r"""*Client for the* ``sphobjinv`` *daemon*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import json
+import os
+from pathlib import Path
+
+import attr
+
+from sphobjinv.error import DaemonError
+from sphobjinv.version import __version__ as soi_version
+
+#: Environment variable that, when set to anything other than an empty
+#: string or ``'0'``, stops the command-line interface using the daemon
+ENV_NO_DAEMON = "SPHOBJINV_NO_DAEMON"
+
+#: Environment variable overriding the path of the daemon state file
+ENV_STATE = "SPHOBJINV_DAEMON_STATE"
+
+#: Request header carrying the token from the daemon state file
+TOKEN_HEADER = "X-Sphobjinv-Token"  # noqa: S105
+
+
+def state_path():
+    """Return the path of the file describing the running daemon.
+
+    The file is ``sphobjinv-daemon.json`` in ``$XDG_RUNTIME_DIR``,
+    if set, and otherwise is named for the current user within
+    the temporary directory. The location can be overridden with
+    the ``SPHOBJINV_DAEMON_STATE`` environment variable.
+
+    Returns
+    -------
+    path
+
+        |Path| -- Path of the state file
+
+    """
+    if override := os.environ.get(ENV_STATE):
+        return Path(override)
+
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir) / "sphobjinv-daemon.json"
+
+    import getpass
+    import tempfile
+
+    return Path(tempfile.gettempdir()) / f"sphobjinv-daemon-{getpass.getuser()}.json"
+
+
+def _read_state(path):
+    """Read the daemon state file, if only the current user can have written it.
+
+    Returns |None| if the file is owned by another user or is accessible
+    to group or others, since the file could then point at a server
+    run by someone else.
+
+    """
+    with Path(path).open("rb") as f:
+        st = os.fstat(f.fileno())
+
+        # There are no POSIX ownership and modes to check on Windows
+        if hasattr(os, "getuid") and (st.st_uid != os.getuid() or st.st_mode & 0o077):
+            return None
+
+        return json.loads(f.read())
+
+
+def _is_loopback(host):
+    """Report whether `host` is a loopback address."""
+    import ipaddress
+
+    if host == "localhost":
+        return True
+
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def daemon_disabled():
+    """Report whether use of the daemon is disabled by the environment.
+
+    The command-line interface does not use the daemon if this
+    returns |True|. Set ``SPHOBJINV_NO_DAEMON=1`` to disable it.
+
+    """
+    return os.environ.get(ENV_NO_DAEMON, "") not in ("", "0")
+
+
+@attr.s(slots=True, frozen=True)
+class DaemonClient:
+    """Client for a :class:`~sphobjinv.daemon.DaemonServer`.
+
+    Usually obtained with :meth:`discover`, which finds the daemon
+    started by ``sphobjinv daemon`` for the current user.
+
+    .. code-block:: python
+
+        client = soi.remote.DaemonClient.discover()
+        if client is not None:
+            inv = client.load("objects.inv")
+            inv.suggest("evolve")
+
+    Every method raises :class:`~sphobjinv.error.DaemonError` if the
+    request cannot be made or the daemon reports a failure.
+
+    """
+
+    #: |int| -- Port on which the daemon listens
+    port = attr.ib()
+
+    #: |str| -- Token authorizing requests to the daemon
+    token = attr.ib(repr=False)
+
+    #: |str| -- Address on which the daemon listens
+    host = attr.ib(default="127.0.0.1")
+
+    #: |float| -- Seconds to wait for the connection and for each response
+    timeout = attr.ib(default=60.0)
+
+    @classmethod
+    def discover(cls, path=None):
+        """Find the running daemon from its state file.
+
+        No request is made, so the daemon may have exited since writing
+        the file; the first request then raises
+        :class:`~sphobjinv.error.DaemonError`.
+
+        Parameters
+        ----------
+        path
+
+            |str| or |Path| *(optional)* -- State file to read, in place of
+            :func:`state_path`
+
+        Returns
+        -------
+        client
+
+            :class:`DaemonClient` or |None| -- Client for the daemon,
+            or |None| if there is no state file, it was written by a
+            different version of |soi|, or it cannot be trusted. The file
+            is trusted only if it is owned by the current user, is not
+            accessible to group or others, and names a loopback host.
+
+        """
+        try:
+            state = _read_state(path or state_path())
+            if state is None or state["version"] != soi_version:
+                return None
+
+            host, port, token = state["host"], state["port"], state["token"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if (
+            not isinstance(host, str)
+            or not _is_loopback(host)
+            or type(port) is not int
+            or not 0 < port < 65536
+            or not isinstance(token, str)
+        ):
+            return None
+
+        return cls(port=port, token=token, host=host)
+
+    def request(self, endpoint, payload=None):
+        """Send a request to the daemon.
+
+        Parameters
+        ----------
+        endpoint
+
+            |str| -- Path of the request, such as ``'/suggest'``
+
+        payload
+
+            |dict| *(optional)* -- Arguments, sent as a JSON ``POST`` body.
+            If |None|, a ``GET`` request is sent.
+
+        Returns
+        -------
+        content_type
+
+            |str| -- Content type of the response
+
+        body
+
+            |bytes| -- Body of the response
+
+        """
+        import http.client
+
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        headers = {TOKEN_HEADER: self.token}
+
+        try:
+            if payload is None:
+                conn.request("GET", endpoint, headers=headers)
+            else:
+                headers["Content-Type"] = "application/json"
+                conn.request(
+                    "POST", endpoint, body=json.dumps(payload).encode(), headers=headers
+                )
+
+            resp = conn.getresponse()
+            body = resp.read()
+        except (OSError, http.client.HTTPException) as e:
+            raise DaemonError(f"Request to daemon failed: {e}") from e
+        finally:
+            conn.close()
+
+        if resp.status != 200:
+            try:
+                message = json.loads(body)["error"]
+            except (ValueError, KeyError, TypeError):
+                message = resp.reason
+            raise DaemonError(message, resp.status)
+
+        return resp.headers.get("Content-Type", ""), body
+
+    def request_json(self, endpoint, payload=None):
+        """Send a request to the daemon, decoding the JSON response.
+
+        Takes the same arguments as :meth:`request`.
+
+        """
+        return json.loads(self.request(endpoint, payload)[1])
+
+    def status(self):
+        """Describe the daemon and the inventories it holds.
+
+        Returns
+        -------
+        status
+
+            |dict| -- The daemon's |soi| version, process ID, and port,
+            the number of requests it has served, and the ``inventories``,
+            ``size``, ``hits``, and ``misses`` of its
+            :class:`~sphobjinv.registry.Registry`
+
+        """
+        return self.request_json("/status")
+
+    def load(self, source):
+        """Have the daemon load an inventory, if it isn't already held.
+
+        Parameters
+        ----------
+        source
+
+            |str| or |Path| -- URL of a zlib-compressed |objects.inv|,
+            or path to a local inventory file. Relative paths are taken
+            relative to the current directory of the caller.
+
+        Returns
+        -------
+        inv
+
+            :class:`RemoteInventory` -- Proxy for the inventory
+            held by the daemon
+
+        """
+        source = _normalize_source(source)
+        header = self.request_json("/load", {"source": source})
+
+        return RemoteInventory(
+            client=self,
+            source=source,
+            project=header["project"],
+            version=header["version"],
+            count=header["count"],
+        )
+
+    def shutdown(self):
+        """Stop the daemon."""
+        self.request("/shutdown", {})
+
+
+def _normalize_source(source):
+    """Make a local path absolute, leaving URLs unchanged."""
+    source = str(source)
+
+    if "://" in source:
+        return source
+
+    return os.path.abspath(source)
+
+
+@attr.s(slots=True)
+class RemoteInventory:
+    """Proxy for an |Inventory| held by a daemon.
+
+    Obtained from :meth:`DaemonClient.load`. Provides the header values
+    of the inventory and the methods of |Inventory| used to search and
+    convert it, each of which makes a request to the daemon.
+
+    """
+
+    #: :class:`DaemonClient` -- Client for the daemon holding the inventory
+    client = attr.ib(repr=False)
+
+    #: |str| -- URL or absolute path of the inventory
+    source = attr.ib()
+
+    #: |str| -- Project name of the inventory
+    project = attr.ib()
+
+    #: |str| -- Project version of the inventory
+    version = attr.ib()
+
+    #: |int| -- Number of objects in the inventory
+    count = attr.ib()
+
+    def suggest(
+        self,
+        name,
+        *,
+        thresh=50,
+        with_index=False,
+        with_score=False,
+        deadline=None,
+        domain=None,
+        role=None,
+    ):
+        """Suggest objects in the inventory to match a name.
+
+        Takes the same arguments as, and returns the same results as,
+        :meth:`Inventory.suggest() <sphobjinv.inventory.Inventory.suggest>`.
+        The daemon keeps the search data for the inventory and caches
+        the results, so repeated searches are fast.
+
+        """
+        resp = self.client.request_json(
+            "/suggest",
+            {
+                "source": self.source,
+                "name": name,
+                "thresh": thresh,
+                "with_index": with_index,
+                "with_score": with_score,
+                "deadline": deadline,
+                "domain": domain,
+                "role": role,
+            },
+        )
+
+        res_l = resp["results"]
+        if with_index or with_score:
+            res_l = [tuple(res) for res in res_l]
+
+        if deadline is None:
+            return res_l
+        else:
+            return res_l, resp["exhaustive"]
+
+    def lookup(self, name, *, domain=None, role=None):
+        r"""Find the objects named exactly `name`.
+
+        Parameters
+        ----------
+        name
+
+            |str| -- Object name
+
+        domain
+
+            |str| *(optional)* -- Only return objects in this Sphinx domain
+
+        role
+
+            |str| *(optional)* -- Only return objects with this Sphinx role
+
+        Returns
+        -------
+        res_l
+
+            |list| of |tuple| -- |cour|\ (index, obj_dict)\ |/cour| for
+            each matching object, where `obj_dict` is as from
+            :meth:`DataObjStr.json_dict() <sphobjinv.data.SuperDataObj.json_dict>`
+
+        """
+        resp = self.client.request_json(
+            "/lookup",
+            {"source": self.source, "name": name, "domain": domain, "role": role},
+        )
+
+        return [(res["index"], res["object"]) for res in resp["objects"]]
+
+    def data_file(self, *, expand=False, contract=False):
+        """Generate a plaintext |objects.inv| as |bytes|.
+
+        As for
+        :meth:`Inventory.data_file() <sphobjinv.inventory.Inventory.data_file>`.
+
+        """
+        return self.client.request(
+            "/convert",
+            {
+                "source": self.source,
+                "mode": "plain",
+                "expand": expand,
+                "contract": contract,
+            },
+        )[1]
+
+    def json_dict(self, expand=False, contract=False):
+        """Generate a flat |dict| representation of the inventory.
+
+        As for
+        :meth:`Inventory.json_dict() <sphobjinv.inventory.Inventory.json_dict>`.
+
+        """
+        return self.client.request_json(
+            "/convert",
+            {
+                "source": self.source,
+                "mode": "json",
+                "expand": expand,
+                "contract": contract,
+            },
+        )
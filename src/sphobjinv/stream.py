@@ -0,0 +1,350 @@
+r"""*Streaming conversion of* ``sphobjinv`` *inventories*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import os
+import time
+from pathlib import Path
+
+from sphobjinv.enum import HeaderFields, Phase
+from sphobjinv.header import peek_header
+from sphobjinv.instrument import _ChunkTimer, emit, enabled
+from sphobjinv.inventory import _MATCH_MAX_LINES, Inventory, _settled_offset
+from sphobjinv.zlib import BUFSIZE, iter_compress, iter_decompress
+
+
+def _expand(name, uri, dispname):
+    """Expand the abbreviations in a data line, as for |DataObjStr|."""
+    if uri.endswith(b"$"):
+        uri = uri[:-1] + name
+    if dispname == b"-":
+        dispname = name
+    return uri, dispname
+
+
+def _contract(name, uri, dispname):
+    """Apply the abbreviations to a data line, as for |DataObjStr|."""
+    if uri.endswith(name):
+        uri = uri[: -len(name)] + b"$"
+    if dispname == name:
+        dispname = b"-"
+    return uri, dispname
+
+
+def iter_plaintext(pieces, *, expand=False, contract=False):
+    r"""Regenerate a plaintext inventory from its text, without building objects.
+
+    The header and data lines are matched exactly as when an |Inventory|
+    is loaded from the text, and are then written back out, so the output
+    is identical to that of
+    :meth:`Inventory.data_file() <sphobjinv.inventory.Inventory.data_file>`.
+    However, no objects are created, and only a few lines at a time
+    are held in memory.
+
+    Lines that are not valid data lines are dropped, as when loading
+    an |Inventory|.
+
+    Parameters
+    ----------
+    pieces
+
+        iterable of |bytes| -- Successive pieces of a plaintext
+        |objects.inv|, such as from :func:`~sphobjinv.zlib.iter_decompress`
+
+    expand
+
+        |bool| *(optional)* -- Expand any
+        :data:`~sphobjinv.data.SuperDataObj.uri` or
+        :data:`~sphobjinv.data.SuperDataObj.dispname` abbreviations
+
+    contract
+
+        |bool| *(optional)* -- Abbreviate
+        :data:`~sphobjinv.data.SuperDataObj.uri` and
+        :data:`~sphobjinv.data.SuperDataObj.dispname` values
+
+    Yields
+    ------
+    out_b
+
+        |bytes| -- Successive pieces of the plaintext |objects.inv|,
+        with ``\n`` newlines
+
+    Raises
+    ------
+    ValueError
+
+        If both `expand` and `contract` are |True|, if the header
+        lacks the project or version, or if no data lines are found.
+        These are raised before anything is yielded.
+
+    """
+    from sphobjinv.re import pb_data, pb_project, pb_version
+
+    if expand and contract:
+        raise ValueError("'expand' and 'contract' cannot both be true.")
+
+    transform = _expand if expand else _contract if contract else None
+
+    buf = b""
+    pos = 0
+    header = {pb_project: None, pb_version: None}
+    lines = []
+    started = False
+
+    def parse(limit):
+        """Consume the data lines ending before `limit`."""
+        nonlocal pos
+
+        for ptn, mch in header.items():
+            if mch is None:
+                header[ptn] = ptn.search(buf, pos, limit)
+
+        for mch in pb_data.finditer(buf, pos):
+            if mch.end() >= limit:
+                break
+
+            name, domain, role, priority, uri, dispname = mch.groups()
+            if transform is not None:
+                uri, dispname = transform(name, uri, dispname)
+
+            lines.append(
+                b"%s %s:%s %s %s %s\n" % (name, domain, role, priority, uri, dispname)
+            )
+            pos = mch.end()
+
+    def header_bytes():
+        """Compose the header lines, as for Inventory.data_file()."""
+        project = header[pb_project].group(HeaderFields.Project.value)
+        version = header[pb_version].group(HeaderFields.Version.value)
+
+        return b"".join(
+            s.encode("utf-8") + b"\n"
+            for s in (
+                Inventory.header_preamble,
+                Inventory.header_project.format(project=project.decode("utf-8")),
+                Inventory.header_version.format(version=version.decode("utf-8")),
+                Inventory.header_zlib,
+            )
+        )
+
+    for piece in pieces:
+        buf += piece
+        limit = _settled_offset(buf, _MATCH_MAX_LINES)
+
+        if limit <= pos:
+            continue
+
+        parse(limit)
+
+        # Drop consumed text, keeping the line containing `pos`
+        # so that line-start anchors behave as on the full text
+        cut = buf.rfind(b"\n", 0, pos) + 1
+        buf = buf[cut:]
+        pos -= cut
+
+        # Output starts once the header and the first data line are found
+        if lines and None not in header.values():
+            if not started:
+                yield header_bytes()
+                started = True
+
+            yield b"".join(lines)
+            lines.clear()
+
+    parse(len(buf) + 1)
+
+    if None in header.values():
+        raise ValueError("Inventory header lacks project or version")
+
+    if not started and not lines:
+        raise ValueError("No objects found in plaintext")
+
+    if not started:
+        yield header_bytes()
+
+    yield b"".join(lines)
+
+
+def check_file(in_path):
+    """Check that an inventory file starts out convertible by :func:`convert_file`.
+
+    Only the start of the file is read, up to the first few data lines,
+    so this is cheap even for large inventories. Corrupt data further
+    into the file is only found by converting it.
+
+    Parameters
+    ----------
+    in_path
+
+        |str| or |Path| -- Path to a plaintext or zlib-compressed
+        |objects.inv|
+
+    Raises
+    ------
+    ValueError
+
+        If `in_path` is not a valid inventory
+
+    zlib.error
+
+        If the start of the compressed data in `in_path` is corrupt
+
+    """
+    header = peek_header(in_path)
+
+    with open(in_path, "rb") as f:
+        pieces = iter(lambda: f.read(BUFSIZE), b"")
+
+        if header.compressed:
+            pieces = iter_decompress(pieces)
+
+        next(iter_plaintext(pieces))
+
+
+def convert_file(in_path, out_path, *, compress=False, expand=False, contract=False):
+    """Convert an inventory file between plaintext and zlib-compressed formats.
+
+    The input is streamed through :func:`~sphobjinv.zlib.iter_decompress`
+    (if compressed), :func:`iter_plaintext`, and
+    :func:`~sphobjinv.zlib.iter_compress` (if `compress` is |True|),
+    so memory use does not depend on the size of the inventory.
+    The output is the same as from writing the result of
+    :meth:`Inventory.data_file() <sphobjinv.inventory.Inventory.data_file>`,
+    compressed or with OS-local newlines, for an |Inventory|
+    loaded from `in_path`.
+
+    The output is written to a temporary file alongside `out_path`,
+    which replaces `out_path` only once the conversion is complete.
+    `out_path` may thus be the same as `in_path`.
+
+    Parameters
+    ----------
+    in_path
+
+        |str| or |Path| -- Path to a plaintext or zlib-compressed
+        |objects.inv|. JSON inventories are not supported.
+
+    out_path
+
+        |str| or |Path| -- Path to the output file
+
+    compress
+
+        |bool| *(optional)* -- Write zlib-compressed output, rather than
+        plaintext
+
+    expand
+
+        |bool| *(optional)* -- As for :func:`iter_plaintext`
+
+    contract
+
+        |bool| *(optional)* -- As for :func:`iter_plaintext`
+
+    Raises
+    ------
+    ValueError
+
+        If `in_path` is not a valid inventory, or if both
+        `expand` and `contract` are |True|
+
+    zlib.error
+
+        If the compressed data in `in_path` is corrupt
+
+    """
+    header = peek_header(in_path)
+    out_path = Path(out_path)
+    tmp_path = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+
+    # With instrumentation, each stage is timed as its pieces are pulled
+    # through, and reported once the conversion is complete
+    timing = enabled()
+
+    with open(in_path, "rb") as f:
+        pieces = read_timer = _ChunkTimer(iter(lambda: f.read(BUFSIZE), b""))
+
+        if header.compressed:
+            pieces = decompress_timer = _ChunkTimer(iter_decompress(pieces))
+
+        pieces = parse_timer = _ChunkTimer(
+            iter_plaintext(pieces, expand=expand, contract=contract)
+        )
+
+        if compress:
+            pieces = iter_compress(pieces)
+        else:
+            linesep = os.linesep.encode("utf-8")
+            pieces = (piece.replace(b"\n", linesep) for piece in pieces)
+
+        pieces = output_timer = _ChunkTimer(pieces)
+
+        # Nothing is written until the input has been found to be valid
+        start = time.perf_counter()
+        first = next(pieces)
+
+        try:
+            with open(tmp_path, "wb") as out:
+                out.write(first)
+
+                for piece in pieces:
+                    out.write(piece)
+
+            os.replace(tmp_path, out_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        total = time.perf_counter() - start
+
+    if timing:
+        # Each timer includes the time spent in the stages feeding it
+        upstream = read_timer.seconds
+        emit(Phase.Read, upstream, size=read_timer.size)
+
+        if header.compressed:
+            emit(
+                Phase.Decompress,
+                decompress_timer.seconds - upstream,
+                size=decompress_timer.size,
+            )
+            upstream = decompress_timer.seconds
+
+        emit(Phase.LineParse, parse_timer.seconds - upstream, size=parse_timer.size)
+
+        if compress:
+            emit(
+                Phase.Compress,
+                output_timer.seconds - parse_timer.seconds,
+                size=output_timer.size,
+            )
+
+        emit(Phase.Write, total - output_timer.seconds, size=output_timer.size)
@@ -0,0 +1,559 @@
+r"""*Helpers for* ``sphobjinv`` *object-name suggestions*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+import attr
+
+from sphobjinv._vendored.fuzzywuzzy import fuzz, utils
+from sphobjinv.enum import Phase
+from sphobjinv.instrument import PhaseTimer
+
+
+@attr.s(slots=True, frozen=True, eq=False)
+class SearchData:
+    r"""Precomputed per-object strings used when scoring suggestions.
+
+    Built once per set of inventory contents by
+    :meth:`Inventory.suggest() <sphobjinv.inventory.Inventory.suggest>`
+    and cached on the |Inventory|.
+
+    """
+
+    #: |list| of |str| reST-like representations of the objects
+    #: (see :attr:`SuperDataObj.as_rst <sphobjinv.data.SuperDataObj.as_rst>`)
+    rst = attr.ib(repr=False)
+
+    #: |list| of |str| scoring choices, each the object's list index
+    #: prepended to its reST-like representation, pre-processed as
+    #: |fuzzywuzzy|_ does for its default scorer
+    choices = attr.ib(repr=False)
+
+    #: |list| of |str| case- and punctuation-folded reST-like
+    #: representations, used to rank candidates for bounded searches
+    folded = attr.ib(repr=False)
+
+    #: |dict| mapping each |cour|\ (domain, role)\ |/cour| pair present
+    #: to the |tuple| of |int| indices of the objects having it
+    groups = attr.ib(repr=False)
+
+    @classmethod
+    def from_objects(cls, objects):
+        """Build search data for a sequence of |DataObjStr|.
+
+        Parameters
+        ----------
+        objects
+
+            |list| of |DataObjStr| -- Objects to be searched
+
+        Returns
+        -------
+        data
+
+            :class:`SearchData` -- New search data over `objects`
+
+        """
+        rst = [o.as_rst for o in objects]
+        groups = {}
+
+        for i, o in enumerate(objects):
+            groups.setdefault((o.domain, o.role), []).append(i)
+
+        return cls(
+            rst=rst,
+            choices=[utils.asciidammit(f"{i} {r}") for i, r in enumerate(rst)],
+            folded=[utils.full_process(r) for r in rst],
+            groups={k: tuple(v) for k, v in groups.items()},
+        )
+
+    def select(self, domain=None, role=None):
+        """Get the indices of the objects with a given domain and/or role.
+
+        Parameters
+        ----------
+        domain
+
+            |str| *(optional)* -- Sphinx domain to select
+
+        role
+
+            |str| *(optional)* -- Sphinx role to select
+
+        Returns
+        -------
+        candidates
+
+            sequence of |int| -- Indices of the selected objects,
+            in ascending order; all objects if neither
+            `domain` nor `role` is given
+
+        """
+        if domain is None and role is None:
+            return range(len(self.rst))
+
+        if domain is not None and role is not None:
+            return self.groups.get((domain, role), ())
+
+        return sorted(
+            idx
+            for (d, r), indices in self.groups.items()
+            if domain in (None, d) and role in (None, r)
+            for idx in indices
+        )
+
+
+def rank_candidates(name, data, candidates):
+    """Order candidates so that the most promising are scored first.
+
+    Candidates whose folded reST-like representation contains the
+    folded search term come first, followed by the rest
+    in descending order of the number of search-term trigrams
+    they contain. Ties are broken by list index.
+
+    Parameters
+    ----------
+    name
+
+        |str| -- Search term
+
+    data
+
+        :class:`SearchData` -- Search data for the inventory
+
+    candidates
+
+        iterable of |int| -- Indices of the objects to rank
+
+    Returns
+    -------
+    ranked
+
+        |list| of |int| -- `candidates`, reordered
+
+    """
+    query = utils.full_process(name)
+    grams = {"".join(g) for g in zip(query, query[1:], query[2:])} or {query}
+    folded = data.folded
+
+    def sort_key(idx):
+        """Rank substring hits first, then by trigram overlap."""
+        text = folded[idx]
+        return (query not in text, -sum(g in text for g in grams), idx)
+
+    return sorted(candidates, key=sort_key)
+
+
+def score_candidates(name, data, candidates, thresh, *, deadline=None):
+    r"""Score candidates against a search term, optionally within a time budget.
+
+    Candidates are scored in the order given, until all are scored
+    or the `deadline` passes, whichever comes first.
+
+    Only the scoring is bounded by `deadline`: any time spent building
+    `data` or ordering `candidates` must be accounted for by the caller.
+
+    Parameters
+    ----------
+    name
+
+        |str| -- Search term
+
+    data
+
+        :class:`SearchData` -- Search data for the inventory
+
+    candidates
+
+        iterable of |int| -- Indices of the objects to score
+
+    thresh
+
+        |float| -- Minimum score for inclusion in the results
+
+    deadline
+
+        |float| *(optional)* -- Absolute :func:`time.monotonic` time
+        after which no further candidates are scored
+
+    Returns
+    -------
+    results
+
+        |list| of |tuple| -- |cour|\ (rst, score, index)\ |/cour| for each
+        scored candidate at or above `thresh`, in descending order of score
+        and then ascending order of index
+
+    exhaustive
+
+        |bool| -- |True| if every candidate was scored
+
+    """
+    choices = data.choices
+    scored = []
+    exhaustive = True
+    count = 0
+
+    with PhaseTimer(Phase.SuggestScore) as timer:
+        for idx in candidates:
+            if deadline is not None and time.monotonic() >= deadline:
+                exhaustive = False
+                break
+
+            score = fuzz.WRatio(name, choices[idx])
+            count += 1
+            if score >= thresh:
+                scored.append((score, idx))
+
+        scored.sort(key=lambda tup: (-tup[0], tup[1]))
+        timer.count = count
+
+    rst = data.rst
+
+    return [(rst[idx], score, idx) for score, idx in scored], exhaustive
+
+
+def select_fields(results, with_index, with_score):
+    r"""Reduce full suggest results to the fields requested.
+
+    Parameters
+    ----------
+    results
+
+        |list| of |tuple| -- |cour|\ (rst, score, index)\ |/cour|
+        results, as returned by :func:`score_candidates`
+
+    with_index
+
+        |bool| -- Retain the index of each object
+
+    with_score
+
+        |bool| -- Retain the score of each object
+
+    Returns
+    -------
+    res_l
+
+        |list| -- Results in the form documented for
+        :meth:`Inventory.suggest() <sphobjinv.inventory.Inventory.suggest>`
+
+    """
+    if with_score:
+        if with_index:
+            return list(results)
+        else:
+            return [tup[:2] for tup in results]
+    else:
+        if with_index:
+            return [tup[::2] for tup in results]
+        else:
+            return [tup[0] for tup in results]
+
+
+@attr.s(slots=True, eq=False)
+class SuggestSession:
+    """Stateful suggest search that refines its results as a query is typed.
+
+    Each call to :meth:`suggest` whose search term extends the previous one
+    (e.g., ``'np.arr'`` followed by ``'np.arra'``) only rescores the
+    objects that scored at least :attr:`thresh` minus :attr:`slack`
+    on the previous term. Any other change to the search term,
+    the session settings, or the contents of the inventory
+    triggers a full search.
+
+    .. doctest:: suggest_session
+
+        >>> inv = soi.Inventory("objects_attrs.inv")
+        >>> session = soi.SuggestSession(inv, thresh=75)
+        >>> session.suggest("attr.evo")
+        [':py:function:`attr.attr.evolve`', ':py:function:`attrs.evolve`']
+        >>> session.suggest("attr.evolve")  # doctest: +NORMALIZE_WHITESPACE
+        [':py:function:`attr.attr.evolve`', ':py:function:`attrs.evolve`',
+         ':py:method:`attrs.Attribute.evolve`']
+        >>> session.refined
+        True
+
+    Since the |fuzzywuzzy|_ score of an object can rise as the search
+    term grows, refinement is an approximation: an object scoring more
+    than :attr:`slack` below :attr:`thresh` on one search term, but at or
+    above :attr:`thresh` on an extension of it, will be missed.
+    Larger values of :attr:`slack` make this less likely,
+    at the cost of more rescoring.
+    Setting :attr:`slack` to |None| disables refinement.
+
+    """
+
+    #: |Inventory| to be searched
+    inventory = attr.ib()
+
+    #: |float| -- |fuzzywuzzy|_ match quality threshold
+    thresh = attr.ib(default=50)
+
+    #: |float| or |None| -- Margin below :attr:`thresh` within which
+    #: objects are retained for rescoring on the next search term
+    slack = attr.ib(default=20)
+
+    #: |str| or |None| -- Only search objects in this Sphinx domain
+    domain = attr.ib(default=None)
+
+    #: |str| or |None| -- Only search objects with this Sphinx role
+    role = attr.ib(default=None)
+
+    #: |bool| -- Whether the most recent search was answered by
+    #: refining the results of the previous one
+    refined = attr.ib(init=False, default=False)
+
+    # State from the previous search: the query, the settings and
+    # search data it was run with, and its full results at or above
+    # thresh - slack
+    _query = attr.ib(init=False, default=None, repr=False)
+    _settings = attr.ib(init=False, default=None, repr=False)
+    _data = attr.ib(init=False, default=None, repr=False)
+    _scored = attr.ib(init=False, default=None, repr=False)
+
+    # Search data of the inventory, kept across searches along with the
+    # inventory contents key it was built for
+    _snapshot = attr.ib(init=False, default=None, repr=False)
+    _snapshot_key = attr.ib(init=False, default=None, repr=False)
+
+    def reset(self):
+        """Discard the state from the previous search."""
+        self._query = None
+        self._settings = None
+        self._data = None
+        self._scored = None
+        self.refined = False
+
+    def _search_data(self):
+        """Get the search data, fetching it only if the contents changed."""
+        inv = self.inventory
+        key = inv._contents_key()
+
+        if self._snapshot is None or key != self._snapshot_key:
+            self._snapshot = inv._cached_derived("search_data", SearchData.from_objects)
+            self._snapshot_key = key
+
+        return self._snapshot
+
+    def suggest(self, name, *, with_index=False, with_score=False, deadline=None):
+        r"""Suggest objects in the inventory to match a name.
+
+        Arguments and return values are as for
+        :meth:`Inventory.suggest() <sphobjinv.inventory.Inventory.suggest>`,
+        with the match threshold and domain/role filters taken from
+        :attr:`thresh`, :attr:`domain`, and :attr:`role`.
+
+        A search cut short by `deadline` is not used as the basis
+        for refining the next one.
+
+        As for :meth:`Inventory.suggest()
+        <sphobjinv.inventory.Inventory.suggest>`, a search that has to
+        build the search data for the inventory can overrun `deadline`.
+
+        """
+        end_time = None if deadline is None else time.monotonic() + deadline
+
+        data = self._search_data()
+        settings = (self.thresh, self.slack, self.domain, self.role)
+
+        self.refined = (
+            self.slack is not None
+            and self._query is not None
+            and data is self._data
+            and settings == self._settings
+            and name.startswith(self._query)
+        )
+
+        if self.refined:
+            candidates = sorted(tup[2] for tup in self._scored)
+        else:
+            candidates = data.select(self.domain, self.role)
+
+        if end_time is not None and time.monotonic() < end_time:
+            candidates = rank_candidates(name, data, candidates)
+
+        floor = self.thresh if self.slack is None else self.thresh - self.slack
+        scored, exhaustive = score_candidates(
+            name, data, candidates, floor, deadline=end_time
+        )
+
+        if exhaustive:
+            self._query = name
+            self._settings = settings
+            self._data = data
+            self._scored = scored
+        else:
+            self.reset()
+
+        res_l = select_fields(
+            [tup for tup in scored if tup[1] >= self.thresh], with_index, with_score
+        )
+
+        if deadline is None:
+            return res_l
+        else:
+            return res_l, exhaustive
+
+
+@attr.s(slots=True, eq=False)
+class SuggestCache:
+    """Bounded LRU cache of :meth:`Inventory.suggest` results.
+
+    Caching is opt-in, per |Inventory|, and transparent to callers of
+    :meth:`~sphobjinv.inventory.Inventory.suggest`:
+
+    .. doctest:: suggest_cache
+
+        >>> inv = soi.Inventory("objects_attrs.inv")
+        >>> inv.suggest_cache = soi.SuggestCache(maxsize=64)
+        >>> first = inv.suggest("evolve")
+        >>> inv.suggest("evolve", with_score=True)[0][0] == first[0]
+        True
+        >>> inv.suggest_cache.hits, inv.suggest_cache.misses
+        (1, 1)
+
+    Entries are keyed on the search term, the match threshold,
+    and any domain/role filters.
+    The scored results are stored in full, so that calls differing only
+    in `with_index` and/or `with_score` share a single entry.
+
+    The cache is emptied automatically whenever the name, domain, or role
+    of any object in the inventory changes, or objects are added or removed.
+
+    Instances are safe to use from multiple threads.
+
+    The :attr:`hits` and :attr:`misses` counters are provided as an aid
+    to sizing the cache.
+
+    """
+
+    #: |int| maximum number of distinct queries to retain
+    maxsize = attr.ib(default=128, validator=attr.validators.instance_of(int))
+
+    #: |int| number of lookups answered from the cache
+    hits = attr.ib(init=False, default=0)
+
+    #: |int| number of lookups that required scoring
+    misses = attr.ib(init=False, default=0)
+
+    _entries = attr.ib(init=False, default=attr.Factory(OrderedDict), repr=False)
+    _contents_key = attr.ib(init=False, default=None, repr=False)
+    _lock = attr.ib(init=False, default=attr.Factory(threading.Lock), repr=False)
+
+    @maxsize.validator
+    def _check_maxsize(self, at, val):
+        """Ensure maxsize is positive."""
+        if val < 1:
+            raise ValueError("'maxsize' must be at least 1")
+
+    def __len__(self):
+        """Return the number of cached queries."""
+        return len(self._entries)
+
+    def clear(self):
+        """Discard all cached results and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._contents_key = None
+            self.hits = 0
+            self.misses = 0
+
+    def lookup(self, contents_key, query_key):
+        """Retrieve cached results, counting a hit or miss.
+
+        Parameters
+        ----------
+        contents_key
+
+            *hashable* -- Key identifying the current contents
+            of the inventory; a change empties the cache
+
+        query_key
+
+            *hashable* -- Key identifying the query
+
+        Returns
+        -------
+        results
+
+            |list| or |None| -- Copy of the cached results, or |None|
+            if the query is not cached
+
+        """
+        with self._lock:
+            if contents_key != self._contents_key:
+                self._entries.clear()
+                self._contents_key = contents_key
+
+            try:
+                results = self._entries[query_key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(query_key)
+            self.hits += 1
+            return list(results)
+
+    def store(self, contents_key, query_key, results):
+        """Add results to the cache, evicting the least recently used if full.
+
+        Results computed against contents other than the current ones
+        are discarded.
+
+        Parameters
+        ----------
+        contents_key
+
+            *hashable* -- Key identifying the inventory contents
+            from which `results` were computed
+
+        query_key
+
+            *hashable* -- Key identifying the query
+
+        results
+
+            |list| -- Results to cache
+
+        """
+        with self._lock:
+            if contents_key != self._contents_key:
+                return
+
+            self._entries[query_key] = list(results)
+            self._entries.move_to_end(query_key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -0,0 +1,502 @@
+r"""*Synthetic inventories for* ``sphobjinv`` *scaling tests*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import random
+import zlib
+from collections import Counter
+from itertools import accumulate
+
+import attr
+
+from sphobjinv.data import DataObjStr
+from sphobjinv.inventory import Inventory
+
+#: Maximum number of name segments distinguished when fitting a model
+MAX_DEPTH = 8
+
+#: Maximum name segment length distinguished when fitting a model
+MAX_SEGMENT = 32
+
+#: Name segment separators recognized when fitting a model
+SEPARATORS = (".", "/", ":", "-")
+
+# Number of distinct words from which name segments are built
+_VOCABULARY_SIZE = 16384
+
+# Probability that a parent name is reused rather than newly generated
+_PARENT_REUSE = 0.9
+
+# Number of recent parent names kept for reuse, per separator and depth
+_PARENT_POOL = 64
+
+_CONSONANTS = "bcdfghklmnprstvwxz"
+_VOWELS = "aeiouy"
+
+
+@attr.s(slots=True, frozen=True)
+class SynthRole:
+    """Fitted statistics for one domain/role/priority combination."""
+
+    #: |str| -- Sphinx domain
+    domain = attr.ib()
+
+    #: |str| -- Sphinx role
+    role = attr.ib()
+
+    #: |str| -- Search priority
+    priority = attr.ib()
+
+    #: |int| -- Relative frequency of the combination
+    weight = attr.ib()
+
+    #: |str| -- Separator between name segments
+    sep = attr.ib()
+
+    #: |float| -- Fraction of URIs with an anchor
+    anchor_rate = attr.ib()
+
+    #: |float| -- Fraction of anchored URIs abbreviated with ``$``
+    uri_abbrev_rate = attr.ib()
+
+    #: |float| -- Fraction of display names abbreviated as ``-``
+    disp_abbrev_rate = attr.ib()
+
+    #: |tuple| of |int| -- Relative frequencies of names with
+    #: 1, 2, ... :data:`MAX_DEPTH` segments
+    depths = attr.ib(converter=tuple)
+
+
+@attr.s(slots=True, frozen=True)
+class SynthModel:
+    """Distributions from which synthetic inventory objects are drawn.
+
+    The default model, :data:`DEFAULT_MODEL`, was fitted with :meth:`fit`
+    to the inventories in the ``tests/resource`` directory of the
+    repository.
+
+    """
+
+    #: |tuple| of :class:`SynthRole` -- Statistics by domain/role/priority
+    roles = attr.ib(converter=tuple)
+
+    #: |tuple| of |int| -- Relative frequencies of name segments of
+    #: length 1, 2, ... :data:`MAX_SEGMENT`
+    segment_lengths = attr.ib(converter=tuple)
+
+    @classmethod
+    def fit(cls, inventories, *, min_share=0.0005):
+        """Fit a model to the objects of existing inventories.
+
+        Parameters
+        ----------
+        inventories
+
+            iterable of |Inventory| -- Inventories to fit to
+
+        min_share
+
+            |float| *(optional)* -- Domain/role/priority combinations
+            making up a smaller fraction of all objects are omitted
+
+        Returns
+        -------
+        model
+
+            :class:`SynthModel` -- Fitted model
+
+        """
+        groups = {}
+        for inv in inventories:
+            for obj in inv.objects:
+                groups.setdefault((obj.domain, obj.role, obj.priority), []).append(obj)
+
+        total = sum(len(objs) for objs in groups.values())
+        segment_lengths = Counter()
+        roles = []
+
+        for (domain, role, priority), objs in groups.items():
+            if len(objs) < min_share * total:
+                continue
+
+            seps = Counter(s for o in objs for s in SEPARATORS if s in o.name)
+            sep = seps.most_common(1)[0][0] if seps else "."
+
+            anchored = [o for o in objs if "#" in o.uri]
+            depths = Counter()
+
+            for obj in objs:
+                segments = [s for s in obj.name.split(sep) if s]
+                depths[min(max(len(segments), 1), MAX_DEPTH)] += 1
+                segment_lengths.update(min(len(s), MAX_SEGMENT) for s in segments)
+
+            roles.append(
+                SynthRole(
+                    domain=domain,
+                    role=role,
+                    priority=priority,
+                    weight=len(objs),
+                    sep=sep,
+                    anchor_rate=_rate(len(anchored), len(objs)),
+                    uri_abbrev_rate=_rate(
+                        sum(o.uri.endswith("#$") for o in anchored), len(anchored)
+                    ),
+                    disp_abbrev_rate=_rate(
+                        sum(o.dispname == "-" for o in objs), len(objs)
+                    ),
+                    depths=(depths[d] for d in range(1, MAX_DEPTH + 1)),
+                )
+            )
+
+        roles.sort(key=lambda r: (-r.weight, r.domain, r.role, r.priority))
+
+        return cls(
+            roles=roles,
+            segment_lengths=(segment_lengths[n] for n in range(1, MAX_SEGMENT + 1)),
+        )
+
+
+# Statistics of each SynthRole of the default model, one per line, in field order
+_DEFAULT_ROLES = """
+py  method           1  36617 . 1     0.999 1     20 353 4182 9592 13358 8926 186 0
+std doc              -1 16360 / 0     0     0.003 760 6854 7817 625 216 85 3 0
+py  attribute        1  13651 . 1     1     1     27 110 1506 2312 5574 4061 59 2
+std label            -1 13362 - 0.987 0.498 0.215 8954 2411 1272 502 170 40 8 5
+py  function         1  9496  . 1     1     1     182 2239 2854 3484 722 15 0 0
+py  class            1  7175  . 1     1     1     54 626 1815 2935 1638 66 40 1
+py  module           0  2603  . 1     0     1     237 506 1155 662 42 1 0 0
+py  data             1  2530  . 1     1     1     205 1086 541 616 68 0 14 0
+ocv function         1  1737  : 1     1     1     451 916 274 44 43 8 1 0
+py  parameter        1  1595  . 1     1     1     0 0 0 30 298 582 634 51
+sip class            0  1526  . 1     0     1     0 0 1295 229 2 0 0 0
+c   function         1  1331  . 1     0     0.999 1328 1 2 0 0 0 0 0
+py  exception        1  763   . 1     1     1     67 163 280 229 21 2 1 0
+std cmdoption        1  633   - 1     0     1     67 290 215 55 4 2 0 0
+std confval          1  576   - 1     0     1     562 6 8 0 0 0 0 0
+std setting          1  470   - 1     0     1     452 18 0 0 0 0 0 0
+ocv cfunction        1  469   . 1     1     1     469 0 0 0 0 0 0 0
+std term             -1 436   - 1     0     1     425 11 0 0 0 0 0 0
+ocv pyfunction       1  296   . 1     1     1     0 242 54 0 0 0 0 0
+ocv pyoldfunction    1  295   . 1     1     1     0 295 0 0 0 0 0 0
+py  classmethod      1  251   . 1     1     1     0 6 57 58 104 25 1 0
+c   var              1  240   . 1     0     1     240 0 0 0 0 0 0 0
+ocv class            1  230   : 1     1     1     86 115 5 23 1 0 0 0
+c   member           1  187   . 1     0     0.984 5 134 48 0 0 0 0 0
+rst directive        1  187   : 1     0     1     98 88 1 0 0 0 0 0
+std token            -1 179   . 1     0     1     179 0 0 0 0 0 0 0
+std option           1  152   - 1     0     1     135 14 1 2 0 0 0 0
+ocv member           1  141   : 1     1     1     133 5 3 0 0 0 0 0
+rst role             1  136   : 1     0     1     63 73 0 0 0 0 0 0
+std opcode           1  119   . 1     0     1     119 0 0 0 0 0 0 0
+py  staticmethod     1  102   . 1     1     1     0 3 2 37 52 6 2 0
+std fieldlookup      1  100   . 1     0     1     65 35 0 0 0 0 0 0
+py  property         1  89    . 1     1     1     0 0 0 18 62 9 0 0
+c   type             1  82    . 1     0     1     82 0 0 0 0 0 0 0
+std templatefilter   1  72    . 1     0     1     72 0 0 0 0 0 0 0
+ocv struct           1  68    : 1     1     1     50 16 2 0 0 0 0 0
+rst directive:option 1  61    : 1     0     1     0 33 27 1 0 0 0 0
+"""
+
+# Segment length frequencies of the default model
+_DEFAULT_SEGMENT_LENGTHS = """
+844 20059 20033 29110 41730 49439 31280 23470 41738 28165 15643 14132 12418 9809
+13606 8585 5401 6009 4651 4080 3382 2858 2165 1726 2247 1498 1135 1305 1002 697
+661 8034
+"""
+
+
+def _parse_roles(table):
+    """Build the :class:`SynthRole` instances described in `table`."""
+    roles = []
+    for line in table.strip().splitlines():
+        domain, role, priority, weight, sep, *rates, depths = line.split(maxsplit=8)
+        roles.append(
+            SynthRole(
+                domain,
+                role,
+                priority,
+                int(weight),
+                sep,
+                *map(float, rates),
+                map(int, depths.split()),
+            )
+        )
+    return roles
+
+
+#: :class:`SynthModel` fitted to the inventories in ``tests/resource``
+DEFAULT_MODEL = SynthModel(
+    roles=_parse_roles(_DEFAULT_ROLES),
+    segment_lengths=map(int, _DEFAULT_SEGMENT_LENGTHS.split()),
+)
+
+
+def _rate(count, total):
+    """Compute a fraction rounded for storage, zero if `total` is zero."""
+    return round(count / total, 3) if total else 0.0
+
+
+class _Generator:
+    """Random source of synthetic object fields, drawn from a model."""
+
+    def __init__(self, model, seed):
+        """Prepare to draw from `model`, with `seed` for the random numbers."""
+        self.rng = rng = random.Random(seed)  # noqa: S311
+        self.roles = model.roles
+        self.role_cum = list(accumulate(r.weight for r in model.roles))
+        self.depth_cum = [list(accumulate(r.depths)) for r in model.roles]
+
+        lengths = rng.choices(
+            range(1, MAX_SEGMENT + 1),
+            cum_weights=list(accumulate(model.segment_lengths)),
+            k=_VOCABULARY_SIZE,
+        )
+        self.words = [self._word(n) for n in lengths]
+
+        # Some words are much more common than others, as in real names
+        self.word_cum = list(
+            accumulate(1 / rank for rank in range(1, len(lengths) + 1))
+        )
+
+        self.parents = {}
+
+    def _word(self, length):
+        """Make a pronounceable word of `length` letters."""
+        rng = self.rng
+        first = rng.random() < 0.5
+        return "".join(
+            rng.choice(_CONSONANTS if (i % 2 == 0) == first else _VOWELS)
+            for i in range(length)
+        )
+
+    def _common_word(self):
+        """Draw a word, favoring the most common."""
+        return self.rng.choices(self.words, cum_weights=self.word_cum)[0]
+
+    def _parent(self, sep, depth):
+        """Draw a parent name of `depth` segments, usually a recent one."""
+        pool = self.parents.setdefault((sep, depth), [])
+
+        if pool and self.rng.random() < _PARENT_REUSE:
+            return self.rng.choice(pool)
+
+        word = self._common_word()
+        name = word if depth == 1 else self._parent(sep, depth - 1) + sep + word
+
+        pool.append(name)
+        if len(pool) > _PARENT_POOL:
+            del pool[0]
+
+        return name
+
+    def fields(self):
+        """Draw the name, domain, role, priority, URI, and display name."""
+        rng = self.rng
+        idx = rng.choices(range(len(self.roles)), cum_weights=self.role_cum)[0]
+        role = self.roles[idx]
+        sep = role.sep
+
+        leaf = rng.choice(self.words)
+        if rng.random() < 0.25:
+            leaf += "_" + rng.choice(self.words)
+        if role.role in ("class", "exception", "struct"):
+            leaf = "".join(w.capitalize() for w in leaf.split("_"))
+
+        depth = rng.choices(range(1, MAX_DEPTH + 1), cum_weights=self.depth_cum[idx])[0]
+        name = leaf if depth == 1 else self._parent(sep, depth - 1) + sep + leaf
+
+        if rng.random() < role.anchor_rate:
+            page = name.rpartition(sep)[0] or name
+            anchor = (
+                "$" if rng.random() < role.uri_abbrev_rate else role.role + "-" + name
+            )
+            uri = f"{page}.html#{anchor}"
+        else:
+            uri = f"{name}.html"
+
+        if rng.random() < role.disp_abbrev_rate:
+            dispname = "-"
+        else:
+            dispname = " ".join(w.capitalize() for w in leaf.split("_"))
+
+        return name, role.domain, role.role, role.priority, uri, dispname
+
+
+def iter_objects(count, *, seed=0, model=None):
+    """Generate synthetic inventory objects.
+
+    The objects are reproducible for a given `seed` and `model`
+    (with the same version of |soi|).
+
+    Parameters
+    ----------
+    count
+
+        |int| -- Number of objects to generate
+
+    seed
+
+        |int| *(optional)* -- Seed for the random numbers
+
+    model
+
+        :class:`SynthModel` *(optional)* -- Distributions to draw from,
+        by default :data:`DEFAULT_MODEL`
+
+    Yields
+    ------
+    obj
+
+        |DataObjStr| -- Each object in turn
+
+    """
+    gen = _Generator(model or DEFAULT_MODEL, seed)
+
+    for _ in range(count):
+        name, domain, role, priority, uri, dispname = gen.fields()
+        yield DataObjStr(
+            name=name,
+            domain=domain,
+            role=role,
+            priority=priority,
+            uri=uri,
+            dispname=dispname,
+        )
+
+
+def generate(count, *, seed=0, model=None, project="Synthetic", version="1.0"):
+    """Create a synthetic inventory.
+
+    .. doctest:: synth_generate
+
+        >>> inv = soi.synth.generate(1000, seed=42)
+        >>> inv.count
+        1000
+        >>> inv == soi.synth.generate(1000, seed=42)
+        True
+
+    Parameters
+    ----------
+    count
+
+        |int| -- Number of objects to generate
+
+    seed
+
+        |int| *(optional)* -- Seed for the random numbers
+
+    model
+
+        :class:`SynthModel` *(optional)* -- Distributions to draw from,
+        by default :data:`DEFAULT_MODEL`
+
+    project
+
+        |str| *(optional)* -- Project name for the inventory
+
+    version
+
+        |str| *(optional)* -- Project version for the inventory
+
+    Returns
+    -------
+    inv
+
+        |Inventory| -- Inventory holding the objects
+        from :func:`iter_objects`
+
+    """
+    inv = Inventory()
+    inv.project = project
+    inv.version = version
+    inv.objects.extend(iter_objects(count, seed=seed, model=model))
+    return inv
+
+
+def write(
+    path,
+    count,
+    *,
+    compress=True,
+    seed=0,
+    model=None,
+    project="Synthetic",
+    version="1.0",
+):
+    """Write a synthetic inventory to disk, without holding it in memory.
+
+    The file has the same contents as would be written from
+    :func:`generate` with the same arguments, so arbitrarily large
+    inventories can be created.
+
+    Parameters
+    ----------
+    path
+
+        |str| or |Path| -- File to write
+
+    count
+
+        |int| -- Number of objects to generate
+
+    compress
+
+        |bool| *(optional)* -- Whether to write a zlib-compressed
+        inventory, rather than plaintext
+
+    seed, model, project, version
+
+        As for :func:`generate`
+
+    """
+    gen = _Generator(model or DEFAULT_MODEL, seed)
+    header = "\n".join(
+        (
+            Inventory.header_preamble,
+            Inventory.header_project.format(project=project),
+            Inventory.header_version.format(version=version),
+            Inventory.header_zlib,
+            "",
+        )
+    )
+    compressor = zlib.compressobj(9) if compress else None
+
+    with open(path, "wb") as f:
+        f.write(header.encode("utf-8"))
+
+        for start in range(0, count, 4096):
+            block = "".join(
+                "{} {}:{} {} {} {}\n".format(*gen.fields())
+                for _ in range(min(4096, count - start))
+            ).encode("utf-8")
+            f.write(compressor.compress(block) if compress else block)
+
+        if compress:
+            f.write(compressor.flush())
@@ -33,6 +33,9 @@ import io
 import os
 import zlib
 
+from sphobjinv.enum import Phase
+from sphobjinv.instrument import PhaseTimer
+
 BUFSIZE = 16 * 1024  # 16k chunks
 
 
@@ -76,24 +79,137 @@ def decompress(bstr):
             yield decompressor.decompress(chunk)
         yield decompressor.flush()
 
-    # Make stream and output string
-    strm = io.BytesIO(bstr)
+    with PhaseTimer(Phase.Decompress) as timer:
+        # Make stream and output string
+        strm = io.BytesIO(bstr)
+
+        # Check to be sure it's v2
+        out_b = strm.readline()
+        if not out_b.endswith(b"2\n"):  # pragma: no cover
+            raise VersionError("Only v2 objects.inv files currently supported")
+
+        # Pull name, version, and description lines
+        parts = [out_b] + [strm.readline() for _ in range(3)]
+
+        # Decompress chunks and join all at once, since repeatedly
+        # appending to a bytes object takes time quadratic in its length
+        parts.extend(decompress_chunks(strm))
+        out_b = b"".join(parts)
+
+        # Replace newlines with the OS-local newlines
+        out_b = out_b.replace(b"\n", os.linesep.encode("utf-8"))
+        timer.size = len(out_b)
+
+    return out_b
+
+
+def iter_decompress(chunks):
+    """Decompress a version 2 |isphx| |objects.inv| incrementally.
+
+    Produces the same content as :func:`decompress`, but accepts the
+    compressed data in pieces, for example as it is being downloaded,
+    and emits decompressed data as soon as it is available.
+
+    Parameters
+    ----------
+    chunks
+
+        iterable of |bytes| -- Successive pieces of a compressed
+        |objects.inv| file
+
+    Yields
+    ------
+    out_b
+
+        |bytes| -- Successive pieces of the plaintext |objects.inv| content
+
+    Raises
+    ------
+    ~sphobjinv.error.VersionError
+
+        If the data is not from a version 2 |objects.inv| file
+
+    """
+    from sphobjinv.error import VersionError
+
+    linesep = os.linesep.encode("utf-8")
+    chunks = iter(chunks)
+    head = b""
+
+    # The four header lines are uncompressed
+    for chunk in chunks:
+        head += chunk
+        if head.count(b"\n") >= 4:
+            break
 
-    # Check to be sure it's v2
-    out_b = strm.readline()
-    if not out_b.endswith(b"2\n"):  # pragma: no cover
+    first_end = head.find(b"\n") + 1 or len(head)
+    if not head[:first_end].endswith(b"2\n"):  # pragma: no cover
         raise VersionError("Only v2 objects.inv files currently supported")
 
-    # Pull name, version, and description lines
+    split = first_end
     for _ in range(3):
-        out_b += strm.readline()
+        split = head.find(b"\n", split) + 1 or len(head)
 
-    # Decompress chunks and append
-    for chunk in decompress_chunks(strm):
-        out_b += chunk
+    yield head[:split].replace(b"\n", linesep)
 
-    # Replace newlines with the OS-local newlines, and return
-    return out_b.replace(b"\n", os.linesep.encode("utf-8"))
+    decompressor = zlib.decompressobj()
+    yield decompressor.decompress(head[split:]).replace(b"\n", linesep)
+
+    for chunk in chunks:
+        yield decompressor.decompress(chunk).replace(b"\n", linesep)
+
+    yield decompressor.flush().replace(b"\n", linesep)
+
+
+def iter_compress(chunks):
+    r"""Compress a version 2 |isphx| |objects.inv| incrementally.
+
+    The counterpart of :func:`iter_decompress`: the four header lines
+    are left unchanged, and everything after them is compressed with
+    :mod:`zlib` as it arrives.
+
+    Unlike :func:`compress`, no cleanup of the input is performed,
+    so it must already be in the form written by
+    :meth:`Inventory.data_file() <sphobjinv.inventory.Inventory.data_file>`,
+    with exactly four header lines and ``\n`` newlines. Such input
+    is compressed to the same bytes as by :func:`compress`.
+
+    Parameters
+    ----------
+    chunks
+
+        iterable of |bytes| -- Successive pieces of a plaintext
+        |objects.inv| file
+
+    Yields
+    ------
+    out_b
+
+        |bytes| -- Successive pieces of the compressed |objects.inv| content
+
+    """
+    chunks = iter(chunks)
+    head = b""
+
+    for chunk in chunks:
+        head += chunk
+        if head.count(b"\n") >= 4:
+            break
+
+    split = 0
+    for _ in range(4):
+        split = head.find(b"\n", split) + 1 or len(head)
+
+    yield head[:split]
+
+    # Level nine, as for compress()
+    compressor = zlib.compressobj(9)
+    yield compressor.compress(head[split:])
+
+    for chunk in chunks:
+        yield compressor.compress(chunk)
+
+    yield compressor.flush()
 
 
 def compress(bstr):
@@ -119,24 +235,28 @@ def compress(bstr):
     """
     from sphobjinv.re import pb_comments, pb_data
 
-    # Preconvert any DOS newlines to Unix
-    s = bstr.replace(b"\r\n", b"\n")
+    with PhaseTimer(Phase.Compress) as timer:
+        # Preconvert any DOS newlines to Unix
+        s = bstr.replace(b"\r\n", b"\n")
+
+        # Pull all of the lines
+        m_comments = pb_comments.findall(s)
+        m_data = pb_data.finditer(s)
 
-    # Pull all of the lines
-    m_comments = pb_comments.findall(s)
-    m_data = pb_data.finditer(s)
+        # Assemble the binary header comments and data
+        # Comments and data blocks must end in newlines
+        hb = b"\n".join(m_comments) + b"\n"
+        db = b"\n".join(_.group(0) for _ in m_data) + b"\n"
 
-    # Assemble the binary header comments and data
-    # Comments and data blocks must end in newlines
-    hb = b"\n".join(m_comments) + b"\n"
-    db = b"\n".join(_.group(0) for _ in m_data) + b"\n"
+        # Compress the data block
+        # Compression level nine is to match that specified in
+        #  sphinx html builder:
+        # https://github.com/sphinx-doc/sphinx/blob/1.4.1/sphinx/
+        #    builders/html.py#L843
+        dbc = zlib.compress(db, 9)
 
-    # Compress the data block
-    # Compression level nine is to match that specified in
-    #  sphinx html builder:
-    # https://github.com/sphinx-doc/sphinx/blob/1.4.1/sphinx/
-    #    builders/html.py#L843
-    dbc = zlib.compress(db, 9)
+        # Composite the bytestring
+        out_b = hb + dbc
+        timer.size = len(out_b)
 
-    # Return the composited bytestring
-    return hb + dbc
+    return out_b
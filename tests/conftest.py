@@ -34,6 +34,7 @@ import platform
 import re
 import shutil
 import sys
+import threading
 from enum import Enum
 from functools import partial
 from io import BytesIO
@@ -45,9 +46,15 @@ from sphinx import __version__ as sphinx_version_str
 from sphinx.util.inventory import InventoryFile as IFile
 
 import sphobjinv as soi
+import sphobjinv.daemon
 from sphobjinv.cli.core import main, main_textconv
 from tests.enum import CLICommand
-from tests.fixtures_http import resource_http_base_url, resource_url  # noqa: F401
+from tests.fixtures_http import (  # noqa: F401
+    keepalive_resource_server,
+    resource_http_base_url,
+    resource_url,
+    scripted_resource_server,
+)
 
 
 def pytest_addoption(parser):
@@ -66,6 +73,31 @@ def pytest_addoption(parser):
     )
 
 
+@pytest.fixture(autouse=True)
+def daemon_state(tmp_path, monkeypatch):
+    """Point the daemon state file into scratch, away from any running daemon."""
+    path = tmp_path / "daemon-state.json"
+    monkeypatch.setenv("SPHOBJINV_DAEMON_STATE", str(path))
+    monkeypatch.delenv("SPHOBJINV_NO_DAEMON", raising=False)
+    return path
+
+
+@pytest.fixture()
+def daemon_server(daemon_state):
+    """Run a DaemonServer in a thread, advertised in the scratch state file."""
+    server = soi.daemon.DaemonServer()
+    server.write_state()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    server.remove_state()
+    thread.join()
+
+
 @pytest.fixture(scope="session")
 def res_path():
     """Provide Path object to the test resource directory."""
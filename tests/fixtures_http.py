@@ -32,8 +32,11 @@ Sphinx |objects.inv| files.
 import contextlib
 import functools
 import http.server
+import re
 import socketserver
+import sys
 import threading
+import time
 from pathlib import Path
 from typing import Callable, Generator
 
@@ -56,20 +59,160 @@ class NoNameLookupHTTPServer(http.server.HTTPServer):
         self.server_port = port
 
 
+class KeepAliveHTTPServer(socketserver.ThreadingMixIn, NoNameLookupHTTPServer):
+    """Threaded HTTP/1.1 server that counts the client connections it accepts."""
+
+    daemon_threads = True
+    connection_count = 0
+
+    def process_request(self, request, client_address):
+        """Count the connection before handing it to a worker thread."""
+        self.connection_count += 1
+        super().process_request(request, client_address)
+
+
+class KeepAliveRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Request handler supporting persistent connections."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # noqa: A002
+        """Suppress per-request logging."""
+
+
+class RangeRequestHandler(KeepAliveRequestHandler):
+    """Request handler honoring single-range ``Range: bytes=a-b`` headers.
+
+    The ranges served are recorded in the class attribute ``ranges``.
+
+    """
+
+    ranges = []
+
+    def do_GET(self):  # noqa: N802
+        """Serve the requested byte range of a file, or all of it."""
+        mch = re.fullmatch(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        path = Path(self.translate_path(self.path))
+
+        if mch is None or not path.is_file():
+            super().do_GET()
+            return
+
+        data = path.read_bytes()
+        start, stop = int(mch.group(1)), int(mch.group(2)) + 1
+
+        if start >= len(data):
+            self.send_error(416)
+            return
+
+        body = data[start:stop]
+        self.ranges.append((start, start + len(body)))
+
+        self.send_response(206)
+        self.send_header(
+            "Content-Range", f"bytes {start}-{start + len(body) - 1}/{len(data)}"
+        )
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ScriptedHTTPServer(KeepAliveHTTPServer):
+    """Threaded HTTP/1.1 server that misbehaves as scripted.
+
+    Each request takes the next action from ``script``, if any:
+    an |int| is sent as an error status, and a |float| is a delay
+    in seconds before the file is served. The |str| ``"stall"`` sends
+    half of a requested file and then waits three seconds before
+    closing the connection, and ``"truncate"`` closes it after half
+    the file without waiting. Once ``script`` is exhausted,
+    files are served normally. ``request_count`` tallies all requests,
+    and ``statuses`` lists the status codes sent.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize with an empty script."""
+        super().__init__(*args, **kwargs)
+        self.script = []
+        self.request_count = 0
+        self.statuses = []
+        self.script_lock = threading.Lock()
+
+    def next_action(self):
+        """Count a request and return its scripted action, if any."""
+        with self.script_lock:
+            self.request_count += 1
+            return self.script.pop(0) if self.script else None
+
+    def handle_error(self, request, client_address):
+        """Ignore clients that gave up waiting on a delayed response."""
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class ScriptedRequestHandler(KeepAliveRequestHandler):
+    """Request handler carrying out the actions of a :class:`ScriptedHTTPServer`."""
+
+    def do_GET(self):  # noqa: N802
+        """Serve a GET request, after any scripted action."""
+        action = self.server.next_action()
+
+        if isinstance(action, int):
+            self.send_error(action)
+            return
+
+        if isinstance(action, float):
+            time.sleep(action)
+
+        if isinstance(action, str) and Path(self.translate_path(self.path)).is_file():
+            self.send_partial(stall=(action == "stall"))
+            return
+
+        super().do_GET()
+
+    def send_partial(self, *, stall):
+        """Send the headers and half the body, then give up on the connection."""
+        data = Path(self.translate_path(self.path)).read_bytes()
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data[: len(data) // 2])
+        self.wfile.flush()
+
+        if stall:
+            time.sleep(3.0)
+
+        self.close_connection = True
+
+    def log_request(self, code="-", size="-"):
+        """Record the status code sent."""
+        self.server.statuses.append(int(code))
+
+
 @contextlib.contextmanager
 def _baseurl_for_served_directory(
-    directory: Path | str, host: str = "127.0.0.1"
+    directory: Path | str,
+    host: str = "127.0.0.1",
+    *,
+    server_cls: type = NoNameLookupHTTPServer,
+    handler_base: type = http.server.SimpleHTTPRequestHandler,
+    server_sink: list | None = None,
 ) -> Generator[str, None, None]:
-    """Spin up HTTP server on a directory and yield the server base URL."""
+    """Spin up HTTP server on a directory and yield the server base URL.
+
+    If `server_sink` is provided, the server instance is appended to it.
+
+    """
     directory = Path(directory).resolve()
 
-    handler_cls = functools.partial(
-        http.server.SimpleHTTPRequestHandler,
-        directory=str(directory),
-    )
+    handler_cls = functools.partial(handler_base, directory=str(directory))
 
     # Bind to port 0 so the OS chooses a free ephemeral port
-    httpd = NoNameLookupHTTPServer((host, 0), handler_cls)
+    httpd = server_cls((host, 0), handler_cls)
+    if server_sink is not None:
+        server_sink.append(httpd)
     port = httpd.server_address[1]
     base_url = f"http://{host}:{port}"
 
@@ -103,6 +246,48 @@ def resource_http_base_url() -> Generator[str, None, None]:
         yield base_url
 
 
+@pytest.fixture
+def keepalive_resource_server() -> Generator[KeepAliveHTTPServer, None, None]:
+    """Provide a threaded HTTP/1.1 server exposing the test resource files.
+
+    The server's base URL is stored on it as ``base_url``.
+
+    """
+    resource_dir = Path(__file__).resolve().parent / "resource"
+    sink = []
+
+    with _baseurl_for_served_directory(
+        resource_dir,
+        server_cls=KeepAliveHTTPServer,
+        handler_base=KeepAliveRequestHandler,
+        server_sink=sink,
+    ) as base_url:
+        httpd = sink[0]
+        httpd.base_url = base_url
+        yield httpd
+
+
+@pytest.fixture
+def scripted_resource_server() -> Generator[ScriptedHTTPServer, None, None]:
+    """Provide a scriptable HTTP/1.1 server exposing the test resource files.
+
+    The server's base URL is stored on it as ``base_url``.
+
+    """
+    resource_dir = Path(__file__).resolve().parent / "resource"
+    sink = []
+
+    with _baseurl_for_served_directory(
+        resource_dir,
+        server_cls=ScriptedHTTPServer,
+        handler_base=ScriptedRequestHandler,
+        server_sink=sink,
+    ) as base_url:
+        httpd = sink[0]
+        httpd.base_url = base_url
+        yield httpd
+
+
 @pytest.fixture(scope="session")
 def resource_url(resource_http_base_url: str) -> Callable[[str], str]:
     """Provide a function to calculate the full test-resource URL from a relative URL.
@@ -29,15 +29,37 @@ Sphinx |objects.inv| files.
 
 """
 
+import asyncio
+import collections
 import copy
+import email.message
+import hashlib
+import http.client
+import io
 import itertools as itt
+import json
+import os
 import re
+import shutil
+import subprocess as sp  # noqa: S404
+import sys
+import threading
+import time
+import tracemalloc
+import urllib.error as urlerr
+import zlib
 from numbers import Number
 
 import dictdiffer
 import pytest
 
 import sphobjinv as soi
+import sphobjinv.aio
+import sphobjinv.mirror
+import sphobjinv.registry
+import sphobjinv.remote
+import sphobjinv.stream
+import sphobjinv.synth
 
 pytestmark = [pytest.mark.api, pytest.mark.local]
 
@@ -479,6 +501,30 @@ class TestInventory:
 
         inv.suggest("class")
 
+    @pytest.mark.testall
+    @pytest.mark.parametrize("chunk_size", [7, 4096, 1 << 24])
+    def test_api_inventory_stream_import(
+        self, chunk_size, testall_inv_path, pytestconfig
+    ):
+        """Confirm incremental zlib import matches the all-at-once import."""
+        # Drop most unless testall
+        if (
+            not pytestconfig.getoption("--testall")
+            and testall_inv_path.name != "objects_attrs.inv"
+        ):
+            pytest.skip("'--testall' not specified")
+
+        b_str = soi.readbytes(testall_inv_path)
+        inv = soi.Inventory()
+
+        if chunk_size < 100 and len(b_str) > 50000:
+            pytest.skip("Too slow with tiny chunks")
+
+        strm = io.BytesIO(b_str)
+        chunks = iter(lambda: strm.read(chunk_size), b"")
+
+        assert inv._import_zlib_stream(chunks) == inv._import_zlib_bytes(b_str)
+
     @pytest.mark.testall
     def test_api_inventory_datafile_gen_and_reimport(
         self,
@@ -612,3 +658,1300 @@ class TestInventory:
 
         # Should not raise an exception; assert is to emphasize this is the check
         assert soi.Inventory(inv.json_dict())
+
+
+class TestNameIndex:
+    """Tests of the name-prefix index."""
+
+    @pytest.mark.parametrize("prefix", ["", "attr.", "attr.attr.f", "attr.validators"])
+    @pytest.mark.parametrize("limit", [None, 3])
+    @pytest.mark.parametrize(
+        ["domain", "role"], [(None, None), ("py", None), ("py", "function")]
+    )
+    def test_api_nameindex_prefix(self, prefix, limit, domain, role, res_cmp):
+        """Confirm prefix enumeration matches a brute-force scan."""
+        inv = soi.Inventory(res_cmp)
+
+        expect = sorted(
+            (o.name, i)
+            for i, o in enumerate(inv.objects)
+            if o.name.startswith(prefix)
+            and domain in (None, o.domain)
+            and role in (None, o.role)
+        )
+
+        result = inv.name_index().prefix(prefix, domain=domain, role=role)
+        assert result == expect
+
+        if limit is not None:
+            result = inv.name_index().prefix(
+                prefix, limit=limit, domain=domain, role=role
+            )
+            assert len(result) <= limit
+            assert result == expect[: len(result)]
+
+    @pytest.mark.parametrize(
+        "parent", ["", "attr", "attr.", "attr.attr", "attr.attr.filters", "nope"]
+    )
+    @pytest.mark.parametrize("domain", [None, "py"])
+    @pytest.mark.parametrize("limit", [None, 1, 3])
+    def test_api_nameindex_children(self, parent, domain, limit, res_cmp):
+        """Confirm dotted-segment child listing matches a brute-force scan."""
+        inv = soi.Inventory(res_cmp)
+
+        # '-' sorts before '.', so the full names sort in a different
+        # order than their first segments
+        inv.objects.extend(
+            soi.DataObjStr(
+                name=name,
+                domain="py",
+                role="function",
+                priority="1",
+                uri="#",
+                dispname="-",
+            )
+            for name in ("0-x", "0.y", "attr.0-x", "attr.0.y")
+        )
+
+        base = parent.rstrip(".") + "." if parent.rstrip(".") else ""
+        n = len(base)
+
+        expect = sorted(
+            {
+                o.name[n:].partition(".")[0]
+                for o in inv.objects
+                if o.name.startswith(base)
+                and o.name[n:].partition(".")[0]
+                and domain in (None, o.domain)
+            }
+        )[:limit]
+
+        assert inv.name_index().children(parent, limit=limit, domain=domain) == expect
+
+    def test_api_nameindex_cache(self, res_cmp):
+        """Confirm the index is reused until the inventory contents change."""
+        inv = soi.Inventory(res_cmp)
+        idx = inv.name_index()
+
+        assert inv.name_index() is idx
+
+        inv.objects[0].name = "zzz.quux"
+
+        idx2 = inv.name_index()
+        assert idx2 is not idx
+        assert idx2.prefix("zzz") == [("zzz.quux", 0)]
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda objs, new: objs.append(new),
+            lambda objs, new: objs.insert(0, new),
+            lambda objs, new: objs.__setitem__(0, new),
+            lambda objs, new: objs.__iadd__([new]),
+        ],
+        ids=["append", "insert", "setitem", "iadd"],
+    )
+    def test_api_nameindex_cache_list_changes(self, mutate, res_cmp):
+        """Confirm changes to the objects list itself rebuild the index."""
+        inv = soi.Inventory(res_cmp)
+        idx = inv.name_index()
+        new = inv.objects[1].evolve(name="zzz.quux")
+
+        mutate(inv.objects, new)
+
+        assert inv.name_index() is not idx
+        assert [name for name, _ in inv.name_index().prefix("zzz")] == ["zzz.quux"]
+
+    def test_api_nameindex_cache_objects_replaced(self, res_cmp):
+        """Confirm assigning a new objects list rebuilds the index."""
+        inv = soi.Inventory(res_cmp)
+        idx = inv.name_index()
+
+        inv.objects = [o.evolve(name="zzz." + o.name) for o in inv.objects]
+
+        assert inv.name_index() is not idx
+        assert len(inv.name_index().prefix("zzz.")) == inv.count
+
+    def test_api_nameindex_empty(self):
+        """Confirm an index over an empty inventory behaves."""
+        idx = soi.Inventory().name_index()
+
+        assert len(idx) == 0
+        assert idx.prefix("foo") == []
+        assert idx.children("") == []
+
+
+class TestSuggestCache:
+    """Tests of the opt-in suggest results cache."""
+
+    def test_api_suggestcache_matches_uncached(self, res_cmp):
+        """Confirm cached results are identical to freshly scored results."""
+        inv = soi.Inventory(res_cmp)
+        expect = inv.suggest("instance", thresh=40, with_index=True, with_score=True)
+
+        inv.suggest_cache = soi.SuggestCache()
+
+        for _ in range(2):
+            assert expect == inv.suggest(
+                "instance", thresh=40, with_index=True, with_score=True
+            )
+
+    def test_api_suggestcache_counters_and_flags(self, res_cmp, check):
+        """Confirm hit/miss counting, and sharing of entries across flags."""
+        inv = soi.Inventory(res_cmp)
+        inv.suggest_cache = soi.SuggestCache()
+
+        full = inv.suggest("evolve", with_index=True, with_score=True)
+        check.equal(inv.suggest("evolve"), [t[0] for t in full])
+        check.equal(inv.suggest("evolve", with_index=True), [t[::2] for t in full])
+        check.equal(inv.suggest("evolve", with_score=True), [t[:2] for t in full])
+        inv.suggest("evolve", thresh=60)
+
+        check.equal(inv.suggest_cache.hits, 3)
+        check.equal(inv.suggest_cache.misses, 2)
+        check.equal(len(inv.suggest_cache), 2)
+
+    def test_api_suggestcache_lru_eviction(self, res_cmp):
+        """Confirm the least recently used entry is evicted at capacity."""
+        inv = soi.Inventory(res_cmp)
+        inv.suggest_cache = soi.SuggestCache(maxsize=2)
+
+        inv.suggest("evolve")
+        inv.suggest("instance")
+        inv.suggest("evolve")
+        inv.suggest("validators")
+
+        assert len(inv.suggest_cache) == 2
+
+        inv.suggest("evolve")
+        assert inv.suggest_cache.hits == 2
+
+        inv.suggest("instance")
+        assert inv.suggest_cache.misses == 4
+
+    def test_api_suggestcache_invalidation(self, res_cmp):
+        """Confirm the cache empties when the inventory contents change."""
+        inv = soi.Inventory(res_cmp)
+        inv.suggest_cache = soi.SuggestCache()
+
+        before = inv.suggest("quuxfoobar", thresh=90)
+        assert before == []
+
+        inv.objects[3].name = "quuxfoobar"
+
+        after = inv.suggest("quuxfoobar", thresh=90)
+        assert ":py:class:`quuxfoobar`" in after
+        assert inv.suggest_cache.misses == 2
+
+    def test_api_suggestcache_result_isolation(self, res_cmp):
+        """Confirm mutating returned results does not corrupt the cache."""
+        inv = soi.Inventory(res_cmp)
+        inv.suggest_cache = soi.SuggestCache()
+
+        res = inv.suggest("evolve", with_index=True, with_score=True)
+        expect = list(res)
+        res.clear()
+
+        assert inv.suggest("evolve", with_index=True, with_score=True) == expect
+
+
+class TestSuggestDeadline:
+    """Tests of time-bounded suggest searches."""
+
+    def test_api_suggest_deadline_generous(self, res_cmp):
+        """Confirm a generous deadline gives the full, unbounded results."""
+        inv = soi.Inventory(res_cmp)
+        expect = inv.suggest("instance", thresh=40, with_index=True, with_score=True)
+
+        res, exhaustive = inv.suggest(
+            "instance", thresh=40, with_index=True, with_score=True, deadline=60
+        )
+
+        assert exhaustive
+        assert res == expect
+
+    def test_api_suggest_deadline_expired(self, res_cmp):
+        """Confirm an already-expired deadline reports a partial search."""
+        inv = soi.Inventory(res_cmp)
+
+        res, exhaustive = inv.suggest("instance", deadline=0)
+
+        assert not exhaustive
+        assert res == []
+
+    def test_api_suggest_deadline_not_cached_when_partial(self, res_cmp):
+        """Confirm partial results are not stored in the suggest cache."""
+        inv = soi.Inventory(res_cmp)
+        inv.suggest_cache = soi.SuggestCache()
+
+        inv.suggest("instance", deadline=0)
+        assert len(inv.suggest_cache) == 0
+
+        inv.suggest("instance", deadline=60)
+        assert len(inv.suggest_cache) == 1
+
+        assert inv.suggest("instance", deadline=0) == (inv.suggest("instance"), True)
+
+    def test_api_suggest_rank_candidates(self, res_cmp):
+        """Confirm objects containing the search term are ranked first."""
+        from sphobjinv.suggest import SearchData, rank_candidates
+
+        inv = soi.Inventory(res_cmp)
+        data = SearchData.from_objects(inv.objects)
+        ranked = rank_candidates("instance_of", data, range(inv.count))
+
+        assert sorted(ranked) == list(range(inv.count))
+        assert "instance_of" in data.rst[ranked[0]]
+
+    def test_api_suggest_deadline_spent_building(self, res_cmp, monkeypatch):
+        """Confirm nothing is ranked or scored if building used up the deadline."""
+        from sphobjinv import suggest
+
+        from_objects = suggest.SearchData.from_objects.__func__
+
+        def slow_build(cls, objects):
+            time.sleep(0.1)
+            return from_objects(cls, objects)
+
+        def no_rank(*args):
+            raise AssertionError("candidates ranked after the deadline")
+
+        monkeypatch.setattr(suggest.SearchData, "from_objects", classmethod(slow_build))
+        monkeypatch.setattr(suggest, "rank_candidates", no_rank)
+        inv = soi.Inventory(res_cmp)
+
+        assert inv.suggest("instance", deadline=0.01) == ([], False)
+        assert soi.SuggestSession(soi.Inventory(res_cmp)).suggest(
+            "instance", deadline=0.01
+        ) == ([], False)
+
+
+class TestSuggestSession:
+    """Tests of incremental as-you-type suggest sessions."""
+
+    def test_api_suggestsession_matches_suggest(self, res_cmp, check):
+        """Confirm session results match plain suggest while typing a name."""
+        inv = soi.Inventory(res_cmp)
+        session = soi.SuggestSession(inv, thresh=60)
+        name = "instance_of"
+
+        for n in range(1, len(name) + 1):
+            query = name[:n]
+            check.equal(
+                session.suggest(query, with_index=True, with_score=True),
+                inv.suggest(query, thresh=60, with_index=True, with_score=True),
+            )
+            check.equal(session.refined, n > 1)
+
+    @pytest.mark.parametrize(
+        ["first", "second", "refined"],
+        [
+            ("attr.ev", "attr.evolve", True),
+            ("attr.evolve", "attr.ev", False),
+            ("attr.evolve", "attrs.evolve", False),
+        ],
+        ids=["extend", "shorten", "edit"],
+    )
+    def test_api_suggestsession_refine_vs_restart(
+        self, first, second, refined, res_cmp
+    ):
+        """Confirm only extensions of the previous query are refined."""
+        session = soi.SuggestSession(soi.Inventory(res_cmp))
+
+        session.suggest(first)
+        session.suggest(second)
+
+        assert session.refined == refined
+
+    def test_api_suggestsession_data_fetched_on_change(self, res_cmp, monkeypatch):
+        """Confirm the search data is only fetched again if the contents change."""
+        inv = soi.Inventory(res_cmp)
+        session = soi.SuggestSession(inv)
+        fetches = []
+        cached_derived = soi.Inventory._cached_derived
+
+        def counting(self, name, build_fxn):
+            fetches.append(name)
+            return cached_derived(self, name, build_fxn)
+
+        monkeypatch.setattr(soi.Inventory, "_cached_derived", counting)
+
+        for query in ("a", "at", "att", "attr", "attr.e"):
+            session.suggest(query)
+
+        assert len(fetches) == 1
+
+        inv.objects.append(inv.objects[0].evolve(name="attr.quuxfoobar"))
+        session.suggest("attr.ev")
+
+        assert len(fetches) == 2
+
+    def test_api_suggestsession_restart_conditions(self, res_cmp):
+        """Confirm changed settings, contents, or a partial search force a restart."""
+        inv = soi.Inventory(res_cmp)
+        session = soi.SuggestSession(inv)
+
+        session.suggest("attr")
+        session.thresh = 70
+        session.suggest("attr.")
+        assert not session.refined
+
+        inv.objects[3].name = "attr.quuxfoobar"
+        session.suggest("attr.q")
+        assert not session.refined
+        assert ":py:class:`attr.quuxfoobar`" in session.suggest("attr.quux")
+
+        session.suggest("attr.quuxf", deadline=0)
+        session.suggest("attr.quuxfo")
+        assert not session.refined
+
+        session.slack = None
+        session.suggest("attr.quuxfoo")
+        assert not session.refined
+
+
+class TestSuggestFilters:
+    """Tests of domain/role filtering of suggest searches."""
+
+    @pytest.mark.parametrize(
+        ["domain", "role"],
+        [("py", None), (None, "function"), ("py", "function"), ("c", "nope")],
+        ids=["domain", "role", "both", "absent"],
+    )
+    def test_api_suggest_filters_match_postfilter(self, domain, role, res_cmp):
+        """Confirm pre-filtered results equal full results filtered afterwards."""
+        inv = soi.Inventory(res_cmp)
+
+        def keep(idx):
+            obj = inv.objects[idx]
+            return domain in (None, obj.domain) and role in (None, obj.role)
+
+        full = inv.suggest("attr", thresh=30, with_index=True, with_score=True)
+        expect = [tup for tup in full if keep(tup[2])]
+
+        assert expect == inv.suggest(
+            "attr",
+            thresh=30,
+            with_index=True,
+            with_score=True,
+            domain=domain,
+            role=role,
+        )
+
+    def test_api_suggest_filters_cache_and_session(self, res_cmp):
+        """Confirm filters are honored by the suggest cache and sessions."""
+        inv = soi.Inventory(res_cmp)
+        inv.suggest_cache = soi.SuggestCache()
+
+        unfiltered = inv.suggest("attr", thresh=30)
+        filtered = inv.suggest("attr", thresh=30, role="function")
+
+        assert len(filtered) < len(unfiltered)
+        assert inv.suggest_cache.misses == 2
+
+        session = soi.SuggestSession(inv, thresh=30, role="function")
+        assert session.suggest("attr") == filtered
+
+
+class TestPeekHeader:
+    """Tests of the header-only inventory inspection."""
+
+    @pytest.mark.parametrize("as_bytes", [False, True], ids=["file", "bytes"])
+    def test_api_peek_header(self, as_bytes, res_cmp, res_dec):
+        """Confirm header fields of compressed and plaintext inventories."""
+        for path, compressed in ((res_cmp, True), (res_dec, False)):
+            source = soi.readbytes(path) if as_bytes else str(path)
+            header = soi.peek_header(source)
+
+            assert header == soi.InventoryHeader(
+                project="attrs",
+                version="22.1",
+                format_version=2,
+                compressed=compressed,
+                size=path.stat().st_size,
+            )
+
+    def test_api_peek_header_body_untouched(self, res_cmp, scratch_path):
+        """Confirm nothing past the header is read or decompressed."""
+        b_str = soi.readbytes(res_cmp)
+        head_len = b_str.index(b"\n", b_str.index(b"zlib.")) + 1
+        path = scratch_path / "truncated.inv"
+        path.write_bytes(b_str[: head_len + 2] + b"\xff" * 100000)
+
+        with pytest.raises(zlib.error):
+            soi.Inventory(fname_zlib=path)
+
+        header = soi.peek_header(path)
+
+        assert header.project == "attrs"
+        assert header.compressed
+        assert header.size == head_len + 100002
+
+    @pytest.mark.testall
+    def test_api_peek_header_matches_inventory(self, testall_inv_path):
+        """Confirm the peeked header matches that of the full import."""
+        header = soi.peek_header(testall_inv_path)
+        inv = soi.Inventory(testall_inv_path)
+
+        assert (header.project, header.version) == (inv.project, inv.version)
+        assert header.compressed
+
+    @pytest.mark.parametrize(
+        "data",
+        [b"", b"not an inventory\n", b"# Sphinx inventory version 2\n# Project: x\n"],
+        ids=["empty", "junk", "no_version"],
+    )
+    def test_api_peek_header_invalid(self, data):
+        """Confirm a source without a complete header is rejected."""
+        with pytest.raises(ValueError):
+            soi.peek_header(data)
+
+
+class TestMirror:
+    """Tests of local inventory mirroring, using file URLs."""
+
+    @pytest.mark.parametrize(
+        ("target", "expect"),
+        [
+            ("https://x.org/docs/objects.inv", "https://x.org/docs/objects.inv"),
+            ("https://x.org/docs", "https://x.org/docs/objects.inv"),
+            ("https://x.org/docs/", "https://x.org/docs/objects.inv"),
+            (["https://x.org/docs", None], "https://x.org/docs/objects.inv"),
+            (["https://x.org/docs", "api/inv.inv"], "https://x.org/docs/api/inv.inv"),
+            (["https://x.org/docs", "https://y.org/o.inv"], "https://y.org/o.inv"),
+        ],
+        ids=["inv", "root", "root_slash", "pair_none", "pair_rel", "pair_abs"],
+    )
+    def test_api_mirror_inventory_url(self, target, expect):
+        """Confirm inventory URLs are derived from mapping values."""
+        assert soi.mirror.inventory_url(target) == expect
+
+    @pytest.mark.parametrize("name", ["", "../x", "a/b", ".hidden"])
+    def test_api_mirror_bad_name(self, name, scratch_path):
+        """Confirm names unusable as file names are rejected up front."""
+        with pytest.raises(ValueError):
+            soi.sync({name: "https://x.org/objects.inv"}, scratch_path / "m")
+
+        assert not (scratch_path / "m").exists()
+
+    def test_api_mirror_sync(self, res_cmp, scratch_path):
+        """Confirm syncing, resyncing, and manifest contents."""
+        mapping = {"attrs": res_cmp.as_uri()}
+        dest = scratch_path / "mirror"
+
+        (res,) = soi.sync(mapping, dest)
+
+        assert res.status is soi.SyncStatus.Updated
+        assert res.path.read_bytes() == soi.readbytes(res_cmp)
+
+        entry = soi.mirror.read_manifest(dest)["inventories"]["attrs"]
+        assert entry["file"] == "objects_attrs.inv"
+        assert entry["sha256"] == hashlib.sha256(soi.readbytes(res_cmp)).hexdigest()
+        assert (entry["project"], entry["count"]) == ("attrs", 129)
+
+        (res,) = soi.sync(mapping, dest)
+
+        assert res.status is soi.SyncStatus.Unchanged
+        assert res.entry["fetched"] == entry["fetched"]
+        assert sorted(p.name for p in dest.iterdir()) == [
+            "manifest.json",
+            "objects_attrs.inv",
+        ]
+
+    def test_api_mirror_sync_keeps_good_copy(self, res_cmp, scratch_path):
+        """Confirm an invalid download doesn't replace the mirrored copy."""
+        src = scratch_path / "objects.inv"
+        shutil.copy(res_cmp, src)
+        mapping = {"attrs": src.as_uri()}
+        dest = scratch_path / "mirror"
+
+        soi.sync(mapping, dest)
+        src.write_bytes(b"# Sphinx inventory version 2\nnot really\n")
+
+        (res,) = soi.sync(mapping, dest)
+
+        assert res.status is soi.SyncStatus.Failed
+        assert res.error is not None
+        assert (dest / "objects_attrs.inv").read_bytes() == soi.readbytes(res_cmp)
+        assert soi.mirror.read_manifest(dest)["inventories"]["attrs"] == res.entry
+
+    def test_api_mirror_sync_repairs_copy(self, res_cmp, scratch_path):
+        """Confirm a damaged mirrored copy is replaced."""
+        mapping = {"attrs": res_cmp.as_uri()}
+        dest = scratch_path / "mirror"
+
+        soi.sync(mapping, dest)
+        (dest / "objects_attrs.inv").write_bytes(b"damaged")
+
+        (res,) = soi.sync(mapping, dest)
+
+        assert res.status is soi.SyncStatus.Updated
+        assert res.path.read_bytes() == soi.readbytes(res_cmp)
+
+
+class TestRequestPolicy:
+    """Tests of the retry and hedging logic of RequestPolicy, without network."""
+
+    @staticmethod
+    def policy(**kwargs):
+        """Create a policy with no backoff delay and its own latency record."""
+        return soi.RequestPolicy(backoff=0, tracker=soi.http.LatencyTracker(), **kwargs)
+
+    @pytest.mark.parametrize(
+        ("exc", "expect"),
+        [
+            (TimeoutError(), True),
+            (ConnectionResetError(), True),
+            (http.client.IncompleteRead(b""), True),
+            (urlerr.URLError(OSError("refused")), True),
+            (urlerr.URLError("no host given"), False),
+            (urlerr.HTTPError("u", 503, "", None, None), True),
+            (urlerr.HTTPError("u", 404, "", None, None), False),
+            (ValueError(), False),
+        ],
+        ids=lambda v: type(v).__name__ if isinstance(v, Exception) else str(v),
+    )
+    def test_api_http_is_transient(self, exc, expect):
+        """Confirm classification of retrieval failures."""
+        assert soi.http.is_transient(exc) is expect
+
+    def test_api_policy_call_retries(self):
+        """Confirm transient failures are retried, up to the limit."""
+        failures = [TimeoutError(), ConnectionResetError()]
+
+        def attempt():
+            """Fail as listed, then succeed."""
+            if failures:
+                raise failures.pop(0)
+            return "ok"
+
+        assert self.policy(retries=2).call(attempt, "http://h/") == "ok"
+
+        failures = [TimeoutError(), ConnectionResetError()]
+        with pytest.raises(ConnectionResetError):
+            self.policy(retries=1).call(attempt, "http://h/")
+
+    def test_api_policy_call_permanent(self):
+        """Confirm non-transient failures are raised immediately."""
+        calls = []
+
+        def attempt():
+            """Fail with a non-transient error on every call."""
+            calls.append(None)
+            raise ValueError("bad data")
+
+        with pytest.raises(ValueError, match="bad data"):
+            self.policy(retries=3).call(attempt, "http://h/")
+
+        assert len(calls) == 1
+
+    def test_api_policy_backoff_delay(self):
+        """Confirm exponential backoff, Retry-After, and the cap."""
+        policy = soi.RequestPolicy(backoff=1, backoff_max=5)
+        exc = TimeoutError()
+
+        assert 0.5 <= policy.backoff_delay(0, exc) <= 1
+        assert 2 <= policy.backoff_delay(2, exc) <= 4
+        assert policy.backoff_delay(10, exc) == 5
+
+        headers = email.message.Message()
+        headers["Retry-After"] = "3"
+        exc = urlerr.HTTPError("u", 503, "", headers, None)
+
+        assert policy.backoff_delay(0, exc) == 3
+
+    def test_api_policy_hedge_after(self):
+        """Confirm the hedge delay follows the recorded latencies."""
+        policy = self.policy(hedge=True, hedge_delay=2.5, hedge_percentile=90)
+
+        for i in range(9):
+            policy.record("http://h/a", (i + 1) / 10)
+
+        assert policy.hedge_after("http://h/b") == 2.5
+
+        policy.record("http://h/a", 1.0)
+
+        assert policy.hedge_after("http://h/b") == 1.0
+        assert policy.hedge_after("http://other/") == 2.5
+
+    def test_api_policy_hedge_first_wins(self):
+        """Confirm the first successful hedged attempt is used."""
+        release = threading.Event()
+        calls = []
+
+        def attempt():
+            """Stall on the first call only."""
+            calls.append(None)
+            if len(calls) == 1:
+                release.wait(5)
+                return "slow"
+            return "fast"
+
+        policy = self.policy(hedge=True, hedge_delay=0.05)
+
+        try:
+            assert policy.call(attempt, "http://h/") == "fast"
+        finally:
+            release.set()
+
+        assert len(calls) == 2
+
+    def test_api_policy_hedge_failure_fallback(self):
+        """Confirm a failed hedged attempt defers to the other one."""
+        calls = []
+
+        def attempt():
+            """Be slow and succeed first, then fail fast."""
+            calls.append(None)
+            if len(calls) == 1:
+                time.sleep(0.2)
+                return "slow"
+            raise ConnectionResetError
+
+        policy = self.policy(hedge=True, hedge_delay=0.05)
+
+        assert policy.call(attempt, "http://h/") == "slow"
+
+    def test_api_policy_hedge_context(self):
+        """Confirm hedged attempts report instrumentation to the caller's collector.
+
+        Run in a fresh interpreter, since pytest-check makes new threads
+        inherit the context of the thread starting them, which would hide
+        a failure to pass the context to the hedging workers.
+
+        """
+        script = (
+            "import sphobjinv as soi\n"
+            "def attempt():\n"
+            "    soi.instrument.emit(soi.Phase.Read, 0.0, size=1)\n"
+            "rec = soi.instrument.Recorder()\n"
+            "policy = soi.RequestPolicy(hedge=True, hedge_delay=5)\n"
+            "with soi.instrument.collect(rec):\n"
+            "    policy.call(attempt, 'http://h/')\n"
+            "print(len(rec.events))\n"
+        )
+
+        out = sp.check_output([sys.executable, "-c", script], text=True)  # noqa: S603
+
+        assert out.strip() == "1"
+
+    def test_api_policy_invalid_retries(self):
+        """Confirm negative retry counts are rejected."""
+        with pytest.raises(ValueError):
+            soi.RequestPolicy(retries=-1)
+
+
+class TestAsyncio:
+    """Local tests of the asyncio loading machinery."""
+
+    def test_api_aio_read_chunked(self):
+        """Confirm chunked transfer encoding is decoded."""
+
+        async def decode():
+            """Decode a canned chunked body."""
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"5;ext=1\r\nhello\r\n7\r\n, world\r\n0\r\nX-T: 1\r\n\r\n")
+            reader.feed_eof()
+            return await soi.aio.read_chunked(reader)
+
+        assert asyncio.run(decode()) == b"hello, world"
+
+    def test_api_aio_load_many_limits(self, res_cmp, monkeypatch):
+        """Confirm the overall and per-host concurrency limits are respected."""
+        data = soi.readbytes(res_cmp)
+        active = collections.Counter()
+        peaks = collections.Counter()
+
+        async def fake_fetch(url, *, context=None, policy=None):
+            """Track concurrency, then return a canned inventory."""
+            host = url.split("/")[2]
+            active[host] += 1
+            active["all"] += 1
+            peaks[host] = max(peaks[host], active[host])
+            peaks["all"] = max(peaks["all"], active["all"])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            active["all"] -= 1
+            return data
+
+        monkeypatch.setattr(soi.aio, "fetch", fake_fetch)
+        urls = [f"https://{h}/{i}/objects.inv" for h in "abc" for i in range(6)]
+
+        async def collect():
+            """Gather all results from load_many."""
+            return [
+                res async for res in soi.aio.load_many(urls, concurrency=5, per_host=2)
+            ]
+
+        results = asyncio.run(collect())
+
+        assert sorted(url for url, _ in results) == sorted(urls)
+        assert all(inv == soi.Inventory(res_cmp) for _, inv in results)
+        assert peaks["all"] == 5
+        assert max(peaks[h] for h in "abc") == 2
+
+
+class TestRegistry:
+    """Tests of the registry of loaded inventories, using local files."""
+
+    def test_api_registry_reuse(self, res_cmp, res_dec):
+        """Confirm an unchanged file is loaded only once."""
+        reg = soi.Registry()
+
+        inv = reg.get(res_cmp)
+
+        assert inv.count == 129
+        assert reg.get(str(res_cmp)) is inv
+        assert reg.get(res_dec) is not inv
+        assert (reg.hits, reg.misses, len(reg)) == (1, 2, 2)
+
+    def test_api_registry_file_changed(self, res_path, scratch_path):
+        """Confirm a changed file is loaded again."""
+        reg = soi.Registry()
+        path = scratch_path / "objects.inv"
+        shutil.copy(res_path / "objects_attrs.inv", path)
+
+        inv = reg.get(path)
+        assert reg.get(path) is inv
+
+        shutil.copy(res_path / "objects_beaker.inv", path)
+
+        assert reg.get(path).project == "Beaker"
+        assert reg.misses == 2
+
+    def test_api_registry_eviction(self, res_path):
+        """Confirm the least recently used inventories are evicted."""
+        paths = [res_path / f"objects_{n}.inv" for n in ("attrs", "beaker", "click")]
+        sizes = [soi.registry.estimate_size(soi.Inventory(p)) for p in paths]
+
+        reg = soi.Registry(max_size=sizes[0] + max(sizes[1:]))
+
+        first = reg.get(paths[0])
+        reg.get(paths[1])
+        reg.get(paths[0])
+        reg.get(paths[2])
+
+        assert len(reg) == 2
+        assert reg.size == sizes[0] + sizes[2]
+        assert reg.get(paths[0]) is first
+
+        reg.discard(paths[0])
+        assert reg.size == sizes[2]
+
+        reg.clear()
+        assert (len(reg), reg.size, reg.hits, reg.misses) == (0, 0, 0, 0)
+
+    def test_api_registry_too_large(self, res_cmp):
+        """Confirm an inventory larger than the budget is returned but not held."""
+        reg = soi.Registry(max_size=1)
+
+        assert reg.get(res_cmp).count == 129
+        assert len(reg) == 0
+
+    @pytest.mark.timeout(30)
+    @pytest.mark.parametrize("fail", [False, True], ids=["ok", "fail"])
+    def test_api_registry_concurrent(self, monkeypatch, res_cmp, fail):
+        """Confirm simultaneous requests share a single load."""
+        reg = soi.Registry()
+        calls = []
+        release = threading.Event()
+        real_inventory = soi.registry.Inventory
+
+        def slow_inventory(source):
+            """Block until released, then load or fail."""
+            calls.append(source)
+            release.wait()
+            if fail:
+                raise ValueError("bad inventory")
+            return real_inventory(source)
+
+        monkeypatch.setattr(soi.registry, "Inventory", slow_inventory)
+
+        results = []
+
+        def request():
+            """Request the inventory, recording the outcome."""
+            try:
+                results.append(reg.get(res_cmp))
+            except ValueError as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+
+        while not calls:
+            time.sleep(0.01)
+        time.sleep(0.1)
+        release.set()
+
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len(results) == 5
+        assert all(r is results[0] for r in results)
+        assert isinstance(results[0], ValueError) is fail
+        assert len(reg) == (0 if fail else 1)
+
+    def test_api_registry_missing(self, scratch_path):
+        """Confirm errors reading a file propagate."""
+        with pytest.raises(FileNotFoundError):
+            soi.Registry().get(scratch_path / "objects_none.inv")
+
+    def test_api_registry_module_get(self, res_cmp):
+        """Confirm the module-level function uses the process-wide registry."""
+        inv = soi.registry.get(res_cmp)
+
+        assert soi.registry.default_registry.get(res_cmp) is inv
+
+        soi.registry.default_registry.discard(res_cmp)
+
+
+class TestDaemon:
+    """Tests of the daemon holding inventories, and of its client."""
+
+    @pytest.mark.timeout(30)
+    def test_api_daemon_discover(self, daemon_server, daemon_state):
+        """Confirm the client is found from the state file."""
+        client = soi.remote.DaemonClient.discover()
+
+        assert client.port == daemon_server.server_port
+        assert client.token == daemon_server.token
+        assert daemon_state.stat().st_mode & 0o077 == 0
+
+        status = client.status()
+        assert status["port"] == daemon_server.server_port
+        assert status["inventories"] == 0
+
+        daemon_server.remove_state()
+        assert soi.remote.DaemonClient.discover() is None
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership only")
+    @pytest.mark.parametrize(
+        ("change", "mode", "trusted"),
+        [
+            ({}, 0o600, True),
+            ({"host": "::1"}, 0o600, True),
+            ({}, 0o644, False),
+            ({}, 0o620, False),
+            ({"host": "192.0.2.1"}, 0o600, False),
+            ({"host": "example.com"}, 0o600, False),
+            ({"port": "8000"}, 0o600, False),
+            ({"port": 0}, 0o600, False),
+            ({"token": None}, 0o600, False),  # noqa: S105
+        ],
+        ids=[
+            "trusted",
+            "ipv6_loopback",
+            "world_readable",
+            "group_writable",
+            "remote_ip",
+            "remote_name",
+            "port_str",
+            "port_zero",
+            "no_token",
+        ],
+    )
+    def test_api_daemon_discover_untrusted(self, daemon_state, change, mode, trusted):
+        """Confirm a state file that another user could have written is ignored."""
+        state = {
+            "version": soi.__version__,
+            "host": "127.0.0.1",
+            "port": 8000,
+            "token": "abc",  # noqa: S105
+            **change,
+        }
+        daemon_state.write_text(json.dumps(state), encoding="utf-8")
+        daemon_state.chmod(mode)
+
+        client = soi.remote.DaemonClient.discover()
+
+        if trusted:
+            assert (client.host, client.port, client.token) == (
+                state["host"],
+                8000,
+                "abc",
+            )
+        else:
+            assert client is None
+
+    @pytest.mark.skipif(
+        not hasattr(os, "geteuid") or os.geteuid() != 0, reason="Needs root to chown"
+    )
+    def test_api_daemon_discover_other_owner(self, daemon_state):
+        """Confirm a state file owned by another user is ignored."""
+        state = {"version": soi.__version__, "host": "127.0.0.1", "port": 8000}
+        state["token"] = "abc"  # noqa: S105
+        daemon_state.write_text(json.dumps(state), encoding="utf-8")
+        daemon_state.chmod(0o600)
+        assert soi.remote.DaemonClient.discover() is not None
+
+        os.chown(daemon_state, 12345, -1)
+        assert soi.remote.DaemonClient.discover() is None
+
+    @pytest.mark.timeout(30)
+    def test_api_daemon_suggest(self, daemon_server, res_cmp):
+        """Confirm remote searches match local ones, and reuse the inventory."""
+        client = soi.remote.DaemonClient.discover()
+        local = soi.Inventory(res_cmp)
+
+        inv = client.load(res_cmp)
+        assert (inv.project, inv.version, inv.count) == ("attrs", "22.1", 129)
+
+        for kwargs in ({}, {"with_index": True, "with_score": True}):
+            assert inv.suggest("evolve", **kwargs) == local.suggest("evolve", **kwargs)
+
+        res_l, exhaustive = inv.suggest("evolve", deadline=10)
+        assert res_l == local.suggest("evolve")
+        assert exhaustive
+
+        assert client.load(res_cmp).suggest("evolve", role="function") == (
+            local.suggest("evolve", role="function")
+        )
+        assert daemon_server.registry.misses == 1
+
+    @pytest.mark.timeout(30)
+    def test_api_daemon_lookup_convert(self, daemon_server, res_cmp):
+        """Confirm objects and whole inventories can be retrieved."""
+        inv = soi.remote.DaemonClient.discover().load(res_cmp)
+        local = soi.Inventory(res_cmp)
+
+        ((idx, obj),) = inv.lookup("attrs.evolve", role="function")
+        assert obj == local.objects[idx].json_dict()
+        assert inv.lookup("attrs.evolv") == []
+
+        assert inv.data_file() == local.data_file()
+        assert inv.data_file(contract=True) == local.data_file(contract=True)
+        assert inv.json_dict(expand=True) == local.json_dict(expand=True)
+
+        _, body = inv.client.request("/convert", {"source": inv.source, "mode": "zlib"})
+        assert soi.Inventory(zlib=body).data_file() == local.data_file()
+
+    @pytest.mark.timeout(30)
+    @pytest.mark.parametrize(
+        ("endpoint", "payload", "status"),
+        [
+            ("/suggest", {"name": "evolve"}, 400),
+            ("/suggest", {"source": "SOURCE"}, 400),
+            ("/convert", {"source": "SOURCE", "mode": "xml"}, 400),
+            ("/load", {"source": "/nonexistent/objects.inv"}, 422),
+            ("/nothing", {"source": "SOURCE"}, 404),
+        ],
+    )
+    def test_api_daemon_bad_request(
+        self, daemon_server, res_cmp, endpoint, payload, status
+    ):
+        """Confirm failed requests raise DaemonError with the status."""
+        client = soi.remote.DaemonClient.discover()
+        if payload.get("source") == "SOURCE":
+            payload["source"] = str(res_cmp)
+
+        with pytest.raises(soi.DaemonError) as e_info:
+            client.request(endpoint, payload)
+
+        assert e_info.value.status == status
+
+    @pytest.mark.timeout(30)
+    def test_api_daemon_token(self, daemon_server):
+        """Confirm requests without the token are refused."""
+        client = soi.remote.DaemonClient(daemon_server.server_port, "wrong")
+
+        with pytest.raises(soi.DaemonError) as e_info:
+            client.status()
+
+        assert e_info.value.status == 403
+        assert daemon_server.requests == 0
+
+
+class TestInstrument:
+    """Tests of the phase-timing instrumentation."""
+
+    def test_api_instrument_load_zlib_file(self, res_cmp):
+        """Confirm loading a compressed file reports each phase with sizes."""
+        rec = soi.instrument.Recorder()
+
+        with soi.instrument.collect(rec) as collector:
+            inv = soi.Inventory(fname_zlib=res_cmp)
+
+        assert collector is rec
+        assert [e.phase for e in rec.events] == [
+            soi.Phase.Read,
+            soi.Phase.Decompress,
+            soi.Phase.HeaderParse,
+            soi.Phase.LineParse,
+            soi.Phase.Construct,
+        ]
+
+        totals = rec.totals()
+        plain_size = len(soi.decompress(soi.readbytes(res_cmp)))
+        assert totals[soi.Phase.Read][1] == res_cmp.stat().st_size
+        assert totals[soi.Phase.Decompress][1] == plain_size
+        assert totals[soi.Phase.LineParse][1:] == (plain_size, inv.count)
+        assert totals[soi.Phase.Construct][2] == inv.count
+        assert all(e.seconds >= 0 for e in rec.events)
+
+    def test_api_instrument_load_url_stream(self, res_cmp):
+        """Confirm the streaming import reports the same phases once each."""
+        rec = soi.instrument.Recorder()
+
+        with soi.instrument.collect(rec):
+            inv = soi.Inventory(url=res_cmp.as_uri())
+
+        totals = rec.totals()
+        assert set(totals) == {
+            soi.Phase.Read,
+            soi.Phase.Decompress,
+            soi.Phase.HeaderParse,
+            soi.Phase.LineParse,
+            soi.Phase.Construct,
+        }
+        assert len(rec.events) == len(totals)
+        assert totals[soi.Phase.Read][1] == res_cmp.stat().st_size
+        assert totals[soi.Phase.Construct][2] == inv.count
+        assert inv == soi.Inventory(res_cmp)
+
+    def test_api_instrument_json_serialize_suggest(self, res_cmp):
+        """Confirm validation, serialization, compression, and scoring are reported."""
+        inv = soi.Inventory(res_cmp)
+        rec = soi.instrument.Recorder()
+
+        with soi.instrument.collect(rec):
+            soi.Inventory(dict_json=inv.json_dict())
+            soi.compress(inv.data_file())
+            inv.suggest("attr.Attribute", thresh=80)
+
+        assert [e.phase for e in rec.events] == [
+            soi.Phase.Serialize,
+            soi.Phase.Validate,
+            soi.Phase.Construct,
+            soi.Phase.Serialize,
+            soi.Phase.Compress,
+            soi.Phase.SuggestScore,
+        ]
+        assert all(e.count == inv.count for e in rec.events[:4])
+        assert rec.events[3].size == len(inv.data_file())
+        assert rec.events[4].count is None
+        assert rec.events[5].count == inv.count
+
+    def test_api_instrument_scoping(self, res_cmp):
+        """Confirm collectors nest and receive nothing outside their block."""
+        outer = soi.instrument.Recorder()
+        inner = soi.instrument.Recorder()
+
+        assert not soi.instrument.enabled()
+
+        with soi.instrument.collect(outer):
+            soi.decompress(soi.readbytes(res_cmp))
+
+            with soi.instrument.collect(inner):
+                assert soi.instrument.enabled()
+                soi.decompress(soi.readbytes(res_cmp))
+
+        soi.decompress(soi.readbytes(res_cmp))
+
+        assert not soi.instrument.enabled()
+        assert len(outer.events) == 2
+        assert len(inner.events) == 1
+
+    def test_api_instrument_no_event_on_error(self):
+        """Confirm a phase that raises is not reported."""
+        rec = soi.instrument.Recorder()
+
+        with soi.instrument.collect(rec), pytest.raises(RuntimeError):
+            with soi.instrument.PhaseTimer(soi.Phase.Read):
+                raise RuntimeError("fail")
+
+        assert rec.events == []
+
+    def test_api_instrument_aio_executor(self, res_cmp):
+        """Confirm events from parsing in an executor reach the caller's collector."""
+        rec = soi.instrument.Recorder()
+
+        async def load():
+            """Load an inventory while collecting."""
+            with soi.instrument.collect(rec):
+                return await soi.aio.load(res_cmp.as_uri())
+
+        inv = asyncio.run(load())
+
+        assert rec.totals()[soi.Phase.Construct][2] == inv.count
+
+
+class TestMemoryUsage:
+    """Tests of the measurement of inventory memory usage."""
+
+    def test_api_memory_usage(self, res_cmp):
+        """Confirm the breakdown covers the objects, their fields, and twins."""
+        inv = soi.Inventory(res_cmp)
+        usage = inv.memory_usage()
+
+        assert usage.count == inv.count
+        assert set(usage.fields) == {f.value for f in soi.DataFields}
+        assert usage.strings == sum(usage.fields.values())
+        assert usage.object_list >= inv.count * 8
+        assert usage.twins > usage.objects > 0
+        assert usage.total == pytest.approx(usage.per_object * inv.count)
+        assert soi.registry.estimate_size(inv) == usage.total
+
+    def test_api_memory_usage_derived(self, res_cmp):
+        """Confirm cached lookup structures are counted as derived."""
+        inv = soi.Inventory(res_cmp)
+        before = inv.memory_usage()
+
+        inv.name_index()
+        after = inv.memory_usage()
+
+        assert after.derived > before.derived
+        assert after.total - before.total == after.derived - before.derived
+
+    def test_api_memory_usage_tracemalloc(self, res_path):
+        """Confirm the measured total is close to the memory allocated."""
+        data = (res_path / "objects_django.inv").read_bytes()
+        soi.Inventory(data)
+
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            inv = soi.Inventory(data)
+            allocated = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+
+        assert inv.memory_usage().total == pytest.approx(allocated, rel=0.15)
+
+    def test_api_memory_usage_empty(self):
+        """Confirm an empty inventory is measured without error."""
+        usage = soi.Inventory().memory_usage()
+
+        assert usage.count == 0
+        assert usage.per_object == 0.0
+        assert usage.total > 0
+
+
+class TestStream:
+    """Tests of converting inventories without building objects."""
+
+    @pytest.mark.parametrize("compress", [False, True], ids=["plain", "zlib"])
+    @pytest.mark.parametrize(
+        ("expand", "contract"),
+        [(False, False), (True, False), (False, True)],
+        ids=["none", "expand", "contract"],
+    )
+    @pytest.mark.parametrize("source", ["res_cmp", "res_dec"])
+    def test_api_stream_convert_file(
+        self, source, compress, expand, contract, request, scratch_path
+    ):
+        """Confirm streamed output matches that from a loaded inventory."""
+        in_path = request.getfixturevalue(source)
+        out_path = scratch_path / "out"
+        b_str = soi.Inventory(in_path).data_file(expand=expand, contract=contract)
+
+        soi.stream.convert_file(
+            in_path, out_path, compress=compress, expand=expand, contract=contract
+        )
+
+        if compress:
+            assert out_path.read_bytes() == soi.compress(b_str)
+        else:
+            assert out_path.read_bytes() == b_str.replace(
+                b"\n", os.linesep.encode("utf-8")
+            )
+
+    def test_api_stream_iter_compress(self, res_dec):
+        """Confirm piecewise compression matches compress()."""
+        b_str = soi.Inventory(res_dec).data_file()
+        bounds = range(0, len(b_str) + 100, 100)
+        pieces = [b_str[start:end] for start, end in itt.pairwise(bounds)]
+
+        assert b"".join(soi.zlib.iter_compress(pieces)) == soi.compress(b_str)
+
+    def test_api_stream_in_place(self, res_cmp, scratch_path):
+        """Confirm a file can be converted onto itself."""
+        path = scratch_path / "objects.inv"
+        shutil.copy(res_cmp, path)
+
+        soi.stream.convert_file(path, path)
+
+        assert soi.Inventory(path) == soi.Inventory(res_cmp)
+        assert list(scratch_path.glob(".*.tmp")) == []
+
+    @pytest.mark.parametrize(
+        ("text", "kwargs", "msg"),
+        [
+            (b"# Project: foo\n# Version: 1\nfoo py:function 1 $ -\n", {}, None),
+            (b"# Project: foo\n# Version: 1\nfoo\n", {}, "No objects"),
+            (b"foo py:function 1 $ -\n", {}, "lacks project"),
+            (b"", {"expand": True, "contract": True}, "cannot both"),
+        ],
+        ids=["good", "no_objects", "no_header", "expand_contract"],
+    )
+    def test_api_stream_iter_plaintext_validation(self, text, kwargs, msg):
+        """Confirm invalid input raises before any output."""
+        pieces = soi.stream.iter_plaintext([text], **kwargs)
+
+        if msg is None:
+            assert b"".join(pieces).endswith(b"\nfoo py:function 1 $ -\n")
+        else:
+            with pytest.raises(ValueError, match=msg):
+                next(pieces)
+
+    def test_api_stream_corrupt(self, res_cmp, scratch_path):
+        """Confirm corrupt data leaves no output behind."""
+        data = bytearray(res_cmp.read_bytes())
+        data[-100:-50] = b"\xff" * 50
+        in_path = scratch_path / "corrupt.inv"
+        in_path.write_bytes(data)
+        out_path = scratch_path / "out.txt"
+
+        with pytest.raises(zlib.error):
+            soi.stream.convert_file(in_path, out_path)
+
+        assert list(scratch_path.glob("*out*")) == []
+
+    def test_api_stream_check_file(self, res_cmp, res_dec, scratch_path):
+        """Confirm the start of an input file is checked without converting it."""
+        soi.stream.check_file(res_cmp)
+        soi.stream.check_file(res_dec)
+
+        in_path = scratch_path / "empty.txt"
+        in_path.write_bytes(b"\n".join(res_dec.read_bytes().splitlines()[:4]))
+
+        with pytest.raises(ValueError, match="No objects"):
+            soi.stream.check_file(in_path)
+
+
+class TestSynth:
+    """Tests of the synthetic inventory generator."""
+
+    def test_api_synth_default_model(self, res_path):
+        """Confirm the default model is fitted to the test resource inventories."""
+        invs = (soi.Inventory(fname_zlib=p) for p in res_path.glob("objects_*.inv"))
+
+        assert soi.synth.SynthModel.fit(invs) == soi.synth.DEFAULT_MODEL
+
+    def test_api_synth_generate(self):
+        """Confirm generated inventories are valid and reproducible."""
+        inv = soi.synth.generate(2000, seed=7, project="Big", version="2.0")
+
+        assert (inv.count, inv.project, inv.version) == (2000, "Big", "2.0")
+        assert inv == soi.synth.generate(2000, seed=7, project="Big", version="2.0")
+        assert inv.objects != soi.synth.generate(2000, seed=8).objects
+
+        assert len({o.as_rst for o in inv.objects}) > 1900
+        assert {o.domain for o in inv.objects} >= {"py", "std"}
+
+        assert soi.Inventory(inv.data_file()) == inv
+        assert soi.Inventory(dict_json=inv.json_dict()) == inv
+
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_api_synth_write(self, compress, scratch_path):
+        """Confirm streamed inventories match generated ones."""
+        path = scratch_path / "synth.inv"
+        soi.synth.write(path, 10_000, compress=compress, seed=3)
+
+        inv = soi.Inventory(path)
+        assert inv == soi.synth.generate(10_000, seed=3)
+        assert inv.source_type == (
+            soi.SourceTypes.FnameZlib if compress else soi.SourceTypes.FnamePlaintext
+        )
@@ -29,9 +29,30 @@ Sphinx |objects.inv| files.
 
 """
 
+import asyncio
+import http.server
+import json
+import os
+import re
+import shutil
+import socket
+import threading
+import time
+import urllib.request as urlrequest
+from urllib.error import HTTPError, URLError
+
 import pytest
 
 import sphobjinv as soi
+import sphobjinv.aio
+import sphobjinv.http
+import sphobjinv.mirror
+from tests.fixtures_http import (
+    KeepAliveHTTPServer,
+    KeepAliveRequestHandler,
+    RangeRequestHandler,
+    _baseurl_for_served_directory,
+)
 
 pytestmark = [
     pytest.mark.api,
@@ -112,3 +133,791 @@ def test_api_inventory_many_url_imports(
     cmp_data = soi.compress(data)
     soi.writebytes(scr_fpath, cmp_data)
     sphinx_load_test(scr_fpath)
+
+
+class TestHTTPCache:
+    """Tests of the HTTP conditional-request cache, against the local server."""
+
+    @pytest.mark.timeout(30)
+    def test_api_httpcache_revalidate(self, http_inv_url_template, res_cmp):
+        """Confirm an unchanged inventory is revalidated rather than re-downloaded."""
+        url = http_inv_url_template.format("attrs")
+        cache = soi.HTTPCache()
+
+        inv1 = soi.Inventory(url=url, http_cache=cache)
+        inv2 = soi.Inventory(url=url, http_cache=cache)
+
+        assert (cache.misses, cache.revalidations, cache.hits) == (1, 1, 0)
+        assert inv1 == inv2 == soi.Inventory(res_cmp)
+
+        # The parsed fields kept for reuse count toward the size
+        fields = tuple(
+            (o.name, o.domain, o.role, o.priority, o.uri, o.dispname)
+            for o in inv1.objects
+        )
+        parsed_size = soi.inventory._estimate_fields_size(fields)
+        assert cache.size == len(soi.readbytes(res_cmp)) + parsed_size
+
+    @pytest.mark.timeout(30)
+    def test_api_httpcache_ttl(self, http_inv_url_template):
+        """Confirm responses within the TTL are reused without a request."""
+        url = http_inv_url_template.format("attrs")
+        cache = soi.HTTPCache(ttl=600)
+
+        for _ in range(3):
+            soi.Inventory(url=url, http_cache=cache)
+
+        assert (cache.misses, cache.revalidations, cache.hits) == (1, 0, 2)
+
+    @pytest.mark.timeout(30)
+    def test_api_httpcache_objects_independent(self, http_inv_url_template):
+        """Confirm inventories loaded from one cache entry don't share objects."""
+        url = http_inv_url_template.format("attrs")
+        cache = soi.HTTPCache(ttl=600)
+
+        inv1 = soi.Inventory(url=url, http_cache=cache)
+        inv1.objects[0].name = "quuxfoobar"
+        inv2 = soi.Inventory(url=url, http_cache=cache)
+        inv3 = soi.Inventory(url=url, http_cache=cache)
+
+        assert inv2.objects[0].name != "quuxfoobar"
+        assert inv2 == inv3
+        assert inv2.objects[0] is not inv3.objects[0]
+        assert inv2.objects[0].as_str is inv2.objects[0]
+
+    @pytest.mark.timeout(30)
+    def test_api_httpcache_max_size(self, http_inv_url_template, res_path):
+        """Confirm least recently used responses are evicted to respect max_size."""
+        names = ("attrs", "beaker", "click")
+        urls = [http_inv_url_template.format(n) for n in names]
+        sizes = []
+
+        for url in urls:
+            cache = soi.HTTPCache()
+            soi.Inventory(url=url, http_cache=cache)
+            sizes.append(cache.size)
+
+        cache = soi.HTTPCache(max_size=sizes[1] + sizes[2])
+
+        for url in urls:
+            soi.Inventory(url=url, http_cache=cache)
+
+        assert len(cache) == 2
+        assert cache.size == sizes[1] + sizes[2]
+
+        # Bodies that fit are evicted once their parsed fields are added
+        body_size = len(soi.readbytes(res_path / "objects_attrs.inv"))
+        cache = soi.HTTPCache(max_size=body_size)
+        soi.Inventory(url=urls[0], http_cache=cache)
+        assert len(cache) == 0
+        assert cache.size == 0
+
+
+@pytest.mark.parametrize(
+    ["fname", "expect"],
+    [
+        ("objects_attrs.inv", True),
+        ("objects_attrs.txt", True),
+        ("objects_attrs.json", False),
+    ],
+    ids=["zlib", "plain", "json"],
+)
+@pytest.mark.timeout(30)
+def test_api_http_probe(fname, expect, resource_url):
+    """Confirm the lightweight inventory probe recognizes inventory files."""
+    assert expect == soi.http.probe(resource_url(fname))
+
+
+@pytest.mark.timeout(30)
+def test_api_http_probe_missing(resource_url):
+    """Confirm the lightweight inventory probe raises on a missing file."""
+    with pytest.raises(HTTPError):
+        soi.http.probe(resource_url("objects_nonexistent.inv"))
+
+
+class TestConnectionPool:
+    """Tests of keep-alive connection pooling, against a local HTTP/1.1 server."""
+
+    @pytest.mark.timeout(30)
+    def test_api_pool_reuses_connection(self, keepalive_resource_server, res_cmp):
+        """Confirm sequential downloads from one host share one connection."""
+        server = keepalive_resource_server
+        pool = soi.http.ConnectionPool()
+
+        for name in ("attrs", "beaker", "attrs"):
+            url = f"{server.base_url}/objects_{name}.inv"
+            with soi.http.urlopen(url, pool=pool) as resp:
+                data = resp.read()
+
+        assert data == soi.readbytes(res_cmp)
+        assert server.connection_count == 1
+        assert pool.idle_count() == 1
+
+        pool.close()
+        assert pool.idle_count() == 0
+
+    @pytest.mark.timeout(30)
+    def test_api_pool_partial_read_discards(self, keepalive_resource_server):
+        """Confirm a connection with an unread body is not returned to the pool."""
+        server = keepalive_resource_server
+        pool = soi.http.ConnectionPool()
+        url = f"{server.base_url}/objects_attrs.inv"
+
+        with soi.http.urlopen(url, pool=pool) as resp:
+            resp.read(10)
+
+        assert pool.idle_count() == 0
+
+        with soi.http.urlopen(url, pool=pool) as resp:
+            resp.read()
+
+        assert server.connection_count == 2
+        assert pool.idle_count() == 1
+        pool.close()
+
+    @pytest.mark.timeout(30)
+    def test_api_pool_error_status(self, keepalive_resource_server):
+        """Confirm error statuses raise HTTPError."""
+        server = keepalive_resource_server
+        pool = soi.http.ConnectionPool()
+
+        with pytest.raises(HTTPError) as exc_info:
+            soi.http.urlopen(f"{server.base_url}/nonexistent.inv", pool=pool)
+
+        assert exc_info.value.code == 404
+        assert exc_info.value.read()
+        pool.close()
+
+    @pytest.mark.timeout(30)
+    def test_api_pool_redirect(self, scratch_path):
+        """Confirm redirects are followed over the pool."""
+        (scratch_path / "docs").mkdir()
+        pool = soi.http.ConnectionPool()
+
+        with _baseurl_for_served_directory(
+            scratch_path,
+            server_cls=KeepAliveHTTPServer,
+            handler_base=KeepAliveRequestHandler,
+        ) as base_url:
+            # The server redirects a directory URL lacking a trailing slash
+            with soi.http.urlopen(f"{base_url}/docs", pool=pool) as resp:
+                resp.read()
+
+            assert resp.status == 200
+            assert resp.url == f"{base_url}/docs/"
+            pool.close()
+
+    @pytest.mark.timeout(30)
+    def test_api_pool_stale_connection(self, keepalive_resource_server, res_cmp):
+        """Confirm a connection closed by the server is replaced transparently."""
+        server = keepalive_resource_server
+        pool = soi.http.ConnectionPool()
+        url = f"{server.base_url}/objects_attrs.inv"
+
+        with soi.http.urlopen(url, pool=pool) as resp:
+            resp.read()
+
+        with pool._lock:
+            (conns,) = pool._idle.values()
+            conns[0].sock.shutdown(socket.SHUT_RDWR)
+
+        inv = soi.Inventory(url=url)
+        with soi.http.urlopen(url, pool=pool) as resp:
+            assert resp.read() == soi.readbytes(res_cmp)
+
+        assert inv == soi.Inventory(res_cmp)
+        pool.close()
+
+
+class TestAsyncio:
+    """Tests of the asyncio loading API, against the local server."""
+
+    @pytest.mark.timeout(30)
+    def test_api_afrom_url(self, http_inv_url_template, res_cmp):
+        """Confirm an inventory loads asynchronously from a URL."""
+        inv = asyncio.run(
+            soi.Inventory.afrom_url(http_inv_url_template.format("attrs"))
+        )
+
+        assert inv == soi.Inventory(res_cmp)
+        assert inv.source_type == soi.SourceTypes.URL
+
+    @pytest.mark.timeout(30)
+    def test_api_afrom_url_http11(self, keepalive_resource_server, res_cmp):
+        """Confirm asynchronous loading from an HTTP/1.1 server."""
+        url = f"{keepalive_resource_server.base_url}/objects_attrs.inv"
+
+        assert asyncio.run(soi.Inventory.afrom_url(url)) == soi.Inventory(res_cmp)
+
+    @pytest.mark.timeout(30)
+    def test_api_aio_load_many(self, http_inv_url_template, res_path):
+        """Confirm bulk asynchronous loading, with failures returned."""
+        names = ["attrs", "beaker", "click", "blarghers"]
+        urls = [http_inv_url_template.format(n) for n in names]
+
+        async def collect():
+            """Gather all results from load_many."""
+            return {
+                url: res
+                async for url, res in soi.aio.load_many(
+                    urls, concurrency=2, per_host=2, return_exceptions=True
+                )
+            }
+
+        results = asyncio.run(collect())
+
+        assert set(results) == set(urls)
+        for name, url in zip(names[:-1], urls):
+            assert results[url] == soi.Inventory(res_path / f"objects_{name}.inv")
+
+        assert isinstance(results[urls[-1]], HTTPError)
+        assert results[urls[-1]].code == 404
+
+    @pytest.mark.timeout(30)
+    def test_api_aio_load_many_raises(self, http_inv_url_template):
+        """Confirm a failure propagates unless exceptions are returned."""
+        urls = [http_inv_url_template.format(n) for n in ("blarghers", "attrs")]
+
+        async def collect():
+            """Gather all results from load_many."""
+            return [res async for res in soi.aio.load_many(urls)]
+
+        with pytest.raises(HTTPError):
+            asyncio.run(collect())
+
+    @pytest.mark.timeout(30)
+    def test_api_aio_load_proxy(self, res_cmp, monkeypatch):
+        """Confirm asynchronous loading goes through a configured proxy."""
+        body = res_cmp.read_bytes()
+        paths = []
+
+        class ProxyHandler(http.server.BaseHTTPRequestHandler):
+            """Answer every request with the inventory, as a proxy would."""
+
+            def do_GET(self):  # noqa: N802
+                """Record the requested URL and send the inventory."""
+                paths.append(self.path)
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                """Keep the test output quiet."""
+
+        with http.server.ThreadingHTTPServer(("127.0.0.1", 0), ProxyHandler) as proxy:
+            thread = threading.Thread(target=proxy.serve_forever, daemon=True)
+            thread.start()
+
+            for name in ("no_proxy", "NO_PROXY", "HTTP_PROXY"):
+                monkeypatch.delenv(name, raising=False)
+            monkeypatch.setenv("http_proxy", f"http://127.0.0.1:{proxy.server_port}")
+
+            # The .invalid domain can't resolve, so only the proxy can answer
+            url = "http://inventory.invalid/objects_attrs.inv"
+            try:
+                inv = asyncio.run(soi.aio.load(url))
+            finally:
+                proxy.shutdown()
+
+        assert inv == soi.Inventory(res_cmp)
+        assert paths == [url]
+
+
+class TestRequestPolicy:
+    """Tests of download timeouts, retries, and hedging, against a local server."""
+
+    @staticmethod
+    def policy(**kwargs):
+        """Create a policy with no backoff delay and its own latency record."""
+        return soi.RequestPolicy(backoff=0, tracker=soi.http.LatencyTracker(), **kwargs)
+
+    @pytest.mark.timeout(30)
+    def test_api_policy_retries(self, scripted_resource_server, res_cmp):
+        """Confirm transient failures are retried."""
+        server = scripted_resource_server
+        server.script = [503, 502]
+        url = f"{server.base_url}/objects_attrs.inv"
+
+        inv = soi.Inventory(url=url, request_policy=self.policy(retries=2))
+
+        assert inv == soi.Inventory(res_cmp)
+        assert server.request_count == 3
+
+    @pytest.mark.timeout(30)
+    def test_api_policy_retries_exhausted(self, scripted_resource_server):
+        """Confirm the last failure is raised once retries run out."""
+        server = scripted_resource_server
+        server.script = [503, 503]
+        url = f"{server.base_url}/objects_attrs.inv"
+
+        with pytest.raises(HTTPError) as exc_info:
+            soi.Inventory(url=url, request_policy=self.policy(retries=1))
+
+        assert exc_info.value.code == 503
+        assert server.request_count == 2
+
+    @pytest.mark.timeout(30)
+    def test_api_policy_no_retry_permanent(self, scripted_resource_server):
+        """Confirm non-transient failures are not retried."""
+        server = scripted_resource_server
+        url = f"{server.base_url}/objects_nonexistent.inv"
+
+        with pytest.raises(HTTPError):
+            soi.Inventory(url=url, request_policy=self.policy(retries=3))
+
+        assert server.request_count == 1
+
+    @pytest.mark.timeout(30)
+    def test_api_policy_read_timeout(self, scripted_resource_server):
+        """Confirm a stalled server is abandoned after the read timeout."""
+        server = scripted_resource_server
+        server.script = [3.0]
+        url = f"{server.base_url}/objects_attrs.inv"
+
+        start = time.monotonic()
+        with pytest.raises(URLError) as exc_info:
+            soi.Inventory(url=url, request_policy=self.policy(read_timeout=0.2))
+
+        assert time.monotonic() - start < 2
+        assert soi.http.is_transient(exc_info.value)
+
+    @pytest.mark.timeout(30)
+    @pytest.mark.parametrize("action", ["stall", "truncate"])
+    def test_api_policy_partial_body(self, action, scripted_resource_server, res_cmp):
+        """Confirm failures partway through the body are retried as URLError."""
+        server = scripted_resource_server
+        server.script = [action]
+        url = f"{server.base_url}/objects_attrs.inv"
+        policy = self.policy(read_timeout=0.2)
+
+        with pytest.raises(URLError) as exc_info:
+            soi.Inventory(url=url, request_policy=policy)
+
+        assert soi.http.is_transient(exc_info.value)
+
+        server.script = [action]
+        inv = soi.Inventory(
+            url=url, request_policy=self.policy(read_timeout=0.2, retries=1)
+        )
+
+        assert inv == soi.Inventory(res_cmp)
+        assert server.request_count == 3
+
+    @pytest.mark.timeout(30)
+    def test_api_policy_hedge(self, scripted_resource_server, res_cmp):
+        """Confirm a hedged request overtakes a stalled one."""
+        server = scripted_resource_server
+        server.script = [3.0]
+        url = f"{server.base_url}/objects_attrs.inv"
+
+        start = time.monotonic()
+        inv = soi.Inventory(
+            url=url, request_policy=self.policy(hedge=True, hedge_delay=0.1)
+        )
+
+        assert time.monotonic() - start < 2
+        assert inv == soi.Inventory(res_cmp)
+        assert server.request_count == 2
+
+    @pytest.mark.timeout(30)
+    def test_api_policy_probe(self, scripted_resource_server):
+        """Confirm the inventory probe retries transient failures."""
+        server = scripted_resource_server
+        server.script = [500]
+        url = f"{server.base_url}/objects_attrs.inv"
+
+        assert soi.http.probe(url, policy=self.policy(retries=1))
+
+    @pytest.mark.timeout(30)
+    def test_api_policy_aio(self, scripted_resource_server, res_cmp):
+        """Confirm retries and hedging of asynchronous downloads."""
+        server = scripted_resource_server
+        server.script = [503, 3.0]
+        url = f"{server.base_url}/objects_attrs.inv"
+        policy = self.policy(retries=1, hedge=True, hedge_delay=0.1)
+
+        start = time.monotonic()
+        inv = asyncio.run(soi.Inventory.afrom_url(url, request_policy=policy))
+
+        assert time.monotonic() - start < 2
+        assert inv == soi.Inventory(res_cmp)
+        assert server.request_count == 3
+
+    @pytest.mark.timeout(30)
+    def test_api_policy_aio_read_timeout(self, scripted_resource_server):
+        """Confirm a stalled server is abandoned by an asynchronous download."""
+        server = scripted_resource_server
+        server.script = [3.0]
+        url = f"{server.base_url}/objects_attrs.inv"
+
+        with pytest.raises(URLError):
+            asyncio.run(soi.aio.fetch(url, policy=self.policy(read_timeout=0.2)))
+
+
+class TestPeekHeader:
+    """Tests of header-only inspection of inventories at URLs."""
+
+    @pytest.mark.timeout(30)
+    def test_api_peek_header_url_range(self, res_cmp, res_path):
+        """Confirm only a small range is requested from a server supporting it."""
+        RangeRequestHandler.ranges = []
+
+        with _baseurl_for_served_directory(
+            res_path,
+            server_cls=KeepAliveHTTPServer,
+            handler_base=RangeRequestHandler,
+        ) as base_url:
+            header = soi.peek_header(f"{base_url}/objects_attrs.inv")
+
+        assert header == soi.peek_header(res_cmp)
+        assert RangeRequestHandler.ranges == [(0, 512)]
+
+    @pytest.mark.timeout(30)
+    def test_api_peek_header_url_no_range(self, res_cmp, resource_url):
+        """Confirm a server ignoring the Range header is also handled."""
+        header = soi.peek_header(resource_url("objects_attrs.inv"))
+
+        assert header == soi.peek_header(res_cmp)
+
+    @pytest.mark.timeout(30)
+    def test_api_peek_header_url_missing(self, resource_url):
+        """Confirm HTTP errors propagate."""
+        with pytest.raises(HTTPError):
+            soi.peek_header(resource_url("objects_nonexistent.inv"))
+
+
+class TestMirror:
+    """Tests of inventory mirroring from a local server."""
+
+    @pytest.mark.timeout(30)
+    def test_api_mirror_conditional(self, scripted_resource_server, scratch_path):
+        """Confirm a resync is answered by Not Modified responses."""
+        server = scripted_resource_server
+        mapping = {
+            name: f"{server.base_url}/objects_{name}.inv"
+            for name in ("attrs", "beaker", "click")
+        }
+        dest = scratch_path / "mirror"
+
+        results = soi.sync(mapping, dest, workers=3)
+
+        assert [r.status for r in results] == [soi.SyncStatus.Updated] * 3
+        assert sorted(server.statuses) == [200] * 3
+
+        server.statuses.clear()
+        results = soi.sync(mapping, dest, workers=3)
+
+        assert [r.status for r in results] == [soi.SyncStatus.Unchanged] * 3
+        assert server.statuses == [304] * 3
+
+        server.statuses.clear()
+        soi.sync(mapping, dest, force=True)
+
+        assert server.statuses == [200] * 3
+
+    @pytest.mark.timeout(30)
+    def test_api_mirror_retries(self, scripted_resource_server, scratch_path):
+        """Confirm the request policy applies to mirror downloads."""
+        server = scripted_resource_server
+        server.script = [503]
+        mapping = {"attrs": f"{server.base_url}/objects_attrs.inv"}
+        policy = soi.RequestPolicy(retries=1, backoff=0)
+
+        (res,) = soi.sync(mapping, scratch_path / "mirror", policy=policy)
+
+        assert res.status is soi.SyncStatus.Updated
+
+
+@pytest.fixture
+def mirror_server(scratch_path, res_path):
+    """Serve a scratch mirror directory with a MirrorServer."""
+    mirror = scratch_path / "served"
+    (mirror / "sub").mkdir(parents=True)
+    shutil.copy(res_path / "objects_attrs.inv", mirror / "objects_attrs.inv")
+    shutil.copy(res_path / "objects_click.inv", mirror / "sub" / "objects_click.inv")
+    (mirror / "notes.txt").write_text("not an inventory")
+
+    server = soi.mirror.MirrorServer(mirror, ("127.0.0.1", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _mirror_get(url, **headers):
+    """Make a GET request, returning HTTP error responses rather than raising."""
+    try:
+        return urlrequest.urlopen(  # noqa: S310
+            urlrequest.Request(url, headers=headers)
+        )
+    except HTTPError as e:
+        return e
+
+
+class TestMirrorServer:
+    """Tests of serving a mirror directory over HTTP."""
+
+    @pytest.mark.timeout(30)
+    def test_api_mirror_server_get(self, mirror_server, res_cmp):
+        """Confirm files are served with strong validators."""
+        with _mirror_get(mirror_server.url + "objects_attrs.inv") as resp:
+            assert resp.status == 200
+            assert resp.read() == res_cmp.read_bytes()
+            etag = resp.headers["ETag"]
+
+        assert re.fullmatch('"[0-9a-f]+"', etag)
+
+        with _mirror_get(mirror_server.url + "objects_attrs.inv") as resp:
+            assert resp.headers["ETag"] == etag
+            assert resp.headers["Accept-Ranges"] == "bytes"
+
+    @pytest.mark.timeout(30)
+    def test_api_mirror_server_conditional(self, mirror_server):
+        """Confirm conditional requests are answered by Not Modified."""
+        url = mirror_server.url + "sub/objects_click.inv"
+
+        with _mirror_get(url) as resp:
+            etag, modified = resp.headers["ETag"], resp.headers["Last-Modified"]
+
+        for headers in (
+            {"If-None-Match": etag},
+            {"If-None-Match": f'"nope", W/{etag}'},
+            {"If-None-Match": "*"},
+            {"If-Modified-Since": modified},
+        ):
+            with _mirror_get(url, **headers) as resp:
+                assert resp.status == 304
+                assert resp.headers["ETag"] == etag
+
+        with _mirror_get(url, **{"If-None-Match": '"nope"'}) as resp:
+            assert resp.status == 200
+
+    @pytest.mark.timeout(30)
+    @pytest.mark.parametrize(
+        ("value", "status", "span"),
+        [
+            ("bytes=0-9", 206, (0, 10)),
+            ("bytes=100-", 206, (100, None)),
+            ("bytes=-20", 206, (-20, None)),
+            ("bytes=1000000-", 416, None),
+            ("bytes=0-1,5-9", 200, (0, None)),
+            ("lines=0-9", 200, (0, None)),
+        ],
+    )
+    def test_api_mirror_server_range(self, mirror_server, res_cmp, value, status, span):
+        """Confirm single byte ranges are honored."""
+        with _mirror_get(mirror_server.url + "objects_attrs.inv", Range=value) as resp:
+            assert resp.status == status
+            data = res_cmp.read_bytes()
+
+            if span is None:
+                assert resp.headers["Content-Range"] == f"bytes */{len(data)}"
+            else:
+                assert resp.read() == data[slice(*span)]
+
+    @pytest.mark.timeout(30)
+    def test_api_mirror_server_if_range(self, mirror_server, res_cmp):
+        """Confirm a stale If-Range gets the whole file."""
+        url = mirror_server.url + "objects_attrs.inv"
+        etag = _mirror_get(url).headers["ETag"]
+
+        with _mirror_get(url, Range="bytes=0-9", **{"If-Range": etag}) as resp:
+            assert resp.status == 206
+
+        with _mirror_get(url, Range="bytes=0-9", **{"If-Range": '"old"'}) as resp:
+            assert resp.status == 200
+            assert resp.read() == res_cmp.read_bytes()
+
+    @pytest.mark.timeout(30)
+    def test_api_mirror_server_head(self, mirror_server, res_cmp):
+        """Confirm HEAD requests get headers only."""
+        req = urlrequest.Request(mirror_server.url + "objects_attrs.inv", method="HEAD")
+
+        with urlrequest.urlopen(req) as resp:  # noqa: S310
+            assert int(resp.headers["Content-Length"]) == res_cmp.stat().st_size
+            assert resp.read() == b""
+
+    @pytest.mark.timeout(30)
+    @pytest.mark.parametrize(
+        "path",
+        ["objects_none.inv", "notes.txt", "../objects_attrs.inv", "sub/../sub"],
+    )
+    def test_api_mirror_server_not_found(self, mirror_server, path):
+        """Confirm only inventories within the directory are served."""
+        with _mirror_get(mirror_server.url + path) as resp:
+            assert resp.status == 404
+
+        assert mirror_server.lookup("../served/objects_attrs.inv") is None
+
+    @pytest.mark.timeout(30)
+    def test_api_mirror_server_index(self, mirror_server, res_cmp):
+        """Confirm the JSON index describes the served inventories."""
+        with _mirror_get(mirror_server.url) as resp:
+            assert resp.headers["Content-Type"] == "application/json"
+            index = json.load(resp)
+            etag = resp.headers["ETag"]
+
+        entries = index["inventories"]
+
+        assert [e["path"] for e in entries] == [
+            "objects_attrs.inv",
+            "sub/objects_click.inv",
+        ]
+        assert entries[0]["project"] == "attrs"
+        assert entries[0]["version"] == "22.1"
+        assert entries[0]["size"] == res_cmp.stat().st_size
+        assert (
+            entries[0]["etag"]
+            == _mirror_get(resp.url + "objects_attrs.inv").headers["ETag"]
+        )
+
+        with _mirror_get(
+            mirror_server.url + "index.json", **{"If-None-Match": etag}
+        ) as r:
+            assert r.status == 304
+
+    @pytest.mark.timeout(30)
+    def test_api_mirror_server_file_changed(self, mirror_server, res_path):
+        """Confirm validators follow changes to the served files."""
+        url = mirror_server.url + "objects_attrs.inv"
+        etag = _mirror_get(url).headers["ETag"]
+
+        target = mirror_server.directory / "objects_attrs.inv"
+        data = (res_path / "objects_beaker.inv").read_bytes()
+        target.write_bytes(data)
+        os.utime(target, ns=(0, 10**18))
+
+        with _mirror_get(url, **{"If-None-Match": etag}) as resp:
+            assert resp.status == 200
+            assert resp.read() == data
+            assert resp.headers["ETag"] != etag
+
+        target.unlink()
+
+        with _mirror_get(mirror_server.url) as resp:
+            assert [e["path"] for e in json.load(resp)["inventories"]] == [
+                "sub/objects_click.inv"
+            ]
+
+    @pytest.mark.timeout(30)
+    def test_api_mirror_server_index_cached(self, mirror_server, res_path, monkeypatch):
+        """Confirm the index is reused until the served files change."""
+        scans = []
+        scan = mirror_server._scan
+
+        def counting_scan():
+            scans.append(None)
+            return scan()
+
+        def age_dirs():
+            """Backdate the directories, as if last changed well before now."""
+            for path in (mirror_server.directory, mirror_server.directory / "sub"):
+                os.utime(path, ns=(0, time.time_ns() - 10**10))
+
+        def index_projects():
+            with _mirror_get(mirror_server.url) as resp:
+                return [e["project"] for e in json.load(resp)["inventories"]]
+
+        monkeypatch.setattr(mirror_server, "_scan", counting_scan)
+        age_dirs()
+
+        assert index_projects() == ["attrs", "Click"]
+        assert index_projects() == ["attrs", "Click"]
+        assert len(scans) == 1
+
+        # A new file changes the modification time of its directory
+        shutil.copy(res_path / "objects_beaker.inv", mirror_server.directory / "sub")
+
+        assert index_projects() == ["attrs", "Beaker", "Click"]
+        assert len(scans) == 2
+
+        # A file changed in place is noticed once it is requested
+        age_dirs()
+        index_projects()
+        target = mirror_server.directory / "objects_attrs.inv"
+        target.write_bytes((res_path / "objects_beaker.inv").read_bytes())
+        os.utime(target, ns=(0, 10**18))
+
+        assert index_projects() == ["attrs", "Beaker", "Click"]
+        assert len(scans) == 3
+
+        _mirror_get(mirror_server.url + "objects_attrs.inv").close()
+
+        assert index_projects() == ["Beaker", "Beaker", "Click"]
+        assert len(scans) == 4
+
+    @pytest.mark.timeout(30)
+    def test_api_mirror_server_no_cache(self, mirror_server, res_cmp):
+        """Confirm files are still served with the memory cache disabled."""
+        mirror_server.cache_size = 0
+
+        for _ in range(2):
+            with _mirror_get(mirror_server.url + "objects_attrs.inv") as resp:
+                assert resp.read() == res_cmp.read_bytes()
+
+    @pytest.mark.timeout(30)
+    def test_api_mirror_server_clients(self, mirror_server, res_cmp, scratch_path):
+        """Confirm the library's own clients work against the server."""
+        url = mirror_server.url + "objects_attrs.inv"
+
+        assert soi.Inventory(url=url).data_file() == soi.Inventory(res_cmp).data_file()
+        assert soi.peek_header(url).project == "attrs"
+
+        mapping = {"attrs": url}
+        dest = scratch_path / "mirror"
+
+        (res,) = soi.sync(mapping, dest)
+        assert res.status is soi.SyncStatus.Updated
+
+        (res,) = soi.sync(mapping, dest)
+        assert res.status is soi.SyncStatus.Unchanged
+
+
+class TestRegistry:
+    """Tests of the registry of loaded inventories, from a local server."""
+
+    @pytest.mark.timeout(30)
+    def test_api_registry_url_revalidate(self, scripted_resource_server):
+        """Confirm URL inventories are revalidated with conditional requests."""
+        server = scripted_resource_server
+        url = f"{server.base_url}/objects_attrs.inv"
+        reg = soi.Registry()
+
+        inv = reg.get(url)
+
+        assert inv.source_type is soi.SourceTypes.URL
+        assert reg.get(url) is inv
+        assert server.statuses == [200, 304]
+        assert (reg.misses, reg.revalidations) == (1, 1)
+
+    @pytest.mark.timeout(30)
+    def test_api_registry_url_ttl(self, scripted_resource_server):
+        """Confirm no request is made within the time-to-live."""
+        server = scripted_resource_server
+        url = f"{server.base_url}/objects_attrs.inv"
+        reg = soi.Registry(ttl=60)
+
+        inv = reg.get(url)
+
+        assert reg.get(url) is inv
+        assert server.statuses == [200]
+
+    @pytest.mark.timeout(30)
+    def test_api_registry_url_policy(self, scripted_resource_server):
+        """Confirm the request policy applies to registry requests."""
+        server = scripted_resource_server
+        server.script = [503]
+        url = f"{server.base_url}/objects_attrs.inv"
+
+        with pytest.raises(HTTPError):
+            soi.Registry().get(url)
+
+        server.script = [503]
+        reg = soi.Registry(policy=soi.RequestPolicy(retries=1, backoff=0))
+
+        assert reg.get(url).count == 129
@@ -0,0 +1,228 @@
+r"""*Tests for the* ``sphobjinv`` *benchmark helpers*.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import json
+
+import pytest
+
+from benchmarks import cli as bench_cli
+from benchmarks import compare as bench_compare
+from benchmarks import library as bench_library
+from benchmarks import memory as bench_memory
+from benchmarks import scaling as bench_scaling
+from benchmarks.common import check_budgets, corpus, percentile, summarize
+
+pytestmark = [pytest.mark.local]
+
+
+def test_benchmarks_percentile():
+    """Confirm percentiles interpolate between samples."""
+    samples = [4.0, 1.0, 3.0, 2.0]
+
+    assert percentile(samples, 0) == 1.0
+    assert percentile(samples, 50) == 2.5
+    assert percentile(samples, 100) == 4.0
+    assert percentile([7.0], 95) == 7.0
+
+
+def test_benchmarks_summarize_and_budgets():
+    """Confirm summary statistics and budget checks."""
+    stats = summarize([0.1, 0.2, 0.3])
+
+    assert (stats["n"], stats["min"], stats["max"]) == (3, 0.1, 0.3)
+    assert stats["p50"] == pytest.approx(0.2)
+
+    cases = {"fast": {"stats": stats}, "slow": {"stats": summarize([2.0])}}
+    budgets = {"fast": {"p50": 1.0}, "slow": {"p50": 1.0}, "absent": {"p50": 0}}
+
+    assert check_budgets(cases, budgets) == [("slow", "p50", 2.0, 1.0)]
+
+
+def test_benchmarks_corpus():
+    """Confirm the corpus spans the test resource inventories."""
+    files = corpus()
+
+    assert len(files) > 60
+    assert all(f.suffix == ".inv" for f in files)
+    assert corpus(limit=2) == files[:2]
+
+
+@pytest.mark.timeout(60)
+def test_benchmarks_cli_run(tmp_path, capsys):
+    """Confirm a minimal CLI benchmark run reports, saves, and compares."""
+    output = tmp_path / "cli.json"
+    args = ["--repeat", "1", "--files", "objects_attrs.inv"]
+    args += ["--cases", "startup,convert-json"]
+
+    assert bench_cli.main(args + ["--output", str(output)]) == 0
+
+    results = json.loads(output.read_text())
+    assert results["suite"] == "cli"
+    assert set(results["cases"]) == {"startup", "convert-json"}
+    assert results["cases"]["convert-json"]["stats"]["n"] == 1
+
+    budgets = tmp_path / "budgets.json"
+    budgets.write_text(json.dumps({"startup": {"p50": 0}}))
+
+    assert bench_cli.main(args + ["--compare", str(output), "--budgets", str(budgets)])
+
+    out = capsys.readouterr().out
+    assert "p50 change" in out
+    assert "BUDGET EXCEEDED: startup p50" in out
+
+
+@pytest.mark.parametrize(
+    ("diffs", "p"),
+    [
+        ([1, 2, 3, 4, 5], 0.0625),
+        ([1, -2, 3, -4, 5], 0.8125),
+        ([0, 0], 1.0),
+        ([1.0] * 30, 4.617e-08),
+    ],
+)
+def test_benchmarks_wilcoxon(diffs, p):
+    """Confirm signed-rank p-values, exact and approximate."""
+    assert bench_compare.wilcoxon_signed_rank(diffs) == pytest.approx(p, rel=1e-3)
+
+
+@pytest.mark.parametrize(
+    ("a", "b", "p"),
+    [
+        ([1, 2, 3, 4, 5], [6, 7, 8, 9, 10], 0.007937),
+        ([1, 3, 5, 7, 9], [2, 4, 6, 8, 10], 0.6905),
+        ([1, 1, 2], [3, 3, 4], 0.07220),
+    ],
+)
+def test_benchmarks_mann_whitney(a, b, p):
+    """Confirm rank-sum p-values, exact and approximate."""
+    assert bench_compare.mann_whitney_u(a, b) == pytest.approx(p, rel=1e-3)
+
+
+def test_benchmarks_compare():
+    """Confirm only significant changes beyond the threshold are flagged."""
+    files = [f"f{i}" for i in range(10)]
+
+    def case(scale, samples=(1.0, 1.1, 1.2)):
+        """Build results for a case with per-file times scaled by `scale`."""
+        return {
+            "samples": [scale * s for s in samples],
+            "by_label": {f: scale * (1 + i / 10) for i, f in enumerate(files)},
+        }
+
+    old = {"cases": {"slow": case(1), "fast": case(1), "same": case(1)}}
+    new = {"cases": {"slow": case(1.5), "fast": case(0.5), "same": case(1.01)}}
+    old["cases"]["few"] = {"samples": [1.0, 1.1, 1.2, 1.3, 1.4], "by_label": {}}
+    new["cases"]["few"] = {"samples": [2.0, 2.1, 2.2, 2.3, 2.4], "by_label": {}}
+
+    rows = {r[0]: r for r in bench_compare.compare(old, new)}
+
+    assert rows["slow"][-1] == "REGRESSION"
+    assert rows["slow"][1] == pytest.approx(1.5)
+    assert rows["fast"][-1] == "improvement"
+    assert rows["same"][-1] == ""
+    assert rows["few"][3:] == ("mann-whitney", "REGRESSION")
+
+
+@pytest.mark.timeout(60)
+def test_benchmarks_library_run(tmp_path, capsys):
+    """Confirm a minimal library benchmark run reports and saves results."""
+    output = tmp_path / "lib.json"
+    args = ["--rounds", "2", "--files", "objects_attrs*.inv", "--suggest-files", "1"]
+    args += ["--cases", "load-bytes-zlib,json-roundtrip,suggest-75"]
+
+    assert bench_library.main(args + ["--output", str(output)]) == 0
+
+    results = json.loads(output.read_text())
+    assert results["suite"] == "library"
+    assert set(results["cases"]) == {"load-bytes-zlib", "json-roundtrip", "suggest-75"}
+    assert len(results["cases"]["load-bytes-zlib"]["by_label"]) > 1
+    assert len(results["cases"]["suggest-75"]["by_label"]) == 1
+    assert results["cases"]["json-roundtrip"]["stats"]["n"] == 2
+    assert results["cases"]["load-bytes-zlib"]["objects_per_s"] > 0
+
+    assert bench_compare.main([str(output), str(output)]) == 0
+    assert "mann-whitney" in capsys.readouterr().out
+
+
+def test_benchmarks_scaling_sizes():
+    """Confirm sizes are parsed and formatted with suffixes."""
+    assert [bench_scaling.parse_size(s) for s in ("500", "10k", "1.5k", "2M")] == [
+        500,
+        10_000,
+        1500,
+        2_000_000,
+    ]
+    assert [bench_scaling.size_label(n) for n in (500, 10_000, 1500, 2_000_000)] == [
+        "500",
+        "10k",
+        "1500",
+        "2M",
+    ]
+
+
+@pytest.mark.timeout(60)
+def test_benchmarks_scaling_run(tmp_path):
+    """Confirm a minimal scaling benchmark run saves results with exponents."""
+    output = tmp_path / "scaling.json"
+    args = ["--sizes", "1k,2k", "--rounds", "1", "--suggest-max", "1k"]
+    args += ["--cases", "parse-zlib,suggest", "--output", str(output)]
+
+    assert bench_scaling.main(args) == 0
+
+    cases = json.loads(output.read_text())["cases"]
+    assert set(cases) == {"parse-zlib-1k", "parse-zlib-2k", "suggest-1k"}
+    assert cases["parse-zlib-1k"]["exponent"] is None
+    assert cases["parse-zlib-2k"]["exponent"] is not None
+
+
+@pytest.mark.timeout(60)
+def test_benchmarks_memory_run(tmp_path, capsys):
+    """Confirm a minimal memory benchmark run saves results and checks budgets."""
+    output = tmp_path / "memory.json"
+    args = ["--files", "objects_attrs*.inv", "--suggest-files", "1"]
+    args += ["--cases", "load-zlib,convert-json,suggest"]
+
+    assert bench_memory.main(args + ["--output", str(output)]) == 0
+
+    cases = json.loads(output.read_text())["cases"]
+    assert set(cases) == {"load-zlib", "convert-json", "suggest"}
+    assert len(cases["load-zlib"]["by_label"]) > 1
+    assert len(cases["suggest"]["by_label"]) == 1
+    assert 0 < cases["load-zlib"]["stats"]["retained_per_object"]
+    assert cases["load-zlib"]["stats"]["retained"] <= cases["load-zlib"]["stats"][
+        "peak"
+    ] * len(cases["load-zlib"]["by_label"])
+
+    budgets = tmp_path / "budgets.json"
+    budgets.write_text(json.dumps({"load-zlib": {"retained_per_object": 1}}))
+
+    assert bench_memory.main(args + ["--budgets", str(budgets)]) == 1
+    assert "BUDGET EXCEEDED: load-zlib retained_per_object" in capsys.readouterr().out
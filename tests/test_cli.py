@@ -30,6 +30,7 @@ Sphinx |objects.inv| files.
 """
 
 import json
+import os
 import re
 import shlex
 import subprocess as sp  # noqa: S404
@@ -40,6 +41,7 @@ import pytest
 from stdio_mgr import stdio_mgr
 
 from sphobjinv import HeaderFields, Inventory, SourceTypes
+from sphobjinv.synth import generate
 
 CLI_TEST_TIMEOUT = 2
 CLI_CMDS = ["sphobjinv", "python -m sphobjinv"]
@@ -397,6 +399,263 @@ class TestSuggestGood:
             run_cmdline_test(["suggest", res_cmp, "function", "-sapt30"])
             assert 1 < out_.getvalue().count("Press Enter to continue")
 
+    @pytest.mark.parametrize(
+        ["timeout", "complete"], [("60", True), ("0", False)], ids=["ample", "zero"]
+    )
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_cli_suggest_timeout(self, timeout, complete, run_cmdline_test, res_cmp):
+        """Confirm the search time limit is applied and reported."""
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(
+                ["suggest", res_cmp, "instance", "-t", "50", "--timeout", timeout]
+            )
+
+            assert complete == ("instance_of" in out_.getvalue())
+            assert complete != ("time limit" in err_.getvalue())
+
+    @pytest.mark.parametrize(
+        ["flags", "found"],
+        [
+            (["-d", "py", "-r", "function"], True),
+            (["--role", "class"], False),
+            (["--domain", "std"], False),
+        ],
+        ids=["match", "role_mismatch", "domain_mismatch"],
+    )
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_cli_suggest_domain_role(self, flags, found, run_cmdline_test, res_cmp):
+        """Confirm domain and role filters restrict the searched objects."""
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["suggest", res_cmp, "instance_of", *flags])
+
+            assert found == ("instance_of" in out_.getvalue())
+
+
+class TestSyncGood:
+    """Tests for expected-good sync functionality."""
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT * 2)
+    def test_cli_sync(self, res_cmp, res_path, scratch_path, run_cmdline_test):
+        """Confirm a mirror is populated and then found current."""
+        mapping = scratch_path / "mapping.json"
+        mapping.write_text(
+            json.dumps(
+                {
+                    "attrs": res_cmp.as_uri(),
+                    "sphinx": [res_path.as_uri(), "objects_sphinx.inv"],
+                }
+            )
+        )
+        dest = scratch_path / "mirror"
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["sync", str(mapping), str(dest)])
+
+            assert "attrs: updated (attrs 22.1, 129 objects)" in err_.getvalue()
+            assert "2 updated, 0 unchanged, 0 failed" in err_.getvalue()
+
+        assert Inventory(dest / "objects_sphinx.inv") == Inventory(
+            res_path / "objects_sphinx.inv"
+        )
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["sy", "-q", str(mapping), str(dest)])
+
+            assert not err_.getvalue()
+
+
+class TestGenerateGood:
+    """Tests for expected-good generate functionality."""
+
+    @pytest.mark.parametrize("mode", ["zlib", "plain", "json"])
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_cli_generate(self, mode, scratch_path, run_cmdline_test):
+        """Confirm a synthetic inventory is written in each format."""
+        path = scratch_path / "synth.out"
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["generate", mode, "500", str(path), "-s", "4"])
+
+            assert "Generated 500 objects" in err_.getvalue()
+
+        def load():
+            """Load the output in the appropriate way for the format."""
+            if mode == "json":
+                return Inventory(json.loads(path.read_text()))
+            return Inventory(path)
+
+        assert load() == generate(500, seed=4)
+
+        run_cmdline_test(["ge", mode, "50", str(path), "--project", "P", "-oq"])
+
+        assert load().project == "P"
+
+
+class TestDiagnostics:
+    """Tests for the timing and profiling of CLI runs."""
+
+    @pytest.mark.parametrize("before", [True, False], ids=["before", "after"])
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_cli_timings_convert(self, before, res_cmp, scratch_path, run_cmdline_test):
+        """Confirm --timings prints a breakdown, wherever it is given."""
+        args = ["convert", "json", res_cmp, scratch_path / "out.json", "-o"]
+        args = ["--timings"] + args if before else args + ["--timings"]
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(args)
+
+            err = err_.getvalue()
+
+        assert "Timings (ms):" in err
+        stages = re.findall(r"^  (\S+)", err, re.M)
+        assert stages == ["load", "convert", "total"]
+        for phase in ("read", "decompress", "construct", "serialize", "write"):
+            assert re.search(rf"^    {phase} +\d", err, re.M), phase
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_cli_timings_passthrough(self, res_cmp, scratch_path, run_cmdline_test):
+        """Confirm the phases of a streamed conversion are reported."""
+        args = ["--timings", "convert", "zlib", res_cmp, scratch_path / "out.inv"]
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(args)
+
+            err = err_.getvalue()
+
+        assert re.findall(r"^  (\S+)", err, re.M) == ["convert", "total"]
+        for phase in ("read", "decompress", "line_parse", "compress", "write"):
+            assert re.search(rf"^    {phase} +\d", err, re.M), phase
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT * 5)
+    def test_cli_timings_env(self, res_cmp, run_cmdline_test, monkeypatch):
+        """Confirm timings can be enabled from the environment."""
+        monkeypatch.setenv("SPHOBJINV_TIMINGS", "1")
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["suggest", res_cmp, "instance", "-t", "90"])
+
+            assert re.search(r"^    suggest_score +\d", err_.getvalue(), re.M)
+
+        monkeypatch.setenv("SPHOBJINV_TIMINGS", "0")
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["suggest", res_cmp, "instance", "-t", "90"])
+
+            assert "Timings" not in err_.getvalue()
+
+    @pytest.mark.parametrize("from_env", [False, True], ids=["arg", "env"])
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_cli_profile(
+        self, from_env, res_cmp, scratch_path, run_cmdline_test, monkeypatch
+    ):
+        """Confirm --profile writes statistics readable by pstats."""
+        import pstats
+
+        path = scratch_path / "run.prof"
+        args = ["convert", "plain", res_cmp, scratch_path / "out.txt"]
+
+        if from_env:
+            monkeypatch.setenv("SPHOBJINV_PROFILE", str(path))
+        else:
+            args = ["--profile", path] + args
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(args)
+
+            assert f"Profile written to '{path}'" in err_.getvalue()
+
+        stats = pstats.Stats(str(path))
+        assert any(func[2] == "iter_plaintext" for func in stats.stats)
+
+
+class TestDaemon:
+    """Tests for running queries through the inventory daemon."""
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT * 5)
+    def test_cli_daemon_suggest(self, daemon_server, res_cmp, run_cmdline_test):
+        """Confirm suggest uses the running daemon."""
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["suggest", res_cmp, "evolve", "-s"])
+
+            out = out_.getvalue()
+
+        assert "attrs.evolve" in out
+        assert daemon_server.registry.misses == 1
+        assert daemon_server.requests == 2
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT * 5)
+    def test_cli_daemon_convert(
+        self, daemon_server, res_cmp, scratch_path, run_cmdline_test, monkeypatch
+    ):
+        """Confirm conversions through the daemon match local ones."""
+        cases = [("json", scratch_path / "out.json"), ("plain", "-"), ("json", "-")]
+        outputs = []
+
+        for from_daemon in (True, False):
+            if not from_daemon:
+                monkeypatch.setenv("SPHOBJINV_NO_DAEMON", "1")
+            requests = daemon_server.requests
+
+            for mode, out in cases:
+                with stdio_mgr() as (in_, out_, err_):
+                    run_cmdline_test(["convert", mode, res_cmp, out, "-o"])
+
+                    outputs.append(out_.getvalue())
+
+            outputs.append((scratch_path / "out.json").read_text())
+            assert (daemon_server.requests > requests) is from_daemon
+
+        assert outputs[:4] == outputs[4:]
+        assert daemon_server.registry.misses == 1
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT * 5)
+    def test_cli_daemon_fallback(self, daemon_server, res_path, run_cmdline_test):
+        """Confirm inventories the daemon can't load are loaded locally."""
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["convert", "plain", res_path / "objects_attrs.json", "-"])
+
+            assert out_.getvalue().startswith("# Sphinx inventory version 2")
+
+        assert daemon_server.requests == 1
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT * 5)
+    def test_cli_daemon_status_stop(
+        self, daemon_server, daemon_state, run_cmdline_test
+    ):
+        """Confirm the daemon can be described and stopped."""
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["daemon", "--status"])
+
+            assert f"pid {os.getpid()}" in out_.getvalue()
+
+        run_cmdline_test(["daemon", "--stop"])
+        daemon_server.server_close()
+        daemon_server.remove_state()
+
+        run_cmdline_test(["daemon", "--status"], expect=1)
+        run_cmdline_test(["daemon", "--stop"], expect=1)
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT * 10)
+    def test_cli_daemon_process(self, daemon_state):
+        """Confirm the daemon runs as a process until stopped."""
+        with sp.Popen(  # noqa: S603
+            shlex.split("sphobjinv daemon"), stderr=sp.PIPE, text=True
+        ) as proc:
+            try:
+                # First line is the cosmetic blank line
+                proc.stderr.readline()
+                assert "Daemon listening at" in proc.stderr.readline()
+                assert daemon_state.is_file()
+
+                sp.run(  # noqa: S603
+                    shlex.split("sphobjinv daemon --stop"), check=True, timeout=10
+                )
+                assert proc.wait(timeout=10) == 0
+            finally:
+                proc.kill()
+
+        assert not daemon_state.exists()
+
 
 class TestFail:
     """Tests for expected-fail behaviors."""
@@ -426,6 +685,90 @@ class TestFail:
             run_cmdline_test(["convert", "plain", fname], expect=1)
             assert "Unrecognized" in err_.getvalue()
 
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_clifail_convert_corrupt(self, res_cmp, scratch_path, run_cmdline_test):
+        """Confirm exit code 1 and no output file for corrupt zlib data."""
+        data = bytearray(res_cmp.read_bytes())
+        data[-100:-50] = b"\xff" * 50
+        in_path = scratch_path / "corrupt.inv"
+        in_path.write_bytes(data)
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["convert", "plain", in_path], expect=1)
+
+            assert "Error while parsing input file" in err_.getvalue()
+
+        assert not (scratch_path / "corrupt.txt").exists()
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_clifail_convert_no_objects(self, scratch_path, run_cmdline_test):
+        """Confirm an invalid input is reported before any overwrite prompt."""
+        in_path = scratch_path / "empty.txt"
+        in_path.write_bytes(
+            b"# Sphinx inventory version 2\n# Project: foo\n# Version: 1\n"
+            b"# The remainder of this file is compressed using zlib.\n"
+        )
+        out_path = scratch_path / "empty.inv"
+        out_path.write_bytes(b"existing")
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["convert", "zlib", in_path, out_path], expect=1)
+
+            assert "Error while parsing input file" in err_.getvalue()
+            assert "No objects found" in err_.getvalue()
+            assert "Overwrite" not in out_.getvalue()
+
+        assert out_path.read_bytes() == b"existing"
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_clifail_sync_partial(self, res_cmp, scratch_path, run_cmdline_test):
+        """Confirm exit code 1 if any inventory fails to sync."""
+        mapping = scratch_path / "mapping.json"
+        missing = scratch_path / "absent.inv"
+        mapping.write_text(
+            json.dumps({"attrs": res_cmp.as_uri(), "absent": missing.as_uri()})
+        )
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(
+                ["sync", str(mapping), str(scratch_path / "mirror")], expect=1
+            )
+
+            assert "absent: FAILED" in err_.getvalue()
+
+        assert (scratch_path / "mirror" / "objects_attrs.inv").is_file()
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_clifail_generate_exists(self, res_cmp, run_cmdline_test):
+        """Confirm an existing file is not overwritten without -o."""
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["generate", "zlib", "10", str(res_cmp)], expect=1)
+
+            assert "File exists" in err_.getvalue()
+
+        assert Inventory(res_cmp).project == "attrs"
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_clifail_sync_bad_mapping(self, scratch_path, run_cmdline_test):
+        """Confirm exit code 1 with an unreadable mapping file."""
+        mapping = scratch_path / "mapping.json"
+        mapping.write_text("[1, 2]")
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(["sync", str(mapping), str(scratch_path)], expect=1)
+
+            assert "mapping file" in err_.getvalue()
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT)
+    def test_clifail_negative_retries(self, res_cmp, run_cmdline_test):
+        """Confirm a negative retry count is rejected."""
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(
+                ["convert", "plain", "-u", str(res_cmp), "-", "--retries", "-1"],
+                expect=2,
+            )
+            assert "non-negative" in err_.getvalue()
+
     @pytest.mark.timeout(CLI_TEST_TIMEOUT)
     def test_clifail_convert_missingfile(self, run_cmdline_test):
         """Confirm exit code 1 with nonexistent file specified."""
@@ -31,11 +31,16 @@ Sphinx |objects.inv| files.
 
 import json
 import re
+import shutil
+import signal
+import subprocess as sp  # noqa: S404
+import sys
 
 import pytest
 from stdio_mgr import stdio_mgr
 
 from sphobjinv import Inventory
+from tests.fixtures_http import _baseurl_for_served_directory
 
 CLI_TEST_TIMEOUT = 5
 
@@ -250,3 +255,137 @@ class TestSuggest:
             check.is_in(
                 "(https://sphobjinv.readthedocs.io/en/v2.0/, None)", err_.getvalue()
             )
+
+
+class TestUrlWalk:
+    """Test the search for an inventory above a docs page URL."""
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT * 4)
+    @pytest.mark.filterwarnings("ignore:implicitly cleaning up.*404")
+    def test_cli_urlwalk_prefers_deepest(self, res_cmp, scratch_path, run_cmdline_test):
+        """Confirm the deepest inventory is used, whatever the probe timing."""
+        site = scratch_path / "site"
+        (site / "en" / "latest" / "api").mkdir(parents=True)
+        (site / "en" / "latest" / "api" / "objects.inv").write_bytes(b"junk")
+        (site / "en" / "latest" / "objects.inv").write_bytes(b"")
+        shutil.copy(res_cmp, site / "en" / "objects.inv")
+        shutil.copy(res_cmp, site / "objects.inv")
+
+        with _baseurl_for_served_directory(site) as base_url:
+            with stdio_mgr() as (in_, out_, err_):
+                run_cmdline_test(
+                    [
+                        "convert",
+                        "json",
+                        "-u",
+                        f"{base_url}/en/latest/api/page.html#anchor",
+                        "-",
+                    ]
+                )
+
+                d = json.loads(out_.getvalue())
+                assert d["metadata"]["url"] == f"{base_url}/en/objects.inv"
+                assert "HTTP error: 404" in err_.getvalue()
+                assert 2 == err_.getvalue().count("no recognized inventory")
+
+
+class TestUrlRetrieval:
+    """Test the URL retrieval options."""
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT * 4)
+    def test_cli_url_retries(self, res_cmp, run_cmdline_test, scripted_resource_server):
+        """Confirm a transient server error is retried when requested."""
+        server = scripted_resource_server
+        server.script = [503]
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(
+                [
+                    "convert",
+                    "plain",
+                    "-u",
+                    f"{server.base_url}/objects_attrs.inv",
+                    "-",
+                    "--retries",
+                    "1",
+                ]
+            )
+
+            assert out_.getvalue().startswith("# Sphinx inventory version 2")
+
+        assert server.request_count == 2
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT * 4)
+    def test_cli_url_read_timeout(self, run_cmdline_test, scripted_resource_server):
+        """Confirm a stalled server fails the load after the read timeout."""
+        server = scripted_resource_server
+        server.script = [3.0] * 10
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(
+                [
+                    "suggest",
+                    "-u",
+                    f"{server.base_url}/objects_attrs.inv",
+                    "attr",
+                    "--read-timeout",
+                    "0.2",
+                ],
+                expect=1,
+            )
+
+            assert "error attempting to retrieve URL" in err_.getvalue()
+
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT * 4)
+    def test_cli_url_stall_mid_body(self, run_cmdline_test, scripted_resource_server):
+        """Confirm a server stalling partway through the body is reported cleanly."""
+        server = scripted_resource_server
+        server.script = ["stall"] * 10
+
+        with stdio_mgr() as (in_, out_, err_):
+            run_cmdline_test(
+                [
+                    "suggest",
+                    "-u",
+                    f"{server.base_url}/objects_attrs.inv",
+                    "attr",
+                    "--read-timeout",
+                    "0.2",
+                ],
+                expect=1,
+            )
+
+            assert "error attempting to retrieve URL" in err_.getvalue()
+            assert "Traceback" not in err_.getvalue()
+
+
+class TestServeMirror:
+    """Test the serve-mirror subcommand."""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Needs POSIX SIGINT")
+    @pytest.mark.timeout(CLI_TEST_TIMEOUT * 4)
+    def test_cli_serve_mirror(self, res_cmp, scratch_path):
+        """Confirm the server starts, serves inventories, and stops cleanly."""
+        mirror = scratch_path / "mirror"
+        mirror.mkdir()
+        shutil.copy(res_cmp, mirror / "objects_attrs.inv")
+
+        proc = sp.Popen(  # noqa: S603
+            [sys.executable, "-m", "sphobjinv", "serve-mirror", str(mirror), "-p", "0"],
+            stderr=sp.PIPE,
+            text=True,
+        )
+
+        try:
+            while not (line := proc.stderr.readline()).startswith("Serving"):
+                assert line, "server exited before starting"
+
+            base_url = line.split(" at ")[-1].strip()
+
+            assert Inventory(url=base_url + "objects_attrs.inv").count == 129
+
+            proc.send_signal(signal.SIGINT)
+            assert proc.wait(timeout=CLI_TEST_TIMEOUT) == 0
+        finally:
+            proc.kill()
+            proc.stderr.close()
@@ -29,8 +29,10 @@ Sphinx |objects.inv| files.
 
 """
 
+import os
 import re
 import shlex
+import shutil
 import subprocess as sp  # noqa: S404
 from pathlib import Path
 
@@ -38,6 +40,7 @@ import pytest
 from stdio_mgr import stdio_mgr
 
 from sphobjinv import Inventory
+from sphobjinv.cli.cache import TextconvCache
 from tests.enum import CLICommand
 
 CLI_TEST_TIMEOUT = 2
@@ -92,6 +95,20 @@ class TestGood:
 
         assert core_output == textconv_output
 
+    def test_textconv_timings_env(self, res_cmp, run_cmdline_test, monkeypatch):
+        """Ensure timings go to stderr, leaving the output unchanged."""
+        with stdio_mgr() as (_, out_, _):
+            run_cmdline_test([res_cmp], command=CLICommand.Textconv)
+            plain_output = out_.getvalue()
+
+        monkeypatch.setenv("SPHOBJINV_TIMINGS", "1")
+
+        with stdio_mgr() as (_, out_, err_):
+            run_cmdline_test([res_cmp], command=CLICommand.Textconv)
+
+            assert out_.getvalue() == plain_output
+            assert "Timings (ms):" in err_.getvalue()
+
     def test_textconv_matches_original(self, res_cmp, run_cmdline_test):
         """Confirm textconv produces a consistent Inventory."""
         with stdio_mgr() as (_, out_, _):
@@ -104,6 +121,86 @@ class TestGood:
 
         assert inv1 == inv2
 
+    @pytest.mark.parametrize("from_env", [False, True], ids=["arg", "env"])
+    def test_textconv_cache(
+        self, from_env, res_cmp, scratch_path, run_cmdline_test, monkeypatch
+    ):
+        """Confirm output is cached and reused for the same input contents."""
+        cache_dir = scratch_path / "cache"
+        args = [res_cmp]
+
+        if from_env:
+            monkeypatch.setenv("SPHOBJINV_TEXTCONV_CACHE", str(cache_dir))
+        else:
+            args = ["--cache", cache_dir] + args
+
+        with stdio_mgr() as (_, out_, _):
+            run_cmdline_test([res_cmp], command=CLICommand.Textconv)
+            plain_output = out_.getvalue()
+
+        with stdio_mgr() as (_, out_, _):
+            run_cmdline_test(args, command=CLICommand.Textconv)
+
+            assert out_.getvalue() == plain_output
+
+        (entry,) = cache_dir.glob("*.txt")
+        entry.write_bytes(b"cached")
+
+        with stdio_mgr() as (_, out_, _):
+            run_cmdline_test(args, command=CLICommand.Textconv)
+
+            assert out_.getvalue() == "cached\n"
+
+        # A copy of the file has the same contents, and so the same entry
+        copied = scratch_path / "copy.inv"
+        shutil.copy(res_cmp, copied)
+
+        with stdio_mgr() as (_, out_, _):
+            run_cmdline_test(args[:-1] + [copied], command=CLICommand.Textconv)
+
+            assert out_.getvalue() == "cached\n"
+
+    def test_textconv_cache_trim(self, scratch_path):
+        """Confirm the least recently used entries are evicted."""
+        cache = TextconvCache(scratch_path / "cache", max_size=250)
+
+        for i, key in enumerate("abc"):
+            cache.put(key, b"x" * 100)
+            # Ensure distinct modification times
+            os.utime(cache.directory / f"{key}.txt", ns=(i * 10**9, i * 10**9))
+
+        assert sorted(p.stem for p in cache.directory.glob("*.txt")) == ["b", "c"]
+
+        assert cache.get("b") == b"x" * 100
+        cache.put("d", b"y" * 100)
+
+        assert sorted(p.stem for p in cache.directory.glob("*.txt")) == ["b", "d"]
+        assert cache.get("c") is None
+
+    def test_textconv_cache_trim_when_full(self, scratch_path, monkeypatch):
+        """Confirm the cache is only examined for trimming once it is full."""
+        cache = TextconvCache(scratch_path / "cache", max_size=1000)
+        trims = []
+        trim = TextconvCache.trim
+        monkeypatch.setattr(
+            TextconvCache, "trim", lambda self: trims.append(1) or trim(self)
+        )
+
+        # The first store finds no running total, and so counts the entries
+        for key in "abcdefghi":
+            cache.put(key, b"x" * 100)
+
+        assert len(trims) == 1
+        assert (cache.directory / "total-size").read_text() == "900"
+
+        cache.put("j", b"x" * 150)
+
+        # Trimmed to 90% of max_size, so the next stores needn't trim
+        assert len(trims) == 2
+        assert len(list(cache.directory.glob("*.txt"))) == 8
+        assert (cache.directory / "total-size").read_text() == "850"
+        assert cache.get("j") == b"x" * 150
+
 
 class TestFail:
     """Tests for expected-fail textconv entrypoint behaviors."""
@@ -0,0 +1,181 @@
+r"""*Import-time budget tests for* ``sphobjinv``.
+
+``sphobjinv`` is a toolkit for manipulation and inspection of
+Sphinx |objects.inv| files.
+
+**Author**
+    Brian Skinn (brian.skinn@gmail.com)
+
+**File Created**
+    19 Oct 2026
+
+**Copyright**
+    \(c) Brian Skinn 2016-2025
+
+**Source Repository**
+    https://github.com/bskinn/sphobjinv
+
+**Documentation**
+    https://sphobjinv.readthedocs.io/en/stable
+
+**License**
+    Code: `MIT License`_
+
+    Docs & Docstrings: |CC BY 4.0|_
+
+    See |license_txt|_ for full license terms.
+
+**Members**
+
+"""
+
+import json
+import subprocess as sp  # noqa: S404
+import sys
+
+import pytest
+
+#: Modules that must not be imported just to load or convert a local inventory
+HEAVY_MODULES = (
+    "certifi",
+    "http.client",
+    "jsonschema",
+    "ssl",
+    "urllib.request",
+    "sphobjinv.http",
+    "sphobjinv.suggest",
+)
+
+#: Cumulative import time budget in microseconds, as reported by
+#: ``python -X importtime``, for each entry-point module.
+#: Several times the typical value, to allow for slow machines.
+IMPORT_BUDGETS_US = {
+    "sphobjinv": 50_000,
+    "sphobjinv.cli.core": 100_000,
+}
+
+#: Names exported by ``from sphobjinv import *`` when all of the
+#: package-level names were imported eagerly
+STAR_IMPORT_NAMES = {
+    "DataFields",
+    "DataObjBytes",
+    "DataObjStr",
+    "HeaderFields",
+    "Inventory",
+    "SourceTypes",
+    "SphobjinvError",
+    "VersionError",
+    "compress",
+    "data",
+    "decompress",
+    "enum",
+    "error",
+    "fileops",
+    "inventory",
+    "json_schema",
+    "p_data",
+    "pb_comments",
+    "pb_data",
+    "pb_project",
+    "pb_version",
+    "re",
+    "readbytes",
+    "readjson",
+    "schema",
+    "urlwalk",
+    "version",
+    "writebytes",
+    "writejson",
+    "zlib",
+}
+
+pytestmark = [pytest.mark.local]
+
+
+def new_imports(code):
+    """Run `code` in a fresh interpreter and list the modules it imports.
+
+    Modules imported during interpreter startup (e.g., by ``.pth``
+    files) are excluded.
+
+    """
+    script = (
+        "import sys, json\n"
+        "before = set(sys.modules)\n"
+        f"{code}\n"
+        "print(json.dumps(sorted(set(sys.modules) - before)))\n"
+    )
+    out = sp.check_output([sys.executable, "-c", script])  # noqa: S603
+    return set(json.loads(out))
+
+
+def import_time_us(module):
+    """Measure the cumulative import time of `module` in a fresh interpreter."""
+    res = sp.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    for line in res.stderr.splitlines():
+        _, _, cumulative, name = (p.strip() for p in line.replace(":", "|").split("|"))
+        if name == module:
+            return int(cumulative)
+
+    raise AssertionError(f"No import time reported for {module}")  # pragma: no cover
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import sphobjinv",
+        "import sphobjinv.cli.core",
+        "import sphobjinv as soi; soi.Inventory({path!r}).data_file()",
+        "import sphobjinv as soi; soi.compress(soi.Inventory({path!r}).data_file())",
+        "\n".join(
+            [
+                "from sphobjinv.cli.core import main",
+                "sys.argv = ['sphobjinv', 'convert', 'plain', {path!r}, {out!r}]",
+                "try:",
+                "    main()",
+                "except SystemExit as e:",
+                "    assert not e.code",
+            ]
+        ),
+    ],
+    ids=["package", "cli", "load_local", "convert_local", "cli_convert_local"],
+)
+def test_importtime_no_heavy_imports(code, res_cmp, tmp_path):
+    """Confirm local use of the package avoids importing URL and JSON machinery."""
+    out = tmp_path / "objects_attrs.txt"
+    imported = new_imports(code.format(path=str(res_cmp), out=str(out)))
+
+    assert "sphobjinv" in imported
+    assert not imported.intersection(HEAVY_MODULES)
+
+
+def test_importtime_lazy_attributes():
+    """Confirm lazily imported names and the SSL context resolve on access."""
+    imported = new_imports(
+        "import ssl, sphobjinv as soi; soi.RequestPolicy; soi.pb_data\n"
+        "assert isinstance(soi.Inventory._sslcontext, ssl.SSLContext)"
+    )
+
+    assert {"sphobjinv.inventory", "sphobjinv.http", "sphobjinv.re"} <= imported
+
+
+def test_importtime_star_import():
+    """Confirm star-import exposes every name it did before imports were deferred."""
+    namespace = {}
+    exec("from sphobjinv import *", namespace)  # noqa: S102
+
+    assert STAR_IMPORT_NAMES <= set(namespace)
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_US))
+def test_importtime_budget(module):
+    """Confirm import time stays within budget, taking the best of three runs."""
+    best = min(import_time_us(module) for _ in range(3))
+
+    assert best < IMPORT_BUDGETS_US[module]